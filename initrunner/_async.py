@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import concurrent.futures
+import os
+import threading
 from collections.abc import Coroutine
 from typing import Any, TypeVar, cast
 
@@ -32,3 +35,89 @@ def run_sync(coro: Coroutine[Any, Any, T]) -> T:
         with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
             return cast(T, pool.submit(anyio.run, _wrapper).result())
     return anyio.run(_wrapper)
+
+
+# ---------------------------------------------------------------------------
+# Shared background loop
+# ---------------------------------------------------------------------------
+
+_shared_loop: asyncio.AbstractEventLoop | None = None
+_shared_thread: threading.Thread | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide background event loop, starting it on first use.
+
+    The loop runs forever on a daemon thread. Objects that hold loop-bound
+    resources across calls (e.g. pooled HTTP clients) must only be awaited
+    on this loop; use :func:`run_on_shared_loop` or
+    :func:`run_on_shared_loop_async` to get there.
+    """
+    global _shared_loop, _shared_thread
+    if _shared_loop is not None:
+        return _shared_loop
+    with _shared_lock:
+        if _shared_loop is None:
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            thread = threading.Thread(target=_run, name="initrunner-shared-loop", daemon=True)
+            thread.start()
+            ready.wait()
+            _shared_loop, _shared_thread = loop, thread
+    return _shared_loop
+
+
+def _on_shared_loop_thread() -> bool:
+    return _shared_thread is not None and threading.current_thread() is _shared_thread
+
+
+def run_on_shared_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run *coro* on the shared background loop and block for its result.
+
+    Unlike :func:`run_sync` this does not start a loop per call. Called from
+    the shared loop's own thread, where blocking would deadlock, it falls
+    back to :func:`run_sync`.
+    """
+    if _on_shared_loop_thread():
+        return run_sync(coro)
+    return asyncio.run_coroutine_threadsafe(coro, get_shared_loop()).result()
+
+
+async def run_on_shared_loop_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Await *coro* on the shared background loop from any running loop."""
+    if _on_shared_loop_thread():
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, get_shared_loop()))
+
+
+def shutdown_shared_loop() -> None:
+    """Stop the shared loop and join its thread. The next use starts a new one."""
+    global _shared_loop, _shared_thread
+    with _shared_lock:
+        loop, thread = _shared_loop, _shared_thread
+        _shared_loop = _shared_thread = None
+    if loop is None or thread is None:
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    if not thread.is_alive():
+        loop.close()
+
+
+def _forget_shared_loop() -> None:
+    # A forked child inherits the loop object but not the thread running it.
+    global _shared_loop, _shared_thread, _shared_lock
+    _shared_loop = _shared_thread = None
+    _shared_lock = threading.Lock()
+
+
+atexit.register(shutdown_shared_loop)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_shared_loop)
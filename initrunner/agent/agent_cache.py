@@ -0,0 +1,99 @@
+"""LRU cache of built agents.
+
+Building an agent loads and validates its role, builds its toolsets and
+creates a model client. Built agents hold no per-run state (run-scoped tools
+are built per run), so features that build the same agent over and over keep
+them in a :class:`BuiltAgentCache`: inline delegation
+(:mod:`initrunner.agent.delegation`) and team personas
+(:mod:`initrunner.team.agents`). Each feature picks its own key and size.
+
+An entry can record a hash of the role file it was built from. The hash is
+re-checked on every lookup, so an edited file is rebuilt on its next use.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+V = TypeVar("V")
+
+_caches: weakref.WeakSet[BuiltAgentCache] = weakref.WeakSet()
+
+
+def cache_size_from_env(var: str, default: int) -> int:
+    """Cache size from the environment variable *var*; ``0`` disables the cache."""
+    raw = os.environ.get(var, "")
+    try:
+        return max(0, int(raw)) if raw else default
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", var, raw)
+        return default
+
+
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class BuiltAgentCache(Generic[V]):
+    """Thread-safe LRU of built agents (or whatever a build returns)."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max = max_entries
+        # key -> (source file sha256, value); least recently used first
+        self._entries: OrderedDict[Hashable, tuple[str | None, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def get_or_build(
+        self, key: Hashable, build: Callable[[], V], *, source: Path | None = None
+    ) -> V:
+        """Return the value cached under *key*, or call *build* and cache its result.
+
+        *key* must cover every build input except *source*, the file the build
+        reads. A cached value is reused only while *source* hashes the same.
+        A *source* that cannot be read is built every time and never cached.
+        """
+        if self._max <= 0:
+            return build()
+        digest = _file_digest(source) if source is not None else None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == digest:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        value = build()
+        if source is not None and digest is None:
+            return value
+        with self._lock:
+            self._entries[key] = (digest, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def clear_agent_caches() -> None:
+    """Empty every built-agent cache in the process."""
+    for cache in list(_caches):
+        cache.clear()
@@ -7,13 +7,16 @@ import logging
 import os
 from collections.abc import Callable
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 from uuid import uuid4
 
+from initrunner.agent.agent_cache import BuiltAgentCache, cache_size_from_env
+
 if TYPE_CHECKING:
     import httpx
 
     from initrunner.agent.schema.base import Metadata
+    from initrunner.agent.schema.role import RoleDefinition
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +142,24 @@ def check_delegation_policy(
     return decision.allowed
 
 
+# ---------------------------------------------------------------------------
+# Built delegate agent cache
+# ---------------------------------------------------------------------------
+#
+# Built (role, agent) pairs, keyed by the resolved role path plus the
+# shared-memory settings. The role file's hash is checked on every lookup, so
+# an edited role is rebuilt on its next delegation.
+
+_delegate_cache: BuiltAgentCache[tuple[RoleDefinition, Any]] = BuiltAgentCache(
+    cache_size_from_env("INITRUNNER_DELEGATE_CACHE_SIZE", 32)
+)
+
+
+def get_delegate_cache() -> BuiltAgentCache[tuple[RoleDefinition, Any]]:
+    """Return the process-wide delegate agent cache."""
+    return _delegate_cache
+
+
 # ---------------------------------------------------------------------------
 # Invoker protocol + implementations
 # ---------------------------------------------------------------------------
@@ -177,9 +198,29 @@ class InlineInvoker:
         self._shared_max_memories = shared_max_memories
         self._source_metadata = source_metadata
 
+    def _build(self) -> tuple[RoleDefinition, Any]:
+        from initrunner.agent import loader
+
+        if not self._shared_memory_path:
+            return loader.load_and_build(self._role_path)
+
+        from initrunner.flow.orchestrator import apply_shared_memory
+
+        loader._load_dotenv(self._role_path.parent)
+        role = loader.load_role(self._role_path)
+        role = loader.resolve_role_model(role, self._role_path)
+        apply_shared_memory(role, self._shared_memory_path, self._shared_max_memories)
+        # Shared memory is injected by the delegation framework from
+        # trusted coordinator YAML -- relax the store-path restriction
+        # so it doesn't conflict with the sub-agent's default policy.
+        role.spec.security.tools = role.spec.security.tools.model_copy(
+            update={"restrict_db_paths": False}
+        )
+        agent = loader.build_agent(role, role_dir=self._role_path.parent)
+        return role, agent
+
     def invoke(self, prompt: str) -> str:
         from initrunner.agent.executor import execute_run
-        from initrunner.agent.loader import load_and_build
         from initrunner.agent.sandbox import _framework_bypass
         from initrunner.runner.run_budget import get_run_budget_tracker
 
@@ -187,28 +228,14 @@ class InlineInvoker:
 
         with _framework_bypass():
             try:
+                variant: tuple = (self._shared_memory_path,)
                 if self._shared_memory_path:
-                    from initrunner.agent.loader import (
-                        _load_dotenv,
-                        build_agent,
-                        load_role,
-                        resolve_role_model,
-                    )
-                    from initrunner.flow.orchestrator import apply_shared_memory
-
-                    _load_dotenv(self._role_path.parent)
-                    role = load_role(self._role_path)
-                    role = resolve_role_model(role, self._role_path)
-                    apply_shared_memory(role, self._shared_memory_path, self._shared_max_memories)
-                    # Shared memory is injected by the delegation framework from
-                    # trusted coordinator YAML -- relax the store-path restriction
-                    # so it doesn't conflict with the sub-agent's default policy.
-                    role.spec.security.tools = role.spec.security.tools.model_copy(
-                        update={"restrict_db_paths": False}
-                    )
-                    agent = build_agent(role, role_dir=self._role_path.parent)
-                else:
-                    role, agent = load_and_build(self._role_path)
+                    variant += (self._shared_max_memories,)
+                role, agent = _delegate_cache.get_or_build(
+                    (str(self._role_path.resolve()), variant),
+                    self._build,
+                    source=self._role_path,
+                )
             except Exception as e:
                 logger.error("Failed to load delegate agent %s: %s", self._role_path, e)
                 return f"{_ERROR_PREFIX} Failed to load agent from {self._role_path}: {e}"
@@ -251,15 +251,19 @@ async def _execute_orchestrated_async(
             result.judge_verdicts = list(judge_verdicts)
 
         _log_run_failure(result, role)
-        _audit_result(
-            result,
-            role,
-            prompt,
-            audit_logger=audit_logger,
-            trigger_type=trigger_type,
-            trigger_metadata=trigger_metadata,
-            principal_id=principal_id,
-        )
+        if audit_logger is not None:
+            # A signed SQLite write that can wait on the busy timeout; keep it
+            # off the loop so one locked audit DB never stalls concurrent runs.
+            await asyncio.to_thread(
+                _audit_result,
+                result,
+                role,
+                prompt,
+                audit_logger=audit_logger,
+                trigger_type=trigger_type,
+                trigger_metadata=trigger_metadata,
+                principal_id=principal_id,
+            )
 
         return result, new_messages
     finally:
@@ -379,14 +383,16 @@ async def _execute_resume_async_inner(
             _record_span_metrics(span, result)
 
         _log_run_failure(result, role)
-        _audit_result(
-            result,
-            role,
-            _resume_prompt(approvals),
-            audit_logger=audit_logger,
-            trigger_type="resume",
-            principal_id=principal_id,
-        )
+        if audit_logger is not None:
+            await asyncio.to_thread(
+                _audit_result,
+                result,
+                role,
+                _resume_prompt(approvals),
+                audit_logger=audit_logger,
+                trigger_type="resume",
+                principal_id=principal_id,
+            )
         return result, new_messages
     finally:
         _exit_agent_context(agent_token)
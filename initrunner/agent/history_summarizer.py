@@ -6,12 +6,17 @@ when estimated tokens exceed the budget.  The same reducer is used both
 as a pre-request history processor (permanent -- PydanticAI writes
 processed history back into run state) and by ``reduce_history()``
 between autonomous/daemon iterations.
+
+The processor sees the same, slowly growing history before every model
+call, so per-message estimates are cached by message identity and the
+drop stage is linear in the history length.
 """
 
 from __future__ import annotations
 
 import dataclasses
 import logging
+import weakref
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
@@ -140,19 +145,37 @@ def _estimate_multimodal(content: Sequence[Any]) -> int:
     return total
 
 
+# id(message) -> (weak reference, part count, estimate).  Messages are
+# unhashable dataclasses, so they are keyed by identity; the weak reference
+# both confirms the id still names the same object and drops the entry when
+# the message is garbage collected.
+_message_token_cache: dict[int, tuple[weakref.ref[Any], int, int]] = {}
+
+
+def _message_tokens(msg: Any) -> int:
+    """Estimate tokens for a single message, cached by message identity."""
+    parts = getattr(msg, "parts", None)
+    if parts is None:
+        # Non-ModelMessage object (e.g. dict in tests) -- rough fallback.
+        return _MSG_OVERHEAD + len(str(msg)) // 4
+
+    key = id(msg)
+    cached = _message_token_cache.get(key)
+    if cached is not None and cached[0]() is msg and cached[1] == len(parts):
+        return cached[2]
+
+    tokens = _MSG_OVERHEAD + sum(_estimate_part_tokens(part) for part in parts)
+    try:
+        ref = weakref.ref(msg, lambda _ref, key=key: _message_token_cache.pop(key, None))
+    except TypeError:
+        return tokens  # not weak-referenceable; don't cache
+    _message_token_cache[key] = (ref, len(parts), tokens)
+    return tokens
+
+
 def estimate_tokens(messages: list[ModelMessage]) -> int:
     """Estimate the total token count of *messages* using a fast heuristic."""
-    total = 0
-    for msg in messages:
-        total += _MSG_OVERHEAD
-        parts = getattr(msg, "parts", None)
-        if parts is None:
-            # Non-ModelMessage object (e.g. dict in tests) -- rough fallback.
-            total += len(str(msg)) // 4
-            continue
-        for part in parts:
-            total += _estimate_part_tokens(part)
-    return total
+    return sum(_message_tokens(msg) for msg in messages)
 
 
 # ---------------------------------------------------------------------------
@@ -265,18 +288,28 @@ def enforce_token_budget(
     first = [truncated[0]] if preserve_first and truncated else []
     middle = truncated[start_idx:]
 
-    # Drop pairs from the front of middle until under budget
-    dropped: list[ModelMessage] = []
-    while len(middle) > 1 and estimate_tokens(first + middle) > budget:
-        msg = middle.pop(0)
-        dropped.append(msg)
+    # Drop pairs from the front of middle until under budget, keeping a
+    # running total instead of re-estimating what is left after each drop.
+    tokens = [_message_tokens(m) for m in middle]
+    remaining = estimate_tokens(first) + sum(tokens)
+    n = len(middle)
+    cut = 0
+    while n - cut > 1 and remaining > budget:
+        msg = middle[cut]
+        remaining -= tokens[cut]
+        cut += 1
+        nxt = middle[cut] if cut < n else None
         # If we just dropped a request, also drop the following response to
         # keep request-response pairing intact.
-        if isinstance(msg, ModelRequest) and middle and isinstance(middle[0], ModelResponse):
-            dropped.append(middle.pop(0))
+        if isinstance(msg, ModelRequest) and isinstance(nxt, ModelResponse):
+            remaining -= tokens[cut]
+            cut += 1
         # If we dropped a response, also drop a dangling response that follows
-        elif isinstance(msg, ModelResponse) and middle and isinstance(middle[0], ModelResponse):
-            dropped.append(middle.pop(0))
+        elif isinstance(msg, ModelResponse) and isinstance(nxt, ModelResponse):
+            remaining -= tokens[cut]
+            cut += 1
+    dropped = middle[:cut]
+    middle = middle[cut:]
 
     # Insert synthetic summary
     if dropped:
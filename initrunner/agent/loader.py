@@ -718,6 +718,7 @@ def _build_auto_tools(
             always_available=ts_config.always_available,
             max_results=ts_config.max_results,
             threshold=ts_config.threshold,
+            persist_index=True,
         )
         from initrunner.agent.tool_events import wrap_observable
 
@@ -287,8 +287,8 @@ def import_memories(
 
     Raises ValueError on malformed input or missing memory config.
     """
-    from initrunner._async import run_sync
-    from initrunner.ingestion.embeddings import create_embedder, embed_texts
+    from initrunner._async import run_on_shared_loop
+    from initrunner.ingestion.embeddings import embed_texts, get_embedder
     from initrunner.stores.base import MemoryType
     from initrunner.stores.factory import open_memory_store
 
@@ -298,7 +298,7 @@ def import_memories(
     mem_cfg = role.spec.memory
     embed_provider = mem_cfg.embeddings.provider or role.spec.model.provider or "openai"  # type: ignore[union-attr]
     embed_model = mem_cfg.embeddings.model
-    embedder = create_embedder(
+    embedder = get_embedder(
         embed_provider,
         embed_model,
         base_url=mem_cfg.embeddings.base_url,
@@ -336,7 +336,7 @@ def import_memories(
     batch_size = 50
     for i in range(0, len(texts), batch_size):
         batch = texts[i : i + batch_size]
-        vectors = run_sync(embed_texts(embedder, batch, input_type="document"))
+        vectors = run_on_shared_loop(embed_texts(embedder, batch, input_type="document"))
         all_embeddings.extend(vectors)
 
     # Store -- new IDs allocated by the store
@@ -40,6 +40,11 @@ _DEFAULT_ENV_PASSTHROUGH = ("PATH", "HOME", "LANG", "TERM")
 _systemd_run_checked = False
 _systemd_run_available = False
 
+# bwrap binaries whose functional probe succeeded. The probe spawns a sandbox,
+# so it runs once per binary per process; failures are not cached so a fixed
+# host is picked up on the next preflight.
+_probed_bwrap: set[str] = set()
+
 
 def _read_sysctl(path: str) -> str | None:
     """Read an integer sysctl from /proc/sys. None if unreadable."""
@@ -143,7 +148,8 @@ class BwrapBackend:
                     "Use backend: docker on this platform, or backend: auto to pick automatically."
                 ),
             )
-        if not shutil.which("bwrap"):
+        bwrap = shutil.which("bwrap")
+        if not bwrap:
             raise SandboxUnavailableError(
                 backend="bwrap",
                 reason="bwrap not found on PATH",
@@ -154,6 +160,8 @@ class BwrapBackend:
                     "  Arch: pacman -S bubblewrap"
                 ),
             )
+        if bwrap in _probed_bwrap:
+            return
         try:
             result = subprocess.run(
                 ["bwrap", "--ro-bind", "/usr", "/usr", "--", "/bin/true"],
@@ -179,6 +187,7 @@ class BwrapBackend:
                 reason=f"bubblewrap probe failed: {exc}",
                 remediation="Check that bubblewrap is installed correctly.",
             ) from None
+        _probed_bwrap.add(bwrap)
 
     def _build_cmd(
         self,
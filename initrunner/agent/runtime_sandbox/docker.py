@@ -94,6 +94,11 @@ class DockerBackend:
     def name(self) -> str:
         return "docker"
 
+    @property
+    def pooled(self) -> bool:
+        """True when calls may run in warm containers (``docker.pool.enabled``)."""
+        return self._config.docker.pool.enabled
+
     def preflight(self) -> None:
         if not check_docker_available():
             raise SandboxUnavailableError(
@@ -149,32 +154,52 @@ class DockerBackend:
         memory_limit: str | None = None,
         cpu_limit: float | None = None,
     ) -> SandboxResult:
-        name = _generate_container_name()
-
         mount_tuples = [(m.source, m.target, m.read_only) for m in extra_mounts]
 
-        cmd = _build_docker_cmd(
-            self._config,
-            container_name=name,
-            work_dir=str(cwd),
-            extra_mounts=mount_tuples or None,
-            interactive=stdin is not None,
-            role_dir=self._role_dir,
-            env=dict(env),
-        )
-        cmd.extend(argv)
-
         t0 = time.monotonic()
-        try:
-            result = subprocess.run(
-                cmd,
-                input=stdin,
-                capture_output=True,
+        result = None
+        if self.pooled:
+            from initrunner.agent.runtime_sandbox.docker_pool import get_container_pool
+
+            run_cmd = _build_docker_cmd(
+                self._config,
+                work_dir=str(cwd),
+                extra_mounts=mount_tuples or None,
+                role_dir=self._role_dir,
+            )
+            result = get_container_pool().run(
+                run_cmd,
+                argv,
+                stdin=stdin,
+                env=env,
                 timeout=timeout,
+                settings=self._config.docker.pool,
+                writable_rootfs=not self._config.read_only_rootfs,
             )
-        except subprocess.TimeoutExpired:
-            _kill_container(name)
-            raise SubprocessTimeout(int(timeout)) from None
+        pooled = result is not None
+
+        if result is None:
+            name = _generate_container_name()
+            cmd = _build_docker_cmd(
+                self._config,
+                container_name=name,
+                work_dir=str(cwd),
+                extra_mounts=mount_tuples or None,
+                interactive=stdin is not None,
+                role_dir=self._role_dir,
+                env=dict(env),
+            )
+            cmd.extend(argv)
+            try:
+                result = subprocess.run(
+                    cmd,
+                    input=stdin,
+                    capture_output=True,
+                    timeout=timeout,
+                )
+            except subprocess.TimeoutExpired:
+                _kill_container(name)
+                raise SubprocessTimeout(int(timeout)) from None
 
         elapsed = (time.monotonic() - t0) * 1000
         stdout = result.stdout.decode("utf-8", errors="replace")
@@ -190,6 +215,7 @@ class DockerBackend:
             details=(
                 f"backend=docker argv0={argv[0] if argv else ''} "
                 f"rc={result.returncode} duration_ms={elapsed:.0f}"
+                + (" pooled=1" if pooled else "")
             ),
         )
 
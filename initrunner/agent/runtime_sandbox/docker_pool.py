@@ -0,0 +1,429 @@
+"""Warm container pool for the Docker sandbox backend.
+
+``docker run`` pays for a container create, a network namespace and a start
+on every tool call. With ``security.sandbox.docker.pool.enabled``,
+:class:`DockerBackend` instead runs calls with ``docker exec`` inside
+long-lived containers started with exactly the flags the one-shot path would
+use (image, limits, network, mounts, user), idling on ``sleep infinity``.
+
+Pool rules:
+
+- Containers are keyed by their ``docker run`` command without the container
+  name, so a container only ever serves calls that would have got an
+  identical one-shot container. A key starts pooling on its second call;
+  one-off commands keep the one-shot path.
+- Each key holds at most ``max_containers``. When all are busy the call falls
+  back to a one-shot run instead of waiting.
+- After each call a maintenance thread checks the container before it goes
+  back to idle. It is removed instead when it has served ``max_uses`` calls,
+  was OOM-killed, left processes running, or wrote outside its scratch space
+  (``docker diff`` on a writable rootfs; ``/tmp`` and ``/dev/shm`` are wiped).
+- Idle containers are removed after ``idle_timeout_seconds``, and containers
+  that disappeared (daemon restart, manual ``docker rm``) are dropped. A
+  daemon error on ``docker exec`` discards the container and the call is
+  retried one-shot.
+- Every pooled container is removed at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+
+from initrunner.agent._subprocess import SubprocessTimeout
+from initrunner.agent.docker_sandbox import _generate_container_name, _kill_container
+from initrunner.agent.schema.security import DockerPoolConfig
+
+logger = logging.getLogger(__name__)
+
+POOL_LABEL = "initrunner.pool=true"
+
+_REAP_INTERVAL_SECONDS = 15.0
+_MAX_SEEN_KEYS = 256
+_CHECK_TIMEOUT = 10
+_CREATE_TIMEOUT = 60
+_OOM_RETURNCODE = 137
+_DAEMON_ERROR = b"Error response from daemon"
+_WIPE_SCRATCH = (
+    "rm -rf /tmp/* /tmp/.[!.]* /tmp/..?* /dev/shm/* /dev/shm/.[!.]* /dev/shm/..?* 2>/dev/null;"
+    " exit 0"
+)
+
+
+@dataclass(frozen=True)
+class DockerPoolStats:
+    """Point-in-time counters for a :class:`DockerContainerPool`."""
+
+    containers: int
+    idle: int
+    busy: int
+    hits: int
+    misses: int
+    created: int
+    recycled: int
+    avg_exec_ms: float
+    max_exec_ms: float
+
+
+@dataclass
+class _Container:
+    name: str
+    key: tuple[str, ...]
+    writable_rootfs: bool
+    baseline_procs: int
+    uses: int = 0
+    dirty: bool = False
+    last_used: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _KeyState:
+    settings: DockerPoolConfig
+    idle: list[_Container] = field(default_factory=list)
+    total: int = 0
+
+
+def _docker(args: list[str], timeout: float = _CHECK_TIMEOUT) -> subprocess.CompletedProcess | None:
+    """Run a docker CLI command; None when it could not be run at all."""
+    try:
+        return subprocess.run(["docker", *args], capture_output=True, timeout=timeout)
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+
+
+def _count_lines(data: bytes) -> int:
+    return len([line for line in data.splitlines() if line.strip()])
+
+
+class DockerContainerPool:
+    """Thread-safe pool of warm sandbox containers, keyed by run command."""
+
+    def __init__(self, *, reap_interval: float = _REAP_INTERVAL_SECONDS) -> None:
+        self._reap_interval = reap_interval
+        self._lock = threading.Lock()
+        self._keys: dict[tuple[str, ...], _KeyState] = {}
+        self._seen: OrderedDict[tuple[str, ...], None] = OrderedDict()
+        self._live: dict[str, _Container] = {}
+        self._queue: queue.Queue[_Container | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+        self._hits = 0
+        self._misses = 0
+        self._created = 0
+        self._recycled = 0
+        self._execs = 0
+        self._exec_total_ms = 0.0
+        self._exec_max_ms = 0.0
+
+    # -- public API -----------------------------------------------------------
+
+    def run(
+        self,
+        run_cmd: Sequence[str],
+        argv: Sequence[str],
+        *,
+        stdin: bytes | None,
+        env: Mapping[str, str],
+        timeout: float,
+        settings: DockerPoolConfig,
+        writable_rootfs: bool,
+    ) -> subprocess.CompletedProcess | None:
+        """Run *argv* in a warm container created from *run_cmd*.
+
+        *run_cmd* is the ``docker run`` prefix (ending with the image) the
+        one-shot path would use, built without a container name or per-call
+        environment. Returns None when the call should run one-shot instead.
+        Raises :class:`SubprocessTimeout` after removing the container when
+        *timeout* expires.
+        """
+        key = tuple(run_cmd)
+        container = self._acquire(key, settings, writable_rootfs)
+        if container is None:
+            return None
+
+        cmd = ["docker", "exec"]
+        if stdin is not None:
+            cmd.append("-i")
+        for k, v in env.items():
+            cmd.extend(["-e", f"{k}={v}"])
+        cmd.append(container.name)
+        cmd.extend(argv)
+
+        t0 = time.monotonic()
+        try:
+            proc = subprocess.run(cmd, input=stdin, capture_output=True, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._discard(container)
+            raise SubprocessTimeout(int(timeout)) from None
+        except OSError as exc:
+            logger.debug("docker exec failed to start: %s", exc)
+            self._discard(container)
+            return None
+        elapsed = (time.monotonic() - t0) * 1000
+
+        if proc.returncode != 0 and proc.stderr.startswith(_DAEMON_ERROR):
+            logger.info(
+                "Pooled container %s unusable, falling back to a one-shot run: %s",
+                container.name,
+                proc.stderr.decode("utf-8", errors="replace").strip(),
+            )
+            self._discard(container)
+            return None
+
+        with self._lock:
+            self._execs += 1
+            self._exec_total_ms += elapsed
+            self._exec_max_ms = max(self._exec_max_ms, elapsed)
+        container.uses += 1
+        container.dirty = proc.returncode == _OOM_RETURNCODE
+        self._queue.put(container)
+        return proc
+
+    def stats(self) -> DockerPoolStats:
+        with self._lock:
+            idle = sum(len(s.idle) for s in self._keys.values())
+            return DockerPoolStats(
+                containers=len(self._live),
+                idle=idle,
+                busy=len(self._live) - idle,
+                hits=self._hits,
+                misses=self._misses,
+                created=self._created,
+                recycled=self._recycled,
+                avg_exec_ms=self._exec_total_ms / self._execs if self._execs else 0.0,
+                max_exec_ms=self._exec_max_ms,
+            )
+
+    def reap(self) -> int:
+        """Remove idle containers past their idle timeout or no longer running.
+
+        Called periodically by the maintenance thread. Returns how many
+        containers were removed.
+        """
+        now = time.monotonic()
+        expired: list[_Container] = []
+        with self._lock:
+            for state in self._keys.values():
+                limit = state.settings.idle_timeout_seconds
+                keep = [c for c in state.idle if now - c.last_used <= limit]
+                expired.extend(c for c in state.idle if now - c.last_used > limit)
+                state.idle = keep
+            idle_names = {c.name for s in self._keys.values() for c in s.idle}
+        for c in expired:
+            self._discard(c, reason="idle timeout")
+
+        gone: list[_Container] = []
+        if idle_names:
+            ps = _docker(["ps", "--filter", f"label={POOL_LABEL}", "--format", "{{.Names}}"])
+            if ps is not None and ps.returncode == 0:
+                running = set(ps.stdout.decode("utf-8", errors="replace").split())
+                with self._lock:
+                    for state in self._keys.values():
+                        gone.extend(c for c in state.idle if c.name not in running)
+                        state.idle = [c for c in state.idle if c.name in running]
+        for c in gone:
+            self._discard(c, reason="no longer running")
+        return len(expired) + len(gone)
+
+    def close(self) -> None:
+        """Remove every pooled container and stop the maintenance thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            names = list(self._live)
+            self._live.clear()
+            self._keys.clear()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+        if names:
+            _docker(["rm", "-f", *names], timeout=30)
+
+    # -- internals ------------------------------------------------------------
+
+    def _acquire(
+        self, key: tuple[str, ...], settings: DockerPoolConfig, writable_rootfs: bool
+    ) -> _Container | None:
+        with self._lock:
+            if self._closed:
+                return None
+            if key not in self._seen:
+                self._seen[key] = None
+                if len(self._seen) > _MAX_SEEN_KEYS:
+                    self._seen.popitem(last=False)
+                self._misses += 1
+                return None
+            self._seen.move_to_end(key)
+            state = self._keys.get(key)
+            if state is None:
+                state = self._keys[key] = _KeyState(settings=settings)
+            state.settings = settings
+            if state.idle:
+                self._hits += 1
+                return state.idle.pop()
+            self._misses += 1
+            if state.total >= settings.max_containers:
+                return None
+            state.total += 1
+            self._ensure_thread_locked()
+
+        container = self._create(key, writable_rootfs)
+        with self._lock:
+            if container is None:
+                state.total -= 1
+            elif self._closed:
+                state.total -= 1
+                self._live.pop(container.name, None)
+            else:
+                return container
+        if container is not None:
+            _kill_container(container.name)
+        return None
+
+    def _create(self, key: tuple[str, ...], writable_rootfs: bool) -> _Container | None:
+        name = _generate_container_name()
+        image = key[-1]
+        cmd = [
+            *key[:2],
+            "-d",
+            "--name",
+            name,
+            "--label",
+            POOL_LABEL,
+            *key[2:-1],
+            "--entrypoint",
+            "sleep",
+            image,
+            "infinity",
+        ]
+        started = _docker(cmd[1:], timeout=_CREATE_TIMEOUT)
+        if started is None or started.returncode != 0:
+            err = started.stderr.decode("utf-8", errors="replace").strip() if started else ""
+            logger.warning("Could not start pooled container for %s: %s", image, err)
+            _kill_container(name)
+            return None
+
+        inspect = _docker(["inspect", "-f", "{{.State.Running}}", name])
+        top = _docker(["top", name])
+        if (
+            inspect is None
+            or inspect.stdout.strip() != b"true"
+            or top is None
+            or top.returncode != 0
+        ):
+            logger.warning("Pooled container %s failed its health check", name)
+            _kill_container(name)
+            return None
+
+        container = _Container(
+            name=name,
+            key=key,
+            writable_rootfs=writable_rootfs,
+            baseline_procs=_count_lines(top.stdout),
+        )
+        with self._lock:
+            self._live[name] = container
+            self._created += 1
+        logger.debug("Started pooled container %s (%s)", name, image)
+        return container
+
+    def _is_reusable(self, c: _Container, settings: DockerPoolConfig) -> bool:
+        if c.dirty or c.uses >= settings.max_uses:
+            return False
+        top = _docker(["top", c.name])
+        if top is None or top.returncode != 0 or _count_lines(top.stdout) > c.baseline_procs:
+            return False
+        wipe = _docker(["exec", c.name, "sh", "-c", _WIPE_SCRATCH])
+        if wipe is None or wipe.returncode != 0:
+            return False
+        if c.writable_rootfs:
+            diff = _docker(["diff", c.name])
+            if diff is None or diff.returncode != 0 or diff.stdout.strip():
+                return False
+        return True
+
+    def _recycle(self, c: _Container) -> None:
+        with self._lock:
+            state = self._keys.get(c.key)
+        if state is None or not self._is_reusable(c, state.settings):
+            self._discard(c, reason="recycled")
+            return
+        with self._lock:
+            if not self._closed and self._keys.get(c.key) is state:
+                c.last_used = time.monotonic()
+                state.idle.append(c)
+                return
+        self._discard(c, reason="pool closed")
+
+    def _discard(self, c: _Container, *, reason: str = "discarded") -> None:
+        with self._lock:
+            if self._live.pop(c.name, None) is None:
+                return  # already removed by close()
+            state = self._keys.get(c.key)
+            if state is not None:
+                state.total -= 1
+            self._recycled += 1
+        logger.debug("Removing pooled container %s (%s)", c.name, reason)
+        _kill_container(c.name)
+
+    def _ensure_thread_locked(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._maintain, name="docker-pool-maintenance", daemon=True
+            )
+            self._thread.start()
+
+    def _maintain(self) -> None:
+        last_reap = time.monotonic()
+        while True:
+            try:
+                container = self._queue.get(timeout=self._reap_interval)
+            except queue.Empty:
+                pass
+            else:
+                try:
+                    if container is None:
+                        return
+                    self._recycle(container)
+                except Exception:
+                    logger.exception("Could not recycle pooled container")
+                finally:
+                    self._queue.task_done()
+            if time.monotonic() - last_reap >= self._reap_interval:
+                last_reap = time.monotonic()
+                try:
+                    self.reap()
+                except Exception:
+                    logger.exception("Could not reap pooled containers")
+
+
+_pool: DockerContainerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_container_pool() -> DockerContainerPool:
+    """Return the process-wide container pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DockerContainerPool()
+            atexit.register(_pool.close)
+        return _pool
+
+
+def reset_container_pool() -> None:
+    """Close and forget the process-wide pool (tests, daemon reloads)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
@@ -88,14 +88,14 @@ def document_to_team(document: AgentDocument, *, base_dir: Path | None = None) -
 
     personas: dict[str, PersonaConfig] = {}
     member_roles: dict[str, RoleDefinition] = {}
-    member_dirs: dict[str, Path] = {}
+    member_files: dict[str, Path] = {}
     for name, child in document.agents.items():
         personas[name] = _child_to_persona(name, child, document, base_dir)
         if child.use:
             # _child_to_persona already rejected a missing base_dir.
             assert base_dir is not None
             member_roles[name] = _team_member_role(name, child, document, base_dir)
-            member_dirs[name] = (base_dir / child.use).resolve().parent
+            member_files[name] = (base_dir / child.use).resolve()
 
     g = document.guardrails
     spec = TeamSpec(
@@ -133,7 +133,8 @@ def document_to_team(document: AgentDocument, *, base_dir: Path | None = None) -
         spec=spec,
     )
     for name, role in member_roles.items():
-        team.set_member_provenance(name, role, member_dirs[name])
+        role_file = member_files[name]
+        team.set_member_provenance(name, role, role_file.parent, role_file)
     return team
 
 
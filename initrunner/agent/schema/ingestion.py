@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, Field, model_validator
 
 from initrunner.stores.base import StoreBackend
 
@@ -63,6 +63,23 @@ class RetrieverConfig(BaseModel):
     reranker_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
 
 
+class ConcurrencyConfig(BaseModel):
+    """How many sources and embedding requests the ingest pipeline keeps busy.
+
+    ``extract_workers`` sizes the process pool used for PDF, DOCX and XLSX
+    extraction (``0`` picks up to 4 from the CPU count, ``1`` extracts
+    in-process). Chunks from many files are packed into embedding requests of
+    up to ``embed_batch_size`` texts, with at most ``embed_concurrency``
+    requests in flight. URL sources are fetched ``fetch_concurrency`` at a
+    time, never more than one request per second to the same host.
+    """
+
+    extract_workers: int = Field(default=0, ge=0)
+    embed_concurrency: int = Field(default=4, ge=1)
+    embed_batch_size: int = Field(default=500, ge=1)
+    fetch_concurrency: int = Field(default=8, ge=1)
+
+
 class IngestConfig(BaseModel):
     auto: bool = True
     sources: list[str]
@@ -70,5 +87,6 @@ class IngestConfig(BaseModel):
     chunking: ChunkingConfig = ChunkingConfig()
     embeddings: EmbeddingConfig = EmbeddingConfig()
     retriever: RetrieverConfig = RetrieverConfig()
+    concurrency: ConcurrencyConfig = ConcurrencyConfig()
     store_backend: StoreBackend = StoreBackend.LANCEDB
     store_path: str | None = None  # default: ~/.initrunner/stores/{agent-name}.db
@@ -77,6 +77,13 @@ class DaemonConfig(BaseModel):
 
     hot_reload: bool = True
     reload_debounce_seconds: float = Field(default=1.0, ge=0.0, le=30.0)
+    # Trigger work queue: events wait here for one of ``workers`` run slots.
+    workers: int = Field(default=4, ge=1, le=64)
+    max_queued: int = Field(default=100, ge=1, le=10000)
+    # Per-trigger-type priority overrides; lower runs first.
+    priorities: dict[str, int] = Field(default_factory=dict)
+    # Trigger types whose queued duplicates (same path) are merged.
+    coalesce: list[str] = Field(default_factory=lambda: ["file_watch"])
 
 
 class AgentSpec(BaseModel):
@@ -189,12 +189,19 @@ class ServerConfig(BaseModel):
     require_https: bool = False
     max_request_body_bytes: Annotated[int, Field(gt=0)] = 1_048_576
     max_conversations: int = 1000
+    max_conversation_memory_mb: Annotated[float, Field(ge=0)] = 256.0
+    persist_conversations: bool = False
+    max_concurrent_runs: Annotated[int, Field(gt=0)] = 32
 
 
 class RateLimitConfig(BaseModel):
     model_config = ConfigDict(extra="forbid")
     requests_per_minute: Annotated[int, Field(gt=0)] = 60
     burst_size: Annotated[int, Field(gt=0)] = 10
+    key_by: Literal["global", "api_key", "conversation", "ip"] = "global"
+    per_model: bool = False
+    max_keys: Annotated[int, Field(gt=0)] = 10_000
+    backend: Literal["memory", "sqlite"] = "memory"
 
 
 class ResourceLimits(BaseModel):
@@ -313,6 +320,21 @@ class BindMount(BaseModel):
 DockerRuntime = Literal["runc", "runsc", "kata-runtime", "kata-qemu", "kata-fc", "kata-clh"]
 
 
+class DockerPoolConfig(BaseModel):
+    """Warm container pool settings nested under sandbox.docker.pool.
+
+    When enabled, tool calls ``docker exec`` into long-lived, identically
+    locked-down containers instead of starting a fresh one per call.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = False
+    max_containers: Annotated[int, Field(ge=1, le=64)] = 4
+    max_uses: Annotated[int, Field(ge=1)] = 100
+    idle_timeout_seconds: Annotated[float, Field(gt=0)] = 300.0
+
+
 class DockerBackendConfig(BaseModel):
     """Docker-specific settings nested under sandbox.docker."""
 
@@ -322,6 +344,7 @@ class DockerBackendConfig(BaseModel):
     user: Literal["auto"] | str | None = "auto"
     extra_args: list[str] = Field(default_factory=list)
     runtime: DockerRuntime | None = None
+    pool: DockerPoolConfig = DockerPoolConfig()
 
     @field_validator("image")
     @classmethod
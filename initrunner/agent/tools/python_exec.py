@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import atexit
+import os
 import shutil
 import sys
 import tempfile
 import textwrap
+import threading
 from pathlib import Path
 
 from pydantic_ai.toolsets.function import FunctionToolset
@@ -54,6 +57,49 @@ _PROXY_ENV_KEYS = (
 )
 
 
+class _ScratchDirs:
+    """Emptied temp dirs handed back out for reuse.
+
+    A pooled Docker backend keys warm containers by their mounts, so a fresh
+    ``mkdtemp`` per call would never hit the pool. Dirs that cannot be emptied
+    are deleted instead of reused.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._free: list[str] = []
+        atexit.register(self.close)
+
+    def acquire(self) -> str:
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return tempfile.mkdtemp(prefix="initrunner_py_")
+
+    def release(self, path: str) -> None:
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+        except OSError:
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        with self._lock:
+            self._free.append(path)
+
+    def close(self) -> None:
+        with self._lock:
+            free, self._free = self._free, []
+        for path in free:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+_scratch_dirs = _ScratchDirs()
+
+
 @register_tool("python", PythonToolConfig)
 def build_python_toolset(config: PythonToolConfig, ctx: ToolBuildContext) -> FunctionToolset:
     """Build a FunctionToolset for executing Python code in a subprocess."""
@@ -62,6 +108,7 @@ def build_python_toolset(config: PythonToolConfig, ctx: ToolBuildContext) -> Fun
     backend = ctx.sandbox_backend
     warn_if_unsandboxed(backend, "python")
     sandbox_cfg = ctx.role.spec.security.sandbox
+    pooled = getattr(backend, "pooled", False)
 
     toolset = FunctionToolset()
 
@@ -75,7 +122,9 @@ def build_python_toolset(config: PythonToolConfig, ctx: ToolBuildContext) -> Fun
 
         use_temp = config.working_dir is None
         if use_temp:
-            work_dir = tempfile.mkdtemp(prefix="initrunner_py_")
+            work_dir = (
+                _scratch_dirs.acquire() if pooled else tempfile.mkdtemp(prefix="initrunner_py_")
+            )
         else:
             work_dir = config.working_dir
             assert work_dir is not None
@@ -92,15 +141,20 @@ def build_python_toolset(config: PythonToolConfig, ctx: ToolBuildContext) -> Fun
             env["NO_PROXY"] = "*"
 
         python_bin = sys.executable if backend.name == "none" else "python3"
+        # A warm container keeps the file mount's original inode, so it would
+        # never see a rewritten _run.py; it reads it through the /work mount.
+        mounts = (
+            []
+            if pooled
+            else [BindMount(source=str(code_file), target="/work/_run.py", read_only=True)]
+        )
         try:
             sr = backend.run(
                 [python_bin, "/work/_run.py"],
                 env=env,
                 cwd=Path(work_dir),
                 timeout=config.timeout_seconds,
-                extra_mounts=[
-                    BindMount(source=str(code_file), target="/work/_run.py", read_only=True),
-                ],
+                extra_mounts=mounts,
             )
         except SubprocessTimeout as exc:
             return str(exc)
@@ -110,7 +164,9 @@ def build_python_toolset(config: PythonToolConfig, ctx: ToolBuildContext) -> Fun
             # can adapt -- usually by switching to the shell tool.
             return f"Error: python tool unavailable on this sandbox backend: {exc}"
         finally:
-            if use_temp:
+            if use_temp and pooled:
+                _scratch_dirs.release(work_dir)
+            elif use_temp:
                 shutil.rmtree(work_dir, ignore_errors=True)
             else:
                 code_file.unlink(missing_ok=True)
@@ -9,11 +9,12 @@ model sees at each inference step.
 
 from __future__ import annotations
 
+import bisect
+import logging
 import math
 import re
 import threading
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pydantic_ai.toolsets.function import FunctionToolset
 
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
     from pydantic_ai import RunContext
     from pydantic_ai.tools import ToolDefinition
 
+_logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Stopwords stripped during tokenisation (common English words that add noise)
@@ -45,19 +47,9 @@ def _tokenize(text: str) -> list[str]:
     return [t for t in tokens if t and t not in _STOPWORDS]
 
 
-@dataclass
-class _DocEntry:
-    """A document in the BM25 index."""
-
-    name: str
-    name_tokens: list[str]
-    param_tokens: list[str]
-    all_tokens: list[str]
-    tf: dict[str, int] = field(default_factory=dict)
-
-    def __post_init__(self) -> None:
-        for tok in self.all_tokens:
-            self.tf[tok] = self.tf.get(tok, 0) + 1
+# Posting flags: the token occurs in the tool name / a parameter name.
+_IN_NAME = 1
+_IN_PARAM = 2
 
 
 class _BM25Index:
@@ -66,44 +58,84 @@ class _BM25Index:
     No external dependencies — pure Python using standard BM25 scoring
     (k1=1.5, b=0.75) with IDF weighting, name/param boosting, and prefix
     matching.
+
+    The index is inverted: each token maps to a posting list of the documents
+    containing it, and ``build()`` precomputes every posting's exact-match and
+    prefix-match score.  A query therefore only touches documents that share
+    (a prefix of) one of its tokens.  Prefix candidates come from a sorted
+    vocabulary via binary search.
     """
 
     def __init__(self) -> None:
-        self._docs: list[_DocEntry] = []
-        self._df: dict[str, int] = {}  # document frequency per token
-        self._avgdl: float = 0.0
+        self._names: list[str] = []
+        self._lengths: list[int] = []
+        # token -> [(doc_id, tf, first-occurrence order, flags)], by doc_id
+        self._raw: dict[str, list[tuple[int, int, int, int]]] = {}
+        # token -> [(doc_id, order, exact score, prefix score)], set by build()
+        self._postings: dict[str, list[tuple[int, int, float, float]]] = {}
+        self._vocab: list[str] = []
+        self._built = True
         self._k1: float = 1.5
         self._b: float = 0.75
 
+    def __len__(self) -> int:
+        return len(self._names)
+
     def add(self, name: str, description: str, param_names: list[str]) -> None:
         """Add a tool to the index."""
         name_tokens = _tokenize(name)
-        desc_tokens = _tokenize(description)
         param_tokens: list[str] = []
         for p in param_names:
             param_tokens.extend(_tokenize(p))
-        all_tokens = name_tokens + desc_tokens + param_tokens
-        entry = _DocEntry(
-            name=name,
-            name_tokens=name_tokens,
-            param_tokens=param_tokens,
-            all_tokens=all_tokens,
-        )
-        self._docs.append(entry)
+        all_tokens = name_tokens + _tokenize(description) + param_tokens
+
+        tf: dict[str, int] = {}
+        for tok in all_tokens:
+            tf[tok] = tf.get(tok, 0) + 1
+        name_set, param_set = set(name_tokens), set(param_tokens)
+        doc_id = len(self._names)
+        for order, (tok, count) in enumerate(tf.items()):
+            flags = (_IN_NAME if tok in name_set else 0) | (_IN_PARAM if tok in param_set else 0)
+            self._raw.setdefault(tok, []).append((doc_id, count, order, flags))
+        self._names.append(name)
+        self._lengths.append(len(all_tokens))
+        self._built = False
 
     def build(self) -> None:
-        """Finalise the index — compute DF and average document length."""
-        self._df.clear()
-        total_len = 0
-        for doc in self._docs:
-            total_len += len(doc.all_tokens)
-            seen: set[str] = set()
-            for tok in doc.all_tokens:
-                if tok not in seen:
-                    self._df[tok] = self._df.get(tok, 0) + 1
-                    seen.add(tok)
-        n = len(self._docs)
-        self._avgdl = total_len / n if n else 1.0
+        """Finalise the index — precompute posting scores and the sorted vocabulary."""
+        n = len(self._names)
+        avgdl = sum(self._lengths) / n if n else 1.0
+        norms = [self._k1 * (1 - self._b + self._b * dl / avgdl) for dl in self._lengths]
+        postings: dict[str, list[tuple[int, int, float, float]]] = {}
+        for tok, raw in self._raw.items():
+            df = len(raw)
+            idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
+            scored = []
+            for doc_id, tf, order, flags in raw:
+                tf_norm = (tf * (self._k1 + 1)) / (tf + norms[doc_id])
+                exact = idf * tf_norm
+                prefix = idf * tf_norm * 0.5
+                # Boost for name and param matches
+                if flags & _IN_NAME:
+                    exact *= 1.5
+                    prefix *= 1.5
+                if flags & _IN_PARAM:
+                    exact *= 1.2
+                    prefix *= 1.2
+                scored.append((doc_id, order, exact, prefix))
+            postings[tok] = scored
+        self._postings = postings
+        self._vocab = sorted(postings)
+        self._built = True
+
+    def _prefix_matches(self, qt: str) -> list[str]:
+        """Vocabulary tokens that extend *qt* or that *qt* extends (excluding *qt*)."""
+        matches = [qt[:i] for i in range(1, len(qt)) if qt[:i] in self._postings]
+        i = bisect.bisect_right(self._vocab, qt)
+        while i < len(self._vocab) and self._vocab[i].startswith(qt):
+            matches.append(self._vocab[i])
+            i += 1
+        return matches
 
     def search(
         self,
@@ -112,64 +144,70 @@ class _BM25Index:
         threshold: float = 0.0,
     ) -> list[tuple[str, float]]:
         """Return ``(tool_name, score)`` pairs sorted by descending score."""
-        if not self._docs:
+        if not self._names:
             return []
 
         query_tokens = _tokenize(query)
         if not query_tokens:
             return []
-
-        n = len(self._docs)
-        scores: list[tuple[str, float]] = []
-
-        for doc in self._docs:
-            score = 0.0
-            dl = len(doc.all_tokens)
-            name_set = set(doc.name_tokens)
-            param_set = set(doc.param_tokens)
-
-            for qt in query_tokens:
-                # Exact matches
-                tf = doc.tf.get(qt, 0)
-                if tf > 0:
-                    df = self._df.get(qt, 0)
-                    idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
-                    denom = tf + self._k1 * (1 - self._b + self._b * dl / self._avgdl)
-                    tf_norm = (tf * (self._k1 + 1)) / denom
-                    term_score = idf * tf_norm
-
-                    # Boost for name and param matches
-                    if qt in name_set:
-                        term_score *= 1.5
-                    if qt in param_set:
-                        term_score *= 1.2
-
-                    score += term_score
-                else:
-                    # Prefix matching at 0.5x weight for fuzzy search
-                    for doc_tok in doc.tf:
-                        if doc_tok.startswith(qt) or qt.startswith(doc_tok):
-                            df = self._df.get(doc_tok, 0)
-                            idf = math.log((n - df + 0.5) / (df + 0.5) + 1.0)
-                            partial_tf = doc.tf[doc_tok]
-                            tf_norm = (partial_tf * (self._k1 + 1)) / (
-                                partial_tf + self._k1 * (1 - self._b + self._b * dl / self._avgdl)
-                            )
-                            term_score = idf * tf_norm * 0.5
-
-                            if doc_tok in name_set:
-                                term_score *= 1.5
-                            if doc_tok in param_set:
-                                term_score *= 1.2
-
-                            score += term_score
-                            break  # best prefix match per query token
-
-            if score > threshold:
-                scores.append((doc.name, score))
-
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores[:max_results]
+        if not self._built:
+            self.build()
+
+        scores: dict[int, float] = {}
+        for qt in query_tokens:
+            exact = self._postings.get(qt, [])
+            for doc_id, _order, term_score, _prefix in exact:
+                scores[doc_id] = scores.get(doc_id, 0.0) + term_score
+
+            # Documents without the exact token get prefix matching at 0.5x
+            # weight for fuzzy search: the match that occurs first in the
+            # document wins.
+            has_exact = {posting[0] for posting in exact}
+            best: dict[int, tuple[int, float]] = {}
+            for tok in self._prefix_matches(qt):
+                for doc_id, order, _exact, term_score in self._postings[tok]:
+                    if doc_id in has_exact:
+                        continue
+                    current = best.get(doc_id)
+                    if current is None or order < current[0]:
+                        best[doc_id] = (order, term_score)
+            for doc_id, (_order, term_score) in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + term_score
+
+        doc_ids = range(len(self._names)) if threshold < 0 else sorted(scores)
+        results = [
+            (self._names[d], scores.get(d, 0.0)) for d in doc_ids if scores.get(d, 0.0) > threshold
+        ]
+        results.sort(key=lambda x: x[1], reverse=True)
+        return results[:max_results]
+
+    # -- persistence ---------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise the index to JSON-compatible data (see :meth:`from_dict`)."""
+        return {
+            "names": self._names,
+            "lengths": self._lengths,
+            "postings": {tok: [list(p) for p in raw] for tok, raw in self._raw.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _BM25Index:
+        """Rebuild an index from :meth:`to_dict` output without re-tokenising.
+
+        Raises ``KeyError``, ``TypeError``, ``ValueError`` or ``IndexError``
+        on malformed data.
+        """
+        index = cls()
+        index._names = list(data["names"])
+        index._lengths = list(data["lengths"])
+        if len(index._names) != len(index._lengths):
+            raise ValueError("names and lengths differ in length")
+        index._raw = {
+            tok: [(d, tf, o, f) for d, tf, o, f in raw] for tok, raw in data["postings"].items()
+        }
+        index.build()
+        return index
 
 
 # ---------------------------------------------------------------------------
@@ -182,6 +220,10 @@ class ToolSearchManager:
 
     Thread-safe: ``_discovered`` is protected by a lock for daemon-mode
     concurrency.  The catalog uses double-checked locking for one-time init.
+
+    With ``persist_index`` the built index is cached next to the MCP schema
+    cache, keyed by a hash of the catalog, so later processes serving the same
+    tools load it instead of re-tokenising every description.
     """
 
     def __init__(
@@ -189,10 +231,13 @@ class ToolSearchManager:
         always_available: list[str],
         max_results: int = 5,
         threshold: float = 0.0,
+        *,
+        persist_index: bool = False,
     ) -> None:
         self._always_available = set(always_available)
         self._max_results = max_results
         self._threshold = threshold
+        self._persist_index = persist_index
 
         self._lock = threading.Lock()
         self._discovered: set[str] = set()
@@ -210,18 +255,42 @@ class ToolSearchManager:
         with self._catalog_lock:
             if self._catalog is not None:
                 return  # pragma: no cover - race window
-            index = _BM25Index()
-            names: set[str] = set()
+            catalog: list[tuple[str, str, list[str]]] = []
             for td in tool_defs:
                 # Skip the search_tools meta-tool itself
                 if td.name == "search_tools":
                     continue
                 params = list(td.parameters_json_schema.get("properties", {}).keys())
-                index.add(td.name, td.description or "", params)
-                names.add(td.name)
-            index.build()
-            self._catalog = index
-            self._catalog_names = names
+                catalog.append((td.name, td.description or "", params))
+            self._catalog = self._load_or_build_index(catalog)
+            self._catalog_names = {name for name, _, _ in catalog}
+
+    def _load_or_build_index(self, catalog: list[tuple[str, str, list[str]]]) -> _BM25Index:
+        key = None
+        if self._persist_index:
+            from initrunner.mcp._cache import read_search_index, search_index_key
+
+            key = search_index_key(catalog)
+            data = read_search_index(key)
+            if data is not None:
+                try:
+                    return _BM25Index.from_dict(data)
+                except (KeyError, TypeError, ValueError, IndexError, AttributeError):
+                    _logger.debug("Invalid cached tool search index %s, rebuilding", key)
+
+        index = _BM25Index()
+        for name, description, params in catalog:
+            index.add(name, description, params)
+        index.build()
+
+        if key is not None:
+            from initrunner.mcp._cache import write_search_index
+
+            try:
+                write_search_index(key, index.to_dict())
+            except OSError as e:
+                _logger.debug("Could not cache tool search index: %s", e)
+        return index
 
     # -- search --------------------------------------------------------------
 
@@ -0,0 +1,290 @@
+"""Per-day usage rollups maintained alongside ``audit_log``.
+
+``usage_rollup`` holds one row per (day, agent, model, provider) and
+``tool_rollup`` one per (day, agent, model, provider, tool). Both are kept
+current by triggers on ``audit_log``, so every insert, prune and delete --
+from this process, another one, or a raw ``sqlite3`` session -- updates them
+in the same transaction as the row change.
+
+``day`` is the first ten characters of the row's timestamp. The logger writes
+UTC ISO-8601 timestamps, so that is the UTC calendar date and compares the
+same way the ``timestamp >= ?`` filters do.
+
+Report queries answer a ``since``/``until`` window from the rollups for every
+day strictly inside it and from ``audit_log`` only for the (at most two) days
+the window cuts through, see :func:`split_window`.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+DAY_EXPR = "substr(timestamp, 1, 10)"
+
+_CREATE_USAGE_ROLLUP = """\
+CREATE TABLE IF NOT EXISTS usage_rollup (
+    day TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    model TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    run_count INTEGER NOT NULL DEFAULT 0,
+    success_count INTEGER NOT NULL DEFAULT 0,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    total_tokens INTEGER NOT NULL DEFAULT 0,
+    thinking_tokens INTEGER NOT NULL DEFAULT 0,
+    reasoning_tokens INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, agent_name, model, provider)
+) WITHOUT ROWID;
+"""
+
+_CREATE_TOOL_ROLLUP = """\
+CREATE TABLE IF NOT EXISTS tool_rollup (
+    day TEXT NOT NULL,
+    agent_name TEXT NOT NULL,
+    model TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    tool_name TEXT NOT NULL,
+    usage_count INTEGER NOT NULL DEFAULT 0,
+    run_count INTEGER NOT NULL DEFAULT 0,
+    tokens_in INTEGER NOT NULL DEFAULT 0,
+    tokens_out INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, agent_name, model, provider, tool_name)
+) WITHOUT ROWID;
+"""
+
+_CREATE_ROLLUP_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_usage_rollup_agent ON usage_rollup (agent_name, day);",
+    "CREATE INDEX IF NOT EXISTS idx_tool_rollup_agent ON tool_rollup (agent_name, day);",
+]
+
+# json_each() raises on malformed JSON, which inside a trigger would abort the
+# audit insert itself, so invalid tool_names are treated as an empty list.
+_TOOLS = "json_each(CASE WHEN json_valid({r}.tool_names) THEN {r}.tool_names ELSE '[]' END)"
+_KEY = (
+    "day = substr({r}.timestamp, 1, 10) AND agent_name = {r}.agent_name"
+    " AND model = {r}.model AND provider = {r}.provider"
+)
+
+
+def _add_sql(r: str) -> str:
+    return f"""\
+    INSERT INTO usage_rollup (
+        day, agent_name, model, provider, run_count, success_count, tokens_in,
+        tokens_out, total_tokens, thinking_tokens, reasoning_tokens, duration_ms
+    ) VALUES (
+        substr({r}.timestamp, 1, 10), {r}.agent_name, {r}.model, {r}.provider, 1,
+        CASE WHEN {r}.success THEN 1 ELSE 0 END, {r}.tokens_in, {r}.tokens_out,
+        {r}.total_tokens, {r}.thinking_tokens, {r}.reasoning_tokens, {r}.duration_ms
+    )
+    ON CONFLICT (day, agent_name, model, provider) DO UPDATE SET
+        run_count = run_count + 1,
+        success_count = success_count + excluded.success_count,
+        tokens_in = tokens_in + excluded.tokens_in,
+        tokens_out = tokens_out + excluded.tokens_out,
+        total_tokens = total_tokens + excluded.total_tokens,
+        thinking_tokens = thinking_tokens + excluded.thinking_tokens,
+        reasoning_tokens = reasoning_tokens + excluded.reasoning_tokens,
+        duration_ms = duration_ms + excluded.duration_ms;
+    INSERT INTO tool_rollup (
+        day, agent_name, model, provider, tool_name, usage_count, run_count,
+        tokens_in, tokens_out
+    )
+    SELECT substr({r}.timestamp, 1, 10), {r}.agent_name, {r}.model, {r}.provider,
+           je.value, COUNT(*), 1, {r}.tokens_in, {r}.tokens_out
+    FROM {_TOOLS.format(r=r)} je
+    WHERE je.value IS NOT NULL
+    GROUP BY je.value
+    ON CONFLICT (day, agent_name, model, provider, tool_name) DO UPDATE SET
+        usage_count = usage_count + excluded.usage_count,
+        run_count = run_count + 1,
+        tokens_in = tokens_in + excluded.tokens_in,
+        tokens_out = tokens_out + excluded.tokens_out;
+"""
+
+
+def _sub_sql(r: str) -> str:
+    key = _KEY.format(r=r)
+    return f"""\
+    UPDATE usage_rollup SET
+        run_count = run_count - 1,
+        success_count = success_count - (CASE WHEN {r}.success THEN 1 ELSE 0 END),
+        tokens_in = tokens_in - {r}.tokens_in,
+        tokens_out = tokens_out - {r}.tokens_out,
+        total_tokens = total_tokens - {r}.total_tokens,
+        thinking_tokens = thinking_tokens - {r}.thinking_tokens,
+        reasoning_tokens = reasoning_tokens - {r}.reasoning_tokens,
+        duration_ms = duration_ms - {r}.duration_ms
+    WHERE {key};
+    DELETE FROM usage_rollup WHERE {key} AND run_count <= 0;
+    UPDATE tool_rollup SET
+        usage_count = usage_count - (
+            SELECT COUNT(*) FROM {_TOOLS.format(r=r)} je WHERE je.value = tool_rollup.tool_name
+        ),
+        run_count = run_count - 1,
+        tokens_in = tokens_in - {r}.tokens_in,
+        tokens_out = tokens_out - {r}.tokens_out
+    WHERE {key} AND tool_name IN (SELECT je.value FROM {_TOOLS.format(r=r)} je);
+    DELETE FROM tool_rollup WHERE {key} AND run_count <= 0;
+"""
+
+
+# Columns that feed a rollup; updates touching only other columns (hashes,
+# timelines, verdicts) do not fire the update trigger.
+_ROLLUP_COLUMNS = (
+    "timestamp, agent_name, model, provider, success, tokens_in, tokens_out, "
+    "total_tokens, thinking_tokens, reasoning_tokens, duration_ms, tool_names"
+)
+
+_CREATE_TRIGGERS = [
+    f"""\
+CREATE TRIGGER IF NOT EXISTS trg_audit_rollup_insert AFTER INSERT ON audit_log
+BEGIN
+{_add_sql("NEW")}END;
+""",
+    f"""\
+CREATE TRIGGER IF NOT EXISTS trg_audit_rollup_delete AFTER DELETE ON audit_log
+BEGIN
+{_sub_sql("OLD")}END;
+""",
+    f"""\
+CREATE TRIGGER IF NOT EXISTS trg_audit_rollup_update
+AFTER UPDATE OF {_ROLLUP_COLUMNS} ON audit_log
+BEGIN
+{_sub_sql("OLD")}{_add_sql("NEW")}END;
+""",
+]
+
+_REBUILD_USAGE = f"""\
+INSERT INTO usage_rollup (
+    day, agent_name, model, provider, run_count, success_count, tokens_in,
+    tokens_out, total_tokens, thinking_tokens, reasoning_tokens, duration_ms
+)
+SELECT {DAY_EXPR}, agent_name, model, provider, COUNT(*),
+       SUM(CASE WHEN success THEN 1 ELSE 0 END), SUM(tokens_in), SUM(tokens_out),
+       SUM(total_tokens), SUM(thinking_tokens), SUM(reasoning_tokens), SUM(duration_ms)
+FROM audit_log
+GROUP BY {DAY_EXPR}, agent_name, model, provider;
+"""
+
+_REBUILD_TOOLS = """\
+INSERT INTO tool_rollup (
+    day, agent_name, model, provider, tool_name, usage_count, run_count,
+    tokens_in, tokens_out
+)
+SELECT day, agent_name, model, provider, tool_name, SUM(calls), COUNT(*),
+       SUM(tokens_in), SUM(tokens_out)
+FROM (
+    SELECT substr(a.timestamp, 1, 10) AS day, a.agent_name, a.model, a.provider,
+           je.value AS tool_name, COUNT(*) AS calls, a.tokens_in, a.tokens_out
+    FROM audit_log a,
+         json_each(CASE WHEN json_valid(a.tool_names) THEN a.tool_names ELSE '[]' END) je
+    WHERE a.tool_names IS NOT NULL AND je.value IS NOT NULL
+    GROUP BY a.id, je.value
+)
+GROUP BY day, agent_name, model, provider, tool_name;
+"""
+
+
+def rebuild_rollups(conn: sqlite3.Connection) -> None:
+    """Recompute both rollup tables from ``audit_log``. Caller owns the transaction."""
+    conn.execute("DELETE FROM usage_rollup")
+    conn.execute("DELETE FROM tool_rollup")
+    conn.execute(_REBUILD_USAGE)
+    conn.execute(_REBUILD_TOOLS)
+
+
+def migrate_add_rollups(conn: sqlite3.Connection) -> None:
+    """Create the rollup tables and triggers, backfilling them on first creation.
+
+    Runs in one BEGIN IMMEDIATE transaction so a concurrent writer cannot
+    insert between the backfill and the trigger that would have counted it.
+    """
+    existing = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_audit_rollup_update'"
+    ).fetchone()
+    if existing:
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(_CREATE_USAGE_ROLLUP)
+        conn.execute(_CREATE_TOOL_ROLLUP)
+        for idx in _CREATE_ROLLUP_INDEXES:
+            conn.execute(idx)
+        for trigger in _CREATE_TRIGGERS:
+            conn.execute(trigger)
+        rebuild_rollups(conn)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+@dataclass(frozen=True)
+class Window:
+    """A ``since``/``until`` window split into rollup days and raw edge ranges.
+
+    ``rollup_where``/``rollup_params`` select the fully covered days from a
+    rollup table. ``raw_where``/``raw_params`` select the ``audit_log`` rows
+    the rollups do not cover (exact ``since``/``until`` filters included);
+    ``raw_where`` is None when no raw scan is needed.
+    """
+
+    rollup_where: list[str]
+    rollup_params: list[object]
+    raw_where: list[str] | None
+    raw_params: list[object]
+
+
+def _day(value: str) -> str | None:
+    try:
+        return date.fromisoformat(value[:10]).isoformat()
+    except ValueError:
+        return None
+
+
+def split_window(since: str | None, until: str | None) -> Window | None:
+    """Split a timestamp window into rollup and raw parts.
+
+    Days strictly after ``since``'s day and strictly before ``until``'s day
+    come from the rollups; rows on those two edge days are read from
+    ``audit_log`` with the exact timestamp filters. Returns None when a bound
+    is not an ISO date the split can reason about -- callers then fall back to
+    scanning ``audit_log``.
+    """
+    rollup_where: list[str] = []
+    rollup_params: list[object] = []
+    raw_exact: list[str] = []
+    raw_exact_params: list[object] = []
+    edges: list[str] = []
+    edge_params: list[object] = []
+
+    if since is not None:
+        since_day = _day(since)
+        if since_day is None:
+            return None
+        rollup_where.append("day > ?")
+        rollup_params.append(since_day)
+        raw_exact.append("timestamp >= ?")
+        raw_exact_params.append(since)
+        next_day = (date.fromisoformat(since_day) + timedelta(days=1)).isoformat()
+        edges.append("timestamp < ?")
+        edge_params.append(next_day)
+    if until is not None:
+        until_day = _day(until)
+        if until_day is None:
+            return None
+        rollup_where.append("day < ?")
+        rollup_params.append(until_day)
+        raw_exact.append("timestamp <= ?")
+        raw_exact_params.append(until)
+        edges.append("timestamp >= ?")
+        edge_params.append(until_day)
+
+    if not edges:
+        return Window(rollup_where, rollup_params, None, [])
+    raw_where = [*raw_exact, "(" + " OR ".join(edges) + ")"]
+    return Window(rollup_where, rollup_params, raw_where, [*raw_exact_params, *edge_params])
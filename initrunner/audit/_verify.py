@@ -0,0 +1,267 @@
+"""Chain walking, checkpoints and parallel segments for ``verify_chain``.
+
+:func:`walk` is the single row-by-row verifier. Sequential verification runs
+it once over the whole table (or everything after a checkpoint); parallel
+verification runs it over contiguous id segments in worker processes, each
+starting "cold" at its first signed row, and :func:`stitch` then checks every
+segment's first link against the previous segment's tip exactly as the
+sequential walk would have.
+
+Checkpoints record the last verified (id, hash) pair with an HMAC under the
+chain key, so a checkpoint row forged without the key is ignored rather than
+used to skip verification.
+"""
+
+from __future__ import annotations
+
+import hmac
+import sqlite3
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from hashlib import sha256
+
+from initrunner.audit._hmac import canonical_serialize, compute_record_hash
+
+_FETCH_SIZE = 500
+_KEEP_CHECKPOINTS = 10
+
+_CREATE_CHECKPOINTS_TABLE = """\
+CREATE TABLE IF NOT EXISTS chain_checkpoints (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    last_id INTEGER NOT NULL,
+    last_hash TEXT NOT NULL,
+    signature TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class Walk:
+    """Result of walking one contiguous run of rows.
+
+    Counts include the breaking row in ``total_rows`` (it was read) but not
+    in ``verified_rows``. ``leading_legacy``/``first_signed_*`` describe how
+    the walk started, which :func:`stitch` needs to link segments.
+    """
+
+    total_rows: int = 0
+    legacy_rows: int = 0
+    verified_rows: int = 0
+    first_row_id: int | None = None
+    leading_legacy: int = 0
+    first_signed_id: int | None = None
+    first_prev_hash: str | None = None
+    last_id: int | None = None
+    last_hash: str | None = None
+    last_row_id: int | None = None
+    pruned_gaps: list[int] = field(default_factory=list)
+    break_id: int | None = None
+    break_reason: str | None = None
+
+
+def _checkpoint_signature(key: bytes, last_id: int, last_hash: str) -> str:
+    return hmac.new(key, f"checkpoint:{last_id}:{last_hash}".encode("ascii"), sha256).hexdigest()
+
+
+def walk(
+    rows: Iterable[sqlite3.Row],
+    key: bytes,
+    fields: Sequence[str],
+    *,
+    chain_started: bool = False,
+    expected_prev_hash: str | None = None,
+    prev_row_id: int | None = None,
+) -> Walk:
+    """Verify *rows* in id order, continuing from the given chain state.
+
+    Legacy rows (NULL hashes) before the first signed row are tolerated. A
+    NULL hash after the chain has started is a break. id gaps with a matching
+    prev_hash mismatch are treated as pruning (informational).
+    """
+    w = Walk()
+    for row in rows:
+        w.total_rows += 1
+        row_id = row["id"]
+        stored_record_hash = row["record_hash"]
+        stored_prev_hash = row["prev_hash"]
+        if w.first_row_id is None:
+            w.first_row_id = row_id
+
+        if stored_record_hash is None:
+            if chain_started:
+                w.break_id, w.break_reason = row_id, "missing_hash_after_chain_start"
+                return w
+            w.legacy_rows += 1
+            prev_row_id = w.last_row_id = row_id
+            continue
+
+        if w.first_signed_id is None:
+            w.first_signed_id = row_id
+            w.first_prev_hash = stored_prev_hash
+            w.leading_legacy = w.legacy_rows
+        if not chain_started:
+            chain_started = True
+            expected_prev_hash = stored_prev_hash
+
+        if stored_prev_hash != expected_prev_hash:
+            if prev_row_id is not None and row_id != prev_row_id + 1:
+                w.pruned_gaps.append(row_id)
+                expected_prev_hash = stored_prev_hash
+            else:
+                w.break_id, w.break_reason = row_id, "prev_hash_mismatch"
+                return w
+
+        record_dict = {f: row[f] for f in fields}
+        record_dict["success"] = bool(record_dict["success"])
+        serialized = canonical_serialize(record_dict, fields)
+        if compute_record_hash(key, expected_prev_hash, serialized) != stored_record_hash:
+            w.break_id, w.break_reason = row_id, "hash_mismatch"
+            return w
+
+        w.verified_rows += 1
+        w.last_id = row_id
+        w.last_hash = stored_record_hash
+        expected_prev_hash = stored_record_hash
+        prev_row_id = w.last_row_id = row_id
+    if w.first_signed_id is None:
+        w.leading_legacy = w.legacy_rows
+    return w
+
+
+def iter_rows(
+    conn: sqlite3.Connection,
+    fields: Sequence[str],
+    lo: int | None = None,
+    hi: int | None = None,
+) -> Iterable[sqlite3.Row]:
+    """Yield audit_log rows with ``lo <= id <= hi`` in id order, in batches."""
+    clauses: list[str] = []
+    params: list[object] = []
+    if lo is not None:
+        clauses.append("id >= ?")
+        params.append(lo)
+    if hi is not None:
+        clauses.append("id <= ?")
+        params.append(hi)
+    where = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+    cols = ", ".join(("id", *fields, "prev_hash", "record_hash"))
+    cursor = conn.execute(f"SELECT {cols} FROM audit_log {where} ORDER BY id ASC", params)
+    while True:
+        batch = cursor.fetchmany(_FETCH_SIZE)
+        if not batch:
+            return
+        yield from batch
+
+
+def verify_segment(db_uri: str, key: bytes, fields: Sequence[str], lo: int, hi: int) -> Walk:
+    """Process-pool entry point: walk ids ``lo..hi`` over a private read-only connection."""
+    conn = sqlite3.connect(db_uri, uri=True, timeout=30)
+    try:
+        conn.row_factory = sqlite3.Row
+        return walk(iter_rows(conn, fields, lo, hi), key, fields)
+    finally:
+        conn.close()
+
+
+def split_range(lo: int, hi: int, segments: int) -> list[tuple[int, int]]:
+    """Split the inclusive id range ``lo..hi`` into at most *segments* contiguous spans."""
+    span = hi - lo + 1
+    segments = max(1, min(segments, span))
+    step, extra = divmod(span, segments)
+    out: list[tuple[int, int]] = []
+    start = lo
+    for i in range(segments):
+        end = start + step - 1 + (1 if i < extra else 0)
+        out.append((start, end))
+        start = end + 1
+    return out
+
+
+def stitch(
+    segments: Sequence[Walk],
+    *,
+    chain_started: bool = False,
+    expected_prev_hash: str | None = None,
+    prev_row_id: int | None = None,
+) -> Walk:
+    """Combine independently walked, id-ordered segments into one result.
+
+    Each segment verified its own rows starting cold at its first signed row.
+    Here that first row is checked against the running tip exactly as
+    :func:`walk` would have, and the first break in id order wins.
+    """
+    out = Walk()
+    for seg in segments:
+        if seg.first_row_id is None:
+            continue
+        if chain_started and seg.leading_legacy:
+            out.total_rows += 1
+            out.break_id, out.break_reason = seg.first_row_id, "missing_hash_after_chain_start"
+            return out
+        if chain_started and seg.first_signed_id is not None:
+            if seg.first_prev_hash != expected_prev_hash:
+                if prev_row_id is not None and seg.first_signed_id != prev_row_id + 1:
+                    out.pruned_gaps.append(seg.first_signed_id)
+                else:
+                    out.total_rows += 1
+                    out.break_id, out.break_reason = seg.first_signed_id, "prev_hash_mismatch"
+                    return out
+
+        out.total_rows += seg.total_rows
+        out.legacy_rows += seg.legacy_rows
+        out.verified_rows += seg.verified_rows
+        out.pruned_gaps.extend(seg.pruned_gaps)
+        if seg.last_id is not None:
+            out.last_id, out.last_hash = seg.last_id, seg.last_hash
+            expected_prev_hash = seg.last_hash
+        if seg.first_signed_id is not None:
+            chain_started = True
+        if seg.break_id is not None:
+            out.break_id, out.break_reason = seg.break_id, seg.break_reason
+            return out
+        prev_row_id = seg.last_row_id
+    return out
+
+
+# -- checkpoints ---------------------------------------------------------------
+
+
+def ensure_checkpoint_table(conn: sqlite3.Connection) -> None:
+    conn.execute(_CREATE_CHECKPOINTS_TABLE)
+
+
+def load_checkpoint(conn: sqlite3.Connection, key: bytes) -> tuple[int, str] | None:
+    """Return the newest (last_id, last_hash) whose signature checks out under *key*."""
+    try:
+        rows = conn.execute(
+            "SELECT last_id, last_hash, signature FROM chain_checkpoints ORDER BY id DESC LIMIT ?",
+            (_KEEP_CHECKPOINTS,),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return None  # table not created yet (read-only connection to an old DB)
+    for last_id, last_hash, signature in rows:
+        expected = _checkpoint_signature(key, last_id, last_hash)
+        if hmac.compare_digest(expected, signature):
+            return last_id, last_hash
+    return None
+
+
+def save_checkpoint(conn: sqlite3.Connection, key: bytes, last_id: int, last_hash: str) -> None:
+    """Append a signed checkpoint and keep only the newest few."""
+    conn.execute(
+        "INSERT INTO chain_checkpoints (created_at, last_id, last_hash, signature)"
+        " VALUES (?, ?, ?, ?)",
+        (
+            datetime.now(UTC).isoformat(),
+            last_id,
+            last_hash,
+            _checkpoint_signature(key, last_id, last_hash),
+        ),
+    )
+    conn.execute(
+        "DELETE FROM chain_checkpoints WHERE id NOT IN "
+        "(SELECT id FROM chain_checkpoints ORDER BY id DESC LIMIT ?)",
+        (_KEEP_CHECKPOINTS,),
+    )
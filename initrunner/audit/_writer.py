@@ -0,0 +1,250 @@
+"""Background batched writer for AuditLogger.
+
+``log()`` enqueues into a bounded queue and a single writer thread drains it,
+handing each batch to a callback that signs and commits the whole batch in
+one SQLite transaction. One writer thread means batches reach the chain in
+enqueue order, so ``verify_chain`` sees the same chain a synchronous logger
+would have written.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from initrunner._log import get_logger
+
+if TYPE_CHECKING:
+    from initrunner.audit.logger import AuditRecord
+
+logger = get_logger("audit.writer")
+
+OverflowPolicy = Literal["block", "drop"]
+
+_DEFAULT_QUEUE_SIZE = 1000
+_DEFAULT_BATCH_SIZE = 100
+_BLOCK_WARN_SECONDS = 5.0
+_DROP_WARN_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class AuditWriterStats:
+    """Snapshot of the background writer's counters."""
+
+    queue_depth: int
+    max_queue_depth: int
+    enqueued: int
+    written: int
+    dropped: int
+    failed: int
+    batches: int
+    last_batch_size: int
+    max_batch_size: int
+
+    @property
+    def avg_batch_size(self) -> float:
+        return self.written / self.batches if self.batches else 0.0
+
+
+class _FlushMarker:
+    """Queue item that releases a flush() caller once everything before it is written."""
+
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class BackgroundAuditWriter:
+    """Single-thread writer that drains queued records in batches.
+
+    *write_batch* receives records in enqueue order and must write them in
+    one transaction. It may raise; the batch is then written again one
+    record at a time, so only the records that still fail are counted as
+    failed and logged. This matches the never-raises contract of
+    ``AuditLogger.log()``.
+
+    Backpressure when the queue is full: ``"block"`` waits for room (the
+    audit trail stays complete at the cost of caller latency), ``"drop"``
+    discards the record, counts it and logs a warning with the number
+    dropped, at most once every few seconds.
+    """
+
+    def __init__(
+        self,
+        write_batch: Callable[[list[AuditRecord]], None],
+        *,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        overflow: OverflowPolicy = "block",
+    ) -> None:
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if overflow not in ("block", "drop"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        self._write_batch = write_batch
+        self._batch_size = batch_size
+        self._overflow = overflow
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=queue_size)
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_batch = 0
+        self._max_batch = 0
+        self._max_depth = 0
+        # overflow drops not yet reported in a warning, and when the next may be
+        self._unreported_drops = 0
+        self._next_drop_warning = 0.0
+        self._thread = threading.Thread(target=self._run, daemon=True, name="audit-writer")
+        self._thread.start()
+
+    # -- producer side -------------------------------------------------------
+
+    def submit(self, record: AuditRecord) -> bool:
+        """Queue *record* for writing. Returns False if it was dropped."""
+        if self._closed:
+            logger.error("Audit writer is closed; dropping record %s", record.run_id)
+            self._count_drop()
+            return False
+        if self._overflow == "drop":
+            try:
+                self._queue.put_nowait(record)
+            except queue.Full:
+                self._count_drop()
+                self._warn_dropped()
+                return False
+        else:
+            try:
+                self._queue.put(record, timeout=_BLOCK_WARN_SECONDS)
+            except queue.Full:
+                logger.warning(
+                    "Audit writer queue full for %.0fs; caller blocked on backpressure",
+                    _BLOCK_WARN_SECONDS,
+                )
+                self._queue.put(record)
+        depth = self._queue.qsize()
+        with self._stats_lock:
+            self._enqueued += 1
+            self._max_depth = max(self._max_depth, depth)
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every record queued before this call is committed.
+
+        Returns False if *timeout* elapsed first or the writer is closed.
+        """
+        if self._closed or not self._thread.is_alive():
+            return False
+        marker = _FlushMarker()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return marker.done.wait(remaining)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Drain the queue, stop the writer thread and wait for it to exit."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Audit writer did not drain within %ss", timeout)
+        self._warn_dropped(final=True)
+
+    def stats(self) -> AuditWriterStats:
+        with self._stats_lock:
+            return AuditWriterStats(
+                queue_depth=self._queue.qsize(),
+                max_queue_depth=self._max_depth,
+                enqueued=self._enqueued,
+                written=self._written,
+                dropped=self._dropped,
+                failed=self._failed,
+                batches=self._batches,
+                last_batch_size=self._last_batch,
+                max_batch_size=self._max_batch,
+            )
+
+    def _count_drop(self) -> None:
+        with self._stats_lock:
+            self._dropped += 1
+
+    def _warn_dropped(self, *, final: bool = False) -> None:
+        """Log overflow drops since the last warning, rate-limited unless *final*."""
+        with self._stats_lock:
+            if not final:
+                self._unreported_drops += 1
+            now = time.monotonic()
+            if not self._unreported_drops or (not final and now < self._next_drop_warning):
+                return
+            count, self._unreported_drops = self._unreported_drops, 0
+            self._next_drop_warning = now + _DROP_WARN_SECONDS
+            total = self._dropped
+        logger.warning("Audit writer queue full; dropped %d record(s) (%d in total)", count, total)
+
+    # -- writer thread -------------------------------------------------------
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            batch: list[AuditRecord] = []
+            markers: list[_FlushMarker] = []
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, _FlushMarker):
+                    # Everything queued before the marker is already in
+                    # `batch`, so it is released once this batch commits.
+                    markers.append(item)
+                else:
+                    batch.append(item)  # type: ignore[arg-type]
+                if stop or len(batch) >= self._batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                self._commit(batch)
+            for marker in markers:
+                marker.done.set()
+
+    def _commit(self, batch: list[AuditRecord]) -> None:
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error("Failed to write audit record %s: %s", batch[0].run_id, e)
+                with self._stats_lock:
+                    self._failed += 1
+                return
+            # Isolate the bad record(s) instead of losing the whole batch.
+            logger.warning(
+                "Failed to write batch of %d audit records, retrying singly: %s", len(batch), e
+            )
+            for record in batch:
+                self._commit([record])
+            return
+        with self._stats_lock:
+            self._written += len(batch)
+            self._batches += 1
+            self._last_batch = len(batch)
+            self._max_batch = max(self._max_batch, len(batch))
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import queue
 import sqlite3
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -22,6 +26,19 @@ from initrunner.audit._hmac import (
     load_or_create_hmac_key,
 )
 from initrunner.audit._redact import scrub_secrets
+from initrunner.audit._rollups import migrate_add_rollups, rebuild_rollups, split_window
+from initrunner.audit._verify import (
+    Walk,
+    ensure_checkpoint_table,
+    iter_rows,
+    load_checkpoint,
+    save_checkpoint,
+    split_range,
+    stitch,
+    verify_segment,
+    walk,
+)
+from initrunner.audit._writer import AuditWriterStats, BackgroundAuditWriter, OverflowPolicy
 
 if TYPE_CHECKING:
     from initrunner.agent.executor import RunResult
@@ -46,6 +63,12 @@ class ChainVerifyResult:
       - "key_missing"                    no env var and no key file
       - "key_invalid"                    env var/key file malformed
       - "query_error"                    SQLite error reading the chain
+      - "checkpoint_mismatch"            the row a checkpoint vouched for now
+                                         carries a different hash
+
+    `resumed_from_id` is the checkpoint id an incremental verify started
+    after (counts then cover only the rows past it); `elapsed_s` is the
+    wall time of the walk.
     """
 
     ok: bool
@@ -57,6 +80,12 @@ class ChainVerifyResult:
     pruned_gaps: tuple[int, ...]
     first_break_id: int | None
     first_break_reason: str | None
+    resumed_from_id: int | None = None
+    elapsed_s: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.total_rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
 
 
 @dataclass
@@ -249,6 +278,31 @@ WHERE record_hash IS NOT NULL
 ORDER BY id DESC LIMIT 1;
 """
 
+# Rollup-shaped row sources for the cost/stats queries (see _rollups.py).
+_USAGE_COLS = (
+    "day, agent_name, model, provider, run_count, success_count, tokens_in, tokens_out, "
+    "total_tokens, thinking_tokens, reasoning_tokens, duration_ms"
+)
+
+_USAGE_RAW_SELECT = """\
+SELECT substr(timestamp, 1, 10) AS day, agent_name, model, provider, 1 AS run_count,
+       CASE WHEN success THEN 1 ELSE 0 END AS success_count, tokens_in, tokens_out,
+       total_tokens, thinking_tokens, reasoning_tokens, duration_ms
+FROM audit_log {where}"""
+
+_TOOL_COLS = (
+    "day, agent_name, model, provider, tool_name, usage_count, run_count, tokens_in, tokens_out"
+)
+
+_TOOL_RAW_SELECT = """\
+SELECT substr(timestamp, 1, 10) AS day, agent_name, model, provider,
+       je.value AS tool_name, COUNT(*) AS usage_count, 1 AS run_count, tokens_in, tokens_out
+FROM audit_log a,
+     json_each(CASE WHEN json_valid(a.tool_names) THEN a.tool_names ELSE '[]' END) je
+{where}
+GROUP BY a.id, je.value
+HAVING je.value IS NOT NULL"""
+
 _CREATE_SECURITY_EVENTS_TABLE = """\
 CREATE TABLE IF NOT EXISTS security_events (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -417,6 +471,42 @@ ORDER BY rowid DESC LIMIT 1;
 
 _DELETE_FLOW_CHECKPOINTS = "DELETE FROM flow_checkpoints WHERE flow_run_id = ?;"
 
+_CREATE_SINK_OUTBOX_TABLE = """\
+CREATE TABLE IF NOT EXISTS sink_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sink_key TEXT NOT NULL,
+    payload_json TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    owner TEXT,
+    lease_until REAL
+);
+"""
+
+_CREATE_SINK_OUTBOX_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_sink_outbox_key ON sink_outbox (sink_key, id);",
+]
+
+_INSERT_SINK_OUTBOX = """\
+INSERT INTO sink_outbox (sink_key, payload_json, created_at, owner, lease_until)
+VALUES (?, ?, ?, ?, ?);
+"""
+
+_SELECT_UNLEASED_SINK_OUTBOX = """\
+SELECT * FROM sink_outbox
+WHERE sink_key = ? AND (lease_until IS NULL OR lease_until < ?)
+ORDER BY id ASC LIMIT ?;
+"""
+
+_CLAIM_SINK_OUTBOX = "UPDATE sink_outbox SET owner = ?, lease_until = ? WHERE id = ?;"
+
+_RENEW_SINK_OUTBOX = "UPDATE sink_outbox SET lease_until = ? WHERE owner = ?;"
+
+_RELEASE_SINK_OUTBOX = """\
+UPDATE sink_outbox SET owner = NULL, lease_until = NULL WHERE owner = ?;
+"""
+
+_DELETE_SINK_OUTBOX = "DELETE FROM sink_outbox WHERE id = ?;"
+
 # Fields hashed into the per-checkpoint HMAC chain, in canonical order.
 _CHECKPOINT_HASH_FIELDS = [
     "flow_run_id",
@@ -466,6 +556,18 @@ class PendingApprovalRecord:
     decision: str | None = None  # "approve" | "deny"
 
 
+@dataclass
+class SinkOutboxRecord:
+    """One sink delivery persisted until it succeeds or exhausts its retries."""
+
+    id: int
+    sink_key: str
+    payload_json: str
+    created_at: str
+    owner: str | None = None
+    lease_until: float | None = None
+
+
 def _default_db_path() -> Path:
     from initrunner.config import get_audit_db_path
 
@@ -644,6 +746,18 @@ def _row_to_pending(row: sqlite3.Row) -> PendingApprovalRecord:
     )
 
 
+def _row_to_sink_outbox(row: sqlite3.Row) -> SinkOutboxRecord:
+    """Convert a sqlite3.Row to a SinkOutboxRecord."""
+    return SinkOutboxRecord(
+        id=row["id"],
+        sink_key=row["sink_key"],
+        payload_json=row["payload_json"],
+        created_at=row["created_at"],
+        owner=row["owner"],
+        lease_until=row["lease_until"],
+    )
+
+
 def _row_to_record(row: sqlite3.Row) -> AuditRecord:
     """Convert a sqlite3.Row to an AuditRecord."""
     return AuditRecord(
@@ -706,6 +820,37 @@ def record_to_dict(record: AuditRecord, *, parse_trigger_metadata: bool = False)
     return d
 
 
+def _scrub_record(record: AuditRecord) -> AuditRecord:
+    """Return a copy of *record* with secrets scrubbed from free-text fields."""
+    return dataclasses.replace(
+        record,
+        user_prompt=scrub_secrets(record.user_prompt),
+        output=scrub_secrets(record.output),
+        error=scrub_secrets(record.error) if record.error else record.error,
+    )
+
+
+def _chain_failure(
+    reason: str,
+    *,
+    first_break_id: int | None = None,
+    resumed_from_id: int | None = None,
+) -> ChainVerifyResult:
+    """A failed ChainVerifyResult that verified nothing."""
+    return ChainVerifyResult(
+        ok=False,
+        total_rows=0,
+        unsigned_legacy_rows=0,
+        verified_rows=0,
+        last_verified_id=None,
+        last_verified_hash=None,
+        pruned_gaps=(),
+        first_break_id=first_break_id,
+        first_break_reason=reason,
+        resumed_from_id=resumed_from_id,
+    )
+
+
 _AUTO_PRUNE_INTERVAL = 1000
 
 _ALLOWED_TABLES: frozenset[str] = frozenset({"audit_log", "security_events", "delegate_events"})
@@ -714,7 +859,19 @@ _T = TypeVar("_T")
 
 
 class AuditLogger:
-    """Append-only audit logger backed by SQLite."""
+    """Append-only audit logger backed by SQLite.
+
+    By default ``log()`` signs and commits on the calling thread. Pass
+    ``background_writer=True`` to queue records instead: a single writer
+    thread commits them in batches of up to *writer_batch_size*, one
+    transaction per batch. *writer_overflow* picks the backpressure policy
+    when *writer_queue_size* records are pending (``"block"`` or ``"drop"``).
+
+    Reads share the writer connection and its lock unless *read_pool_size*
+    is set: queries then check out one of up to that many read-only
+    connections, so dashboards reading the log never queue behind a write
+    (WAL readers do not block the writer, or each other).
+    """
 
     def __init__(
         self,
@@ -723,14 +880,25 @@ class AuditLogger:
         auto_prune_interval: int = _AUTO_PRUNE_INTERVAL,
         retention_days: int = 90,
         max_records: int = 100_000,
+        background_writer: bool = False,
+        writer_queue_size: int = 1000,
+        writer_batch_size: int = 100,
+        writer_overflow: OverflowPolicy = "block",
+        read_pool_size: int = 0,
     ) -> None:
         self._db_path = db_path
+        self._writer: BackgroundAuditWriter | None = None
+        self._read_pool: queue.LifoQueue[sqlite3.Connection] | None = None
+        self._read_pool_size = read_pool_size
+        self._readers: list[sqlite3.Connection] = []
+        self._closed = False
         self._insert_count = 0
         self._auto_prune_interval = auto_prune_interval
         self._retention_days = retention_days
         self._max_records = max_records
         self._hmac_key: bytes | None = None  # loaded lazily on first log()
         resolved_path = Path(db_path) if not isinstance(db_path, Path) else db_path
+        self._resolved_path = resolved_path
         ensure_private_dir(resolved_path.parent)
         self._conn = sqlite3.connect(
             str(resolved_path),
@@ -749,6 +917,8 @@ class AuditLogger:
             self._conn.execute(_CREATE_BUDGET_STATE_TABLE)
             self._conn.execute(_CREATE_PENDING_APPROVALS_TABLE)
             self._conn.execute(_CREATE_FLOW_CHECKPOINTS_TABLE)
+            self._conn.execute(_CREATE_SINK_OUTBOX_TABLE)
+            ensure_checkpoint_table(self._conn)
             _migrate_add_trigger_columns(self._conn)
             _migrate_add_principal_column(self._conn)
             _migrate_add_compose_name_column(self._conn)
@@ -768,10 +938,22 @@ class AuditLogger:
                 self._conn.execute(idx)
             for idx in _CREATE_FLOW_CHECKPOINT_INDEXES:
                 self._conn.execute(idx)
+            for idx in _CREATE_SINK_OUTBOX_INDEXES:
+                self._conn.execute(idx)
             self._conn.commit()
+            migrate_add_rollups(self._conn)
         except Exception:
             self._conn.close()
             raise
+        if read_pool_size > 0:
+            self._read_pool = queue.LifoQueue(maxsize=read_pool_size)
+        if background_writer:
+            self._writer = BackgroundAuditWriter(
+                self._log_signed_batch_locked,
+                queue_size=writer_queue_size,
+                batch_size=writer_batch_size,
+                overflow=writer_overflow,
+            )
 
     def _execute_insert_locked(
         self,
@@ -799,6 +981,46 @@ class AuditLogger:
         except Exception as e:
             logger.error("Failed to write %s: %s", error_label, e)
 
+    def _read_only_uri(self) -> str:
+        return f"{self._resolved_path.resolve().as_uri()}?mode=ro"
+
+    def _open_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._read_only_uri(), uri=True, check_same_thread=False, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection for one read-only query.
+
+        Without a read pool this is the writer connection under
+        ``self._lock``. With one, a pooled read-only connection is checked
+        out (opened lazily, up to *read_pool_size*; further callers wait for
+        one to come back) and the writer lock is never touched.
+        """
+        pool = self._read_pool
+        if pool is None:
+            with self._lock:
+                yield self._conn
+            return
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if len(self._readers) < self._read_pool_size:
+                    conn = self._open_reader()
+                    self._readers.append(conn)
+            if conn is None:
+                conn = pool.get()
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                pool.put(conn)
+
     def _get_hmac_key(self) -> bytes:
         """Return the cached HMAC key, loading/creating it on first call."""
         if self._hmac_key is None:
@@ -811,33 +1033,22 @@ class AuditLogger:
         Acquires `self._lock` AND a SQLite write lock (BEGIN IMMEDIATE) so
         concurrent processes on the same DB cannot fork the chain.
         """
-        scrubbed = AuditRecord(
-            run_id=record.run_id,
-            agent_name=record.agent_name,
-            timestamp=record.timestamp,
-            user_prompt=scrub_secrets(record.user_prompt),
-            model=record.model,
-            provider=record.provider,
-            output=scrub_secrets(record.output),
-            tokens_in=record.tokens_in,
-            tokens_out=record.tokens_out,
-            total_tokens=record.total_tokens,
-            thinking_tokens=record.thinking_tokens,
-            reasoning_tokens=record.reasoning_tokens,
-            tool_calls=record.tool_calls,
-            duration_ms=record.duration_ms,
-            success=record.success,
-            error=scrub_secrets(record.error) if record.error else record.error,
-            trigger_type=record.trigger_type,
-            trigger_metadata=record.trigger_metadata,
-            principal_id=record.principal_id,
-            tool_names=record.tool_names,
-            event_timeline_json=record.event_timeline_json,
-            judge_verdicts=record.judge_verdicts,
-        )
+        self._log_signed_batch_locked([record])
+
+    def _log_signed_batch_locked(self, records: list[AuditRecord]) -> None:
+        """Sign and insert *records*, in order, inside one BEGIN IMMEDIATE transaction.
+
+        Scrubbing and canonical serialization happen before the locks are
+        taken; only the chain-tip read, the HMAC chaining and the insert run
+        under them. Each record's prev_hash is the previous record's hash, so
+        the batch extends the chain exactly as N single writes would.
+        """
         key = self._get_hmac_key()
-        record_dict = {f: getattr(scrubbed, f) for f in _RECORD_FIELDS}
-        serialized = canonical_serialize(record_dict, _RECORD_FIELDS)
+        scrubbed = [_scrub_record(r) for r in records]
+        serialized = [
+            canonical_serialize({f: getattr(r, f) for f in _RECORD_FIELDS}, _RECORD_FIELDS)
+            for r in scrubbed
+        ]
 
         with self._lock:
             in_txn = False
@@ -846,42 +1057,26 @@ class AuditLogger:
                 in_txn = True
                 prev_row = self._conn.execute(_SELECT_CHAIN_TIP).fetchone()
                 prev_hash = prev_row["record_hash"] if prev_row else None
-                record_hash = compute_record_hash(key, prev_hash, serialized)
-                self._conn.execute(
-                    _INSERT,
-                    (
-                        scrubbed.run_id,
-                        scrubbed.agent_name,
-                        scrubbed.timestamp,
-                        scrubbed.user_prompt,
-                        scrubbed.model,
-                        scrubbed.provider,
-                        scrubbed.output,
-                        scrubbed.tokens_in,
-                        scrubbed.tokens_out,
-                        scrubbed.total_tokens,
-                        scrubbed.thinking_tokens,
-                        scrubbed.reasoning_tokens,
-                        scrubbed.tool_calls,
-                        scrubbed.duration_ms,
-                        scrubbed.success,
-                        scrubbed.error,
-                        scrubbed.trigger_type,
-                        scrubbed.trigger_metadata,
-                        scrubbed.principal_id,
-                        scrubbed.tool_names,
-                        scrubbed.event_timeline_json,
-                        scrubbed.judge_verdicts,
-                        prev_hash,
-                        record_hash,
-                    ),
-                )
+                rows: list[tuple] = []
+                for rec, ser in zip(scrubbed, serialized, strict=True):
+                    record_hash = compute_record_hash(key, prev_hash, ser)
+                    rows.append(
+                        (
+                            *(getattr(rec, f) for f in _RECORD_FIELDS),
+                            prev_hash,
+                            record_hash,
+                        )
+                    )
+                    prev_hash = record_hash
+                self._conn.executemany(_INSERT, rows)
                 self._conn.commit()
                 in_txn = False
-                self._insert_count += 1
+                before = self._insert_count
+                self._insert_count += len(rows)
                 if (
                     self._auto_prune_interval > 0
-                    and self._insert_count % self._auto_prune_interval == 0
+                    and before // self._auto_prune_interval
+                    != self._insert_count // self._auto_prune_interval
                 ):
                     self._prune_locked(
                         retention_days=self._retention_days,
@@ -896,12 +1091,33 @@ class AuditLogger:
                 raise
 
     def log(self, record: AuditRecord) -> None:
-        """Insert a signed audit record. Never raises — logs on failure."""
+        """Insert a signed audit record. Never raises — logs on failure.
+
+        With ``background_writer=True`` the record is queued and committed by
+        the writer thread; call :meth:`flush` before reading it back.
+        """
+        if self._writer is not None:
+            self._writer.submit(record)
+            return
         try:
             self._log_signed_locked(record)
         except Exception as e:
             logger.error("Failed to write audit record: %s", e)
 
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued audit record is committed.
+
+        A no-op returning True for a synchronous logger. Returns False when
+        *timeout* elapses before the background writer catches up.
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def writer_stats(self) -> AuditWriterStats | None:
+        """Queue depth and batch-size counters, or None for a synchronous logger."""
+        return self._writer.stats() if self._writer is not None else None
+
     # -- budget state persistence --------------------------------------------
 
     def save_budget_state(self, agent_name: str, state: dict) -> None:
@@ -927,8 +1143,8 @@ class AuditLogger:
     def load_budget_state(self, agent_name: str) -> dict | None:
         """Load persisted budget counters. Returns None if missing or on error."""
         try:
-            with self._lock:
-                row = self._conn.execute(
+            with self._reader() as conn:
+                row = conn.execute(
                     "SELECT * FROM budget_state WHERE agent_name = ?",
                     (agent_name,),
                 ).fetchone()
@@ -960,8 +1176,8 @@ class AuditLogger:
         where, params = _build_where(filters)
         sql = f"SELECT * FROM {table} {where} ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
-        with self._lock:
-            rows = self._conn.execute(sql, params).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [row_mapper(row) for row in rows]
 
     def query(
@@ -1002,8 +1218,8 @@ class AuditLogger:
 
         sql = f"SELECT * FROM audit_log {where} ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
-        with self._lock:
-            rows = self._conn.execute(sql, params).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [_row_to_record(row) for row in rows]
 
     def log_security_event(
@@ -1222,34 +1438,29 @@ class AuditLogger:
         since: str | None = None,
         until: str | None = None,
     ):
-        """Compute aggregate stats from the audit_log table."""
+        """Compute aggregate stats, reading the daily rollups where possible."""
         from initrunner.services.operations import AuditStats, TopAgent
 
-        filters: list[tuple[str, object | None]] = [
-            ("agent_name = ?", agent_name),
-            ("timestamp >= ?", since),
-            ("timestamp <= ?", until),
-        ]
-        active = [(c, v) for c, v in filters if v is not None]
-        where, params = _build_where(active)
-
+        src, params = self._usage_source(agent_name, since, until)
         sql = f"""
             SELECT
-                COUNT(*) AS total_runs,
-                COALESCE(SUM(CASE WHEN success THEN 1 ELSE 0 END), 0) AS successes,
+                COALESCE(SUM(run_count), 0) AS total_runs,
+                COALESCE(SUM(success_count), 0) AS successes,
                 COALESCE(SUM(total_tokens), 0) AS total_tokens,
-                COALESCE(AVG(duration_ms), 0) AS avg_duration_ms
-            FROM audit_log {where}
+                COALESCE(SUM(duration_ms) * 1.0 / NULLIF(SUM(run_count), 0), 0)
+                    AS avg_duration_ms
+            FROM ({src})
         """
         top_sql = f"""
-            SELECT agent_name, COUNT(*) AS cnt, COALESCE(AVG(duration_ms), 0) AS avg_dur
-            FROM audit_log {where}
+            SELECT agent_name, SUM(run_count) AS cnt,
+                   COALESCE(SUM(duration_ms) * 1.0 / NULLIF(SUM(run_count), 0), 0) AS avg_dur
+            FROM ({src})
             GROUP BY agent_name ORDER BY cnt DESC LIMIT 5
         """
 
-        with self._lock:
-            row = self._conn.execute(sql, params).fetchone()
-            top_rows = self._conn.execute(top_sql, params).fetchall()
+        with self._reader() as conn:
+            row = conn.execute(sql, params).fetchone()
+            top_rows = conn.execute(top_sql, params).fetchall()
 
         total = row["total_runs"] if row else 0
         successes = row["successes"] if row else 0
@@ -1290,14 +1501,14 @@ class AuditLogger:
             ORDER BY timestamp DESC LIMIT 1
         """
 
-        with self._lock:
-            rows = self._conn.execute(agg_sql, (agent_name,)).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(agg_sql, (agent_name,)).fetchall()
             results: list[TriggerStat] = []
             for row in rows:
                 ttype = row["trigger_type"]
                 last_error: str | None = None
                 if row["fail_count"] > 0:
-                    err_row = self._conn.execute(error_sql, (agent_name, ttype)).fetchone()
+                    err_row = conn.execute(error_sql, (agent_name, ttype)).fetchone()
                     if err_row:
                         last_error = err_row["error"]
                 results.append(
@@ -1346,8 +1557,8 @@ class AuditLogger:
                 ORDER BY timestamp ASC LIMIT ?
             """
             params = (agent_name, since, until, limit)
-        with self._lock:
-            rows = self._conn.execute(sql, params).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [dict(row) for row in rows]
 
     def timeline_stats(
@@ -1386,8 +1597,8 @@ class AuditLogger:
                 WHERE agent_name = ? AND timestamp >= ? AND timestamp <= ?
             """
             params = (agent_name, since, until)
-        with self._lock:
-            row = self._conn.execute(sql, params).fetchone()
+        with self._reader() as conn:
+            row = conn.execute(sql, params).fetchone()
         if not row or row["total_runs"] == 0:
             return {
                 "total_runs": 0,
@@ -1430,6 +1641,54 @@ class AuditLogger:
         ]
         return _build_where(filters)
 
+    def _rollup_source(
+        self,
+        rollup_table: str,
+        rollup_cols: str,
+        raw_select: str,
+        agent_name: str | None,
+        since: str | None,
+        until: str | None,
+    ) -> tuple[str, list[object]]:
+        """Build a subquery yielding rollup-shaped rows for a window.
+
+        Fully covered days come from *rollup_table*; the edge days the window
+        cuts through come from *raw_select* (``... FROM audit_log ...``
+        followed by ``{where}`` and an optional GROUP BY) with the exact
+        timestamp filters. Unparseable bounds fall back to the raw select alone.
+        """
+        agent = [("agent_name = ?", agent_name)] if agent_name is not None else []
+        window = split_window(since, until)
+        if window is None:
+            where, params = self._cost_filters(agent_name, since, until)
+            return raw_select.format(where=where), params
+
+        r_where, r_params = _build_where(
+            agent + list(zip(window.rollup_where, window.rollup_params, strict=False))
+        )
+        parts = [f"SELECT {rollup_cols} FROM {rollup_table} {r_where}"]
+        params = list(r_params)
+        if window.raw_where is not None:
+            clauses = [c for c, _ in agent] + window.raw_where
+            parts.append(raw_select.format(where="WHERE " + " AND ".join(clauses)))
+            params += [v for _, v in agent] + window.raw_params
+        return " UNION ALL ".join(parts), params
+
+    def _usage_source(
+        self,
+        agent_name: str | None,
+        since: str | None,
+        until: str | None,
+    ) -> tuple[str, list[object]]:
+        return self._rollup_source(
+            "usage_rollup",
+            _USAGE_COLS,
+            _USAGE_RAW_SELECT,
+            agent_name,
+            since,
+            until,
+        )
+
     def cost_by_agent(
         self,
         *,
@@ -1441,20 +1700,20 @@ class AuditLogger:
 
         Ordered by total token volume descending (proxy for cost).
         """
-        where, params = self._cost_filters(agent_name, since, until)
+        src, params = self._usage_source(agent_name, since, until)
         sql = f"""\
             SELECT agent_name, model, provider,
                    COALESCE(SUM(tokens_in), 0)        AS tokens_in,
                    COALESCE(SUM(tokens_out), 0)       AS tokens_out,
                    COALESCE(SUM(thinking_tokens), 0)  AS thinking_tokens,
                    COALESCE(SUM(reasoning_tokens), 0) AS reasoning_tokens,
-                   COUNT(*)                           AS run_count
-            FROM audit_log {where}
+                   COALESCE(SUM(run_count), 0)        AS run_count
+            FROM ({src})
             GROUP BY agent_name, model, provider
             ORDER BY SUM(tokens_in + tokens_out) DESC
         """
-        with self._lock:
-            rows = self._conn.execute(sql, params).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [dict(r) for r in rows]
 
     def cost_by_day(
@@ -1468,18 +1727,18 @@ class AuditLogger:
 
         Ordered by date ascending.
         """
-        where, params = self._cost_filters(agent_name, since, until)
+        src, params = self._usage_source(agent_name, since, until)
         sql = f"""\
-            SELECT date(timestamp) AS date, model, provider,
+            SELECT day AS date, model, provider,
                    COALESCE(SUM(tokens_in), 0)  AS tokens_in,
                    COALESCE(SUM(tokens_out), 0) AS tokens_out,
-                   COUNT(*)                      AS run_count
-            FROM audit_log {where}
-            GROUP BY date(timestamp), model, provider
-            ORDER BY date(timestamp) ASC
+                   COALESCE(SUM(run_count), 0)  AS run_count
+            FROM ({src})
+            GROUP BY day, model, provider
+            ORDER BY day ASC
         """
-        with self._lock:
-            rows = self._conn.execute(sql, params).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [dict(r) for r in rows]
 
     def cost_by_model(
@@ -1492,20 +1751,20 @@ class AuditLogger:
 
         Ordered by total token volume descending.
         """
-        where, params = self._cost_filters(None, since, until)
+        src, params = self._usage_source(None, since, until)
         sql = f"""\
             SELECT model, provider,
                    COALESCE(SUM(tokens_in), 0)        AS tokens_in,
                    COALESCE(SUM(tokens_out), 0)       AS tokens_out,
                    COALESCE(SUM(thinking_tokens), 0)  AS thinking_tokens,
                    COALESCE(SUM(reasoning_tokens), 0) AS reasoning_tokens,
-                   COUNT(*)                           AS run_count
-            FROM audit_log {where}
+                   COALESCE(SUM(run_count), 0)        AS run_count
+            FROM ({src})
             GROUP BY model, provider
             ORDER BY SUM(tokens_in + tokens_out) DESC
         """
-        with self._lock:
-            rows = self._conn.execute(sql, params).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [dict(r) for r in rows]
 
     def cost_by_tool(
@@ -1517,200 +1776,158 @@ class AuditLogger:
     ) -> list[dict]:
         """Aggregate token usage grouped by individual tool name.
 
-        Uses a CTE to avoid overcounting: if a tool appears N times in one
-        run, ``usage_count`` reflects N but token totals are counted once
-        per (run, tool) pair.
+        If a tool appears N times in one run, ``usage_count`` reflects N but
+        token totals are counted once per (run, tool) pair.
         """
-        where, params = self._cost_filters(agent_name, since, until)
-        extra = "a.tool_names IS NOT NULL"
-        if where:
-            where += f" AND {extra}"
-        else:
-            where = f"WHERE {extra}"
-
+        src, params = self._rollup_source(
+            "tool_rollup",
+            _TOOL_COLS,
+            _TOOL_RAW_SELECT,
+            agent_name,
+            since,
+            until,
+        )
         sql = f"""\
-            WITH tool_runs AS (
-                SELECT DISTINCT a.run_id, je.value AS tool_name,
-                       a.tokens_in, a.tokens_out, a.model, a.provider,
-                       COUNT(*) OVER (PARTITION BY a.run_id, je.value) AS call_count
-                FROM audit_log a, json_each(a.tool_names) je
-                {where}
-            )
             SELECT tool_name,
-                   COALESCE(SUM(call_count), 0) AS usage_count,
-                   COUNT(*)                      AS run_count,
-                   COALESCE(SUM(tokens_in), 0)  AS tokens_in,
-                   COALESCE(SUM(tokens_out), 0) AS tokens_out,
+                   COALESCE(SUM(usage_count), 0) AS usage_count,
+                   COALESCE(SUM(run_count), 0)   AS run_count,
+                   COALESCE(SUM(tokens_in), 0)   AS tokens_in,
+                   COALESCE(SUM(tokens_out), 0)  AS tokens_out,
                    model, provider
-            FROM tool_runs
+            FROM ({src})
             GROUP BY tool_name, model, provider
             ORDER BY usage_count DESC
         """
-        with self._lock:
-            rows = self._conn.execute(sql, params).fetchall()
+        with self._reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
         return [dict(r) for r in rows]
 
-    def verify_chain(self) -> ChainVerifyResult:
+    def rebuild_rollups(self) -> None:
+        """Recompute the cost/usage rollup tables from ``audit_log``.
+
+        The rollups are trigger-maintained, so this is only needed after the
+        DB was modified with triggers disabled or restored from a copy taken
+        without them.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rebuild_rollups(self._conn)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def verify_chain(
+        self,
+        *,
+        incremental: bool = False,
+        workers: int = 1,
+        checkpoint: bool = True,
+    ) -> ChainVerifyResult:
         """Walk the signed chain and verify every signed row. Never raises.
 
         Legacy rows (NULL hashes) before the first signed row are tolerated.
         A NULL hash after the chain has started is a break. id gaps with a
         matching prev_hash mismatch are treated as pruning (informational).
+
+        With *incremental*, verification resumes after the newest signed
+        checkpoint instead of re-walking rows an earlier verify already
+        covered. *workers* > 1 splits the id range into segments verified on
+        a process pool and stitched back together. A clean result records a
+        new checkpoint unless *checkpoint* is False.
         """
+        started_at = time.perf_counter()
         try:
             key = load_hmac_key_readonly()
-        except KeyUnavailableError:
-            return ChainVerifyResult(
-                ok=False,
-                total_rows=0,
-                unsigned_legacy_rows=0,
-                verified_rows=0,
-                last_verified_id=None,
-                last_verified_hash=None,
-                pruned_gaps=(),
-                first_break_id=None,
-                first_break_reason="key_missing",
-            )
-        except KeyInvalidError:
-            return ChainVerifyResult(
-                ok=False,
-                total_rows=0,
-                unsigned_legacy_rows=0,
-                verified_rows=0,
-                last_verified_id=None,
-                last_verified_hash=None,
-                pruned_gaps=(),
-                first_break_id=None,
-                first_break_reason="key_invalid",
-            )
-
-        select_cols = ", ".join(("id", *_RECORD_FIELDS, "prev_hash", "record_hash"))
-        sql = f"SELECT {select_cols} FROM audit_log ORDER BY id ASC"
-
-        total_rows = 0
-        legacy_rows = 0
-        verified_rows = 0
-        last_id: int | None = None
-        last_hash: str | None = None
-        pruned_gaps: list[int] = []
-        chain_started = False
-        expected_prev_hash: str | None = None
-        prev_row_id: int | None = None
-
-        with self._lock:
-            try:
-                cursor = self._conn.execute(sql)
-            except sqlite3.Error:
-                return ChainVerifyResult(
-                    ok=False,
-                    total_rows=0,
-                    unsigned_legacy_rows=0,
-                    verified_rows=0,
-                    last_verified_id=None,
-                    last_verified_hash=None,
-                    pruned_gaps=(),
-                    first_break_id=None,
-                    first_break_reason="query_error",
-                )
+        except (KeyUnavailableError, KeyInvalidError) as e:
+            reason = "key_missing" if isinstance(e, KeyUnavailableError) else "key_invalid"
+            return _chain_failure(reason)
 
-            while True:
-                try:
-                    batch = cursor.fetchmany(500)
-                except sqlite3.Error:
-                    return ChainVerifyResult(
-                        ok=False,
-                        total_rows=total_rows,
-                        unsigned_legacy_rows=legacy_rows,
-                        verified_rows=verified_rows,
-                        last_verified_id=last_id,
-                        last_verified_hash=last_hash,
-                        pruned_gaps=tuple(pruned_gaps),
-                        first_break_id=None,
-                        first_break_reason="query_error",
-                    )
-                if not batch:
-                    break
-
-                for row in batch:
-                    total_rows += 1
-                    stored_record_hash = row["record_hash"]
-                    stored_prev_hash = row["prev_hash"]
-                    row_id = row["id"]
-
-                    if stored_record_hash is None:
-                        if chain_started:
-                            return ChainVerifyResult(
-                                ok=False,
-                                total_rows=total_rows,
-                                unsigned_legacy_rows=legacy_rows,
-                                verified_rows=verified_rows,
-                                last_verified_id=last_id,
-                                last_verified_hash=last_hash,
-                                pruned_gaps=tuple(pruned_gaps),
-                                first_break_id=row_id,
-                                first_break_reason="missing_hash_after_chain_start",
-                            )
-                        legacy_rows += 1
-                        prev_row_id = row_id
-                        continue
-
-                    if not chain_started:
-                        chain_started = True
-                        expected_prev_hash = stored_prev_hash
-
-                    id_gap = prev_row_id is not None and row_id != prev_row_id + 1
-                    if stored_prev_hash != expected_prev_hash:
-                        if id_gap:
-                            pruned_gaps.append(row_id)
-                            expected_prev_hash = stored_prev_hash
-                        else:
-                            return ChainVerifyResult(
-                                ok=False,
-                                total_rows=total_rows,
-                                unsigned_legacy_rows=legacy_rows,
-                                verified_rows=verified_rows,
-                                last_verified_id=last_id,
-                                last_verified_hash=last_hash,
-                                pruned_gaps=tuple(pruned_gaps),
-                                first_break_id=row_id,
-                                first_break_reason="prev_hash_mismatch",
-                            )
-
-                    record_dict = {f: row[f] for f in _RECORD_FIELDS}
-                    record_dict["success"] = bool(record_dict["success"])
-                    serialized = canonical_serialize(record_dict, _RECORD_FIELDS)
-                    expected_hash = compute_record_hash(key, expected_prev_hash, serialized)
-                    if expected_hash != stored_record_hash:
-                        return ChainVerifyResult(
-                            ok=False,
-                            total_rows=total_rows,
-                            unsigned_legacy_rows=legacy_rows,
-                            verified_rows=verified_rows,
-                            last_verified_id=last_id,
-                            last_verified_hash=last_hash,
-                            pruned_gaps=tuple(pruned_gaps),
-                            first_break_id=row_id,
-                            first_break_reason="hash_mismatch",
+        resume: tuple[int, str] | None = None
+        try:
+            with self._reader() as conn:
+                if incremental:
+                    resume = load_checkpoint(conn, key)
+                if resume is not None:
+                    anchor = conn.execute(
+                        "SELECT record_hash FROM audit_log WHERE id = ?", (resume[0],)
+                    ).fetchone()
+                    if anchor is not None and anchor["record_hash"] != resume[1]:
+                        return _chain_failure(
+                            "checkpoint_mismatch",
+                            first_break_id=resume[0],
+                            resumed_from_id=resume[0],
                         )
-
-                    verified_rows += 1
-                    last_id = row_id
-                    last_hash = stored_record_hash
-                    expected_prev_hash = stored_record_hash
-                    prev_row_id = row_id
+                state: dict[str, Any] = {}
+                if resume is not None:
+                    state = {
+                        "chain_started": True,
+                        "expected_prev_hash": resume[1],
+                        "prev_row_id": resume[0],
+                    }
+                lo = resume[0] + 1 if resume is not None else None
+                if workers > 1:
+                    bounds = conn.execute(
+                        "SELECT MIN(id), MAX(id) FROM audit_log WHERE id >= ?", (lo or 0,)
+                    ).fetchone()
+                    result = self._verify_parallel(key, bounds[0], bounds[1], workers, state)
+                else:
+                    rows = iter_rows(conn, _RECORD_FIELDS, lo)
+                    result = walk(rows, key, _RECORD_FIELDS, **state)
+        except sqlite3.Error:
+            return _chain_failure("query_error")
+
+        ok = result.break_id is None
+        last_id, last_hash = result.last_id, result.last_hash
+        if last_id is None and resume is not None:
+            last_id, last_hash = resume
+        if ok and checkpoint and last_id is not None and last_hash is not None:
+            if resume is None or resume[0] != last_id:
+                try:
+                    with self._lock:
+                        save_checkpoint(self._conn, key, last_id, last_hash)
+                except Exception as e:
+                    logger.warning("Failed to save chain checkpoint: %s", e)
 
         return ChainVerifyResult(
-            ok=True,
-            total_rows=total_rows,
-            unsigned_legacy_rows=legacy_rows,
-            verified_rows=verified_rows,
+            ok=ok,
+            total_rows=result.total_rows,
+            unsigned_legacy_rows=result.legacy_rows,
+            verified_rows=result.verified_rows,
             last_verified_id=last_id,
             last_verified_hash=last_hash,
-            pruned_gaps=tuple(pruned_gaps),
-            first_break_id=None,
-            first_break_reason=None,
+            pruned_gaps=tuple(result.pruned_gaps),
+            first_break_id=result.break_id,
+            first_break_reason=result.break_reason,
+            resumed_from_id=resume[0] if resume is not None else None,
+            elapsed_s=time.perf_counter() - started_at,
         )
 
+    def _verify_parallel(
+        self,
+        key: bytes,
+        lo: int | None,
+        hi: int | None,
+        workers: int,
+        state: dict[str, Any],
+    ) -> Walk:
+        """Verify ids ``lo..hi`` as *workers* segments on a spawn-context process pool."""
+        if lo is None or hi is None:
+            return Walk()
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        ranges = split_range(lo, hi, workers)
+        uri = self._read_only_uri()
+        fields = list(_RECORD_FIELDS)
+        with ProcessPoolExecutor(
+            max_workers=len(ranges), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [pool.submit(verify_segment, uri, key, fields, a, b) for a, b in ranges]
+            segments = [f.result() for f in futures]
+        return stitch(segments, **state)
+
     def _prune_locked(self, retention_days: int = 90, max_records: int = 100_000) -> int:
         """Core prune logic. Caller must hold self._lock."""
         deleted = 0
@@ -1790,8 +2007,8 @@ class AuditLogger:
     def load_pending_approvals(self, run_id: str) -> list[PendingApprovalRecord]:
         """Return every pending-approval row for a run, oldest first."""
         try:
-            with self._lock:
-                rows = self._conn.execute(_SELECT_PENDING_BY_RUN, (run_id,)).fetchall()
+            with self._reader() as conn:
+                rows = conn.execute(_SELECT_PENDING_BY_RUN, (run_id,)).fetchall()
         except Exception as e:
             logger.error("Failed to load pending approvals for %s: %s", run_id, e)
             return []
@@ -1800,8 +2017,8 @@ class AuditLogger:
     def list_pending_approvals(self, *, limit: int = 100) -> list[PendingApprovalRecord]:
         """Return unresolved approvals across all runs, oldest first."""
         try:
-            with self._lock:
-                rows = self._conn.execute(_SELECT_PENDING_UNRESOLVED, (limit,)).fetchall()
+            with self._reader() as conn:
+                rows = conn.execute(_SELECT_PENDING_UNRESOLVED, (limit,)).fetchall()
         except Exception as e:
             logger.error("Failed to list pending approvals: %s", e)
             return []
@@ -1912,10 +2129,8 @@ class AuditLogger:
         separate concern, so a missing key never blocks a resume.
         """
         try:
-            with self._lock:
-                row = self._conn.execute(
-                    _SELECT_FLOW_CHECKPOINT, (flow_run_id, service_name)
-                ).fetchone()
+            with self._reader() as conn:
+                row = conn.execute(_SELECT_FLOW_CHECKPOINT, (flow_run_id, service_name)).fetchone()
             if row is None:
                 return None
             return FlowCheckpointRecord(
@@ -1939,8 +2154,8 @@ class AuditLogger:
     def list_completed_services(self, flow_run_id: str) -> list[str]:
         """Return service names checkpointed for a flow, in sequence order."""
         try:
-            with self._lock:
-                rows = self._conn.execute(_SELECT_COMPLETED_SERVICES, (flow_run_id,)).fetchall()
+            with self._reader() as conn:
+                rows = conn.execute(_SELECT_COMPLETED_SERVICES, (flow_run_id,)).fetchall()
             return [row["service_name"] for row in rows]
         except Exception as e:
             logger.error("Failed to list completed services for %s: %s", flow_run_id, e)
@@ -1955,8 +2170,111 @@ class AuditLogger:
             auto_prune=False,
         )
 
+    # ------------------------------------------------------------------
+    # Sink outbox (durable background sink delivery)
+    # ------------------------------------------------------------------
+
+    def add_sink_delivery(
+        self,
+        sink_key: str,
+        payload_json: str,
+        *,
+        owner: str | None = None,
+        lease_seconds: float = 0.0,
+    ) -> int | None:
+        """Persist one pending sink delivery. Returns its id, or None on failure.
+
+        With an *owner* the entry is leased to it for *lease_seconds*, so no
+        other worker claims it while the owner keeps renewing the lease.
+        """
+        ts = datetime.now(UTC).isoformat()
+        lease_until = time.time() + lease_seconds if owner is not None else None
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    _INSERT_SINK_OUTBOX, (sink_key, payload_json, ts, owner, lease_until)
+                )
+                self._conn.commit()
+                return cursor.lastrowid
+        except Exception as e:
+            logger.error("Failed to write sink outbox entry: %s", e)
+            return None
+
+    def claim_sink_deliveries(
+        self, sink_key: str, owner: str, *, lease_seconds: float, limit: int = 1000
+    ) -> list[SinkOutboxRecord]:
+        """Lease up to *limit* unleased or expired deliveries for one sink to *owner*.
+
+        Runs inside BEGIN IMMEDIATE, so two processes sharing the DB never
+        claim the same entry. Returns the claimed entries, oldest first.
+        """
+        now = time.time()
+        with self._lock:
+            in_txn = False
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                in_txn = True
+                rows = self._conn.execute(
+                    _SELECT_UNLEASED_SINK_OUTBOX, (sink_key, now, limit)
+                ).fetchall()
+                self._conn.executemany(
+                    _CLAIM_SINK_OUTBOX,
+                    [(owner, now + lease_seconds, row["id"]) for row in rows],
+                )
+                self._conn.commit()
+                in_txn = False
+            except Exception as e:
+                if in_txn:
+                    try:
+                        self._conn.rollback()
+                    except Exception:
+                        pass
+                logger.error("Failed to claim sink outbox for %s: %s", sink_key, e)
+                return []
+        return [
+            dataclasses.replace(
+                _row_to_sink_outbox(row), owner=owner, lease_until=now + lease_seconds
+            )
+            for row in rows
+        ]
+
+    def renew_sink_leases(self, owner: str, *, lease_seconds: float) -> None:
+        """Extend the lease on every outbox entry held by *owner*. Never raises."""
+        self._execute_insert_locked(
+            _RENEW_SINK_OUTBOX,
+            (time.time() + lease_seconds, owner),
+            error_label="sink outbox lease renewal",
+            auto_prune=False,
+        )
+
+    def release_sink_deliveries(self, owner: str) -> None:
+        """Give up *owner*'s leases so the next worker claims them at once. Never raises."""
+        self._execute_insert_locked(
+            _RELEASE_SINK_OUTBOX,
+            (owner,),
+            error_label="sink outbox release",
+            auto_prune=False,
+        )
+
+    def remove_sink_delivery(self, delivery_id: int) -> None:
+        """Delete a delivered (or abandoned) outbox entry. Never raises."""
+        self._execute_insert_locked(
+            _DELETE_SINK_OUTBOX,
+            (delivery_id,),
+            error_label="sink outbox delete",
+            auto_prune=False,
+        )
+
     def close(self) -> None:
+        if self._writer is not None:
+            # Drain before closing the connection so no queued record is lost.
+            self._writer.close()
+            self._writer = None
         with self._lock:
+            self._closed = True
+            for reader in self._readers:
+                reader.close()
+            self._readers.clear()
             self._conn.close()
 
     def __enter__(self) -> AuditLogger:
@@ -1964,3 +2282,25 @@ class AuditLogger:
 
     def __exit__(self, *args: object) -> None:
         self.close()
+
+
+@contextmanager
+def reuse_or_open(
+    audit_logger: AuditLogger | None, audit_db: Path | None = None
+) -> Iterator[AuditLogger | None]:
+    """Yield *audit_logger* unchanged, or a short-lived logger on *audit_db*.
+
+    Read-only service helpers take an optional long-lived logger (the
+    dashboard's shared one) and fall back to opening their own. Yields None
+    when no logger is given and the DB file does not exist yet, so a read
+    never creates an empty audit DB.
+    """
+    if audit_logger is not None:
+        yield audit_logger
+        return
+    db_path = audit_db or DEFAULT_DB_PATH
+    if not db_path.exists():
+        yield None
+        return
+    with AuditLogger(db_path) as logger:
+        yield logger
@@ -210,14 +210,21 @@ def load_and_build_or_exit(
             raise typer.Exit(1) from None
 
 
-def create_audit_logger(audit_db: Path | None, no_audit: bool) -> AuditLogger | None:
+def create_audit_logger(
+    audit_db: Path | None, no_audit: bool, *, background: bool = False
+) -> AuditLogger | None:
+    """Open the audit logger for a command, or None when auditing is off.
+
+    *background* queues records to a batched writer thread instead of
+    committing on the run thread (used by ``--serve --audit-batch``).
+    """
     if no_audit:
         return None
     from initrunner.agent.runtime_sandbox import set_default_audit_logger
     from initrunner.audit.logger import DEFAULT_DB_PATH
     from initrunner.audit.logger import AuditLogger as _AuditLogger
 
-    logger = _AuditLogger(audit_db or DEFAULT_DB_PATH)
+    logger = _AuditLogger(audit_db or DEFAULT_DB_PATH, background_writer=background)
     set_default_audit_logger(logger)
     return logger
 
@@ -327,6 +334,7 @@ def command_context(
     model_override: str | None = None,
     dry_run: bool = False,
     role_mutator: Callable[[RoleDefinition], RoleDefinition] | None = None,
+    audit_background: bool = False,
 ):
     """Context manager for agent setup and resource cleanup.
 
@@ -340,7 +348,7 @@ def command_context(
 
     # Audit logger is created before build so sandbox backends pick it up
     # as the default (sandbox.exec events won't fire otherwise).
-    audit_logger = create_audit_logger(audit_db, no_audit)
+    audit_logger = create_audit_logger(audit_db, no_audit, background=audit_background)
 
     role, agent = load_and_build_or_exit(
         role_file,
@@ -361,9 +369,15 @@ def command_context(
     with managed_memory_store(mem_role, agent) as memory_store:
         sink_dispatcher = None
         if with_sinks and role.spec.sinks:
-            from initrunner.sinks.dispatcher import SinkDispatcher
-
-            sink_dispatcher = SinkDispatcher(role.spec.sinks, role, role_dir=role_file.parent)
+            from initrunner.sinks.dispatcher import SinkDispatcher, sink_outbox_enabled
+
+            sink_dispatcher = SinkDispatcher(
+                role.spec.sinks,
+                role,
+                role_dir=role_file.parent,
+                background=True,
+                outbox=audit_logger if sink_outbox_enabled() else None,
+            )
 
         try:
             # Auto-ingest hook: shared by all `initrunner run` execution
@@ -378,6 +392,9 @@ def command_context(
 
             yield role, agent, audit_logger, memory_store, sink_dispatcher
         finally:
+            # Drain sinks first: their outbox lives in the audit DB.
+            if sink_dispatcher is not None:
+                sink_dispatcher.close()
             if audit_logger is not None:
                 audit_logger.close()
             if _otel_provider is not None:
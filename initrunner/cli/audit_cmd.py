@@ -159,8 +159,24 @@ def audit_security_events(
 
 
 @app.command("verify-chain")
-def audit_verify_chain(audit_db: AuditDbOption = None) -> None:
-    """Verify the HMAC-signed audit chain. Exits non-zero on any break."""
+def audit_verify_chain(
+    audit_db: AuditDbOption = None,
+    full: Annotated[
+        bool,
+        typer.Option(
+            "--full", help="Re-verify the whole chain instead of resuming from the last checkpoint"
+        ),
+    ] = False,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", min=1, help="Verify the chain in this many parallel segments"),
+    ] = 1,
+) -> None:
+    """Verify the HMAC-signed audit chain. Exits non-zero on any break.
+
+    Each clean run records a signed checkpoint; the next run only verifies
+    rows added since. Use --full to walk every row again.
+    """
     from rich.table import Table
 
     from initrunner.audit.logger import DEFAULT_DB_PATH
@@ -171,7 +187,7 @@ def audit_verify_chain(audit_db: AuditDbOption = None) -> None:
         console.print(f"[red]Error:[/red] Audit database not found at {db_path}")
         raise typer.Exit(1)
 
-    result = verify_audit_chain_sync(audit_db=db_path)
+    result = verify_audit_chain_sync(audit_db=db_path, incremental=not full, workers=workers)
 
     tip_hash_short = result.last_verified_hash[:16] + "..." if result.last_verified_hash else "-"
 
@@ -184,6 +200,10 @@ def audit_verify_chain(audit_db: AuditDbOption = None) -> None:
     table.add_row("Tip id", str(result.last_verified_id) if result.last_verified_id else "-")
     table.add_row("Tip hash", tip_hash_short)
     table.add_row("Pruned gaps", str(len(result.pruned_gaps)))
+    if result.resumed_from_id is not None:
+        table.add_row("Resumed after id", str(result.resumed_from_id))
+    table.add_row("Elapsed", f"{result.elapsed_s:.2f}s")
+    table.add_row("Rows/sec", f"{result.rows_per_sec:,.0f}")
     console.print(table)
 
     if result.ok:
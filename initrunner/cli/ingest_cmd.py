@@ -3,18 +3,35 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
 from initrunner.cli._helpers import console, ingest_status_color, load_role_or_exit, suggest_next
 
+if TYPE_CHECKING:
+    from initrunner.agent.schema.role import RoleDefinition
+
 
 def ingest(
     role_file: Annotated[
         Path, typer.Argument(help="Agent directory, role YAML, or installed role name")
     ],
     force: Annotated[bool, typer.Option("--force", help="Force re-ingestion of all files")] = False,
+    verify_hashes: Annotated[
+        bool,
+        typer.Option(
+            "--verify-hashes",
+            help="Hash every file instead of skipping files whose size and mtime are unchanged",
+        ),
+    ] = False,
+    optimize: Annotated[
+        bool,
+        typer.Option(
+            "--optimize",
+            help="Compact and index the role's stores instead of ingesting, and report the effect",
+        ),
+    ] = False,
 ) -> None:
     """Ingest documents defined in the role's ingest config."""
     from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
@@ -31,6 +48,10 @@ def ingest(
     base_dir = effective_ingest_base_dir(role_file)
     _load_dotenv(base_dir)
 
+    if optimize:
+        _optimize_stores(role)
+        return
+
     if role.spec.ingest is None:
         console.print("[red]Error:[/red] No ingest config in role definition.")
         console.print(
@@ -73,6 +94,7 @@ def ingest(
                 progress_callback=on_progress,
                 max_file_size_mb=resource_limits.max_file_size_mb,
                 max_total_ingest_mb=resource_limits.max_total_ingest_mb,
+                verify_hashes=verify_hashes,
             )
         except Exception as exc:
             from initrunner.stores.base import EmbeddingModelChangedError
@@ -107,6 +129,8 @@ def ingest(
         parts.append(f"[dim]Skipped: {stats.skipped}[/dim]")
     if stats.errored:
         parts.append(f"[red]Errors: {stats.errored}[/red]")
+    if stats.embed_cache_hits:
+        parts.append(f"[dim]Cached embeddings: {stats.embed_cache_hits}[/dim]")
 
     console.print(f"[green]Done.[/green] {stats.total_chunks} chunks stored. " + " | ".join(parts))
 
@@ -115,3 +139,42 @@ def ingest(
             console.print(f"  [red]Error:[/red] {fr.path}: {fr.error}")
 
     suggest_next("ingest", role, role_file)
+
+
+def _optimize_stores(role: RoleDefinition) -> None:
+    from rich.table import Table
+
+    from initrunner.services.ingest import optimize_role_stores
+
+    with console.status(f"Optimizing stores for [cyan]{role.metadata.name}[/cyan]..."):
+        reports = optimize_role_stores(role)
+    if not reports:
+        console.print("[yellow]No document or memory store to optimize.[/yellow]")
+        return
+
+    for report in reports:
+        table = Table(
+            title=f"{report.store} ({report.path})", show_header=True, header_style="bold"
+        )
+        table.add_column("table")
+        table.add_column("rows", justify="right")
+        table.add_column("fragments", justify="right")
+        table.add_column("versions", justify="right")
+        table.add_column("unindexed", justify="right")
+        for before, after in zip(report.before, report.after, strict=False):
+            table.add_row(
+                after.table,
+                str(after.rows),
+                f"{before.fragments} -> {after.fragments}",
+                f"{before.versions} -> {after.versions}",
+                f"{before.unindexed_rows} -> {after.unindexed_rows}"
+                if after.indexed_rows
+                else "[dim]no index[/dim]",
+            )
+        console.print(table)
+        if report.query_ms_before is not None and report.query_ms_after is not None:
+            console.print(
+                f"  query latency (median): {report.query_ms_before:.2f} ms -> "
+                f"{report.query_ms_after:.2f} ms"
+            )
+        console.print(f"  [dim]optimized in {report.elapsed_s:.2f}s[/dim]")
@@ -119,6 +119,12 @@ def mcp_serve(
     pass_through: Annotated[
         bool, typer.Option("--pass-through", help="Also expose agent MCP tools directly")
     ] = False,
+    max_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--max-concurrency", min=1, help="Concurrent runs allowed per agent; extra calls wait"
+        ),
+    ] = 4,
     audit_db: AuditDbOption = None,
     no_audit: NoAuditOption = False,
     skill_dir: SkillDirOption = None,
@@ -157,6 +163,7 @@ def mcp_serve(
             pass_through=pass_through,
             extra_skill_dirs=extra_skill_dirs,
             role_mutators=role_mutators,
+            max_concurrency=max_concurrency,
         )
     except Exception as e:
         err_console.print(f"[red]Error:[/red] {e}")
@@ -160,6 +160,15 @@ def run(
             "--cors-origin", help="CORS origin (repeatable)", rich_help_panel="Serve Options"
         ),
     ] = None,
+    audit_batch: Annotated[
+        bool,
+        typer.Option(
+            "--audit-batch",
+            help="Commit audit records in batches from a background writer thread",
+            envvar="INITRUNNER_AUDIT_BATCH",
+            rich_help_panel="Serve Options",
+        ),
+    ] = False,
     # --- Bot options ---
     allowed_users: Annotated[
         list[str] | None,
@@ -494,6 +503,7 @@ def run(
                 no_audit,
                 skill_dir,
                 effective_model,
+                audit_batch=audit_batch,
             )
         else:
             dispatch_group_daemon(
@@ -520,6 +530,7 @@ def run(
             skill_dir,
             effective_model,
             role_mutator=role_mutator,
+            audit_batch=audit_batch,
         )
         return
 
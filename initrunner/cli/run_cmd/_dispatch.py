@@ -77,6 +77,7 @@ def _dispatch_serve(
     skill_dir: Path | None,
     model: str | None,
     role_mutator: RoleMutator = None,
+    audit_batch: bool = False,
 ) -> None:
     """Serve an agent as an OpenAI-compatible API."""
     from initrunner.middleware import resolve_exposed_api_key
@@ -93,6 +94,7 @@ def _dispatch_serve(
         extra_skill_dirs=resolve_skill_dirs(skill_dir),
         model_override=resolved_model,
         role_mutator=role_mutator,
+        audit_background=audit_batch,
     ) as (role, agent, audit_logger, _memory_store, _sink_dispatcher):
         console.print(f"Serving [cyan]{role.metadata.name}[/cyan] at http://{host}:{port}")
         console.print(f"  Model ID: {role.metadata.name}")
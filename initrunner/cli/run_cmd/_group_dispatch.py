@@ -44,6 +44,7 @@ def group_context(
     with_sinks: bool = False,
     skill_dir: Path | None = None,
     model: str | None = None,
+    audit_background: bool = False,
 ) -> Iterator[GroupRuntime]:
     """Build every member of a group and own their resources for the process.
 
@@ -54,11 +55,11 @@ def group_context(
     from initrunner.cli.run_cmd._group import load_roster_or_exit
     from initrunner.group.prepare import GroupPrepareError, prepare_group
     from initrunner.observability import setup_tracing, shutdown_tracing
-    from initrunner.sinks.dispatcher import SinkDispatcher
+    from initrunner.sinks.dispatcher import SinkDispatcher, sink_outbox_enabled
     from initrunner.stores.factory import managed_memory_store
 
     roster = load_roster_or_exit(group_file)
-    audit_logger = create_audit_logger(audit_db, no_audit)
+    audit_logger = create_audit_logger(audit_db, no_audit, background=audit_background)
 
     provider = None
     if roster.group.observability is not None:
@@ -89,10 +90,16 @@ def group_context(
                         memory_stores[key] = store
                 if with_sinks and member.role.spec.sinks:
                     sinks[key] = SinkDispatcher(
-                        member.role.spec.sinks, member.role, role_dir=member.role_dir
+                        member.role.spec.sinks,
+                        member.role,
+                        role_dir=member.role_dir,
+                        background=True,
+                        outbox=audit_logger if sink_outbox_enabled() else None,
                     )
             yield roster, prepared, audit_logger, memory_stores, sinks
     finally:
+        for dispatcher in sinks.values():
+            dispatcher.close()
         if audit_logger is not None:
             audit_logger.close()
         if provider is not None:
@@ -109,6 +116,8 @@ def dispatch_group_serve(
     no_audit: bool,
     skill_dir: Path | None,
     model: str | None,
+    *,
+    audit_batch: bool = False,
 ) -> None:
     """Serve every member of a group from one OpenAI-compatible API."""
     from initrunner.middleware import resolve_exposed_api_key
@@ -122,6 +131,7 @@ def dispatch_group_serve(
         no_audit=no_audit,
         skill_dir=skill_dir,
         model=model,
+        audit_background=audit_batch,
     ) as (roster, prepared, audit_logger, _stores, _sinks):
         members = {
             key: ServedMember(key=key, role=member.role, agent=member.agent, role_path=member.path)
@@ -73,6 +73,22 @@ def get_mcp_cache_dir() -> Path:
     return get_home_dir() / "cache" / "mcp"
 
 
+def get_embedding_cache_path() -> Path:
+    return get_home_dir() / "cache" / "embeddings.db"
+
+
+def get_oci_blob_cache_dir() -> Path:
+    return get_home_dir() / "cache" / "oci" / "blobs"
+
+
+def get_rate_limit_db_path() -> Path:
+    return get_home_dir() / "ratelimit.db"
+
+
+def get_server_conversations_path() -> Path:
+    return get_home_dir() / "server_conversations.db"
+
+
 def get_hub_auth_path() -> Path:
     return get_home_dir() / "hub-auth.json"
 
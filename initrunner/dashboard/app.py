@@ -24,10 +24,12 @@ from starlette.responses import RedirectResponse
 from initrunner._compat import MissingExtraError
 from initrunner.dashboard.config import DashboardSettings
 from initrunner.dashboard.deps import (
+    AuditPool,
     FlowCache,
     RoleCache,
     SkillCache,
     TeamCache,
+    get_audit_pool,
     get_flow_cache,
     get_role_cache,
     get_skill_cache,
@@ -47,6 +49,7 @@ def create_app(settings: DashboardSettings | None = None) -> FastAPI:
     flow_cache = FlowCache(settings)
     team_cache = TeamCache(settings)
     skill_cache = SkillCache(settings)
+    audit_pool = AuditPool()
 
     @asynccontextmanager
     async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
@@ -56,7 +59,12 @@ def create_app(settings: DashboardSettings | None = None) -> FastAPI:
         await asyncio.to_thread(flow_cache.refresh)
         await asyncio.to_thread(team_cache.refresh)
         await asyncio.to_thread(skill_cache.refresh)
-        yield
+        # Run the audit schema migrations once, up front, if the DB exists.
+        await asyncio.to_thread(audit_pool.get, create=False)
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(audit_pool.close)
 
     app = FastAPI(
         title="InitRunner Dashboard",
@@ -97,6 +105,7 @@ def create_app(settings: DashboardSettings | None = None) -> FastAPI:
     app.dependency_overrides[get_flow_cache] = lambda: flow_cache
     app.dependency_overrides[get_team_cache] = lambda: team_cache
     app.dependency_overrides[get_skill_cache] = lambda: skill_cache
+    app.dependency_overrides[get_audit_pool] = lambda: audit_pool
 
     # -- Health endpoint ----------------------------------------------------
     @app.get("/api/health", tags=["health"])
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Generic, TypeVar
@@ -11,6 +13,7 @@ from typing import TYPE_CHECKING, Generic, TypeVar
 from initrunner.dashboard.config import DashboardSettings
 
 if TYPE_CHECKING:
+    from initrunner.audit.logger import AuditLogger
     from initrunner.services.discovery import (  # noqa: F401
         DiscoveredFlow,
         DiscoveredRole,
@@ -140,6 +143,62 @@ class SkillCache(_YamlFileCache["DiscoveredSkillFull"]):
             _logger.warning("Failed to reload skill %s: %s", skill_id, exc)
 
 
+class AuditPool:
+    """One long-lived AuditLogger shared by every dashboard router.
+
+    Opening an ``AuditLogger`` runs the schema setup and every migration, so
+    doing it per request costs a connection plus a dozen DDL statements per
+    HTTP call. The pool opens it once -- one writer connection and up to
+    *read_pool_size* read-only connections -- and hands the same instance to
+    every request until the app shuts down.
+    """
+
+    def __init__(self, read_pool_size: int = 4) -> None:
+        self._read_pool_size = read_pool_size
+        self._logger: AuditLogger | None = None
+        self._lock = threading.Lock()
+
+    def get(self, *, create: bool = True) -> AuditLogger | None:
+        """Return the shared logger, opening it on first use.
+
+        With ``create=False`` returns None instead of creating a missing
+        audit DB, for read-only routes that should show an empty state.
+        """
+        if self._logger is not None:
+            return self._logger
+        from initrunner.audit.logger import AuditLogger
+        from initrunner.config import get_audit_db_path
+
+        with self._lock:
+            if self._logger is None:
+                db_path = get_audit_db_path()
+                if not create and not db_path.exists():
+                    return None
+                self._logger = AuditLogger(db_path, read_pool_size=self._read_pool_size)
+            return self._logger
+
+    async def get_async(self, *, create: bool = True) -> AuditLogger | None:
+        """:meth:`get` for async handlers: the first open runs off the event loop."""
+        if self._logger is not None:
+            return self._logger
+        return await asyncio.to_thread(self.get, create=create)
+
+    async def require(self) -> AuditLogger:
+        """Return the shared logger, or raise 503 when it cannot be opened."""
+        from fastapi import HTTPException  # type: ignore[import-not-found]
+
+        logger = await self.get_async()
+        if logger is None:
+            raise HTTPException(status_code=503, detail="Audit log is unavailable")
+        return logger
+
+    def close(self) -> None:
+        with self._lock:
+            if self._logger is not None:
+                self._logger.close()
+                self._logger = None
+
+
 # -- Convenience aliases used by routers ---------------------------------------
 
 _role_id = _file_id
@@ -169,3 +228,8 @@ def get_team_cache() -> TeamCache:
 def get_skill_cache() -> SkillCache:
     """Dependency placeholder -- overridden in app factory."""
     raise RuntimeError("SkillCache not initialized")
+
+
+def get_audit_pool() -> AuditPool:
+    """Dependency placeholder -- overridden in app factory."""
+    raise RuntimeError("AuditPool not initialized")
@@ -9,10 +9,12 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException  # type: ignore[import-not-found]
 
 from initrunner.dashboard.deps import (
+    AuditPool,
     FlowCache,
     RoleCache,
     SkillCache,
     TeamCache,
+    get_audit_pool,
     get_flow_cache,
     get_role_cache,
     get_skill_cache,
@@ -359,6 +361,7 @@ async def delete_agent(
 async def get_trigger_stats(
     agent_id: str,
     role_cache: Annotated[RoleCache, Depends(get_role_cache)],
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
 ) -> list[TriggerStatResponse]:
     from initrunner.agent.schema.triggers import CronTriggerConfig, HeartbeatTriggerConfig
     from initrunner.config import get_audit_db_path
@@ -382,6 +385,7 @@ async def get_trigger_stats(
         trigger_stats_sync,
         agent_name=dr.role.metadata.name,
         audit_db=get_audit_db_path(),
+        audit_logger=await audit_pool.get_async(create=False),
     )
     stats_by_type = {s.trigger_type: s for s in stats_list}
 
@@ -416,13 +420,13 @@ async def get_trigger_stats(
 async def get_timeline(
     agent_id: str,
     role_cache: Annotated[RoleCache, Depends(get_role_cache)],
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
     since: str | None = None,
     until: str | None = None,
     limit: int = 500,
 ) -> TimelineResponse:
     from datetime import timedelta
 
-    from initrunner.config import get_audit_db_path
     from initrunner.dashboard._timeline import build_timeline_response
     from initrunner.dashboard.schemas import TimelineStatsResponse
 
@@ -440,17 +444,13 @@ async def get_timeline(
     if since is None:
         since = (now - timedelta(hours=24)).isoformat()
 
-    from initrunner.audit.logger import AuditLogger
+    al = await audit_pool.require()
 
     def _query():
-        al = AuditLogger(get_audit_db_path())
-        try:
-            return (
-                al.timeline_query(agent_name=agent_name, since=since, until=until, limit=limit),
-                al.timeline_stats(agent_name=agent_name, since=since, until=until),
-            )
-        finally:
-            al.close()
+        return (
+            al.timeline_query(agent_name=agent_name, since=since, until=until, limit=limit),
+            al.timeline_stats(agent_name=agent_name, since=since, until=until),
+        )
 
     rows, stats_dict = await asyncio.to_thread(_query)
     return build_timeline_response(rows, stats_dict)
@@ -460,9 +460,8 @@ async def get_timeline(
 async def get_budget_progress(
     agent_id: str,
     role_cache: Annotated[RoleCache, Depends(get_role_cache)],
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
 ) -> BudgetProgressResponse:
-    from initrunner.audit.logger import AuditLogger
-    from initrunner.config import get_audit_db_path
     from initrunner.dashboard.schemas import BudgetGauge
     from initrunner.runner.budget import BudgetSnapshot
 
@@ -475,14 +474,8 @@ async def get_budget_progress(
     guardrails = dr.role.spec.guardrails
     tz = guardrails.budget_timezone
 
-    def _load():
-        al = AuditLogger(get_audit_db_path())
-        try:
-            return al.load_budget_state(dr.role.metadata.name)  # type: ignore[union-attr]
-        finally:
-            al.close()
-
-    saved = await asyncio.to_thread(_load)
+    al = await audit_pool.require()
+    saved = await asyncio.to_thread(al.load_budget_state, dr.role.metadata.name)
 
     if saved is not None:
         snap = BudgetSnapshot.from_dict(saved).with_resets(tz)
@@ -4,7 +4,8 @@ These endpoints sit alongside the OpenAI-compatible ``/v1/approvals/{run_id}``
 route on ``initrunner/server/app.py`` but serve the dashboard's own needs:
 grouping by run, exposing the originating prompt, and feeding the nav badge.
 
-All reads hit the audit SQLite directly via :class:`AuditLogger`; the resolve
+All reads hit the audit SQLite through the dashboard's shared
+:class:`~initrunner.dashboard.deps.AuditPool`; the resolve
 path calls ``services.execution.resume_run_sync`` in-process rather than
 proxying to the OpenAI-compatible server.
 """
@@ -15,10 +16,12 @@ import asyncio
 import json
 import logging
 from pathlib import Path
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query  # type: ignore[import-not-found]
+from fastapi import APIRouter, Depends, HTTPException, Query  # type: ignore[import-not-found]
 
-from initrunner.audit.logger import AuditLogger, PendingApprovalRecord
+from initrunner.audit.logger import PendingApprovalRecord
+from initrunner.dashboard.deps import AuditPool, get_audit_pool
 from initrunner.dashboard.schemas import (
     ApprovalsResolveRequest,
     ApprovalsResolveResponse,
@@ -33,12 +36,6 @@ router = APIRouter(prefix="/api/approvals", tags=["approvals"])
 _logger = logging.getLogger(__name__)
 
 
-def _audit_logger() -> AuditLogger:
-    from initrunner.config import get_audit_db_path
-
-    return AuditLogger(get_audit_db_path())
-
-
 def _parse_args(raw: str) -> dict:
     try:
         parsed = json.loads(raw)
@@ -111,13 +108,11 @@ def _group_by_run(rows: list[PendingApprovalRecord]) -> list[PendingRunResponse]
 async def list_pending(
     count_only: bool = Query(False, description="Return only the count."),
     limit: int = Query(200, ge=1, le=1000),
+    audit_pool: AuditPool = Depends(get_audit_pool),  # noqa: B008
 ) -> PendingListResponse | PendingCountResponse:
     """List unresolved approvals. With ``count_only=1``, returns just a count."""
-    logger = _audit_logger()
-    try:
-        rows = await asyncio.to_thread(logger.list_pending_approvals, limit=limit)
-    finally:
-        await asyncio.to_thread(logger.close)
+    logger = await audit_pool.require()
+    rows = await asyncio.to_thread(logger.list_pending_approvals, limit=limit)
 
     if count_only:
         return PendingCountResponse(count=len(rows))
@@ -127,13 +122,13 @@ async def list_pending(
 
 
 @router.get("/{run_id}", response_model=PendingRunResponse)
-async def get_run(run_id: str) -> PendingRunResponse:
+async def get_run(
+    run_id: str,
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
+) -> PendingRunResponse:
     """Return the pending calls + context for one paused run."""
-    logger = _audit_logger()
-    try:
-        rows = await asyncio.to_thread(logger.load_pending_approvals, run_id)
-    finally:
-        await asyncio.to_thread(logger.close)
+    logger = await audit_pool.require()
+    rows = await asyncio.to_thread(logger.load_pending_approvals, run_id)
 
     unresolved = [r for r in rows if r.resolved_at is None]
     if not unresolved:
@@ -145,83 +140,84 @@ async def get_run(run_id: str) -> PendingRunResponse:
 
 
 @router.post("/{run_id}", response_model=ApprovalsResolveResponse)
-async def resolve_run(run_id: str, req: ApprovalsResolveRequest) -> ApprovalsResolveResponse:
+async def resolve_run(
+    run_id: str,
+    req: ApprovalsResolveRequest,
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
+) -> ApprovalsResolveResponse:
     """Submit decisions for a paused run and resume it in-process."""
     if not req.decisions:
         raise HTTPException(status_code=400, detail="decisions must be non-empty")
     if not all(isinstance(v, bool) for v in req.decisions.values()):
         raise HTTPException(status_code=400, detail="every decision must be a bool")
 
-    logger = _audit_logger()
-    try:
-        rows = await asyncio.to_thread(logger.load_pending_approvals, run_id)
-        unresolved = [r for r in rows if r.resolved_at is None]
-        if not unresolved:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No unresolved approvals found for run {run_id!r}",
-            )
+    logger = await audit_pool.require()
+    rows = await asyncio.to_thread(logger.load_pending_approvals, run_id)
+    unresolved = [r for r in rows if r.resolved_at is None]
+    if not unresolved:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No unresolved approvals found for run {run_id!r}",
+        )
 
-        role_paths = {r.role_path for r in unresolved if r.role_path}
-        if len(role_paths) != 1:
-            raise HTTPException(
-                status_code=409,
-                detail="Pending rows for this run disagree on the role path",
-            )
-        role_path = Path(next(iter(role_paths)))
-        if not role_path.exists():
-            raise HTTPException(
-                status_code=410,
-                detail=f"Role file no longer exists at {role_path}",
-            )
+    role_paths = {r.role_path for r in unresolved if r.role_path}
+    if len(role_paths) != 1:
+        raise HTTPException(
+            status_code=409,
+            detail="Pending rows for this run disagree on the role path",
+        )
+    role_path = Path(next(iter(role_paths)))
+    if not role_path.exists():
+        raise HTTPException(
+            status_code=410,
+            detail=f"Role file no longer exists at {role_path}",
+        )
 
-        from initrunner.services.execution import build_agent_sync, resume_run_sync
-
-        role, agent = await asyncio.to_thread(build_agent_sync, role_path)
-        try:
-            result, new_messages = await asyncio.to_thread(
-                resume_run_sync,
-                agent,
-                role,
-                run_id,
-                req.decisions,
-                audit_logger=logger,
-                resolved_by=req.resolved_by,
-                role_path=role_path,
-            )
-        except ValueError as exc:
-            # missing decision for some unresolved tool_call_id
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-
-        serialized_history: str | None = None
-        if result.success or result.status == "paused":
-            from pydantic_ai.messages import ModelMessagesTypeAdapter
-
-            from initrunner.agent.history import session_limits, trim_message_history
-
-            _, max_history = session_limits(role)
-            trimmed = trim_message_history(new_messages, max_history)
-            serialized_history = ModelMessagesTypeAdapter.dump_json(trimmed).decode("utf-8")
-
-        return ApprovalsResolveResponse(
-            run_id=run_id,
-            status=result.status,
-            success=result.success,
-            output=result.output,
-            error=result.error,
-            tokens_in=result.tokens_in,
-            tokens_out=result.tokens_out,
-            total_tokens=result.total_tokens,
-            duration_ms=result.duration_ms,
-            message_history=serialized_history,
-            pending_approvals=[
-                PendingCallResponse(
-                    tool_call_id=p.tool_call_id,
-                    tool_name=p.tool_name,
-                    arguments=p.arguments,
-                )
-                for p in result.pending_approvals
-            ],
+    from initrunner.services.execution import build_agent_sync, resume_run_sync
+
+    role, agent = await asyncio.to_thread(build_agent_sync, role_path)
+    try:
+        result, new_messages = await asyncio.to_thread(
+            resume_run_sync,
+            agent,
+            role,
+            run_id,
+            req.decisions,
+            audit_logger=logger,
+            resolved_by=req.resolved_by,
+            role_path=role_path,
         )
-    finally:
-        await asyncio.to_thread(logger.close)
+    except ValueError as exc:
+        # missing decision for some unresolved tool_call_id
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    serialized_history: str | None = None
+    if result.success or result.status == "paused":
+        from pydantic_ai.messages import ModelMessagesTypeAdapter
+
+        from initrunner.agent.history import session_limits, trim_message_history
+
+        _, max_history = session_limits(role)
+        trimmed = trim_message_history(new_messages, max_history)
+        serialized_history = ModelMessagesTypeAdapter.dump_json(trimmed).decode("utf-8")
+
+    return ApprovalsResolveResponse(
+        run_id=run_id,
+        status=result.status,
+        success=result.success,
+        output=result.output,
+        error=result.error,
+        tokens_in=result.tokens_in,
+        tokens_out=result.tokens_out,
+        total_tokens=result.total_tokens,
+        duration_ms=result.duration_ms,
+        message_history=serialized_history,
+        pending_approvals=[
+            PendingCallResponse(
+                tool_call_id=p.tool_call_id,
+                tool_name=p.tool_name,
+                arguments=p.arguments,
+            )
+            for p in result.pending_approvals
+        ],
+    )
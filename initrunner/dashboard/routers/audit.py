@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import json
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query  # type: ignore[import-not-found]
+from fastapi import APIRouter, Depends, HTTPException, Query  # type: ignore[import-not-found]
 
+from initrunner.dashboard.deps import AuditPool, get_audit_pool
 from initrunner.dashboard.schemas import (
     AuditRecordResponse,
     AuditRunDetailResponse,
@@ -26,6 +28,7 @@ async def query_audit(
     until: str | None = Query(None, description="ISO 8601 datetime"),
     limit: int = Query(50, ge=1, le=500),
     exclude_trigger_types: list[str] | None = Query(None),  # noqa: B008
+    audit_pool: AuditPool = Depends(get_audit_pool),  # noqa: B008
 ) -> list[AuditRecordResponse]:
     from initrunner.config import get_audit_db_path
     from initrunner.services.operations import query_audit_sync
@@ -39,6 +42,7 @@ async def query_audit(
         until=until,
         limit=limit,
         audit_db=get_audit_db_path(),
+        audit_logger=await audit_pool.get_async(create=False),
         exclude_trigger_types=exclude_trigger_types,
     )
 
@@ -78,6 +82,7 @@ async def audit_stats(
     agent_name: str | None = Query(None),
     since: str | None = Query(None, description="ISO 8601 datetime"),
     until: str | None = Query(None, description="ISO 8601 datetime"),
+    audit_pool: AuditPool = Depends(get_audit_pool),  # noqa: B008
 ) -> AuditStatsResponse:
     from initrunner.config import get_audit_db_path
     from initrunner.services.operations import audit_stats_sync
@@ -88,6 +93,7 @@ async def audit_stats(
         since=since,
         until=until,
         audit_db=get_audit_db_path(),
+        audit_logger=await audit_pool.get_async(create=False),
     )
     return AuditStatsResponse(
         total_runs=stats.total_runs,
@@ -113,7 +119,10 @@ def _parse_json_list(raw: str | None) -> list[dict] | None:
 
 
 @router.get("/{run_id}")
-async def audit_run_detail(run_id: str) -> AuditRunDetailResponse:
+async def audit_run_detail(
+    run_id: str,
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
+) -> AuditRunDetailResponse:
     """Drill-down for a single run: base record plus parsed timeline and judge verdicts.
 
     Registered after ``/stats`` so FastAPI matches the literal path before the converter.
@@ -126,6 +135,7 @@ async def audit_run_detail(run_id: str) -> AuditRunDetailResponse:
         run_id=run_id,
         limit=1,
         audit_db=get_audit_db_path(),
+        audit_logger=await audit_pool.get_async(create=False),
     )
     if not records:
         raise HTTPException(status_code=404, detail="Run not found")
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 
-from fastapi import APIRouter, Query  # type: ignore[import-not-found]
+from fastapi import APIRouter, Depends, Query  # type: ignore[import-not-found]
 
+from initrunner.dashboard.deps import AuditPool, get_audit_pool
 from initrunner.dashboard.schemas import (
     AgentCostResponse,
     CostSummaryResponse,
@@ -18,11 +19,17 @@ router = APIRouter(prefix="/api/cost", tags=["cost"])
 
 
 @router.get("/summary")
-async def get_cost_summary() -> CostSummaryResponse:
+async def get_cost_summary(
+    audit_pool: AuditPool = Depends(get_audit_pool),  # noqa: B008
+) -> CostSummaryResponse:
     from initrunner.config import get_audit_db_path
     from initrunner.services.cost import cost_summary_sync
 
-    summary = await asyncio.to_thread(cost_summary_sync, audit_db=get_audit_db_path())
+    summary = await asyncio.to_thread(
+        cost_summary_sync,
+        audit_db=get_audit_db_path(),
+        audit_logger=await audit_pool.get_async(create=False),
+    )
     return CostSummaryResponse(
         today=summary.today,
         this_week=summary.this_week,
@@ -57,6 +64,7 @@ async def get_cost_by_agent(
     agent_name: str | None = Query(None),
     since: str | None = Query(None, description="ISO 8601 datetime"),
     until: str | None = Query(None, description="ISO 8601 datetime"),
+    audit_pool: AuditPool = Depends(get_audit_pool),  # noqa: B008
 ) -> list[AgentCostResponse]:
     from initrunner.config import get_audit_db_path
     from initrunner.services.cost import cost_report_sync
@@ -67,6 +75,7 @@ async def get_cost_by_agent(
         since=since,
         until=until,
         audit_db=get_audit_db_path(),
+        audit_logger=await audit_pool.get_async(create=False),
     )
     return [
         AgentCostResponse(
@@ -87,24 +96,19 @@ async def get_cost_by_agent(
 async def get_cost_daily(
     days: int = Query(30, ge=1, le=365),
     agent_name: str | None = Query(None),
+    audit_pool: AuditPool = Depends(get_audit_pool),  # noqa: B008
 ) -> list[DailyCostResponse]:
     from datetime import UTC, datetime, timedelta
 
-    from initrunner.config import get_audit_db_path
-
     since = (datetime.now(UTC) - timedelta(days=days)).isoformat()
-    # Use cost_by_day via the summary path
-    from initrunner.audit.logger import AuditLogger
-
-    db_path = get_audit_db_path()
-    if not db_path.exists():
+    audit_logger = await audit_pool.get_async(create=False)
+    if audit_logger is None:
         return []
 
     def _query() -> list[DailyCostResponse]:
         from initrunner.services.cost import _daily_entries_from_rows
 
-        with AuditLogger(db_path) as logger:
-            rows = logger.cost_by_day(agent_name=agent_name, since=since)
+        rows = audit_logger.cost_by_day(agent_name=agent_name, since=since)
         entries = _daily_entries_from_rows(rows)
         return [
             DailyCostResponse(
@@ -122,6 +126,7 @@ async def get_cost_daily(
 async def get_cost_by_model(
     since: str | None = Query(None, description="ISO 8601 datetime"),
     until: str | None = Query(None, description="ISO 8601 datetime"),
+    audit_pool: AuditPool = Depends(get_audit_pool),  # noqa: B008
 ) -> list[ModelCostResponse]:
     from initrunner.config import get_audit_db_path
     from initrunner.services.cost import cost_by_model_sync
@@ -131,6 +136,7 @@ async def get_cost_by_model(
         since=since,
         until=until,
         audit_db=get_audit_db_path(),
+        audit_logger=await audit_pool.get_async(create=False),
     )
     return [
         ModelCostResponse(
@@ -152,6 +158,7 @@ async def get_cost_by_tool(
     agent_name: str | None = Query(None),
     since: str | None = Query(None, description="ISO 8601 datetime"),
     until: str | None = Query(None, description="ISO 8601 datetime"),
+    audit_pool: AuditPool = Depends(get_audit_pool),  # noqa: B008
 ) -> list[ToolCostResponse]:
     from initrunner.config import get_audit_db_path
     from initrunner.services.cost import cost_by_tool_sync
@@ -162,6 +169,7 @@ async def get_cost_by_tool(
         since=since,
         until=until,
         audit_db=get_audit_db_path(),
+        audit_logger=await audit_pool.get_async(create=False),
     )
     return [
         ToolCostResponse(
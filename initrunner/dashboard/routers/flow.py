@@ -11,9 +11,11 @@ from fastapi import APIRouter, Depends, HTTPException  # type: ignore[import-not
 from starlette.responses import StreamingResponse
 
 from initrunner.dashboard.deps import (
+    AuditPool,
     FlowCache,
     RoleCache,
     _role_id,
+    get_audit_pool,
     get_flow_cache,
     get_role_cache,
 )
@@ -267,6 +269,7 @@ async def stream_flow_run(
     flow_id: str,
     req: FlowRunRequest,
     flow_cache: Annotated[FlowCache, Depends(get_flow_cache)],
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
 ) -> StreamingResponse:
     dc = flow_cache.get(flow_id)
     if dc is None:
@@ -280,7 +283,6 @@ async def stream_flow_run(
 
         message_history = _parse_message_history(req.message_history)
 
-    from initrunner.dashboard.routers.runs import _audit_logger
     from initrunner.dashboard.streaming import stream_flow_run_sse
 
     return StreamingResponse(
@@ -288,7 +290,7 @@ async def stream_flow_run(
             dc.flow,
             dc.path.parent,
             req.prompt,
-            audit_logger=_audit_logger(),
+            audit_logger=await audit_pool.require(),
             message_history=message_history,
         ),
         media_type="text/event-stream",
@@ -363,13 +365,13 @@ async def delete_flow(
 async def get_flow_timeline(
     flow_id: str,
     flow_cache: Annotated[FlowCache, Depends(get_flow_cache)],
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
     since: str | None = None,
     until: str | None = None,
     limit: int = 500,
 ) -> TimelineResponse:
     from datetime import timedelta
 
-    from initrunner.config import get_audit_db_path
     from initrunner.dashboard._timeline import build_timeline_response
 
     dc = flow_cache.get(flow_id)
@@ -386,28 +388,24 @@ async def get_flow_timeline(
     if since is None:
         since = (now - timedelta(hours=24)).isoformat()
 
-    from initrunner.audit.logger import AuditLogger
+    al = await audit_pool.require()
 
     def _query():
-        al = AuditLogger(get_audit_db_path())
-        try:
-            return (
-                al.timeline_query(
-                    agent_name=flow_name,
-                    trigger_type="flow_run",
-                    since=since,
-                    until=until,
-                    limit=limit,
-                ),
-                al.timeline_stats(
-                    agent_name=flow_name,
-                    trigger_type="flow_run",
-                    since=since,
-                    until=until,
-                ),
-            )
-        finally:
-            al.close()
+        return (
+            al.timeline_query(
+                agent_name=flow_name,
+                trigger_type="flow_run",
+                since=since,
+                until=until,
+                limit=limit,
+            ),
+            al.timeline_stats(
+                agent_name=flow_name,
+                trigger_type="flow_run",
+                since=since,
+                until=until,
+            ),
+        )
 
     rows, stats_dict = await asyncio.to_thread(_query)
     return build_timeline_response(rows, stats_dict)
@@ -159,6 +159,11 @@ async def save_key(req: SaveKeyRequest) -> SaveKeyResponse:
     # Set in current process so subsequent requests see it immediately
     os.environ[env_name] = req.api_key
 
+    # Shared embedders captured the previous key when they were built
+    from initrunner.ingestion.embeddings import reset_embedders
+
+    reset_embedders()
+
     # Optional validation
     validated = False
     validation_supported = req.provider in _VALIDATABLE_PROVIDERS if req.provider else False
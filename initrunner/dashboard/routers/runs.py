@@ -9,7 +9,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException  # type: ignore[import-not-found]
 from fastapi.responses import StreamingResponse  # type: ignore[import-not-found]
 
-from initrunner.dashboard.deps import RoleCache, get_role_cache
+from initrunner.dashboard.deps import AuditPool, RoleCache, get_audit_pool, get_role_cache
 from initrunner.dashboard.schemas import RunRequest, RunResponse
 
 router = APIRouter(prefix="/api/runs", tags=["runs"])
@@ -17,14 +17,6 @@ router = APIRouter(prefix="/api/runs", tags=["runs"])
 _logger = logging.getLogger(__name__)
 
 
-def _audit_logger():
-    """Create an AuditLogger writing to the default audit DB."""
-    from initrunner.audit.logger import AuditLogger
-    from initrunner.config import get_audit_db_path
-
-    return AuditLogger(get_audit_db_path())
-
-
 def _parse_message_history(raw: str | None):
     """Deserialize an opaque message_history JSON string.
 
@@ -59,6 +51,7 @@ def _serialize_history(role, messages):
 async def execute_run(
     req: RunRequest,
     role_cache: Annotated[RoleCache, Depends(get_role_cache)],
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
 ) -> RunResponse:
     dr = role_cache.get(req.agent_id)
     if dr is None:
@@ -76,7 +69,7 @@ async def execute_run(
         agent,
         role,
         req.prompt,
-        audit_logger=_audit_logger(),
+        audit_logger=await audit_pool.require(),
         message_history=history,
     )
     return RunResponse(
@@ -98,6 +91,7 @@ async def execute_run(
 async def stream_run(
     req: RunRequest,
     role_cache: Annotated[RoleCache, Depends(get_role_cache)],
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
 ) -> StreamingResponse:
     dr = role_cache.get(req.agent_id)
     if dr is None:
@@ -112,7 +106,7 @@ async def stream_run(
             dr.path,
             req.prompt,
             model_override=req.model_override,
-            audit_logger=_audit_logger(),
+            audit_logger=await audit_pool.require(),
             message_history=history,
         ),
         media_type="text/event-stream",
@@ -9,7 +9,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException  # type: ignore[import-not-found]
 from starlette.responses import StreamingResponse
 
-from initrunner.dashboard.deps import TeamCache, get_team_cache
+from initrunner.dashboard.deps import AuditPool, TeamCache, get_audit_pool, get_team_cache
 from initrunner.dashboard.schemas import (
     DeleteResponse,
     ItemSummary,
@@ -205,6 +205,7 @@ async def stream_team_run(
     team_id: str,
     body: TeamRunRequest,
     cache: Annotated[TeamCache, Depends(get_team_cache)],
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
 ) -> StreamingResponse:
     discovered = cache.get(team_id)
     if discovered is None:
@@ -212,7 +213,6 @@ async def stream_team_run(
     if discovered.error or discovered.team is None:
         raise HTTPException(422, detail=discovered.error or "Team failed to load")
 
-    from initrunner.dashboard.routers.runs import _audit_logger
     from initrunner.dashboard.streaming import stream_team_run_sse
 
     return StreamingResponse(
@@ -220,7 +220,7 @@ async def stream_team_run(
             discovered.team,
             discovered.path.parent,
             body.prompt,
-            audit_logger=_audit_logger(),
+            audit_logger=await audit_pool.require(),
         ),
         media_type="text/event-stream",
         headers={
@@ -251,13 +251,13 @@ async def delete_team(
 async def get_team_timeline(
     team_id: str,
     cache: Annotated[TeamCache, Depends(get_team_cache)],
+    audit_pool: Annotated[AuditPool, Depends(get_audit_pool)],
     since: str | None = None,
     until: str | None = None,
     limit: int = 500,
 ) -> TimelineResponse:
     from datetime import timedelta
 
-    from initrunner.config import get_audit_db_path
     from initrunner.dashboard._timeline import build_timeline_response
 
     dt = cache.get(team_id)
@@ -274,28 +274,24 @@ async def get_team_timeline(
     if since is None:
         since = (now - timedelta(hours=24)).isoformat()
 
-    from initrunner.audit.logger import AuditLogger
+    al = await audit_pool.require()
 
     def _query():
-        al = AuditLogger(get_audit_db_path())
-        try:
-            return (
-                al.timeline_query(
-                    agent_name=team_name,
-                    trigger_type="team_run",
-                    since=since,
-                    until=until,
-                    limit=limit,
-                ),
-                al.timeline_stats(
-                    agent_name=team_name,
-                    trigger_type="team_run",
-                    since=since,
-                    until=until,
-                ),
-            )
-        finally:
-            al.close()
+        return (
+            al.timeline_query(
+                agent_name=team_name,
+                trigger_type="team_run",
+                since=since,
+                until=until,
+                limit=limit,
+            ),
+            al.timeline_stats(
+                agent_name=team_name,
+                trigger_type="team_run",
+                since=since,
+                until=until,
+            ),
+        )
 
     rows, stats_dict = await asyncio.to_thread(_query)
     return build_timeline_response(rows, stats_dict)
@@ -0,0 +1,145 @@
+"""Concurrent URL fetching for ingestion.
+
+:func:`fetch_urls` fetches many URLs over one pooled ``httpx.AsyncClient``:
+
+- At most ``concurrency`` requests are in flight overall.
+- Each host has a token bucket, so one host is never sent more than
+  ``domain_rate`` requests per second, while requests to other hosts go
+  ahead.
+- URLs with stored ``ETag``/``Last-Modified`` validators are requested
+  conditionally. A ``304 Not Modified`` costs one round-trip, with no body
+  download and no markdown conversion.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+import httpx
+
+from initrunner._html import _USER_AGENT, _read_body_capped_async, _response_to_markdown
+from initrunner.agent._urls import AsyncSSRFSafeTransport
+
+DEFAULT_FETCH_TIMEOUT = 15  # seconds
+DEFAULT_MAX_BYTES = 512_000
+
+
+@dataclass(frozen=True)
+class UrlFetch:
+    """Outcome of fetching one URL.
+
+    Exactly one of ``text`` (fetched and converted to markdown),
+    ``not_modified`` (the server answered ``304``) or ``error`` is set.
+    ``etag`` and ``last_modified`` are the validators to store for the next
+    conditional request.
+    """
+
+    url: str
+    text: str | None = None
+    not_modified: bool = False
+    error: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class DomainThrottle:
+    """Per-host token buckets: at most *rate* requests per second, bursts of *burst*."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self._rate = rate
+        self._burst = burst
+        # host -> [tokens, last refill]; the lock serializes waiters per host
+        self._buckets: dict[str, list[float]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a request to *host* is allowed, then take a token."""
+        lock = self._locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            bucket = self._buckets.setdefault(host, [float(self._burst), time.monotonic()])
+            while True:
+                now = time.monotonic()
+                bucket[0] = min(self._burst, bucket[0] + (now - bucket[1]) * self._rate)
+                bucket[1] = now
+                if bucket[0] >= 1:
+                    bucket[0] -= 1
+                    return
+                await asyncio.sleep((1 - bucket[0]) / self._rate)
+
+
+async def _fetch_one(
+    client: httpx.AsyncClient,
+    url: str,
+    validators: tuple[str | None, str | None] | None,
+    max_bytes: int,
+) -> UrlFetch:
+    etag, last_modified = validators or (None, None)
+    headers: dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    async with client.stream("GET", url, headers=headers) as resp:
+        if resp.status_code == 304:
+            # A 304 may carry updated validators; keep the old ones otherwise.
+            return UrlFetch(
+                url,
+                not_modified=True,
+                etag=resp.headers.get("etag", etag),
+                last_modified=resp.headers.get("last-modified", last_modified),
+            )
+        resp.raise_for_status()
+        content_type = resp.headers.get("content-type", "")
+        body = await _read_body_capped_async(resp, max_bytes)
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+
+    # HTML parsing is CPU-bound; keep it off the event loop.
+    text = await asyncio.to_thread(_response_to_markdown, body, content_type, max_bytes)
+    return UrlFetch(url, text=text, etag=etag, last_modified=last_modified)
+
+
+async def fetch_urls(
+    urls: list[str],
+    validators: Mapping[str, tuple[str | None, str | None]] | None = None,
+    *,
+    concurrency: int = 8,
+    domain_rate: float = 1.0,
+    timeout: float = DEFAULT_FETCH_TIMEOUT,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> list[UrlFetch]:
+    """Fetch *urls* concurrently. Results are in input order; failures are returned, not raised.
+
+    *validators* maps a URL to the ``(etag, last_modified)`` it was last
+    served with. Those URLs are requested conditionally.
+    """
+    validators = validators or {}
+    throttle = DomainThrottle(domain_rate)
+    slots = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(
+        timeout=timeout,
+        headers={"User-Agent": _USER_AGENT},
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        transport=AsyncSSRFSafeTransport(),
+    ) as client:
+
+        async def _one(url: str) -> UrlFetch:
+            # Wait for the host's turn before taking a slot, so a slow host
+            # never holds slots that other hosts could use.
+            await throttle.acquire(urlparse(url).hostname or "")
+            async with slots:
+                try:
+                    return await _fetch_one(client, url, validators.get(url), max_bytes)
+                except Exception as e:
+                    return UrlFetch(url, error=str(e) or type(e).__name__)
+
+        return list(await asyncio.gather(*(_one(url) for url in urls)))
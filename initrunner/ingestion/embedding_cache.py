@@ -0,0 +1,238 @@
+"""On-disk embedding cache keyed by model identity, input type and text hash.
+
+Embedding the same text with the same model always yields the same vector, so
+re-ingesting after a chunking change, re-importing memories or recalling the
+same query can reuse earlier results instead of calling the provider again.
+Entries live in a small SQLite database under ``~/.initrunner/cache`` and are
+evicted least-recently-used first once the file grows past its size cap.
+
+Vectors are stored as float32, the precision LanceDB stores them at anyway.
+
+Set ``INITRUNNER_EMBEDDING_CACHE=0`` to disable the cache and
+``INITRUNNER_EMBEDDING_CACHE_MAX_MB`` to change the size cap (default 512).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from initrunner._log import get_logger
+
+logger = get_logger("ingestion.embedding_cache")
+
+_DEFAULT_MAX_MB = 512
+_EVICT_TO = 0.9  # after eviction, the cache is at most this fraction of its cap
+_SQL_CHUNK = 500  # keys per IN (...) lookup, under SQLite's variable limit
+
+_CREATE_TABLE = """\
+CREATE TABLE IF NOT EXISTS embeddings (
+    model TEXT NOT NULL,
+    input_type TEXT NOT NULL,
+    text_hash TEXT NOT NULL,
+    vector BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, input_type, text_hash)
+);
+"""
+_CREATE_LRU_INDEX = "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)"
+
+
+@dataclass(frozen=True)
+class EmbeddingCacheStats:
+    """Hit/miss counters for this process plus the cache's current size."""
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _pack(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> list[float]:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """Thread-safe SQLite embedding cache with LRU eviction by total size."""
+
+    def __init__(self, path: Path, *, max_bytes: int = _DEFAULT_MAX_MB * 1024 * 1024) -> None:
+        from initrunner._paths import ensure_private_dir, secure_database
+
+        ensure_private_dir(path.parent)
+        self._path = path
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, timeout=30)
+        secure_database(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_CREATE_TABLE)
+        self._conn.execute(_CREATE_LRU_INDEX)
+        self._conn.commit()
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()
+        self._size_bytes = int(row[0])
+
+    def get_many(
+        self, model: str, input_type: str, texts: Sequence[str]
+    ) -> list[list[float] | None]:
+        """Return the cached vector for each text, or ``None`` where there is none."""
+        hashes = [_text_hash(t) for t in texts]
+        found: dict[str, bytes] = {}
+        with self._lock:
+            unique = list(dict.fromkeys(hashes))
+            for i in range(0, len(unique), _SQL_CHUNK):
+                part = unique[i : i + _SQL_CHUNK]
+                placeholders = ", ".join("?" * len(part))
+                rows = self._conn.execute(
+                    "SELECT text_hash, vector FROM embeddings"
+                    f" WHERE model = ? AND input_type = ? AND text_hash IN ({placeholders})",
+                    (model, input_type, *part),
+                ).fetchall()
+                found.update(rows)
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ?"
+                    " WHERE model = ? AND input_type = ? AND text_hash = ?",
+                    [(now, model, input_type, h) for h in found],
+                )
+                self._conn.commit()
+            hits = sum(1 for h in hashes if h in found)
+            self._hits += hits
+            self._misses += len(hashes) - hits
+        return [_unpack(found[h]) if h in found else None for h in hashes]
+
+    def put_many(
+        self,
+        model: str,
+        input_type: str,
+        texts: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+    ) -> None:
+        """Store one vector per text, evicting old entries if over the size cap."""
+        now = time.time()
+        rows = []
+        for text, vector in zip(texts, vectors, strict=True):
+            blob = _pack(vector)
+            rows.append((model, input_type, _text_hash(text), blob, len(blob), now))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings"
+                " (model, input_type, text_hash, vector, size, last_used)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+            self._size_bytes += sum(r[4] for r in rows)
+            if self._size_bytes > self._max_bytes:
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        """Drop least-recently-used entries until under the eviction target."""
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()
+        self._size_bytes = int(row[0])
+        excess = self._size_bytes - int(self._max_bytes * _EVICT_TO)
+        if excess <= 0:
+            return
+        victims: list[int] = []
+        freed = 0
+        for rowid, size in self._conn.execute(
+            "SELECT rowid, size FROM embeddings ORDER BY last_used ASC"
+        ):
+            victims.append(rowid)
+            freed += size
+            if freed >= excess:
+                break
+        for i in range(0, len(victims), _SQL_CHUNK):
+            part = victims[i : i + _SQL_CHUNK]
+            self._conn.execute(
+                f"DELETE FROM embeddings WHERE rowid IN ({', '.join('?' * len(part))})", part
+            )
+        self._conn.commit()
+        self._size_bytes -= freed
+        logger.debug("Evicted %d embeddings (%d bytes)", len(victims), freed)
+
+    def stats(self) -> EmbeddingCacheStats:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            return EmbeddingCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=entries,
+                size_bytes=self._size_bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._size_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cache: EmbeddingCache | None = None
+_cache_disabled = False
+_cache_guard = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Return the process-wide embedding cache, or ``None`` when disabled.
+
+    Built lazily so tests can patch ``INITRUNNER_HOME`` before first use.
+    Call ``reset_embedding_cache()`` from fixtures that change environment state.
+    """
+    global _cache, _cache_disabled
+    if _cache is not None or _cache_disabled:
+        return _cache
+    with _cache_guard:
+        if _cache is not None or _cache_disabled:
+            return _cache
+        if os.environ.get("INITRUNNER_EMBEDDING_CACHE", "1").lower() in ("0", "false", "off", "no"):
+            _cache_disabled = True
+            return None
+        from initrunner.config import get_embedding_cache_path
+
+        max_mb = int(os.environ.get("INITRUNNER_EMBEDDING_CACHE_MAX_MB", _DEFAULT_MAX_MB))
+        try:
+            _cache = EmbeddingCache(get_embedding_cache_path(), max_bytes=max_mb * 1024 * 1024)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Embedding cache unavailable, embedding without it: %s", e)
+            _cache_disabled = True
+        return _cache
+
+
+def reset_embedding_cache() -> None:
+    global _cache, _cache_disabled
+    with _cache_guard:
+        if _cache is not None:
+            _cache.close()
+        _cache = None
+        _cache_disabled = False
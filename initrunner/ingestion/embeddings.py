@@ -11,16 +11,25 @@ provider) requires a fresh store path.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import sqlite3
+import threading
+import weakref
 from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
 from pydantic_ai.embeddings import Embedder, EmbeddingModel
 
+from initrunner._log import get_logger
+
 if TYPE_CHECKING:
     from pydantic_ai.embeddings import EmbeddingResult
     from pydantic_ai.embeddings.settings import EmbeddingSettings
 
+logger = get_logger("ingestion.embeddings")
+
 _DEFAULT_MODELS: dict[str, str] = {
     "openai": "openai:text-embedding-3-small",
     "anthropic": "openai:text-embedding-3-small",  # Anthropic has no embeddings; use OpenAI
@@ -29,6 +38,20 @@ _DEFAULT_MODELS: dict[str, str] = {
     "local": "local:BAAI/bge-small-en-v1.5",
 }
 
+
+@dataclass
+class _CacheTag:
+    """Embedding cache key and hit/miss counters for one embedder."""
+
+    identity: str
+    hits: int = 0
+    misses: int = 0
+
+
+# Embedders built by create_embedder, tagged with their model identity so
+# embed_texts can use the embedding cache. Embedders built elsewhere bypass it.
+_cache_tags: weakref.WeakKeyDictionary[Embedder, _CacheTag] = weakref.WeakKeyDictionary()
+
 _PROVIDER_EMBEDDING_KEY_DEFAULTS: dict[str, str] = {
     "openai": "OPENAI_API_KEY",
     "anthropic": "OPENAI_API_KEY",
@@ -80,7 +103,60 @@ def create_embedder(
     The ``local`` provider runs an in-process embedding model via fastembed with
     no HTTP hop. It is distinct from ``ollama``, which routes through an
     OpenAI-compatible HTTP client and needs a running endpoint.
+
+    The embedder is registered under its :func:`compute_model_identity` so
+    :func:`embed_texts` can serve repeated texts from the embedding cache.
     """
+    embedder = _build_embedder(provider, model, base_url, api_key_env)
+    _cache_tags[embedder] = _CacheTag(compute_model_identity(provider, model, base_url))
+    return embedder
+
+
+# Shared embedders for embed_single / embed_single_async, keyed by
+# (provider, model, base_url, api_key_env).
+_embedders: dict[tuple[str, str, str, str], Embedder] = {}
+_embedders_lock = threading.Lock()
+
+
+def get_embedder(
+    provider: str,
+    model: str = "",
+    *,
+    base_url: str = "",
+    api_key_env: str = "",
+) -> Embedder:
+    """Return the process-wide embedder for these settings, creating it on first use.
+
+    Reusing one embedder keeps its provider client and HTTP connections alive
+    across calls. Its client is bound to the event loop it first ran on, so
+    only await it on the shared loop (see :func:`initrunner._async.get_shared_loop`),
+    as :func:`embed_single` and :func:`embed_single_async` do.
+    """
+    key = (provider, model, base_url, api_key_env)
+    embedder = _embedders.get(key)
+    if embedder is not None:
+        return embedder
+    with _embedders_lock:
+        embedder = _embedders.get(key)
+        if embedder is None:
+            embedder = create_embedder(provider, model, base_url=base_url, api_key_env=api_key_env)
+            _embedders[key] = embedder
+    return embedder
+
+
+def reset_embedders() -> None:
+    """Drop all shared embedders, e.g. after an API key changed."""
+    with _embedders_lock:
+        _embedders.clear()
+
+
+def embedding_cache_counts(embedder: Embedder) -> tuple[int, int]:
+    """Return ``(hits, misses)`` of embedding cache lookups made with *embedder*."""
+    tag = _cache_tags.get(embedder)
+    return (tag.hits, tag.misses) if tag is not None else (0, 0)
+
+
+def _build_embedder(provider: str, model: str, base_url: str, api_key_env: str) -> Embedder:
     if provider == "local":
         return _create_local_embedder(model)
 
@@ -274,12 +350,11 @@ def embed_single(
     api_key_env: str = "",
     input_type: Literal["query", "document"] = "query",
 ) -> list[float]:
-    """Create an embedder and embed a single text synchronously."""
-    from initrunner._async import run_sync
+    """Embed a single text synchronously with the shared embedder on the shared loop."""
+    from initrunner._async import run_on_shared_loop
 
-    embedder = create_embedder(provider, model, base_url=base_url, api_key_env=api_key_env)
-    coro = embed_texts(embedder, [text], input_type=input_type)
-    vectors = run_sync(coro)
+    embedder = get_embedder(provider, model, base_url=base_url, api_key_env=api_key_env)
+    vectors = run_on_shared_loop(embed_texts(embedder, [text], input_type=input_type))
     return vectors[0]
 
 
@@ -289,9 +364,46 @@ async def embed_texts(
     *,
     input_type: Literal["query", "document"] = "document",
 ) -> list[list[float]]:
-    """Embed a list of texts, returning float vectors."""
-    result = await embedder.embed(texts, input_type=input_type)
-    return [list(v) for v in result.embeddings]
+    """Embed a list of texts, returning float vectors.
+
+    Texts already in the embedding cache for this embedder's model are not
+    sent to the provider; newly embedded texts are added to the cache. Cache
+    reads and writes are SQLite transactions, so they run in a worker thread
+    to keep the event loop free.
+    """
+    from initrunner.ingestion.embedding_cache import get_embedding_cache
+
+    tag = _cache_tags.get(embedder)
+    cache = await asyncio.to_thread(get_embedding_cache) if tag is not None and texts else None
+    if cache is None or tag is None:
+        result = await embedder.embed(texts, input_type=input_type)
+        return [list(v) for v in result.embeddings]
+
+    try:
+        vectors = await asyncio.to_thread(cache.get_many, tag.identity, input_type, texts)
+    except sqlite3.Error as e:
+        logger.warning("Embedding cache read failed: %s", e)
+        vectors = [None] * len(texts)
+
+    missing = list(dict.fromkeys(t for t, v in zip(texts, vectors, strict=True) if v is None))
+    misses = sum(1 for v in vectors if v is None)
+    tag.hits += len(texts) - misses
+    tag.misses += misses
+    if missing:
+        result = await embedder.embed(missing, input_type=input_type)
+        embeddings = [list(v) for v in result.embeddings]
+        if len(embeddings) != len(missing):
+            # Malformed response: leave it to the caller's count check.
+            return embeddings
+        fresh = dict(zip(missing, embeddings, strict=True))
+        try:
+            await asyncio.to_thread(
+                cache.put_many, tag.identity, input_type, missing, [fresh[t] for t in missing]
+            )
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache write failed: %s", e)
+        vectors = [v if v is not None else fresh[t] for t, v in zip(texts, vectors, strict=True)]
+    return vectors  # type: ignore[return-value]
 
 
 async def embed_single_async(
@@ -303,9 +415,11 @@ async def embed_single_async(
     api_key_env: str = "",
     input_type: Literal["query", "document"] = "query",
 ) -> list[float]:
-    """Async variant of ``embed_single`` — directly awaits ``embed_texts``."""
-    embedder = create_embedder(provider, model, base_url=base_url, api_key_env=api_key_env)
-    vectors = await embed_texts(embedder, [text], input_type=input_type)
+    """Async variant of ``embed_single``; awaits the shared loop from the caller's loop."""
+    from initrunner._async import run_on_shared_loop_async
+
+    embedder = get_embedder(provider, model, base_url=base_url, api_key_env=api_key_env)
+    vectors = await run_on_shared_loop_async(embed_texts(embedder, [text], input_type=input_type))
     return vectors[0]
 
 
@@ -1,34 +1,61 @@
-"""Ingestion pipeline: glob sources → extract → chunk → embed → store."""
+"""Ingestion pipeline: glob sources → extract → chunk → embed → store.
+
+Extract, embed and store run as concurrent stages connected by bounded
+queues: PDF/DOCX/XLSX extraction happens on a process pool, chunks from many
+sources are packed into shared embedding requests with a cap on requests in
+flight, and a single writer stores sources in order once all their chunks
+are embedded, batching every source that is ready into one store write.
+"""
 
 from __future__ import annotations
 
+import asyncio
 import glob as globmod
 import hashlib
 import logging
 import os
 import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum
 from pathlib import Path
-from urllib.parse import urlparse
 
 from pydantic_ai.embeddings import Embedder
 
 from initrunner._async import run_sync
 from initrunner.agent.schema.ingestion import IngestConfig
 from initrunner.ingestion.chunker import Chunk, chunk_text
-from initrunner.ingestion.embeddings import compute_model_identity, create_embedder, embed_texts
+from initrunner.ingestion.embeddings import (
+    compute_model_identity,
+    create_embedder,
+    embed_texts,
+    embedding_cache_counts,
+)
 from initrunner.ingestion.extractors import extract_text
-from initrunner.stores.base import DocumentStore, StoreBackend, resolve_store_path
+from initrunner.stores.base import (
+    DocumentStore,
+    FileFingerprint,
+    SourceReplacement,
+    StoreBackend,
+    resolve_store_path,
+)
 from initrunner.stores.factory import create_document_store
 
-_EMBED_BATCH_SIZE = 500
 _DOMAIN_DELAY_SECONDS = 1.0
 _URL_FETCH_TIMEOUT = 15  # seconds
+_STAGE_QUEUE_SIZE = 16  # sources buffered between pipeline stages
+# Embedded sources wait here while the previous batch is written, then go to
+# the store together in one replace_sources() call.
+_WRITE_BATCH_SOURCES = 256
+_WRITE_BATCH_CHUNKS = 4096
+_POOL_SUFFIXES = frozenset({".pdf", ".docx", ".xlsx"})  # extracted on the process pool
+_HASH_BUFFER_BYTES = 1 << 20  # 1 MiB reads when hashing files
+_HASH_WORKERS = min(8, os.cpu_count() or 1)
 
 _ingest_locks: dict[str, threading.Lock] = {}
 _ingest_locks_guard = threading.Lock()
@@ -46,23 +73,6 @@ def _get_ingest_lock(db_path: Path) -> threading.Lock:
 logger = logging.getLogger(__name__)
 
 
-def _embed_batch(
-    embedder: Embedder, texts: list[str], batch_size: int = _EMBED_BATCH_SIZE
-) -> list[list[float]]:
-    """Embed texts in batches to limit peak memory usage."""
-
-    async def _embed_all() -> list[list[float]]:
-        if len(texts) <= batch_size:
-            return await embed_texts(embedder, texts)
-        all_embeddings: list[list[float]] = []
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            all_embeddings.extend(await embed_texts(embedder, batch))
-        return all_embeddings
-
-    return run_sync(_embed_all())
-
-
 class FileStatus(StrEnum):
     NEW = "new"
     UPDATED = "updated"
@@ -78,6 +88,22 @@ class FileResult:
     error: str | None = None
 
 
+@dataclass
+class StageStats:
+    """Items one pipeline stage handled and the wall time it was active.
+
+    ``extract`` counts sources, ``embed`` counts chunks and ``store`` counts
+    sources written.
+    """
+
+    items: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def per_sec(self) -> float:
+        return self.items / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
 @dataclass
 class IngestStats:
     new: int = 0
@@ -86,6 +112,11 @@ class IngestStats:
     errored: int = 0
     total_chunks: int = 0
     file_results: list[FileResult] = field(default_factory=list)
+    extract: StageStats = field(default_factory=StageStats)
+    embed: StageStats = field(default_factory=StageStats)
+    store: StageStats = field(default_factory=StageStats)
+    embed_cache_hits: int = 0
+    embed_cache_misses: int = 0
 
 
 def _is_url(source: str) -> bool:
@@ -126,15 +157,37 @@ def resolve_sources(
 def _file_hash(path: Path) -> str:
     """SHA-256 hex digest of file bytes."""
     h = hashlib.sha256()
-    with open(path, "rb") as f:
-        while True:
-            block = f.read(8192)
-            if not block:
-                break
-            h.update(block)
+    buf = bytearray(_HASH_BUFFER_BYTES)
+    view = memoryview(buf)
+    with open(path, "rb", buffering=0) as f:
+        while n := f.readinto(buf):
+            h.update(view[:n])
     return h.hexdigest()
 
 
+def _hash_files(paths: list[Path]) -> list[str | OSError]:
+    """Hash *paths* on a thread pool; each result is the digest or the error.
+
+    ``hashlib`` releases the GIL while hashing large buffers, so files are
+    read and hashed in parallel.
+    """
+    if len(paths) <= 1:
+        workers = 1
+    else:
+        workers = min(_HASH_WORKERS, len(paths))
+
+    def _one(path: Path) -> str | OSError:
+        try:
+            return _file_hash(path)
+        except OSError as e:
+            return e
+
+    if workers == 1:
+        return [_one(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ingest-hash") as pool:
+        return list(pool.map(_one, paths))
+
+
 def _content_hash(text: str) -> str:
     """SHA-256 hex digest of text content."""
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -160,18 +213,18 @@ def _record_error(
     return result
 
 
-def _read_file_hashes(
+def _read_file_fingerprints(
     backend: StoreBackend,
     db_path: Path,
-) -> dict[str, str]:
-    """Read {source: content_hash} via the store abstraction.
+) -> dict[str, FileFingerprint]:
+    """Read {source: FileFingerprint} via the store abstraction.
 
     Returns an empty dict for new databases (no existing store).
     """
     if not db_path.exists():
         return {}
     with create_document_store(backend, db_path) as store:
-        return store.list_file_hashes()
+        return store.list_file_fingerprints()
 
 
 def _check_cached_hash(
@@ -205,22 +258,53 @@ def _check_cached_hash(
     return FileStatus.UPDATED if cached_hash is not None else FileStatus.NEW
 
 
+@dataclass(frozen=True)
+class _FileToIngest:
+    """A file classified NEW or UPDATED, with the fingerprint taken while classifying."""
+
+    path: Path
+    status: FileStatus
+    content_hash: str
+    last_modified: float
+    size: int
+
+
+def _record_skipped(
+    stats: IngestStats,
+    path: Path,
+    progress_callback: Callable[[Path, FileStatus], None] | None,
+) -> None:
+    stats.file_results.append(FileResult(path=path, status=FileStatus.SKIPPED))
+    stats.skipped += 1
+    if progress_callback:
+        progress_callback(path, FileStatus.SKIPPED)
+
+
 def _classify_files(
     files: list[Path],
-    file_metadata: dict[str, str],
+    fingerprints: dict[str, FileFingerprint],
     stats: IngestStats,
     *,
     force: bool,
     max_file_size_mb: float,
     max_total_ingest_mb: float,
     progress_callback: Callable[[Path, FileStatus], None] | None,
-) -> tuple[list[tuple[Path, FileStatus]], set[str]]:
+    verify_hashes: bool = False,
+    unchanged_stats: dict[str, tuple[float, int]] | None = None,
+) -> tuple[list[_FileToIngest], set[str]]:
     """Classify files as NEW, UPDATED, SKIPPED, or ERROR.
 
+    A file whose size and mtime match its stored fingerprint is skipped on
+    the stat alone. Every other file is hashed (on a thread pool) and
+    compared with the stored hash, unless *force* makes it NEW regardless.
+    *verify_hashes* hashes every file. Files that hash the same as before
+    but have a new size or mtime are skipped and their new stats are added
+    to *unchanged_stats*, so the store can record them.
+
     Returns (to_process, resolved_sources).
     """
-    to_process: list[tuple[Path, FileStatus]] = []
     resolved_sources: set[str] = set()
+    to_hash: list[tuple[Path, os.stat_result]] = []
 
     cumulative_bytes = 0
     max_file_bytes = int(max_file_size_mb * 1024 * 1024) if max_file_size_mb > 0 else 0
@@ -230,57 +314,70 @@ def _classify_files(
         source = str(f)
         resolved_sources.add(source)
 
+        try:
+            st = f.stat()
+        except OSError as e:
+            _record_error(stats, f, str(e), progress_callback)
+            continue
+        file_size = st.st_size
+
         # Resource limits check
-        if max_file_bytes > 0 or max_total_bytes > 0:
-            try:
-                file_size = f.stat().st_size
-            except OSError as e:
-                _record_error(stats, f, str(e), progress_callback)
-                continue
+        if max_file_bytes > 0 and file_size > max_file_bytes:
+            _record_error(
+                stats,
+                f,
+                f"File size ({file_size / 1024 / 1024:.1f} MB) exceeds limit "
+                f"({max_file_size_mb} MB)",
+                progress_callback,
+            )
+            continue
 
-            if max_file_bytes > 0 and file_size > max_file_bytes:
-                _record_error(
-                    stats,
-                    f,
-                    f"File size ({file_size / 1024 / 1024:.1f} MB) exceeds limit "
-                    f"({max_file_size_mb} MB)",
-                    progress_callback,
-                )
-                continue
+        if max_total_bytes > 0 and cumulative_bytes + file_size > max_total_bytes:
+            _record_error(
+                stats,
+                f,
+                f"Total ingest size would exceed limit ({max_total_ingest_mb} MB)",
+                progress_callback,
+            )
+            continue
 
-            if max_total_bytes > 0 and cumulative_bytes + file_size > max_total_bytes:
-                _record_error(
-                    stats,
-                    f,
-                    f"Total ingest size would exceed limit ({max_total_ingest_mb} MB)",
-                    progress_callback,
-                )
-                continue
+        cumulative_bytes += file_size
+
+        # Stat fast path: same size and mtime as when it was last ingested.
+        # Tools that preserve timestamps (cp -p, rsync -a) can defeat it,
+        # which is what --verify-hashes (or --force) is for.
+        prior = fingerprints.get(source)
+        if (
+            not force
+            and not verify_hashes
+            and prior is not None
+            and prior.size == file_size
+            and prior.last_modified == st.st_mtime
+        ):
+            _record_skipped(stats, f, progress_callback)
+            continue
 
-            cumulative_bytes += file_size
+        to_hash.append((f, st))
 
-        if not force:
-            try:
-                content_hash = _file_hash(f)
-            except OSError as e:
-                _record_error(stats, f, str(e), progress_callback)
-                continue
+    to_process: list[_FileToIngest] = []
+    hashes = _hash_files([f for f, _ in to_hash])
+    for (f, st), content_hash in zip(to_hash, hashes, strict=True):
+        if isinstance(content_hash, OSError):
+            _record_error(stats, f, str(content_hash), progress_callback)
+            continue
+        prior = fingerprints.get(str(f))
+        if force or prior is None:
+            status = FileStatus.NEW
+        elif prior.content_hash != content_hash:
+            status = FileStatus.UPDATED
         else:
-            content_hash = ""
-
-        status = _check_cached_hash(
-            source,
-            content_hash,
-            file_metadata,
-            force=force,
-            display_path=f,
-            stats=stats,
-            progress_callback=progress_callback,
-        )
-        if status is None:
+            _record_skipped(stats, f, progress_callback)
+            if unchanged_stats is not None and (
+                prior.size != st.st_size or prior.last_modified != st.st_mtime
+            ):
+                unchanged_stats[str(f)] = (st.st_mtime, st.st_size)
             continue
-
-        to_process.append((f, status))
+        to_process.append(_FileToIngest(f, status, content_hash, st.st_mtime, st.st_size))
 
     return to_process, resolved_sources
 
@@ -293,11 +390,18 @@ def _classify_urls(
     force: bool,
     progress_callback: Callable[[Path, FileStatus], None] | None,
     skip_existing_urls: bool = False,
-) -> tuple[list[tuple[str, FileStatus, str]], set[str]]:
+    validators: dict[str, tuple[str | None, str | None]] | None = None,
+    changed_validators: dict[str, tuple[str | None, str | None]] | None = None,
+    fetch_concurrency: int = 8,
+) -> tuple[list[tuple[str, FileStatus, str, tuple[str | None, str | None]]], set[str]]:
     """Classify URLs as NEW, UPDATED, SKIPPED, or ERROR.
 
-    Fetches each URL, computes content hash on the extracted markdown, and
-    compares against the stored hash for incremental skip.
+    Fetches the URLs concurrently (see :mod:`initrunner.ingestion.crawler`),
+    computes the content hash on the extracted markdown, and compares it
+    against the stored hash for incremental skip. URLs with stored
+    *validators* (``{url: (etag, last_modified)}``) are requested
+    conditionally, and a ``304 Not Modified`` is SKIPPED without a download.
+    Skipped URLs whose validators changed are added to *changed_validators*.
 
     When ``skip_existing_urls`` is ``True``, URLs already present in
     ``file_metadata`` are recorded as SKIPPED *without* fetching them. The
@@ -305,13 +409,13 @@ def _classify_urls(
     ``initrunner ingest`` path leaves it ``False`` so URLs get refreshed.
 
     Returns (to_process, resolved_url_sources) where each to_process entry
-    is (url, status, extracted_markdown_text).
+    is (url, status, extracted_markdown_text, (etag, last_modified)).
     """
-    from initrunner.ingestion.extractors import extract_url
+    from initrunner.ingestion.crawler import fetch_urls
 
-    to_process: list[tuple[str, FileStatus, str]] = []
+    to_process: list[tuple[str, FileStatus, str, tuple[str | None, str | None]]] = []
     resolved_sources: set[str] = set()
-    domain_last_request: dict[str, float] = {}
+    to_fetch: list[str] = []
 
     for url in urls:
         resolved_sources.add(url)
@@ -319,58 +423,65 @@ def _classify_urls(
         # Auto-mode fast-path: existing URLs are not refetched. New URLs
         # added to the YAML still get processed below.
         if skip_existing_urls and url in file_metadata:
-            result = FileResult(path=Path(url), status=FileStatus.SKIPPED)
-            stats.file_results.append(result)
-            stats.skipped += 1
-            if progress_callback:
-                progress_callback(Path(url), FileStatus.SKIPPED)
+            _record_skipped(stats, Path(url), progress_callback)
             continue
+        to_fetch.append(url)
+
+    if not to_fetch:
+        return to_process, resolved_sources
+
+    # --force re-downloads everything, so it sends no validators.
+    fetches = run_sync(
+        fetch_urls(
+            to_fetch,
+            None if force else validators,
+            concurrency=fetch_concurrency,
+            domain_rate=1.0 / _DOMAIN_DELAY_SECONDS,
+            timeout=_URL_FETCH_TIMEOUT,
+        )
+    )
 
-        # Per-domain rate limiting
-        domain = urlparse(url).hostname or ""
-        last = domain_last_request.get(domain)
-        if last is not None:
-            elapsed = time.monotonic() - last
-            if elapsed < _DOMAIN_DELAY_SECONDS:
-                time.sleep(_DOMAIN_DELAY_SECONDS - elapsed)
-
-        try:
-            text = extract_url(url, timeout=_URL_FETCH_TIMEOUT)
-        except Exception as e:
-            logger.warning("Failed to fetch URL %s: %s", url, e)
-            _record_error(stats, url, f"Fetch error: {e}", progress_callback)
-            domain_last_request[domain] = time.monotonic()
+    for fetch in fetches:
+        url = fetch.url
+        new_validators = (fetch.etag, fetch.last_modified)
+        if fetch.error is not None:
+            logger.warning("Failed to fetch URL %s: %s", url, fetch.error)
+            _record_error(stats, url, f"Fetch error: {fetch.error}", progress_callback)
             continue
 
-        domain_last_request[domain] = time.monotonic()
-
-        url_hash = _content_hash(text) if not force else ""
-        status = _check_cached_hash(
-            url,
-            url_hash,
-            file_metadata,
-            force=force,
-            display_path=Path(url),
-            stats=stats,
-            progress_callback=progress_callback,
-        )
-        if status is None:
-            continue
+        if fetch.not_modified:
+            _record_skipped(stats, Path(url), progress_callback)
+        else:
+            assert fetch.text is not None
+            url_hash = _content_hash(fetch.text) if not force else ""
+            status = _check_cached_hash(
+                url,
+                url_hash,
+                file_metadata,
+                force=force,
+                display_path=Path(url),
+                stats=stats,
+                progress_callback=progress_callback,
+            )
+            if status is not None:
+                to_process.append((url, status, fetch.text, new_validators))
+                continue
 
-        to_process.append((url, status, text))
+        if changed_validators is not None and (validators or {}).get(url) != new_validators:
+            changed_validators[url] = new_validators
 
     return to_process, resolved_sources
 
 
 def _chunk_urls(
-    to_process: list[tuple[str, FileStatus, str]],
+    to_process: list[tuple[str, FileStatus, str, tuple[str | None, str | None]]],
     config: IngestConfig,
     stats: IngestStats,
     progress_callback: Callable[[Path, FileStatus], None] | None,
-) -> list[tuple[str, FileStatus, str, list[Chunk]]]:
-    """Chunk pre-fetched URL text. Returns list of (url, status, text, chunks)."""
-    url_chunks: list[tuple[str, FileStatus, str, list[Chunk]]] = []
-    for url, status, text in to_process:
+) -> list[tuple[str, FileStatus, str, list[Chunk], tuple[str | None, str | None]]]:
+    """Chunk pre-fetched URL text. Returns list of (url, status, text, chunks, validators)."""
+    url_chunks: list[tuple[str, FileStatus, str, list[Chunk], tuple[str | None, str | None]]] = []
+    for url, status, text, validators in to_process:
         chunks = chunk_text(
             text,
             source=url,
@@ -382,49 +493,119 @@ def _chunk_urls(
             _record_error(stats, url, "No chunks extracted", progress_callback)
             continue
 
-        url_chunks.append((url, status, text, chunks))
+        url_chunks.append((url, status, text, chunks, validators))
     return url_chunks
 
 
-def _extract_and_chunk(
-    to_process: list[tuple[Path, FileStatus]],
+def _extract_in_worker(path: Path) -> str:
+    """Process-pool entry point for extracting one file."""
+    return extract_text(path)
+
+
+def _chunk_file(entry: _FileToIngest, text: str, config: IngestConfig) -> _SourceItem | str:
+    """Chunk extracted text. Returns the item or an error message."""
+    f = entry.path
+    chunks = chunk_text(
+        text,
+        source=str(f),
+        strategy=config.chunking.strategy,
+        chunk_size=config.chunking.chunk_size,
+        chunk_overlap=config.chunking.chunk_overlap,
+    )
+    if not chunks:
+        return "No chunks extracted"
+    return _SourceItem(
+        str(f),
+        f,
+        entry.status,
+        chunks,
+        entry.content_hash,
+        entry.last_modified,
+        file_size=entry.size,
+    )
+
+
+def _open_extract_pool(
+    to_process: list[_FileToIngest], config: IngestConfig
+) -> ProcessPoolExecutor | None:
+    """Return a process pool for PDF/DOCX/XLSX extraction, or ``None`` when not worth it."""
+    import multiprocessing
+
+    workers = config.concurrency.extract_workers or min(4, os.cpu_count() or 1)
+    heavy = sum(1 for e in to_process if e.path.suffix.lower() in _POOL_SUFFIXES)
+    if workers <= 1 or heavy < 2:
+        return None
+    return ProcessPoolExecutor(
+        max_workers=min(workers, heavy), mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+async def _produce_file_items(
+    to_process: list[_FileToIngest],
     config: IngestConfig,
     stats: IngestStats,
     progress_callback: Callable[[Path, FileStatus], None] | None,
-) -> list[tuple[Path, FileStatus, list[Chunk]]]:
-    """Extract text and chunk each file. Returns list of (path, status, chunks)."""
-    file_chunks: list[tuple[Path, FileStatus, list[Chunk]]] = []
-    for f, status in to_process:
+    pool: ProcessPoolExecutor | None,
+    out: asyncio.Queue[_SourceItem | None],
+) -> None:
+    """Extract stage: extract and chunk files, a bounded window at a time, in input order."""
+
+    async def _one(entry: _FileToIngest) -> _SourceItem | str:
+        f = entry.path
         try:
-            text = extract_text(f)
+            if pool is not None and f.suffix.lower() in _POOL_SUFFIXES:
+                text = await asyncio.wrap_future(pool.submit(_extract_in_worker, f))
+            else:
+                text = await asyncio.to_thread(extract_text, f)
         except Exception as e:
             # Broad on purpose: format-specific extractors raise types well
             # outside (ValueError, OSError) -- zipfile.BadZipFile, KeyError,
             # PackageNotFoundError, openpyxl InvalidFileException, RecursionError,
             # pymupdf errors. One malformed file must mark that file ERROR and
             # let the rest of the batch ingest, matching _classify_urls.
-            _record_error(stats, f, str(e), progress_callback)
-            continue
-
-        chunks = chunk_text(
-            text,
-            source=str(f),
-            strategy=config.chunking.strategy,
-            chunk_size=config.chunking.chunk_size,
-            chunk_overlap=config.chunking.chunk_overlap,
-        )
-        if not chunks:
-            _record_error(stats, f, "No chunks extracted", progress_callback)
-            continue
+            return str(e)
+        return await asyncio.to_thread(_chunk_file, entry, text, config)
+
+    started = time.perf_counter()
+    window: deque[tuple[Path, asyncio.Task[_SourceItem | str]]] = deque()
+
+    async def _emit() -> None:
+        f, task = window.popleft()
+        result = await task
+        stats.extract.items += 1
+        if isinstance(result, str):
+            _record_error(stats, f, result, progress_callback)
+        else:
+            await out.put(result)
 
-        file_chunks.append((f, status, chunks))
-    return file_chunks
+    try:
+        for entry in to_process:
+            window.append((entry.path, asyncio.create_task(_one(entry))))
+            if len(window) >= _STAGE_QUEUE_SIZE:
+                await _emit()
+        while window:
+            await _emit()
+    finally:
+        for _, task in window:
+            task.cancel()
+        stats.extract.elapsed_s += time.perf_counter() - started
+    await out.put(None)
 
 
 class _SourceItem:
     """Pre-processed item ready for embed-and-store."""
 
-    __slots__ = ("chunks", "content_hash", "display_path", "last_modified", "source_id", "status")
+    __slots__ = (
+        "chunks",
+        "content_hash",
+        "display_path",
+        "etag",
+        "file_size",
+        "http_last_modified",
+        "last_modified",
+        "source_id",
+        "status",
+    )
 
     def __init__(
         self,
@@ -434,6 +615,10 @@ class _SourceItem:
         chunks: list[Chunk],
         content_hash: str,
         last_modified: float,
+        *,
+        file_size: int = -1,
+        etag: str | None = None,
+        http_last_modified: str | None = None,
     ) -> None:
         self.source_id = source_id
         self.display_path = display_path
@@ -441,6 +626,181 @@ class _SourceItem:
         self.chunks = chunks
         self.content_hash = content_hash
         self.last_modified = last_modified
+        self.file_size = file_size
+        self.etag = etag
+        self.http_last_modified = http_last_modified
+
+
+class _PendingItem:
+    """A source whose chunks are being embedded, possibly across several requests."""
+
+    __slots__ = ("done", "error", "item", "remaining", "vectors")
+
+    def __init__(self, item: _SourceItem) -> None:
+        self.item = item
+        self.vectors: list[list[float]] = [[] for _ in item.chunks]
+        self.remaining = len(item.chunks)
+        self.error: str | None = None
+        self.done = asyncio.Event()
+
+
+async def _run_stages(
+    produce: Callable[[asyncio.Queue[_SourceItem | None]], Awaitable[None]],
+    embedder: Embedder,
+    config: IngestConfig,
+    db_path: Path,
+    now: str,
+    stats: IngestStats,
+    progress_callback: Callable[[Path, FileStatus], None] | None,
+    error_fn: Callable[
+        [IngestStats, str | Path, str, Callable[[Path, FileStatus], None] | None],
+        FileResult | None,
+    ],
+    store: DocumentStore | None,
+    stack: ExitStack,
+) -> DocumentStore | None:
+    """Run *produce* → embed → store as concurrent stages. Returns the opened store.
+
+    *produce* puts source items on a bounded queue and ``None`` when done.
+    Chunks from consecutive items share embedding requests of up to
+    ``embed_batch_size`` texts, with at most ``embed_concurrency`` in flight.
+    The writer stores items in the order they were produced, each once all of
+    its chunks are embedded. Items that finish while a write is in flight go
+    to the store together in the next ``replace_sources`` call.
+    """
+    batch_size = config.concurrency.embed_batch_size
+    slots = asyncio.Semaphore(config.concurrency.embed_concurrency)
+    items: asyncio.Queue[_SourceItem | None] = asyncio.Queue(maxsize=_STAGE_QUEUE_SIZE)
+    ready: asyncio.Queue[_PendingItem | None] = asyncio.Queue(maxsize=_STAGE_QUEUE_SIZE)
+    embedded: asyncio.Queue[_PendingItem | None] = asyncio.Queue(maxsize=_WRITE_BATCH_SOURCES)
+    embed_span: list[float] = []  # [first request sent, last request done]
+
+    async def _embed(batch: list[tuple[_PendingItem, int, str]]) -> None:
+        try:
+            vectors = await embed_texts(embedder, [text for _, _, text in batch])
+        finally:
+            slots.release()
+        stats.embed.items += len(batch)
+        embed_span[1:] = [time.perf_counter()]
+        if len(vectors) != len(batch):
+            for pending, _, _ in batch:
+                pending.error = "Embedding returned empty"
+        else:
+            for (pending, idx, _), vector in zip(batch, vectors, strict=True):
+                pending.vectors[idx] = vector
+        for pending, _, _ in batch:
+            pending.remaining -= 1
+            if pending.remaining == 0:
+                pending.done.set()
+
+    async def _batch(tg: asyncio.TaskGroup) -> None:
+        batch: list[tuple[_PendingItem, int, str]] = []
+
+        async def _submit() -> None:
+            nonlocal batch
+            await slots.acquire()
+            if not embed_span:
+                embed_span.append(time.perf_counter())
+            tg.create_task(_embed(batch))
+            batch = []
+
+        while (item := await items.get()) is not None:
+            pending = _PendingItem(item)
+            # The writer may be waiting on chunks still sitting in the partial
+            # batch; send it before blocking on a full queue.
+            if ready.full() and batch:
+                await _submit()
+            await ready.put(pending)
+            for idx, chunk in enumerate(item.chunks):
+                batch.append((pending, idx, chunk.text))
+                if len(batch) >= batch_size:
+                    await _submit()
+        if batch:
+            await _submit()
+        await ready.put(None)
+
+    async def _collect() -> None:
+        while (pending := await ready.get()) is not None:
+            await pending.done.wait()
+            if pending.error is not None:
+                error_fn(stats, pending.item.source_id, pending.error, progress_callback)
+                continue
+            await embedded.put(pending)
+        await embedded.put(None)
+
+    async def _write() -> None:
+        nonlocal store
+        finished = False
+        while not finished and (first := await embedded.get()) is not None:
+            # Take whatever else was embedded while the last batch was written.
+            batch = [first]
+            chunks = len(first.item.chunks)
+            while chunks < _WRITE_BATCH_CHUNKS and not embedded.empty():
+                pending = embedded.get_nowait()
+                if pending is None:
+                    finished = True
+                    break
+                batch.append(pending)
+                chunks += len(pending.item.chunks)
+
+            started = time.perf_counter()
+            store = await asyncio.to_thread(_store_items, store, batch)
+            stats.store.items += len(batch)
+            stats.store.elapsed_s += time.perf_counter() - started
+
+            for pending in batch:
+                item = pending.item
+                chunk_count = len(item.chunks)
+                result = FileResult(path=item.display_path, status=item.status, chunks=chunk_count)
+                stats.file_results.append(result)
+                stats.total_chunks += chunk_count
+
+                if item.status == FileStatus.NEW:
+                    stats.new += 1
+                elif item.status == FileStatus.UPDATED:
+                    stats.updated += 1
+
+                if progress_callback:
+                    progress_callback(item.display_path, item.status)
+
+    def _store_items(current: DocumentStore | None, batch: list[_PendingItem]) -> DocumentStore:
+        # Open store lazily once we know dimensions
+        if current is None:
+            current = stack.enter_context(
+                create_document_store(
+                    config.store_backend, db_path, dimensions=len(batch[0].vectors[0])
+                )
+            )
+        current.replace_sources(
+            [
+                SourceReplacement(
+                    source=p.item.source_id,
+                    texts=[c.text for c in p.item.chunks],
+                    embeddings=p.vectors,
+                    content_hash=p.item.content_hash,
+                    last_modified=p.item.last_modified,
+                    file_size=p.item.file_size,
+                    etag=p.item.etag,
+                    http_last_modified=p.item.http_last_modified,
+                )
+                for p in batch
+            ],
+            ingested_at=now,
+        )
+        return current
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce(items))
+            tg.create_task(_batch(tg))
+            tg.create_task(_collect())
+            tg.create_task(_write())
+    except BaseExceptionGroup as eg:
+        # Surface the first failure (e.g. an embedding API error) as-is.
+        raise eg.exceptions[0] from None
+    if len(embed_span) == 2:
+        stats.embed.elapsed_s += embed_span[1] - embed_span[0]
+    return store
 
 
 def _embed_and_store_items(
@@ -459,103 +819,71 @@ def _embed_and_store_items(
     existing_store: DocumentStore | None = None,
     stack: ExitStack | None = None,
 ) -> DocumentStore | None:
-    """Embed items in batches, store results. Returns the opened store."""
-    store = existing_store
+    """Embed already-chunked items and store them. Returns the opened store."""
 
-    own_stack = stack is None
-    if own_stack:
-        stack = ExitStack()
-    if stack is None:
-        raise RuntimeError("ExitStack not initialized")
-
-    try:
+    async def _produce(out: asyncio.Queue[_SourceItem | None]) -> None:
         for item in items:
-            chunk_texts = [c.text for c in item.chunks]
+            await out.put(item)
+        await out.put(None)
 
-            chunk_embeddings = _embed_batch(embedder, chunk_texts)
-            if not chunk_embeddings:
-                error_fn(stats, item.source_id, "Embedding returned empty", progress_callback)
-                continue
-
-            # Open store lazily once we know dimensions
-            if store is None:
-                dimensions = len(chunk_embeddings[0])
-                store = stack.enter_context(
-                    create_document_store(config.store_backend, db_path, dimensions=dimensions)
-                )
-
-            chunk_count = len(item.chunks)
-
-            store.replace_source(
-                source=item.source_id,
-                texts=chunk_texts,
-                embeddings=chunk_embeddings,
-                ingested_at=now,
-                content_hash=item.content_hash,
-                last_modified=item.last_modified,
+    with ExitStack() as own_stack:
+        return run_sync(
+            _run_stages(
+                _produce,
+                embedder,
+                config,
+                db_path,
+                now,
+                stats,
+                progress_callback,
+                error_fn,
+                existing_store,
+                stack if stack is not None else own_stack,
             )
-
-            result = FileResult(path=item.display_path, status=item.status, chunks=chunk_count)
-            stats.file_results.append(result)
-            stats.total_chunks += chunk_count
-
-            if item.status == FileStatus.NEW:
-                stats.new += 1
-            elif item.status == FileStatus.UPDATED:
-                stats.updated += 1
-
-            if progress_callback:
-                progress_callback(item.display_path, item.status)
-    finally:
-        if own_stack:
-            stack.close()
-
-    return store
+        )
 
 
-def _embed_and_store(
-    file_chunks: list[tuple[Path, FileStatus, list[Chunk]]],
+def _ingest_files(
+    to_process: list[_FileToIngest],
     embedder: Embedder,
     config: IngestConfig,
     db_path: Path,
     now: str,
     stats: IngestStats,
-    resolved_sources: set[str],
     progress_callback: Callable[[Path, FileStatus], None] | None,
     *,
     existing_store: DocumentStore | None = None,
-    stack: ExitStack | None = None,
+    stack: ExitStack,
     purge_resolved_sources: set[str] | None = None,
 ) -> DocumentStore | None:
-    """Embed per-file in batches, store results, and purge deleted sources.
+    """Extract, chunk, embed and store files, then purge deleted sources.
 
     Returns the opened store (or *existing_store*) so URL pipeline can reuse it.
 
     If *purge_resolved_sources* is a set, purge file sources not in it.
     If ``None``, skip purging (managed-source additions).
     """
-    items: list[_SourceItem] = []
-    for f, status, chunks in file_chunks:
-        try:
-            content_hash = _file_hash(f)
-            last_modified = os.stat(f).st_mtime
-        except OSError as e:
-            _record_error(stats, f, str(e), progress_callback)
-            continue
-        items.append(_SourceItem(str(f), f, status, chunks, content_hash, last_modified))
-
-    store = _embed_and_store_items(
-        items,
-        embedder,
-        config,
-        db_path,
-        now,
-        stats,
-        progress_callback,
-        _record_error,
-        existing_store=existing_store,
-        stack=stack,
-    )
+    pool = _open_extract_pool(to_process, config)
+    try:
+        store = run_sync(
+            _run_stages(
+                lambda out: _produce_file_items(
+                    to_process, config, stats, progress_callback, pool, out
+                ),
+                embedder,
+                config,
+                db_path,
+                now,
+                stats,
+                progress_callback,
+                _record_error,
+                existing_store,
+                stack,
+            )
+        )
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
     # Purge deleted files (only file sources -- URL sources are never auto-purged)
     if purge_resolved_sources is not None and store is not None:
@@ -565,7 +893,7 @@ def _embed_and_store(
 
 
 def _embed_and_store_urls(
-    url_chunks: list[tuple[str, FileStatus, str, list[Chunk]]],
+    url_chunks: list[tuple[str, FileStatus, str, list[Chunk], tuple[str | None, str | None]]],
     embedder: Embedder,
     config: IngestConfig,
     db_path: Path,
@@ -578,8 +906,19 @@ def _embed_and_store_urls(
 ) -> DocumentStore | None:
     """Embed and store URL-sourced chunks. Returns the store."""
     items: list[_SourceItem] = []
-    for url, status, text, chunks in url_chunks:
-        items.append(_SourceItem(url, Path(url), status, chunks, _content_hash(text), time.time()))
+    for url, status, text, chunks, (etag, http_last_modified) in url_chunks:
+        items.append(
+            _SourceItem(
+                url,
+                Path(url),
+                status,
+                chunks,
+                _content_hash(text),
+                time.time(),
+                etag=etag,
+                http_last_modified=http_last_modified,
+            )
+        )
 
     return _embed_and_store_items(
         items,
@@ -669,37 +1008,39 @@ def _run_file_pipeline(
     store: DocumentStore | None,
     stats: IngestStats,
     now: str,
-    file_metadata: dict[str, str],
+    fingerprints: dict[str, FileFingerprint],
     *,
     force: bool,
     max_file_size_mb: float,
     max_total_ingest_mb: float,
     progress_callback: Callable[[Path, FileStatus], None] | None,
     purge_resolved_sources: set[str] | None,
+    verify_hashes: bool = False,
 ) -> tuple[DocumentStore | None, set[str]]:
     """Classify, extract, chunk, embed, store files. Returns (store, file_resolved_sources)."""
+    unchanged_stats: dict[str, tuple[float, int]] = {}
     to_process, file_resolved_sources = _classify_files(
         files,
-        file_metadata,
+        fingerprints,
         stats,
         force=force,
         max_file_size_mb=max_file_size_mb,
         max_total_ingest_mb=max_total_ingest_mb,
         progress_callback=progress_callback,
+        verify_hashes=verify_hashes,
+        unchanged_stats=unchanged_stats,
     )
 
-    file_chunks = _extract_and_chunk(to_process, config, stats, progress_callback)
-
-    if file_chunks:
-        store = _embed_and_store(
-            file_chunks,
+    if to_process:
+        store = _ingest_files(
+            to_process,
             embedder,
             config,
             db_path,
             now,
             stats,
-            file_resolved_sources,
             progress_callback,
+            existing_store=store,
             stack=stack,
             purge_resolved_sources=purge_resolved_sources,
         )
@@ -709,6 +1050,13 @@ def _run_file_pipeline(
             store = stack.enter_context(create_document_store(config.store_backend, db_path))
             _purge_deleted(store, purge_resolved_sources)
 
+    # Files that were touched but not changed: record their new size and
+    # mtime so the next run skips them without hashing.
+    if unchanged_stats and db_path.exists():
+        if store is None:
+            store = stack.enter_context(create_document_store(config.store_backend, db_path))
+        store.refresh_file_stats(unchanged_stats)
+
     return store, file_resolved_sources
 
 
@@ -721,22 +1069,37 @@ def _run_url_pipeline(
     store: DocumentStore | None,
     stats: IngestStats,
     now: str,
-    file_metadata: dict[str, str],
+    fingerprints: dict[str, FileFingerprint],
     *,
     force: bool,
     progress_callback: Callable[[Path, FileStatus], None] | None,
     skip_existing_urls: bool = False,
 ) -> DocumentStore | None:
     """Classify, chunk, embed, store URLs. Returns (possibly new) store."""
+    changed_validators: dict[str, tuple[str | None, str | None]] = {}
     url_to_process, _url_resolved = _classify_urls(
         urls,
-        file_metadata,
+        {source: fp.content_hash for source, fp in fingerprints.items()},
         stats,
         force=force,
         progress_callback=progress_callback,
         skip_existing_urls=skip_existing_urls,
+        validators={
+            source: (fp.etag, fp.http_last_modified)
+            for source, fp in fingerprints.items()
+            if fp.etag or fp.http_last_modified
+        },
+        changed_validators=changed_validators,
+        fetch_concurrency=config.concurrency.fetch_concurrency,
     )
 
+    # Unchanged pages served with new validators: store them, so the next
+    # request for the page is conditional on the current version.
+    if changed_validators and db_path.exists():
+        if store is None:
+            store = stack.enter_context(create_document_store(config.store_backend, db_path))
+        store.refresh_url_validators(changed_validators)
+
     if url_to_process:
         url_chunked = _chunk_urls(url_to_process, config, stats, progress_callback)
         if url_chunked:
@@ -768,6 +1131,7 @@ def _execute_ingest_core(
     max_total_ingest_mb: float = 0,
     purge_resolved_sources: set[str] | None = None,
     skip_existing_urls: bool = False,
+    verify_hashes: bool = False,
 ) -> IngestStats:
     """Shared pipeline core: lock, embedder, model check, classify, embed, store, purge.
 
@@ -786,6 +1150,8 @@ def _execute_ingest_core(
         skip_existing_urls: If True, URLs already present in the store are
             skipped without fetching. Used by the auto-ingest path to avoid
             per-run network calls.
+        verify_hashes: Hash every file instead of skipping files whose size
+            and mtime match the stored metadata.
     """
     from opentelemetry import trace  # type: ignore[import-not-found]
 
@@ -813,9 +1179,10 @@ def _execute_ingest_core(
         embedder, current_identity = _setup_embedder_and_check_model(
             config, provider, db_path, force=force
         )
+        hits_before, misses_before = embedding_cache_counts(embedder)
 
         now = datetime.now(UTC).isoformat()
-        file_metadata = _read_file_hashes(config.store_backend, db_path)
+        fingerprints = _read_file_fingerprints(config.store_backend, db_path)
 
         with ExitStack() as stack:
             store: DocumentStore | None = None
@@ -830,12 +1197,13 @@ def _execute_ingest_core(
                     store,
                     stats,
                     now,
-                    file_metadata,
+                    fingerprints,
                     force=force,
                     max_file_size_mb=max_file_size_mb,
                     max_total_ingest_mb=max_total_ingest_mb,
                     progress_callback=progress_callback,
                     purge_resolved_sources=purge_resolved_sources,
+                    verify_hashes=verify_hashes,
                 )
 
             if urls:
@@ -848,7 +1216,7 @@ def _execute_ingest_core(
                     store,
                     stats,
                     now,
-                    file_metadata,
+                    fingerprints,
                     force=force,
                     progress_callback=progress_callback,
                     skip_existing_urls=skip_existing_urls,
@@ -872,6 +1240,19 @@ def _execute_ingest_core(
                 else:
                     with create_document_store(config.store_backend, db_path) as write_store:
                         write_store.write_store_meta("embedding_model", current_identity)
+
+            # Each write batch still adds a data fragment plus deletion files
+            # for the sources it replaced, and new rows are not in the vector
+            # index until it is updated. Compact and fold them in once, at the
+            # end of the run, before the store is queried.
+            if store is not None and (stats.new or stats.updated):
+                try:
+                    store.optimize()
+                except Exception as e:
+                    logger.warning("Optimizing %s after ingest failed: %s", db_path, e)
+        hits, misses = embedding_cache_counts(embedder)
+        stats.embed_cache_hits = hits - hits_before
+        stats.embed_cache_misses = misses - misses_before
     finally:
         lock.release()
 
@@ -929,12 +1310,16 @@ def run_ingest(
     max_file_size_mb: float = 0,
     max_total_ingest_mb: float = 0,
     skip_existing_urls: bool = False,
+    verify_hashes: bool = False,
 ) -> IngestStats:
     """Run the full ingestion pipeline synchronously. Returns IngestStats.
 
     When ``skip_existing_urls`` is True, URLs already present in the store
     are skipped without fetching. Used by the auto-ingest path; the manual
     ``initrunner ingest`` command leaves it False so URLs get refreshed.
+
+    Files whose size and mtime match the stored metadata are skipped without
+    being read; ``verify_hashes`` hashes every file instead.
     """
     all_files, all_urls = resolve_full_sources(config, agent_name, base_dir=base_dir)
     all_resolved = {str(p) for p in all_files}
@@ -951,6 +1336,7 @@ def run_ingest(
         max_total_ingest_mb=max_total_ingest_mb,
         purge_resolved_sources=all_resolved,
         skip_existing_urls=skip_existing_urls,
+        verify_hashes=verify_hashes,
     )
 
 
@@ -1,4 +1,9 @@
-"""MCP tool schema cache -- persist ToolDefinitions to avoid connecting on startup."""
+"""MCP tool schema cache -- persist ToolDefinitions to avoid connecting on startup.
+
+The same directory also holds built ``tool_search`` indexes, keyed by a hash
+of the tool catalog they were built from. Only the most recently used few are
+kept, so a changing tool set does not grow the directory without bound.
+"""
 
 from __future__ import annotations
 
@@ -21,6 +26,9 @@ from initrunner.config import get_mcp_cache_dir
 _logger = logging.getLogger(__name__)
 
 CACHE_VERSION = 1
+SEARCH_INDEX_VERSION = 1
+# Several roles with different tool sets can share the cache directory.
+SEARCH_INDEX_KEEP = 8
 
 
 # ---------------------------------------------------------------------------
@@ -109,29 +117,32 @@ def read_cache(key: str) -> CacheEntry | None:
         return None
 
 
-def write_cache(key: str, tools: list[CachedTool]) -> None:
-    """Atomic write: tmp file + rename."""
+def _atomic_write(path: Path, data: str) -> None:
+    """Write *data* to *path* via tmp file + rename in the cache directory."""
     directory = get_mcp_cache_dir()
     directory.mkdir(parents=True, exist_ok=True)
 
-    entry = CacheEntry(
-        version=CACHE_VERSION,
-        cached_at=datetime.now(UTC).isoformat(),
-        tools=tools,
-    )
-    data = json.dumps(asdict(entry), indent=2)
-
     fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
     try:
         os.write(fd, data.encode())
         os.close(fd)
-        os.replace(tmp, _cache_path(key))
+        os.replace(tmp, path)
     except BaseException:
         os.close(fd) if not os.get_inheritable(fd) else None  # pragma: no cover
         Path(tmp).unlink(missing_ok=True)
         raise
 
 
+def write_cache(key: str, tools: list[CachedTool]) -> None:
+    """Atomic write: tmp file + rename."""
+    entry = CacheEntry(
+        version=CACHE_VERSION,
+        cached_at=datetime.now(UTC).isoformat(),
+        tools=tools,
+    )
+    _atomic_write(_cache_path(key), json.dumps(asdict(entry), indent=2))
+
+
 def invalidate_cache(key: str) -> bool:
     """Delete cache file.  Returns ``True`` if the file existed."""
     path = _cache_path(key)
@@ -153,6 +164,64 @@ def cache_age_seconds(key: str) -> float | None:
         return None
 
 
+# ---------------------------------------------------------------------------
+# tool_search index cache
+# ---------------------------------------------------------------------------
+
+
+def search_index_key(catalog: list[tuple[str, str, list[str]]]) -> str:
+    """Hash a ``(name, description, param_names)`` tool catalog, order included."""
+    raw = json.dumps(catalog, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def _search_index_path(key: str) -> Path:
+    return get_mcp_cache_dir() / f"search-index-{key}.json"
+
+
+def read_search_index(key: str) -> dict[str, Any] | None:
+    """Read a serialised search index.  ``None`` on missing, corrupt, or wrong version."""
+    path = _search_index_path(key)
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(path.read_text())
+        if raw.get("version") != SEARCH_INDEX_VERSION:
+            return None
+        index = raw["index"]
+    except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+        _logger.debug("Corrupt search index cache file %s, ignoring", path)
+        return None
+    try:
+        os.utime(path)  # mark as recently used for _prune_search_indexes
+    except OSError:
+        pass
+    return index
+
+
+def write_search_index(key: str, index: dict[str, Any]) -> None:
+    """Persist a serialised search index (atomic write)."""
+    data = json.dumps({"version": SEARCH_INDEX_VERSION, "index": index}, separators=(",", ":"))
+    _atomic_write(_search_index_path(key), data)
+    _prune_search_indexes(keep=SEARCH_INDEX_KEEP)
+
+
+def _prune_search_indexes(keep: int) -> None:
+    """Delete all but the *keep* most recently used search index files."""
+    paths = []
+    for path in get_mcp_cache_dir().glob("search-index-*.json"):
+        try:
+            paths.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    paths.sort(reverse=True)
+    for _, path in paths[keep:]:
+        try:
+            path.unlink()
+        except OSError as e:
+            _logger.debug("Could not remove stale search index %s: %s", path, e)
+
+
 # ---------------------------------------------------------------------------
 # Schema diff
 # ---------------------------------------------------------------------------
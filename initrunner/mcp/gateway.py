@@ -1,18 +1,39 @@
-"""MCP gateway — expose InitRunner agents as MCP tools."""
+"""MCP gateway — expose InitRunner agents as MCP tools.
+
+The gateway is built to be shared by many clients at once:
+
+- Agent tools are async. Each runs ``execute_run_async`` on the event loop,
+  at most ``max_concurrency`` runs per agent, so one busy agent does not
+  starve the others.
+- Each pass-through MCP server keeps one warm client session
+  (:class:`PassThroughBackend`). A background task pings it and reconnects,
+  with backoff, when it dies.
+- Per-tool call counts, errors, in-flight calls and latency are kept by
+  :class:`GatewayMetrics` and served as the ``initrunner://gateway/metrics``
+  resource.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
+import logging
 import re
-from dataclasses import dataclass
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from fastmcp import FastMCP  # type: ignore[import-not-found]
-from fastmcp.server import create_proxy  # type: ignore[import-not-found]
+from fastmcp import Client, FastMCP  # type: ignore[import-not-found]
+from fastmcp.server.middleware import Middleware  # type: ignore[import-not-found]
+from fastmcp.server.providers.proxy import FastMCPProxy  # type: ignore[import-not-found]
 from fastmcp.server.transforms import Visibility  # type: ignore[import-not-found]
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable
 
     from pydantic_ai import Agent
 
@@ -20,6 +41,18 @@ if TYPE_CHECKING:
     from initrunner.agent.schema.tools import McpToolConfig
     from initrunner.audit.logger import AuditLogger
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+METRICS_URI = "initrunner://gateway/metrics"
+
+_LATENCY_WINDOW = 1024  # most recent calls kept per tool for percentiles
+_HEALTH_CHECK_INTERVAL = 30.0  # seconds
+_PING_TIMEOUT = 10.0
+_CONNECT_TIMEOUT = 30.0
+_RECONNECT_BACKOFF_BASE = 1.0
+_RECONNECT_BACKOFF_MAX = 30.0
+
 
 @dataclass
 class _AgentEntry:
@@ -30,6 +63,252 @@ class _AgentEntry:
     role_path: Path
 
 
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class ToolCallStats:
+    """Snapshot of one gateway tool's call counters and recent latency."""
+
+    tool: str
+    calls: int
+    errors: int
+    in_flight: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+@dataclass
+class _ToolCounters:
+    calls: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class GatewayMetrics:
+    """Per-tool call counters for a gateway, fed by :class:`_MetricsMiddleware`.
+
+    Latency percentiles cover the last ``_LATENCY_WINDOW`` calls of each tool.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tools: dict[str, _ToolCounters] = {}
+
+    def _counters(self, tool: str) -> _ToolCounters:
+        return self._tools.setdefault(tool, _ToolCounters())
+
+    def call_started(self, tool: str) -> None:
+        with self._lock:
+            self._counters(tool).in_flight += 1
+
+    def call_finished(self, tool: str, seconds: float, *, error: bool = False) -> None:
+        with self._lock:
+            counters = self._counters(tool)
+            counters.in_flight -= 1
+            counters.calls += 1
+            counters.errors += error
+            counters.latencies.append(seconds * 1000)
+
+    def record_error(self, tool: str) -> None:
+        """Count a call that completed but reported a failure to the client."""
+        with self._lock:
+            self._counters(tool).errors += 1
+
+    def snapshot(self) -> list[ToolCallStats]:
+        with self._lock:
+            stats = []
+            for tool, counters in sorted(self._tools.items()):
+                ordered = sorted(counters.latencies)
+                stats.append(
+                    ToolCallStats(
+                        tool=tool,
+                        calls=counters.calls,
+                        errors=counters.errors,
+                        in_flight=counters.in_flight,
+                        p50_ms=round(_percentile(ordered, 0.5), 3),
+                        p95_ms=round(_percentile(ordered, 0.95), 3),
+                        max_ms=round(ordered[-1], 3) if ordered else 0.0,
+                    )
+                )
+            return stats
+
+
+class _MetricsMiddleware(Middleware):
+    """Time every tool call, agent and pass-through alike."""
+
+    def __init__(self, metrics: GatewayMetrics) -> None:
+        self._metrics = metrics
+
+    async def on_call_tool(self, context, call_next):
+        tool = context.message.name
+        self._metrics.call_started(tool)
+        start = time.perf_counter()
+        error = True
+        try:
+            result = await call_next(context)
+            error = False
+            return result
+        finally:
+            self._metrics.call_finished(tool, time.perf_counter() - start, error=error)
+
+
+# ---------------------------------------------------------------------------
+# Pass-through backends
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BackendHealth:
+    """Snapshot of one pass-through server's connection state."""
+
+    name: str
+    connected: bool
+    connects: int
+    consecutive_failures: int
+    last_error: str | None
+
+
+class PassThroughBackend:
+    """One long-lived client session to an MCP server proxied by the gateway.
+
+    ``create_proxy`` opens a fresh session -- for stdio servers a fresh
+    process -- per request. This keeps a single session open instead and
+    hands it to the proxy as its client factory. When the session dies or
+    stops answering pings it is dropped and reopened; failed reconnects back
+    off exponentially up to ``_RECONNECT_BACKOFF_MAX`` seconds.
+
+    The session is shared by every gateway client, so server-initiated
+    requests (sampling, elicitation) are not forwarded to them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        transport: Any,
+        *,
+        connect_timeout: float = _CONNECT_TIMEOUT,
+        ping_timeout: float = _PING_TIMEOUT,
+    ) -> None:
+        self.name = name
+        self._transport = transport
+        self._connect_timeout = connect_timeout
+        self._ping_timeout = ping_timeout
+        self._client: Client = Client(transport)
+        self._lock = asyncio.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._held = False  # whether we hold the session's outermost reference
+        self._connects = 0
+        self._failures = 0
+        self._retry_at = 0.0
+        self._last_error: str | None = None
+
+    def _live(self) -> bool:
+        return self._held and self._client.is_connected()
+
+    def _adopt_loop(self) -> None:
+        # A session belongs to the loop that opened it. If the gateway is
+        # driven from a new loop, start over with a fresh client.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None:
+                self._client = Client(self._transport)
+                self._held = False
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+    async def client(self) -> Client:
+        """Return the connected client, connecting first if needed."""
+        self._adopt_loop()
+        if not self._live():
+            async with self._lock:
+                if not self._live():
+                    await self._connect()
+        return self._client
+
+    async def check(self) -> bool:
+        """Ping the server, reconnecting if the session is gone or unresponsive."""
+        self._adopt_loop()
+        async with self._lock:
+            try:
+                if self._live():
+                    await asyncio.wait_for(self._client.ping(), timeout=self._ping_timeout)
+                else:
+                    await self._connect()
+                return True
+            except Exception as e:
+                if self._held:
+                    logger.warning("MCP server %s failed its health check: %s", self.name, e)
+                    self._last_error = str(e) or type(e).__name__
+                    await self._drop()
+                return False
+
+    async def close(self) -> None:
+        """Close the session (and for stdio servers, stop the process)."""
+        async with self._lock:
+            if self._held:
+                await self._drop()
+
+    def health(self) -> BackendHealth:
+        return BackendHealth(
+            name=self.name,
+            connected=self._live(),
+            connects=self._connects,
+            consecutive_failures=self._failures,
+            last_error=self._last_error,
+        )
+
+    async def _connect(self) -> None:
+        if self._held:  # the session died underneath us
+            await self._drop()
+        wait = self._retry_at - time.monotonic()
+        if wait > 0:
+            raise RuntimeError(
+                f"MCP server {self.name!r} is unavailable ({self._last_error}); "
+                f"retrying in {wait:.0f}s"
+            )
+        try:
+            await asyncio.wait_for(self._client.__aenter__(), timeout=self._connect_timeout)
+        except Exception as e:
+            self._failures += 1
+            self._last_error = str(e) or type(e).__name__
+            backoff = min(
+                _RECONNECT_BACKOFF_MAX, _RECONNECT_BACKOFF_BASE * 2 ** (self._failures - 1)
+            )
+            self._retry_at = time.monotonic() + backoff
+            logger.warning(
+                "Connecting to MCP server %s failed (attempt %d, next in %.0fs): %s",
+                self.name,
+                self._failures,
+                backoff,
+                self._last_error,
+            )
+            raise
+        if self._connects:
+            logger.info("Reconnected to MCP server %s", self.name)
+        self._held = True
+        self._connects += 1
+        self._failures = 0
+        self._retry_at = 0.0
+
+    async def _drop(self) -> None:
+        self._held = False
+        try:
+            await self._client.close()
+        except Exception as e:
+            logger.debug("Closing MCP server %s failed: %s", self.name, e)
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -92,18 +371,33 @@ def _register_agent_tool(
     entry: _AgentEntry,
     tool_name: str,
     audit_logger: AuditLogger | None,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    metrics: GatewayMetrics | None = None,
 ) -> None:
-    """Register a single agent as an MCP tool using a factory to capture closures."""
-    from initrunner.agent.executor import execute_run
+    """Register a single agent as an async MCP tool using a factory to capture closures.
 
-    def handler(prompt: str) -> str:
-        try:
-            result, _ = execute_run(entry.agent, entry.role, prompt, audit_logger=audit_logger)
-            if not result.success:
-                return f"Error: {result.error}"
-            return result.output
-        except Exception as e:
-            return f"Internal error: {e}"
+    Calls beyond *max_concurrency* wait for a free slot.
+    """
+    from initrunner.agent.executor import execute_run_async
+
+    slots = asyncio.Semaphore(max_concurrency)
+
+    async def handler(prompt: str) -> str:
+        async with slots:
+            try:
+                result, _ = await execute_run_async(
+                    entry.agent, entry.role, prompt, audit_logger=audit_logger
+                )
+            except Exception as e:
+                if metrics is not None:
+                    metrics.record_error(tool_name)
+                return f"Internal error: {e}"
+        if not result.success:
+            if metrics is not None:
+                metrics.record_error(tool_name)
+            return f"Error: {result.error}"
+        return result.output
 
     handler.__name__ = tool_name.replace("-", "_")
     handler.__doc__ = entry.description
@@ -125,10 +419,14 @@ def _build_pass_through_transport(
 def _register_pass_through_tools(
     mcp: FastMCP,
     entries: list[_AgentEntry],
-) -> None:
-    """Mount pass-through proxies for MCP tools configured on each agent."""
+) -> list[PassThroughBackend]:
+    """Mount pass-through proxies for MCP tools configured on each agent.
+
+    Returns the backends holding the proxied servers' sessions.
+    """
     from initrunner.agent.schema.tools import McpToolConfig
 
+    backends: list[PassThroughBackend] = []
     for entry in entries:
         mcp_configs = [t for t in entry.role.spec.tools if isinstance(t, McpToolConfig)]
         if not mcp_configs:
@@ -137,8 +435,16 @@ def _register_pass_through_tools(
         agent_prefix = _sanitize_name(entry.name)
 
         for cfg in mcp_configs:
+            # Build the combined namespace: agent_name + optional tool_prefix
+            # mount() joins namespace and tool name with "_"
+            namespace = agent_prefix
+            if cfg.tool_prefix:
+                namespace += "_" + cfg.tool_prefix.rstrip("_")
+
             transport = _build_pass_through_transport(cfg, entry.role, entry.role_path.parent)
-            proxy = create_proxy(transport)
+            backend = PassThroughBackend(namespace, transport)
+            backends.append(backend)
+            proxy = FastMCPProxy(client_factory=backend.client)
 
             # Apply tool_filter / tool_exclude via Visibility transforms
             if cfg.tool_filter:
@@ -147,13 +453,54 @@ def _register_pass_through_tools(
             elif cfg.tool_exclude:
                 proxy.add_transform(Visibility(False, names=set(cfg.tool_exclude)))
 
-            # Build the combined namespace: agent_name + optional tool_prefix
-            # mount() joins namespace and tool name with "_"
-            namespace = agent_prefix
-            if cfg.tool_prefix:
-                namespace += "_" + cfg.tool_prefix.rstrip("_")
-
             mcp.mount(proxy, namespace=namespace)
+    return backends
+
+
+async def _watch_backends(backends: list[PassThroughBackend], interval: float) -> None:
+    """Connect every backend, then health-check them every *interval* seconds."""
+    while True:
+        await asyncio.gather(*(backend.check() for backend in backends))
+        await asyncio.sleep(interval)
+
+
+def _gateway_lifespan(backends: list[PassThroughBackend], health_interval: float):
+    """Lifespan that keeps pass-through backends warm while the gateway runs."""
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+        watcher = None
+        if backends:
+            watcher = asyncio.create_task(_watch_backends(backends, health_interval))
+        try:
+            yield {}
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+                with suppress(asyncio.CancelledError):
+                    await watcher
+            await asyncio.gather(*(b.close() for b in backends), return_exceptions=True)
+
+    return lifespan
+
+
+def _register_metrics_resource(
+    mcp: FastMCP, metrics: GatewayMetrics, backends: list[PassThroughBackend]
+) -> None:
+    def gateway_metrics() -> str:
+        return json.dumps(
+            {
+                "tools": [asdict(s) for s in metrics.snapshot()],
+                "backends": [asdict(b.health()) for b in backends],
+            }
+        )
+
+    mcp.resource(
+        METRICS_URI,
+        name="gateway_metrics",
+        description="Per-tool call counts, latency and pass-through server health",
+        mime_type="application/json",
+    )(gateway_metrics)
 
 
 # ---------------------------------------------------------------------------
@@ -169,22 +516,41 @@ def build_mcp_gateway(
     pass_through: bool = False,
     extra_skill_dirs: list[Path] | None = None,
     role_mutators: dict[Path, Callable[[RoleDefinition], RoleDefinition]] | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    health_interval: float = _HEALTH_CHECK_INTERVAL,
 ) -> FastMCP:
-    """Build a FastMCP server that exposes InitRunner agents as MCP tools."""
+    """Build a FastMCP server that exposes InitRunner agents as MCP tools.
+
+    Each agent runs at most *max_concurrency* prompts at once. Pass-through
+    servers are pinged every *health_interval* seconds while the gateway runs.
+    """
     if not role_paths:
         raise ValueError("At least one role file required")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
 
     entries = _load_agents(role_paths, extra_skill_dirs, role_mutators)
-    mcp = FastMCP(server_name)
+    backends: list[PassThroughBackend] = []
+    metrics = GatewayMetrics()
+    mcp = FastMCP(server_name, lifespan=_gateway_lifespan(backends, health_interval))
+    mcp.add_middleware(_MetricsMiddleware(metrics))
 
     seen: set[str] = set()
     for entry in entries:
         tool_name = _make_tool_name(entry.name, seen)
-        _register_agent_tool(mcp, entry, tool_name, audit_logger)
+        _register_agent_tool(
+            mcp,
+            entry,
+            tool_name,
+            audit_logger,
+            max_concurrency=max_concurrency,
+            metrics=metrics,
+        )
 
     if pass_through:
-        _register_pass_through_tools(mcp, entries)
+        backends.extend(_register_pass_through_tools(mcp, entries))
 
+    _register_metrics_resource(mcp, metrics, backends)
     return mcp
 
 
@@ -1,19 +1,32 @@
 """Shared security middleware factories for dashboard and server apps.
 
-Each factory returns an ``async def dispatch(request, call_next)`` callable
-suitable for ``BaseHTTPMiddleware``.
+Each guard is written once as a *check*: ``check(request)`` returns an error
+``Response`` to short-circuit, or ``None`` to let the request through. Checks
+are synchronous unless they do blocking I/O (the SQLite rate limiter); those
+are ``async def`` and run it in a worker thread. ``make_*_check`` factories
+return the check itself, for ``GuardMiddleware``, a pure-ASGI middleware that
+runs several checks in one layer. ``make_*_dispatch`` factories wrap the same
+check as an ``async def dispatch(request, call_next)`` callable for
+``BaseHTTPMiddleware``.
+
+Prefer ``GuardMiddleware`` on hot paths: every ``BaseHTTPMiddleware`` layer
+adds a task group and re-wraps the response body stream on each request,
+which costs latency and gets in the way of streamed (SSE) responses.
 """
 
 from __future__ import annotations
 
 import hmac
+import inspect
 import ipaddress
 import logging
+import math
 import secrets
-from collections.abc import Callable, Set
+from collections.abc import Awaitable, Callable, Sequence, Set
 
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 _logger = logging.getLogger(__name__)
 
@@ -132,9 +145,54 @@ def openai_error_response(status_code: int, message: str) -> Response:
 
 ErrorResponseFn = Callable[[int, str], Response]
 AppliesFn = Callable[[Request], bool]
+CheckFn = Callable[[Request], Response | Awaitable[Response | None] | None]
+DispatchFn = Callable[[Request, Callable[[Request], Awaitable[Response]]], Awaitable[Response]]
 
 
-def make_auth_dispatch(
+async def _run_check(check: CheckFn, request: Request) -> Response | None:
+    response = check(request)
+    if inspect.isawaitable(response):
+        response = await response
+    return response
+
+
+def _dispatch_from_check(check: CheckFn) -> DispatchFn:
+    """Wrap *check* as a ``BaseHTTPMiddleware`` dispatch callable."""
+
+    async def dispatch(request: Request, call_next) -> Response:
+        response = await _run_check(check, request)
+        if response is not None:
+            return response
+        return await call_next(request)
+
+    return dispatch
+
+
+class GuardMiddleware:
+    """Pure-ASGI middleware that runs *checks* in order before the app.
+
+    The first check to return a response answers the request; otherwise the
+    app is called with the original ``receive``/``send``, so the request body
+    and streamed responses pass through untouched. Non-HTTP scopes (lifespan,
+    websocket) are not checked, matching ``BaseHTTPMiddleware``.
+    """
+
+    def __init__(self, app: ASGIApp, *, checks: Sequence[CheckFn]) -> None:
+        self.app = app
+        self.checks = tuple(checks)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and self.checks:
+            request = Request(scope)
+            for check in self.checks:
+                response = await _run_check(check, request)
+                if response is not None:
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
+
+def make_auth_check(
     *,
     api_key: str,
     applies_to: AppliesFn,
@@ -146,7 +204,7 @@ def make_auth_dispatch(
     cookie_token: str = "",
     login_redirect: str | None = None,
     secure_cookies: bool = False,
-):
+) -> CheckFn:
     """Bearer token auth with timing-safe comparison.
 
     When *allow_cookie* is True, checks the ``initrunner_token`` cookie as
@@ -161,56 +219,59 @@ def make_auth_dispatch(
     # otherwise fall back to comparing against the raw API key.
     _cookie_expected = cookie_token or api_key
 
-    async def dispatch(request: Request, call_next) -> Response:
-        if applies_to(request):
-            token = ""
-            from_cookie = False
-            auth_header = request.headers.get("authorization", "")
-            if auth_header.startswith("Bearer "):
-                token = auth_header[7:]
-
-            # --- Plain API-key path ---
-            if not token and allow_query_param:
-                token = request.query_params.get("api_key", "")
-                # If token came via query param, set cookie and redirect
-                if token and hmac.compare_digest(token, api_key):
+    def check(request: Request) -> Response | None:
+        if not applies_to(request):
+            return None
+        token = ""
+        from_cookie = False
+        auth_header = request.headers.get("authorization", "")
+        if auth_header.startswith("Bearer "):
+            token = auth_header[7:]
+
+        # --- Plain API-key path ---
+        if not token and allow_query_param:
+            token = request.query_params.get("api_key", "")
+            # If token came via query param, set cookie and redirect
+            if token and hmac.compare_digest(token, api_key):
+                from starlette.responses import RedirectResponse
+
+                path = request.url.path or "/roles"
+                resp = RedirectResponse(path, status_code=302)
+                resp.set_cookie(
+                    key=cookie_name,
+                    value=_cookie_expected,
+                    httponly=True,
+                    samesite="strict",
+                    secure=secure_cookies,
+                )
+                return resp
+        if not token and allow_cookie:
+            token = request.cookies.get(cookie_name, "")
+            from_cookie = bool(token)
+
+        # Compare against the right secret: cookies use the session
+        # token, Bearer/query-param tokens use the raw API key.
+        expected = _cookie_expected if from_cookie else api_key
+        if not token or not hmac.compare_digest(token, expected):
+            # Redirect HTML requests to login page
+            if login_redirect:
+                accept = request.headers.get("accept", "")
+                if "text/html" in accept:
+                    from urllib.parse import quote
+
                     from starlette.responses import RedirectResponse
 
-                    path = request.url.path or "/roles"
-                    resp = RedirectResponse(path, status_code=302)
-                    resp.set_cookie(
-                        key=cookie_name,
-                        value=_cookie_expected,
-                        httponly=True,
-                        samesite="strict",
-                        secure=secure_cookies,
-                    )
-                    return resp
-            if not token and allow_cookie:
-                token = request.cookies.get(cookie_name, "")
-                from_cookie = bool(token)
-
-            # Compare against the right secret: cookies use the session
-            # token, Bearer/query-param tokens use the raw API key.
-            expected = _cookie_expected if from_cookie else api_key
-            if not token or not hmac.compare_digest(token, expected):
-                # Redirect HTML requests to login page
-                if login_redirect:
-                    accept = request.headers.get("accept", "")
-                    if "text/html" in accept:
-                        from urllib.parse import quote
-
-                        from starlette.responses import RedirectResponse
-
-                        next_url = quote(str(request.url.path), safe="/")
-                        return RedirectResponse(
-                            f"{login_redirect}?next={next_url}", status_code=302
-                        )
-                return error_response(401, error_message)
+                    next_url = quote(str(request.url.path), safe="/")
+                    return RedirectResponse(f"{login_redirect}?next={next_url}", status_code=302)
+            return error_response(401, error_message)
+        return None
 
-        return await call_next(request)
+    return check
 
-    return dispatch
+
+def make_auth_dispatch(**kwargs) -> DispatchFn:
+    """``BaseHTTPMiddleware`` form of :func:`make_auth_check` (same arguments)."""
+    return _dispatch_from_check(make_auth_check(**kwargs))
 
 
 async def read_body_capped(request: Request, max_bytes: int) -> bytes | None:
@@ -218,7 +279,7 @@ async def read_body_capped(request: Request, max_bytes: int) -> bytes | None:
 
     Streams the body and aborts the moment the cap is crossed, so a chunked
     ``Transfer-Encoding`` request with no ``Content-Length`` cannot force
-    unbounded buffering. The header-only checks (``make_body_size_dispatch`` and
+    unbounded buffering. The header-only checks (``make_body_size_check`` and
     the webhook's Content-Length check) are trivially bypassed by chunked
     encoding; this enforces the limit on the bytes actually received.
     """
@@ -232,34 +293,70 @@ async def read_body_capped(request: Request, max_bytes: int) -> bytes | None:
     return b"".join(chunks)
 
 
-def make_rate_limit_dispatch(
+def make_rate_limit_check(
     *,
     rate_limiter,
     applies_to: AppliesFn,
     error_response: ErrorResponseFn,
     error_message: str = "Too many requests",
-):
-    """Rate limit middleware using any object with an ``allow()`` method."""
+    key_func: Callable[[Request], str] | None = None,
+) -> CheckFn:
+    """Rate limit using any object with an ``acquire(key) -> float`` method.
+
+    *key_func* picks the bucket for a request (all requests share one bucket
+    when it is omitted). Limited responses carry ``Retry-After``. A limiter
+    that also has an ``async acquire_async(key)`` (one backed by a database)
+    is called through that, so the check never blocks the event loop.
+    """
+    acquire_async = getattr(rate_limiter, "acquire_async", None)
 
-    async def dispatch(request: Request, call_next) -> Response:
-        if applies_to(request):
-            if not rate_limiter.allow():
-                return error_response(429, error_message)
-        return await call_next(request)
+    def _limited(wait: float) -> Response | None:
+        if wait:
+            return rate_limited_response(wait, error_response, error_message)
+        return None
+
+    if inspect.iscoroutinefunction(acquire_async):
+
+        async def check_async(request: Request) -> Response | None:
+            if not applies_to(request):
+                return None
+            return _limited(await acquire_async(key_func(request) if key_func else ""))
+
+        return check_async
+
+    def check(request: Request) -> Response | None:
+        if not applies_to(request):
+            return None
+        return _limited(rate_limiter.acquire(key_func(request) if key_func is not None else ""))
+
+    return check
+
+
+def rate_limited_response(
+    wait: float, error_response: ErrorResponseFn, error_message: str = "Too many requests"
+) -> Response:
+    """A 429 from *error_response* with ``Retry-After`` set to *wait*, rounded up."""
+    response = error_response(429, error_message)
+    if math.isfinite(wait):
+        response.headers["Retry-After"] = str(max(1, math.ceil(wait)))
+    return response
 
-    return dispatch
 
+def make_rate_limit_dispatch(**kwargs) -> DispatchFn:
+    """``BaseHTTPMiddleware`` form of :func:`make_rate_limit_check` (same arguments)."""
+    return _dispatch_from_check(make_rate_limit_check(**kwargs))
 
-def make_body_size_dispatch(
+
+def make_body_size_check(
     *,
     max_bytes: int,
     error_response: ErrorResponseFn,
     applies_to: AppliesFn | None = None,
     error_message: str = "Request body too large",
-):
+) -> CheckFn:
     """Reject POST/PUT/PATCH requests whose Content-Length exceeds *max_bytes*."""
 
-    async def dispatch(request: Request, call_next) -> Response:
+    def check(request: Request) -> Response | None:
         if request.method in ("POST", "PUT", "PATCH"):
             if applies_to is None or applies_to(request):
                 content_length = request.headers.get("content-length")
@@ -269,9 +366,14 @@ def make_body_size_dispatch(
                             return error_response(413, error_message)
                     except ValueError:
                         pass
-        return await call_next(request)
+        return None
 
-    return dispatch
+    return check
+
+
+def make_body_size_dispatch(**kwargs) -> DispatchFn:
+    """``BaseHTTPMiddleware`` form of :func:`make_body_size_check` (same arguments)."""
+    return _dispatch_from_check(make_body_size_check(**kwargs))
 
 
 def make_security_headers_dispatch():
@@ -296,19 +398,24 @@ def make_security_headers_dispatch():
     return dispatch
 
 
-def make_https_dispatch(
+def make_https_check(
     *,
     applies_to: AppliesFn,
     error_response: ErrorResponseFn,
     error_message: str = "HTTPS is required",
-):
+) -> CheckFn:
     """Reject non-HTTPS requests based on ``X-Forwarded-Proto``."""
 
-    async def dispatch(request: Request, call_next) -> Response:
+    def check(request: Request) -> Response | None:
         if applies_to(request):
             proto = request.headers.get("x-forwarded-proto", "")
             if proto != "https":
                 return error_response(403, error_message)
-        return await call_next(request)
+        return None
 
-    return dispatch
+    return check
+
+
+def make_https_dispatch(**kwargs) -> DispatchFn:
+    """``BaseHTTPMiddleware`` form of :func:`make_https_check` (same arguments)."""
+    return _dispatch_from_check(make_https_check(**kwargs))
@@ -0,0 +1,154 @@
+"""Content-addressed local cache of OCI blobs.
+
+Bundle layers and digest-pinned manifests are immutable, so a blob pulled or
+pushed once is kept under ``~/.initrunner/cache/oci/blobs/sha256/<hex>`` and
+reused instead of downloaded again. A download that is interrupted leaves a
+``.partial`` file next to it, which the next pull resumes from.
+
+The cache is capped at ``INITRUNNER_OCI_CACHE_MAX_MB`` megabytes (default
+1024; ``0`` for no cap). After each blob is added, the least recently used
+blobs (by mtime, which every cache hit refreshes) are deleted until the cache
+fits.
+
+Set ``INITRUNNER_OCI_CACHE=0`` to disable the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+from pathlib import Path
+
+from initrunner._log import get_logger
+
+logger = get_logger("packaging.blob_cache")
+
+_DIGEST_RE = re.compile(r"^sha256:([0-9a-f]{64})$")
+_HASH_BUFFER_BYTES = 1 << 20
+_DEFAULT_MAX_MB = 1024
+
+
+def file_digest(path: Path) -> tuple[str, int]:
+    """Stream *path* through SHA-256. Returns ``("sha256:<hex>", size)``."""
+    hasher = hashlib.sha256()
+    size = 0
+    with path.open("rb") as f:
+        while chunk := f.read(_HASH_BUFFER_BYTES):
+            hasher.update(chunk)
+            size += len(chunk)
+    return f"sha256:{hasher.hexdigest()}", size
+
+
+class BlobCache:
+    """Blobs stored by digest under *root*; every read is re-verified.
+
+    *max_bytes* caps the total size of stored blobs; ``0`` means no cap.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = 0) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def path(self, digest: str) -> Path:
+        match = _DIGEST_RE.match(digest)
+        if match is None:
+            raise ValueError(f"Unsupported blob digest: {digest!r}")
+        return self.root / "sha256" / match.group(1)
+
+    def partial_path(self, digest: str) -> Path:
+        """Where an in-progress download of *digest* is written."""
+        path = self.path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.with_name(path.name + ".partial")
+
+    def get(self, digest: str) -> Path | None:
+        """Return the cached blob for *digest*, or None if absent or corrupt."""
+        path = self.path(digest)
+        if not path.is_file():
+            return None
+        actual, _size = file_digest(path)
+        if actual != digest:
+            logger.warning("Dropping corrupt cached blob %s (got %s)", digest, actual)
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # most recently used, for prune()
+        except OSError:
+            pass
+        return path
+
+    def commit(self, digest: str, verified: Path) -> Path:
+        """Move an already verified file into the cache as *digest*."""
+        path = self.path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(verified, path)
+        if self.max_bytes > 0:
+            self.prune(self.max_bytes, keep=path)
+        return path
+
+    def prune(self, max_bytes: int, *, keep: Path | None = None) -> int:
+        """Delete least recently used blobs until at most *max_bytes* remain.
+
+        *keep* (a blob just added and about to be read) is never deleted.
+        In-progress ``.partial`` downloads are left alone. Returns the number
+        of bytes freed.
+        """
+        blobs: list[tuple[float, int, Path]] = []
+        for path in (self.root / "sha256").glob("*"):
+            if path.suffix == ".partial" or path == keep:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in blobs)
+        if keep is not None and keep.is_file():
+            total += keep.stat().st_size
+        freed = 0
+        for _, size, path in sorted(blobs):
+            if total - freed <= max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.debug("Could not evict cached blob %s: %s", path, e)
+                continue
+            freed += size
+        if freed:
+            logger.info("Evicted %d bytes of cached OCI blobs", freed)
+        return freed
+
+    def add_file(self, digest: str, source: Path) -> Path:
+        """Copy *source*, whose digest the caller computed, into the cache."""
+        path = self.path(digest)
+        if path.is_file():
+            return path
+        partial = self.partial_path(digest)
+        shutil.copyfile(source, partial)
+        return self.commit(digest, partial)
+
+    def add_bytes(self, digest: str, data: bytes) -> Path:
+        path = self.path(digest)
+        if path.is_file():
+            return path
+        partial = self.partial_path(digest)
+        partial.write_bytes(data)
+        return self.commit(digest, partial)
+
+
+def get_blob_cache() -> BlobCache | None:
+    """The blob cache under the InitRunner home, or None when disabled."""
+    if os.environ.get("INITRUNNER_OCI_CACHE", "1").lower() in ("0", "false", "off", "no"):
+        return None
+    from initrunner.config import get_oci_blob_cache_dir
+
+    raw = os.environ.get("INITRUNNER_OCI_CACHE_MAX_MB", "")
+    try:
+        max_mb = max(0, int(raw)) if raw else _DEFAULT_MAX_MB
+    except ValueError:
+        logger.warning("Ignoring invalid INITRUNNER_OCI_CACHE_MAX_MB=%r", raw)
+        max_mb = _DEFAULT_MAX_MB
+    return BlobCache(get_oci_blob_cache_dir(), max_bytes=max_mb * 1024 * 1024)
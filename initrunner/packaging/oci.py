@@ -1,10 +1,23 @@
-"""OCI Distribution API client for publishing and pulling role bundles."""
+"""OCI Distribution API client for publishing and pulling role bundles.
+
+Bundles are streamed, never held in memory whole:
+
+- ``push`` hashes the bundle from disk, skips blobs the registry already
+  has (``HEAD``), and uploads the rest in ``PATCH`` chunks through an upload
+  session. A failed chunk is resumed from the offset the registry reports.
+- ``pull`` streams the layer to disk while hashing it, and resumes an
+  interrupted download with a ``Range`` request.
+- Layers, and manifests fetched by digest, are kept in the local blob cache
+  (:mod:`initrunner.packaging.blob_cache`), so pulling a digest-pinned
+  reference again does no network I/O.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import json
 import logging
+import os
 import urllib.error
 import urllib.parse
 import urllib.request
@@ -13,6 +26,7 @@ from pathlib import Path
 from typing import Any
 
 from initrunner.packaging.auth import OCIAuth, resolve_auth
+from initrunner.packaging.blob_cache import file_digest, get_blob_cache
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +34,10 @@ OCI_CONFIG_MEDIA_TYPE = "application/vnd.initrunner.config.v1+json"
 OCI_LAYER_MEDIA_TYPE = "application/vnd.initrunner.role.v1.tar+gzip"
 OCI_MANIFEST_MEDIA_TYPE = "application/vnd.oci.image.manifest.v1+json"
 
+DEFAULT_UPLOAD_CHUNK_BYTES = 8 << 20
+_READ_BUFFER_BYTES = 1 << 20
+_MAX_RESUMES = 3
+
 
 class OCIError(Exception):
     """Base error for OCI operations."""
@@ -98,8 +116,9 @@ def parse_oci_ref(source: str) -> OCIRef:
 class OCIClient:
     """Synchronous OCI Distribution API client using urllib."""
 
-    def __init__(self, ref: OCIRef) -> None:
+    def __init__(self, ref: OCIRef, *, chunk_size: int = DEFAULT_UPLOAD_CHUNK_BYTES) -> None:
         self.ref = ref
+        self._chunk_size = chunk_size
         self._token: str | None = None
         self._auth: OCIAuth | None = resolve_auth(ref.registry)
 
@@ -108,12 +127,22 @@ class OCIClient:
         # 1. Upload config blob
         config_bytes = json.dumps(config_data, indent=2).encode()
         config_digest = f"sha256:{hashlib.sha256(config_bytes).hexdigest()}"
-        self._upload_blob(config_bytes, config_digest)
+        if not self._blob_exists(config_digest):
+            self._upload_blob(config_bytes, config_digest)
 
-        # 2. Upload layer blob (the tar.gz bundle)
-        layer_data = bundle_path.read_bytes()
-        layer_digest = f"sha256:{hashlib.sha256(layer_data).hexdigest()}"
-        self._upload_blob(layer_data, layer_digest)
+        # 2. Upload layer blob (the tar.gz bundle), streamed from disk
+        layer_digest, layer_size = file_digest(bundle_path)
+        if self._blob_exists(layer_digest):
+            logger.info("Layer %s already in registry; skipping upload", layer_digest)
+        else:
+            self._upload_blob_chunked(bundle_path, layer_digest, layer_size)
+
+        cache = get_blob_cache()
+        if cache is not None:
+            try:
+                cache.add_file(layer_digest, bundle_path)
+            except OSError as e:
+                logger.debug("Could not cache pushed layer %s: %s", layer_digest, e)
 
         # 3. PUT OCI manifest
         manifest = {
@@ -128,7 +157,7 @@ class OCIClient:
                 {
                     "mediaType": OCI_LAYER_MEDIA_TYPE,
                     "digest": layer_digest,
-                    "size": len(layer_data),
+                    "size": layer_size,
                 }
             ],
         }
@@ -153,20 +182,7 @@ class OCIClient:
     def pull(self, target_dir: Path) -> Path:
         """Download an OCI artifact and extract the bundle. Returns extracted path."""
         # 1. GET manifest
-        tag_or_digest = self.ref.digest or self.ref.tag
-        url = f"{self.ref.api_prefix}/manifests/{tag_or_digest}"
-
-        try:
-            with self._urlopen_with_auth(
-                url, headers={"Accept": OCI_MANIFEST_MEDIA_TYPE}, timeout=60
-            ) as resp:
-                manifest = json.loads(resp.read().decode())
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                raise OCIError(
-                    f"Artifact not found: {self.ref.registry}/{self.ref.repository}:{tag_or_digest}"
-                ) from e
-            raise OCIError(f"Failed to fetch manifest: HTTP {e.code}") from e
+        manifest = self._fetch_manifest()
 
         # 2. Download the layer blob
         if not manifest.get("layers"):
@@ -175,31 +191,116 @@ class OCIClient:
         layer = manifest["layers"][0]
         layer_digest = layer["digest"]
 
-        blob_url = f"{self.ref.api_prefix}/blobs/{layer_digest}"
-
-        try:
-            with self._urlopen_with_auth(blob_url, timeout=120) as resp:
-                layer_data = resp.read()
-        except urllib.error.HTTPError as e:
-            raise OCIError(f"Failed to download layer: HTTP {e.code}") from e
-
-        # Verify digest
-        actual = f"sha256:{hashlib.sha256(layer_data).hexdigest()}"
-        if actual != layer_digest:
-            raise OCIError(f"Layer digest mismatch: expected {layer_digest}, got {actual}")
-
-        # 3. Save and extract
+        # 3. Stream to the cache (or next to the target) and extract
         target_dir.mkdir(parents=True, exist_ok=True)
-        archive_path = target_dir / "bundle.tar.gz"
-        archive_path.write_bytes(layer_data)
+        cache = get_blob_cache()
+        if cache is not None:
+            archive_path = cache.get(layer_digest)
+            if archive_path is None:
+                partial = cache.partial_path(layer_digest)
+                self._download_blob(layer_digest, partial)
+                archive_path = cache.commit(layer_digest, partial)
+            else:
+                logger.info("Using cached layer %s", layer_digest)
+        else:
+            partial = target_dir / "bundle.tar.gz.partial"
+            self._download_blob(layer_digest, partial)
+            archive_path = target_dir / "bundle.tar.gz"
+            os.replace(partial, archive_path)
 
         from initrunner.packaging.bundle import extract_bundle
 
         extract_bundle(archive_path, target_dir)
-        archive_path.unlink()
+        if cache is None:
+            archive_path.unlink()
 
         return target_dir
 
+    def _fetch_manifest(self) -> dict:
+        """GET the manifest; by-digest manifests are served from and stored in the cache."""
+        tag_or_digest = self.ref.digest or self.ref.tag
+        cache = get_blob_cache() if self.ref.digest else None
+        if cache is not None:
+            try:
+                cached = cache.get(self.ref.digest)
+            except ValueError:
+                cached = None
+                cache = None
+            if cached is not None:
+                return json.loads(cached.read_bytes().decode())
+
+        url = f"{self.ref.api_prefix}/manifests/{tag_or_digest}"
+        try:
+            with self._urlopen_with_auth(
+                url, headers={"Accept": OCI_MANIFEST_MEDIA_TYPE}, timeout=60
+            ) as resp:
+                manifest_bytes = resp.read()
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                raise OCIError(
+                    f"Artifact not found: {self.ref.registry}/{self.ref.repository}:{tag_or_digest}"
+                ) from e
+            raise OCIError(f"Failed to fetch manifest: HTTP {e.code}") from e
+
+        if cache is not None:
+            actual = f"sha256:{hashlib.sha256(manifest_bytes).hexdigest()}"
+            if actual != self.ref.digest:
+                raise OCIError(
+                    f"Manifest digest mismatch: expected {self.ref.digest}, got {actual}"
+                )
+            cache.add_bytes(actual, manifest_bytes)
+        return json.loads(manifest_bytes.decode())
+
+    def _download_blob(self, digest: str, dest: Path) -> None:
+        """Stream blob *digest* into *dest*, verifying it on the fly.
+
+        Bytes already in *dest* (an interrupted earlier attempt) are kept and
+        the rest is requested with ``Range``. *dest* is removed if the result
+        does not match *digest*.
+        """
+        url = f"{self.ref.api_prefix}/blobs/{digest}"
+        hasher = hashlib.sha256()
+        offset = 0
+        if dest.exists():
+            with dest.open("rb") as f:
+                while chunk := f.read(_READ_BUFFER_BYTES):
+                    hasher.update(chunk)
+                    offset += len(chunk)
+
+        failures = 0
+        while True:
+            headers = {"Range": f"bytes={offset}-"} if offset else None
+            try:
+                with self._urlopen_with_auth(url, headers=headers, timeout=120) as resp:
+                    if offset and getattr(resp, "status", None) != 206:
+                        # The registry ignored the range: start over.
+                        hasher = hashlib.sha256()
+                        offset = 0
+                    with dest.open("ab" if offset else "wb") as out:
+                        while chunk := resp.read(_READ_BUFFER_BYTES):
+                            out.write(chunk)
+                            hasher.update(chunk)
+                            offset += len(chunk)
+                break
+            except urllib.error.HTTPError as e:
+                if e.code == 416 and offset:
+                    # What we have is not a prefix of the blob: start over.
+                    dest.unlink(missing_ok=True)
+                    hasher = hashlib.sha256()
+                    offset = 0
+                    continue
+                raise OCIError(f"Failed to download layer: HTTP {e.code}") from e
+            except OSError as e:  # URLError, connection resets, timeouts
+                failures += 1
+                if failures > _MAX_RESUMES:
+                    raise OCIError(f"Failed to download layer: {e}") from e
+                logger.warning("Layer download interrupted at %d bytes (%s); resuming", offset, e)
+
+        actual = f"sha256:{hasher.hexdigest()}"
+        if actual != digest:
+            dest.unlink(missing_ok=True)
+            raise OCIError(f"Layer digest mismatch: expected {digest}, got {actual}")
+
     def head(self) -> dict:
         """Check if artifact exists and return metadata."""
         tag_or_digest = self.ref.digest or self.ref.tag
@@ -222,9 +323,24 @@ class OCIClient:
                 raise OCIError("Artifact not found") from e
             raise OCIError(f"HEAD request failed: HTTP {e.code}") from e
 
-    def _upload_blob(self, data: bytes, digest: str) -> None:
-        """Upload a blob via POST (initiate) + PUT (complete) flow."""
-        # POST to initiate upload
+    def _blob_exists(self, digest: str) -> bool:
+        """HEAD the blob; any answer but 200 means upload it."""
+        url = f"{self.ref.api_prefix}/blobs/{digest}"
+        try:
+            with self._urlopen_with_auth(url, method="HEAD", timeout=30):
+                return True
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                logger.debug("HEAD %s failed with HTTP %d; uploading", digest, e.code)
+            return False
+
+    def _absolute_url(self, location: str) -> str:
+        if location.startswith("/"):
+            return f"{self.ref.base_url}{location}"
+        return location
+
+    def _start_upload(self) -> str:
+        """POST to open an upload session. Returns its absolute URL."""
         url = f"{self.ref.api_prefix}/blobs/uploads/"
 
         try:
@@ -242,17 +358,15 @@ class OCIClient:
 
         if not upload_url:
             raise OCIError("No Location header in upload initiation response")
+        return self._absolute_url(upload_url)
 
-        # Make upload URL absolute if relative
-        if upload_url.startswith("/"):
-            upload_url = f"{self.ref.base_url}{upload_url}"
-
-        # PUT to complete upload
+    def _finish_upload(self, upload_url: str, digest: str, data: bytes = b"") -> None:
+        """PUT the closing request of an upload session, with any remaining *data*."""
         separator = "&" if "?" in upload_url else "?"
         put_url = f"{upload_url}{separator}digest={digest}"
 
         try:
-            self._urlopen_with_auth(
+            with self._urlopen_with_auth(
                 put_url,
                 method="PUT",
                 data=data,
@@ -261,11 +375,62 @@ class OCIClient:
                     "Content-Length": str(len(data)),
                 },
                 timeout=120,
-            )
+            ):
+                pass
         except urllib.error.HTTPError as e:
             body = e.read().decode(errors="replace")
             raise OCIError(f"Failed to upload blob: HTTP {e.code}: {body}") from e
 
+    def _upload_blob(self, data: bytes, digest: str) -> None:
+        """Upload a small blob via POST (initiate) + PUT (complete) flow."""
+        self._finish_upload(self._start_upload(), digest, data)
+
+    def _upload_blob_chunked(self, path: Path, digest: str, size: int) -> None:
+        """Upload *path* in ``PATCH`` chunks, resuming from the registry's offset on failure."""
+        upload_url = self._start_upload()
+        offset = 0
+        failures = 0
+        with path.open("rb") as f:
+            while offset < size:
+                f.seek(offset)
+                chunk = f.read(self._chunk_size)
+                end = offset + len(chunk) - 1
+                try:
+                    with self._urlopen_with_auth(
+                        upload_url,
+                        method="PATCH",
+                        data=chunk,
+                        headers={
+                            "Content-Type": "application/octet-stream",
+                            "Content-Length": str(len(chunk)),
+                            "Content-Range": f"{offset}-{end}",
+                        },
+                        timeout=120,
+                    ) as resp:
+                        upload_url = self._absolute_url(resp.headers.get("Location") or upload_url)
+                    offset = end + 1
+                except OSError as e:  # HTTPError, URLError, connection resets
+                    failures += 1
+                    if failures > _MAX_RESUMES:
+                        detail = f"HTTP {e.code}" if isinstance(e, urllib.error.HTTPError) else e
+                        raise OCIError(f"Failed to upload blob: {detail}") from e
+                    upload_url, offset = self._upload_status(upload_url)
+                    logger.warning("Blob upload interrupted (%s); resuming at byte %d", e, offset)
+        self._finish_upload(upload_url, digest)
+
+    def _upload_status(self, upload_url: str) -> tuple[str, int]:
+        """GET an upload session's progress. Returns its URL and the next offset."""
+        try:
+            with self._urlopen_with_auth(upload_url, timeout=30) as resp:
+                location = self._absolute_url(resp.headers.get("Location") or upload_url)
+                received = resp.headers.get("Range", "")
+        except urllib.error.HTTPError as e:
+            raise OCIError(f"Blob upload session lost: HTTP {e.code}") from e
+        # Range: 0-<last byte received>, so "0-0" means byte 0 has landed. A
+        # session that has received nothing sends no Range header at all.
+        _, _, last = received.partition("-")
+        return location, int(last) + 1 if last.isdigit() else 0
+
     def _get_token(self, www_authenticate: str) -> str:
         """Handle WWW-Authenticate challenge for token exchange."""
         # Parse: Bearer realm="...",service="...",scope="..."
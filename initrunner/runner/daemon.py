@@ -36,6 +36,7 @@ from initrunner.runner.display import (
     _display_stream_stats,
     console,
 )
+from initrunner.runner.work_queue import TriggerWorkQueue, WorkQueueStats
 from initrunner.sinks.dispatcher import SinkDispatcher
 from initrunner.stores.base import MemoryStoreBase
 from initrunner.triggers.base import TriggerEvent
@@ -61,7 +62,6 @@ class PendingClarification:
 class DaemonRunner:
     """Encapsulates daemon mode state and trigger handling."""
 
-    _MAX_CONCURRENT = 4
     _SHUTDOWN_GRACE_SECONDS = 30
 
     def __init__(
@@ -101,7 +101,19 @@ class DaemonRunner:
         self._stop = stop_event if stop_event is not None else threading.Event()
         self._in_flight_count = 0
         self._in_flight_cond = threading.Condition()
-        self._concurrency_semaphore = threading.Semaphore(self._MAX_CONCURRENT)
+
+        # Trigger threads enqueue; worker threads run _on_trigger. The queue
+        # shape is fixed at startup (hot-reload does not resize it).
+        daemon_cfg = role.spec.daemon
+        self._work_queue = TriggerWorkQueue(
+            self._on_trigger,
+            workers=daemon_cfg.workers,
+            max_queued=daemon_cfg.max_queued,
+            priorities=daemon_cfg.priorities,
+            coalesce=set(daemon_cfg.coalesce),
+            on_drop=self._on_drop,
+            name=f"{label or role.metadata.name}-daemon",
+        )
 
         guardrails = role.spec.guardrails
 
@@ -172,7 +184,8 @@ class DaemonRunner:
             if self._autopilot or getattr(tc, "autonomous", False):
                 self._autonomous_trigger_types.add(tc.type)
 
-        self._dispatcher = TriggerDispatcher(self._role.spec.triggers, self._on_trigger)
+        self._dispatcher = TriggerDispatcher(self._role.spec.triggers, self._submit_trigger)
+        self._work_queue.start()
 
         _display_daemon_header(
             self._role,
@@ -199,6 +212,9 @@ class DaemonRunner:
             # Drain in-flight runs before the dispatcher tears down the trigger
             # threads (which only join for ~10s); otherwise a longer run is
             # abandoned mid-execution and its post-processing never runs.
+            discarded = self._work_queue.stop(timeout=0)
+            if discarded:
+                console.print(f"[dim]  Discarded {discarded} queued trigger(s).[/dim]")
             self._drain_in_flight()
 
         if self._reloader is not None:
@@ -216,7 +232,7 @@ class DaemonRunner:
         autonomy_config = self._role.spec.autonomy
 
         self._schedule_queue = ScheduleQueue(
-            self._on_trigger,
+            self._submit_trigger,
             max_total=autonomy_config.max_scheduled_total,
         )
 
@@ -227,19 +243,44 @@ class DaemonRunner:
         self._scheduling_toolset = build_scheduling_toolset(autonomy_config, self._schedule_queue)
         console.print("[dim]  Scheduling enabled (in-memory, lost on restart).[/dim]")
 
-    def _on_trigger(self, event: TriggerEvent) -> None:
-        """Handle a trigger event with concurrency limiting."""
-        # Fast path: deliver clarification answer (bypass semaphore + budget)
+    def _submit_trigger(self, event: TriggerEvent) -> None:
+        """Trigger callback: answer a pending clarification or queue the event."""
+        # Answers bypass the queue: the run waiting for one holds a worker and
+        # its conversation, so a queued answer would never be reached.
+        if self._deliver_clarification(event):
+            return
+        self._work_queue.submit(event)
+
+    def _deliver_clarification(self, event: TriggerEvent) -> bool:
+        """Hand *event* to a run waiting on a clarification for its conversation."""
         conv_key = event.conversation_key
-        if conv_key is not None:
-            with self._pending_lock:
-                pending = self._pending_clarifications.get(conv_key)
-                if pending is not None:
-                    pending.answer = event.prompt
-                    pending.event.set()
-                    return
+        if conv_key is None:
+            return False
+        with self._pending_lock:
+            pending = self._pending_clarifications.get(conv_key)
+            if pending is None:
+                return False
+            pending.answer = event.prompt
+            pending.event.set()
+            return True
+
+    def _on_drop(self, event: TriggerEvent, reason: str) -> None:
+        console.print(
+            f"\n[yellow]{self._prefix}Trigger queue: dropping trigger "
+            f"({event.trigger_type}): {reason}[/yellow]"
+        )
 
-        # Circuit breaker check (before semaphore to avoid wasting slots)
+    def queue_stats(self) -> WorkQueueStats:
+        """Queue depth, wait time and drop counters for this daemon."""
+        return self._work_queue.stats()
+
+    def _on_trigger(self, event: TriggerEvent) -> None:
+        """Run one trigger event on the calling (worker) thread."""
+        # Fast path: deliver clarification answer (bypass budget)
+        if self._deliver_clarification(event):
+            return
+
+        # Circuit breaker check
         if self._circuit_breaker is not None:
             cb_allowed, cb_reason = self._circuit_breaker.allow_request()
             if not cb_allowed:
@@ -249,20 +290,9 @@ class DaemonRunner:
                 )
                 return
 
-        if not self._concurrency_semaphore.acquire(blocking=False):
-            # Free any HALF_OPEN probe slot we just claimed: this run won't execute.
-            if self._circuit_breaker is not None:
-                self._circuit_breaker.release_probe()
-            console.print(
-                f"\n[yellow]Max concurrent triggers ({self._MAX_CONCURRENT}) reached — "
-                f"skipping trigger ({event.trigger_type})[/yellow]"
-            )
-            return
-
         try:
             self._on_trigger_inner(event)
         finally:
-            self._concurrency_semaphore.release()
             # Release a claimed probe if the run never recorded a result (budget
             # drop, pause-for-approval, or an unexpected error). No-op once a
             # success/failure was recorded, since the breaker left HALF_OPEN.
@@ -774,7 +804,7 @@ class DaemonRunner:
         if self._dispatcher is not None:
             self._dispatcher.stop_all()
 
-        self._dispatcher = TriggerDispatcher(new_role.spec.triggers, self._on_trigger)
+        self._dispatcher = TriggerDispatcher(new_role.spec.triggers, self._submit_trigger)
         self._dispatcher.start_all()
         console.print("[dim]  Triggers restarted after config change.[/dim]")
 
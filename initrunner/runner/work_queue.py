@@ -0,0 +1,304 @@
+"""Bounded priority work queue for daemon trigger events.
+
+Trigger threads submit events and return immediately; a fixed pool of worker
+threads runs them. Scheduling rules:
+
+- Lower priority numbers run first; ties run in submission order.
+- Events that share a conversation key run one at a time, in arrival order.
+- A queued event whose trigger type is coalescible (``file_watch`` by
+  default) absorbs later duplicates for the same path until it starts.
+- When the queue is full, a new event evicts the lowest-priority queued event
+  if it outranks it; otherwise the new event is dropped.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+
+from initrunner.triggers.base import CONVERSATIONAL_TRIGGER_TYPES, TriggerEvent
+
+_logger = logging.getLogger(__name__)
+
+# Chat replies first, then pushed events, then timers, then file churn.
+DEFAULT_PRIORITIES: dict[str, int] = {
+    "webhook": 10,
+    "scheduled": 20,
+    "cron": 20,
+    "heartbeat": 30,
+    "file_watch": 40,
+}
+_CONVERSATIONAL_PRIORITY = 0
+_DEFAULT_PRIORITY = 20
+
+
+@dataclass(frozen=True)
+class WorkQueueStats:
+    """Point-in-time counters for a :class:`TriggerWorkQueue`."""
+
+    depth: int
+    in_flight: int
+    submitted: int
+    completed: int
+    dropped: int
+    coalesced: int
+    avg_wait_s: float
+    max_wait_s: float
+
+
+@dataclass(order=True)
+class _Item:
+    priority: int
+    seq: int
+    event: TriggerEvent = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    conv_key: str | None = field(compare=False)
+    coalesce_key: tuple[str, str] | None = field(compare=False)
+    cancelled: bool = field(default=False, compare=False)
+
+
+class TriggerWorkQueue:
+    """Run submitted trigger events on ``workers`` threads, ``max_queued`` deep."""
+
+    def __init__(
+        self,
+        handler: Callable[[TriggerEvent], None],
+        *,
+        workers: int = 4,
+        max_queued: int = 100,
+        priorities: Mapping[str, int] | None = None,
+        coalesce: frozenset[str] | set[str] = frozenset({"file_watch"}),
+        on_drop: Callable[[TriggerEvent, str], None] | None = None,
+        name: str = "daemon",
+    ) -> None:
+        self._handler = handler
+        self._workers = workers
+        self._max_queued = max_queued
+        self._priorities = {**DEFAULT_PRIORITIES, **(priorities or {})}
+        self._coalesce = frozenset(coalesce)
+        self._on_drop = on_drop
+        self._name = name
+
+        self._cond = threading.Condition()
+        self._heap: list[_Item] = []
+        self._seq = itertools.count()
+        self._depth = 0  # live items in the heap plus parked items
+        # A conversation has at most one item queued in the heap or running;
+        # the rest wait in arrival order in _parked.
+        self._active_convs: set[str] = set()
+        self._parked: dict[str, deque[_Item]] = {}
+        self._queued_by_path: dict[tuple[str, str], _Item] = {}
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+
+        self._in_flight = 0
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    # -- public API -----------------------------------------------------------
+
+    def priority_of(self, event: TriggerEvent) -> int:
+        if event.trigger_type in self._priorities:
+            return self._priorities[event.trigger_type]
+        if event.trigger_type in CONVERSATIONAL_TRIGGER_TYPES:
+            return _CONVERSATIONAL_PRIORITY
+        return _DEFAULT_PRIORITY
+
+    def start(self) -> None:
+        """Start the worker threads. Idempotent."""
+        with self._cond:
+            if self._threads:
+                return
+            self._closed = False
+            for i in range(self._workers):
+                t = threading.Thread(
+                    target=self._worker, name=f"{self._name}-worker-{i}", daemon=True
+                )
+                self._threads.append(t)
+                t.start()
+
+    def submit(self, event: TriggerEvent) -> bool:
+        """Queue *event*. Returns False if it was dropped."""
+        evicted: _Item | None = None
+        drop_reason = ""
+        with self._cond:
+            coalesce_key = self._coalesce_key(event)
+            if self._closed:
+                drop_reason = "daemon is stopping"
+            elif coalesce_key is not None and coalesce_key in self._queued_by_path:
+                self._coalesced += 1
+                return True
+            else:
+                item = _Item(
+                    priority=self.priority_of(event),
+                    seq=next(self._seq),
+                    event=event,
+                    enqueued_at=time.monotonic(),
+                    conv_key=event.conversation_key,
+                    coalesce_key=coalesce_key,
+                )
+                if self._depth >= self._max_queued:
+                    evicted = self._lowest_priority_queued()
+                    if evicted is None or evicted.priority <= item.priority:
+                        evicted = None
+                        drop_reason = f"queue full ({self._max_queued} waiting)"
+                    else:
+                        self._remove(evicted)
+                        self._dropped += 1
+                if not drop_reason:
+                    self._add(item)
+                    self._submitted += 1
+                    self._cond.notify()
+            if drop_reason:
+                self._dropped += 1
+
+        if evicted is not None:
+            self._report_drop(evicted.event, "evicted by a higher-priority event")
+        if drop_reason:
+            self._report_drop(event, drop_reason)
+            return False
+        return True
+
+    def stop(self, timeout: float = 5.0) -> int:
+        """Stop accepting work, discard queued events and join idle workers.
+
+        Returns the number of queued events discarded. Runs already in progress
+        are not interrupted; callers drain them separately.
+        """
+        with self._cond:
+            self._closed = True
+            discarded = self._depth
+            self._heap.clear()
+            self._parked.clear()
+            self._active_convs.clear()
+            self._queued_by_path.clear()
+            self._depth = 0
+            self._cond.notify_all()
+            threads, self._threads = self._threads, []
+        deadline = time.monotonic() + timeout
+        for t in threads:
+            t.join(timeout=max(0.0, deadline - time.monotonic()))
+        return discarded
+
+    def stats(self) -> WorkQueueStats:
+        with self._cond:
+            return WorkQueueStats(
+                depth=self._depth,
+                in_flight=self._in_flight,
+                submitted=self._submitted,
+                completed=self._completed,
+                dropped=self._dropped,
+                coalesced=self._coalesced,
+                avg_wait_s=self._wait_total / self._started if self._started else 0.0,
+                max_wait_s=self._wait_max,
+            )
+
+    # -- internals (call with self._cond held) --------------------------------
+
+    def _coalesce_key(self, event: TriggerEvent) -> tuple[str, str] | None:
+        if event.trigger_type not in self._coalesce:
+            return None
+        return (event.trigger_type, event.metadata.get("path") or event.prompt)
+
+    def _add(self, item: _Item) -> None:
+        self._depth += 1
+        if item.coalesce_key is not None:
+            self._queued_by_path[item.coalesce_key] = item
+        key = item.conv_key
+        if key is None:
+            heapq.heappush(self._heap, item)
+        elif key in self._active_convs:
+            self._parked.setdefault(key, deque()).append(item)
+        else:
+            self._active_convs.add(key)
+            heapq.heappush(self._heap, item)
+
+    def _remove(self, item: _Item) -> None:
+        self._depth -= 1
+        if item.coalesce_key is not None:
+            self._queued_by_path.pop(item.coalesce_key, None)
+        key = item.conv_key
+        parked = self._parked.get(key) if key is not None else None
+        if parked is not None and item in parked:
+            parked.remove(item)
+            if not parked:
+                del self._parked[key]  # type: ignore[arg-type]
+        else:
+            # In the heap: delete lazily and hand the slot to the next in line.
+            item.cancelled = True
+            if key is not None:
+                self._advance_conv(key)
+
+    def _advance_conv(self, key: str) -> None:
+        """Queue the next parked item of *key*, or mark the conversation idle."""
+        parked = self._parked.get(key)
+        if parked:
+            heapq.heappush(self._heap, parked.popleft())
+            if not parked:
+                del self._parked[key]
+            self._cond.notify()
+        else:
+            self._active_convs.discard(key)
+
+    def _lowest_priority_queued(self) -> _Item | None:
+        candidates = [i for i in self._heap if not i.cancelled]
+        for parked in self._parked.values():
+            candidates.extend(parked)
+        # Newest of the least urgent goes first, like a LIFO shed.
+        return max(candidates, key=lambda i: (i.priority, i.seq), default=None)
+
+    def _next_item(self) -> _Item | None:
+        while self._heap:
+            item = heapq.heappop(self._heap)
+            if not item.cancelled:
+                return item
+        return None
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                item = self._next_item()
+                while item is None and not self._closed:
+                    self._cond.wait()
+                    item = self._next_item()
+                if item is None:
+                    return
+                self._depth -= 1
+                if item.coalesce_key is not None:
+                    self._queued_by_path.pop(item.coalesce_key, None)
+                self._in_flight += 1
+                self._started += 1
+                wait = time.monotonic() - item.enqueued_at
+                self._wait_total += wait
+                self._wait_max = max(self._wait_max, wait)
+            try:
+                self._handler(item.event)
+            except Exception:
+                _logger.exception(
+                    "Unhandled error in trigger handler (%s)", item.event.trigger_type
+                )
+            finally:
+                with self._cond:
+                    self._in_flight -= 1
+                    self._completed += 1
+                    if item.conv_key is not None:
+                        self._advance_conv(item.conv_key)
+
+    def _report_drop(self, event: TriggerEvent, reason: str) -> None:
+        _logger.warning("Dropped trigger (%s): %s", event.trigger_type, reason)
+        if self._on_drop is not None:
+            try:
+                self._on_drop(event, reason)
+            except Exception:
+                _logger.debug("on_drop callback failed", exc_info=True)
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import hmac
 import json
 import logging
 import secrets
 import time
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -21,7 +23,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, StreamingResponse
 from starlette.routing import Route
 
-from initrunner.agent.policies import validate_input
+from initrunner.agent.policies import validate_input_async
 from initrunner.agent.prompt import extract_text_from_prompt
 from initrunner.agent.schema.role import RoleDefinition
 from initrunner.agent.schema.security import SecurityPolicy
@@ -40,7 +42,7 @@ from initrunner.server.models import (
     StreamChoice,
     Usage,
 )
-from initrunner.services.execution import execute_run_stream_sync, execute_run_sync
+from initrunner.services.execution import execute_run_async, execute_run_stream_async
 
 _logger = logging.getLogger(__name__)
 
@@ -85,6 +87,30 @@ def _member_for_run(
     return None
 
 
+def _rate_limit_key(request: Request, key_by: str, api_key: str | None = None) -> str:
+    """Bucket key for *request* under ``security.rate_limit.key_by``.
+
+    The limit runs before auth and every header is client controlled, so a
+    header never buys a fresh bucket on its own: a bearer token counts only
+    when it is the configured *api_key*, and a conversation id is scoped to
+    the client IP. Everything else falls back to the client IP.
+    """
+    if key_by == "global":
+        return ""
+    ip = request.client.host if request.client else ""
+    if key_by == "api_key":
+        auth = request.headers.get("authorization", "")
+        token = auth[7:] if auth.startswith("Bearer ") else ""
+        if api_key and token and hmac.compare_digest(token, api_key):
+            # Hashed so live API keys are not held as dictionary/database keys.
+            return "key:" + hashlib.sha256(token.encode()).hexdigest()[:32]
+    elif key_by == "conversation":
+        conv_id = request.headers.get("x-conversation-id")
+        if conv_id:
+            return f"conv:{ip}:{conv_id}"
+    return "ip:" + ip
+
+
 def _error_response(status: int, error_type: str, message: str) -> JSONResponse:
     """Return an OpenAI-style error JSON response."""
     return JSONResponse(
@@ -113,6 +139,7 @@ def _classify_error(error: str) -> tuple[int, str, str]:
 
 
 _MAX_CONVERSATION_HISTORY = 40  # Match dashboard's limit
+_CONVERSATION_SWEEP_SECONDS = 60.0
 
 
 def _trim_history(messages: list, max_messages: int) -> list:
@@ -238,7 +265,7 @@ def create_multi_app(
     long-standing behaviour. With several, it selects the agent and is required:
     guessing on the client's behalf would silently answer as the wrong agent.
     """
-    from initrunner.server.rate_limiter import TokenBucketRateLimiter
+    from initrunner.server.rate_limiter import SQLiteRateLimiter, build_rate_limiter
 
     if not members:
         raise ValueError("a server needs at least one agent")
@@ -247,14 +274,21 @@ def create_multi_app(
     rate_cfg = security.rate_limit
     single = next(iter(members.values())) if len(members) == 1 else None
 
+    spill_path = None
+    if server_cfg.persist_conversations:
+        from initrunner.config import get_server_conversations_path
+
+        spill_path = get_server_conversations_path()
     conversations = ConversationStore(
         ttl_seconds=conversation_ttl if conversation_ttl is not None else 3600,
         max_conversations=server_cfg.max_conversations,
+        max_bytes=int(server_cfg.max_conversation_memory_mb * 1024 * 1024),
+        spill_path=spill_path,
     )
-    rate_limiter = TokenBucketRateLimiter(
-        rate=rate_cfg.requests_per_minute / 60.0,
-        burst=rate_cfg.burst_size,
-    )
+    rate_limiter = build_rate_limiter(rate_cfg, namespace=",".join(sorted(members)))
+    # Runs execute on the server's event loop, so this is what bounds how many
+    # agent runs are in flight at once; requests past it wait for a slot.
+    run_limiter = asyncio.Semaphore(server_cfg.max_concurrent_runs)
 
     def _resolve_member(requested: str) -> ServedMember | None:
         if single is not None:
@@ -309,11 +343,25 @@ def create_multi_app(
         if member is None:
             return _unknown_model_error(req.model)
 
+        if rate_cfg.per_model:
+            # The agent is only known once the body is parsed, so this bucket
+            # is checked here rather than in the guard middleware.
+            principal = _rate_limit_key(request, rate_cfg.key_by, api_key)
+            bucket = f"{principal}\x00model:{member.key}"
+            if isinstance(rate_limiter, SQLiteRateLimiter):
+                wait = await rate_limiter.acquire_async(bucket)
+            else:
+                wait = rate_limiter.acquire(bucket)
+            if wait:
+                from initrunner.middleware import openai_error_response, rate_limited_response
+
+                return rate_limited_response(wait, openai_error_response)
+
         # Resolve conversation history. The key includes the agent so that a
         # client reusing one conversation id across agents does not hand one
         # agent another's history.
         conv_id = request.headers.get("x-conversation-id") or secrets.token_urlsafe(24)
-        server_history = conversations.get(_conv_key(member.key, conv_id))
+        server_history = await conversations.get_async(_conv_key(member.key, conv_id))
 
         try:
             if server_history is not None:
@@ -393,15 +441,16 @@ def create_multi_app(
         from initrunner.services.execution import resume_run_async
 
         try:
-            result, new_messages = await resume_run_async(
-                member.agent,
-                member.role,
-                run_id,
-                approvals,
-                audit_logger=audit_logger,
-                resolved_by=resolved_by,
-                role_path=member.role_path,
-            )
+            async with run_limiter:
+                result, new_messages = await resume_run_async(
+                    member.agent,
+                    member.role,
+                    run_id,
+                    approvals,
+                    audit_logger=audit_logger,
+                    resolved_by=resolved_by,
+                    role_path=member.role_path,
+                )
         except ValueError as e:
             return _error_response(404, "invalid_request_error", str(e))
         except Exception:
@@ -422,7 +471,7 @@ def create_multi_app(
         if not result.success:
             status, error_type, message = _classify_error(result.error or "")
             return _error_response(status, error_type, message)
-        conversations.save(
+        await conversations.save_async(
             _conv_key(member.key, conv_id),
             _trim_history(new_messages, _MAX_CONVERSATION_HISTORY),
         )
@@ -455,20 +504,20 @@ def create_multi_app(
     ) -> JSONResponse:
         role = member.role
         content_policy = role.spec.security.content
-        validation = validate_input(extract_text_from_prompt(prompt), content_policy)
+        validation = await validate_input_async(extract_text_from_prompt(prompt), content_policy)
         if not validation.valid:
             return _error_response(400, "invalid_request_error", validation.reason)
 
         try:
-            result, new_messages = await asyncio.to_thread(
-                execute_run_sync,
-                member.agent,
-                role,
-                prompt,
-                audit_logger=audit_logger,
-                message_history=message_history,
-                skip_input_validation=True,
-            )
+            async with run_limiter:
+                result, new_messages = await execute_run_async(
+                    member.agent,
+                    role,
+                    prompt,
+                    audit_logger=audit_logger,
+                    message_history=message_history,
+                    skip_input_validation=True,
+                )
         except Exception:
             return _error_response(500, "server_error", "Internal server error")
 
@@ -487,7 +536,7 @@ def create_multi_app(
                 role_path=member.role_path,
             )
 
-        conversations.save(
+        await conversations.save_async(
             _conv_key(member.key, conv_id),
             _trim_history(new_messages, _MAX_CONVERSATION_HISTORY),
         )
@@ -510,8 +559,7 @@ def create_multi_app(
 
     # --- Streaming handler ---
 
-    _TOKEN_QUEUE_MAX = 65_536
-    _HEARTBEAT_INTERVAL = 100  # iterations (~10s at 0.1s poll)
+    _HEARTBEAT_SECONDS = 10.0
 
     async def _handle_stream(
         member: ServedMember,
@@ -527,44 +575,36 @@ def create_multi_app(
         # Pre-flight input validation — reject before streaming starts so the
         # client gets a proper HTTP 400, not a 200 SSE stream with an error.
         content_policy = role.spec.security.content
-        validation = validate_input(extract_text_from_prompt(prompt), content_policy)
+        validation = await validate_input_async(extract_text_from_prompt(prompt), content_policy)
         if not validation.valid:
             return _error_response(400, "invalid_request_error", validation.reason)
 
         completion_id = _make_id()
         created = _now_ts()
 
-        token_queue: asyncio.Queue[str | None] = asyncio.Queue(
-            maxsize=_TOKEN_QUEUE_MAX,
-        )
-        loop = asyncio.get_running_loop()
+        # The run and the SSE writer share this loop, so tokens go straight
+        # onto the queue; None marks the end of the run.
+        token_queue: asyncio.Queue[str | None] = asyncio.Queue()
 
         def on_token(chunk: str) -> None:
+            token_queue.put_nowait(chunk)
+
+        async def run_stream():
             try:
-                loop.call_soon_threadsafe(token_queue.put_nowait, chunk)
-            except RuntimeError:
-                # Event loop closed — stream is being torn down
-                pass
-
-        def run_stream():
-            # AuditLogger is thread-safe — audit_logger.log() may be
-            # called from the thread pool.
-            try:
-                return execute_run_stream_sync(
-                    member.agent,
-                    role,
-                    prompt,
-                    audit_logger=audit_logger,
-                    message_history=message_history,
-                    on_token=on_token,
-                    skip_input_validation=True,
-                )
+                async with run_limiter:
+                    return await execute_run_stream_async(
+                        member.agent,
+                        role,
+                        prompt,
+                        audit_logger=audit_logger,
+                        message_history=message_history,
+                        on_token=on_token,
+                        skip_input_validation=True,
+                    )
             finally:
-                loop.call_soon_threadsafe(token_queue.put_nowait, None)
-
-        async def event_generator():
-            stream_task = loop.run_in_executor(None, run_stream)
+                token_queue.put_nowait(None)
 
+        async def _stream_events(stream_task: asyncio.Future):
             # Send initial chunk with role
             initial = ChatCompletionChunk(
                 id=completion_id,
@@ -574,30 +614,14 @@ def create_multi_app(
             )
             yield f"data: {initial.model_dump_json(exclude_none=True)}\n\n"
 
-            # Forward tokens as SSE data events
-            heartbeat_counter = 0
-            while not stream_task.done():
+            # Forward tokens as SSE data events; a quiet gap (including a
+            # wait for a run slot) gets a heartbeat comment.
+            while True:
                 try:
-                    token = await asyncio.wait_for(token_queue.get(), timeout=0.1)
-                    if token is None:
-                        break
-                    chunk = ChatCompletionChunk(
-                        id=completion_id,
-                        created=created,
-                        model=model_name,
-                        choices=[StreamChoice(delta=DeltaMessage(content=token))],
-                    )
-                    yield f"data: {chunk.model_dump_json(exclude_none=True)}\n\n"
-                    heartbeat_counter = 0
+                    token = await asyncio.wait_for(token_queue.get(), timeout=_HEARTBEAT_SECONDS)
                 except TimeoutError:
-                    heartbeat_counter += 1
-                    if heartbeat_counter >= _HEARTBEAT_INTERVAL:
-                        yield ": heartbeat\n\n"
-                        heartbeat_counter = 0
-
-            # Drain remaining tokens
-            while not token_queue.empty():
-                token = token_queue.get_nowait()
+                    yield ": heartbeat\n\n"
+                    continue
                 if token is None:
                     break
                 chunk = ChatCompletionChunk(
@@ -608,7 +632,7 @@ def create_multi_app(
                 )
                 yield f"data: {chunk.model_dump_json(exclude_none=True)}\n\n"
 
-            # Get result from executor
+            # Get the run's result
             try:
                 result, new_messages = await stream_task
 
@@ -646,7 +670,7 @@ def create_multi_app(
                     )
                     yield f"data: {finish.model_dump_json(exclude_none=True)}\n\n"
                 elif result.success:
-                    conversations.save(
+                    await conversations.save_async(
                         _conv_key(member.key, conv_id),
                         _trim_history(new_messages, _MAX_CONVERSATION_HISTORY),
                     )
@@ -697,6 +721,19 @@ def create_multi_app(
 
             yield "data: [DONE]\n\n"
 
+        async def event_generator():
+            stream_task = asyncio.ensure_future(run_stream())
+            try:
+                async for event in _stream_events(stream_task):
+                    yield event
+            finally:
+                # Client went away mid-stream: stop the run instead of
+                # letting it finish for nobody.
+                if not stream_task.done():
+                    stream_task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await stream_task
+
         return StreamingResponse(
             event_generator(),
             media_type="text/event-stream",
@@ -736,10 +773,21 @@ def create_multi_app(
             )
         )
 
+    async def _sweep_conversations() -> None:
+        while True:
+            await asyncio.sleep(_CONVERSATION_SWEEP_SECONDS)
+            await conversations.sweep_async()
+
     @asynccontextmanager
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        sweeper = asyncio.create_task(_sweep_conversations())
         yield
-        conversations.clear()
+        sweeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper
+        await conversations.close_async()
+        if isinstance(rate_limiter, SQLiteRateLimiter):
+            rate_limiter.close()
         if audit_logger is not None:
             audit_logger.close()
 
@@ -749,55 +797,60 @@ def create_multi_app(
         lifespan=lifespan,
     )
 
-    from starlette.middleware.base import BaseHTTPMiddleware
-
     from initrunner.middleware import (
+        CheckFn,
+        GuardMiddleware,
         all_paths_predicate,
-        make_auth_dispatch,
-        make_body_size_dispatch,
-        make_https_dispatch,
-        make_rate_limit_dispatch,
+        make_auth_check,
+        make_body_size_check,
+        make_https_check,
+        make_rate_limit_check,
         openai_error_response,
         prefix_predicate,
     )
 
     v1_predicate = prefix_predicate("/v1/")
+    # With per-model limits, chat completions are limited in the handler.
+    rate_predicate = (
+        prefix_predicate("/v1/", exclude={"/v1/chat/completions"})
+        if rate_cfg.per_model
+        else v1_predicate
+    )
 
-    # Order matters: outermost middleware runs first
+    # One pure-ASGI layer runs every guard, outside CORS, in this order:
     # HTTPS check -> Body size -> Rate limit -> Auth
-    if api_key:
-        app.add_middleware(
-            BaseHTTPMiddleware,  # type: ignore[arg-type]
-            dispatch=make_auth_dispatch(
-                api_key=api_key,
-                applies_to=v1_predicate,
+    checks: list[CheckFn] = []
+    if server_cfg.require_https:
+        checks.append(
+            make_https_check(
+                applies_to=all_paths_predicate(exclude={"/health"}),
                 error_response=openai_error_response,
-                error_message="invalid API key",
-            ),
+            )
         )
-    app.add_middleware(
-        BaseHTTPMiddleware,  # type: ignore[arg-type]
-        dispatch=make_rate_limit_dispatch(
-            rate_limiter=rate_limiter,
-            applies_to=v1_predicate,
+    checks.append(
+        make_body_size_check(
+            max_bytes=server_cfg.max_request_body_bytes,
             error_response=openai_error_response,
-        ),
+        )
     )
-    app.add_middleware(
-        BaseHTTPMiddleware,  # type: ignore[arg-type]
-        dispatch=make_body_size_dispatch(
-            max_bytes=server_cfg.max_request_body_bytes,
+    checks.append(
+        make_rate_limit_check(
+            rate_limiter=rate_limiter,
+            applies_to=rate_predicate,
             error_response=openai_error_response,
-        ),
+            key_func=lambda request: _rate_limit_key(request, rate_cfg.key_by, api_key),
+        )
     )
-    if server_cfg.require_https:
-        app.add_middleware(
-            BaseHTTPMiddleware,  # type: ignore[arg-type]
-            dispatch=make_https_dispatch(
-                applies_to=all_paths_predicate(exclude={"/health"}),
+    if api_key:
+        checks.append(
+            make_auth_check(
+                api_key=api_key,
+                applies_to=v1_predicate,
                 error_response=openai_error_response,
-            ),
+                error_message="invalid API key",
+            )
         )
+    app.add_middleware(GuardMiddleware, checks=checks)
 
     return app
 
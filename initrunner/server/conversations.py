@@ -1,71 +1,310 @@
-"""In-memory conversation store for server-side history tracking."""
+"""Conversation store for server-side history tracking.
+
+Conversations are kept in an ``OrderedDict`` in last-access order. Every
+conversation has the same TTL and access refreshes it, so that order is also
+expiry order: touching, evicting and expiring are O(1) per conversation,
+always from the front of the dict.
+
+The store is bounded two ways: ``max_conversations`` and ``max_bytes``, a cap
+on the estimated size of all stored histories. With a ``spill_path`` it also
+has a SQLite tier. Conversations evicted from memory by either cap, and
+everything still in memory at ``close()``, are written there. A later
+``get()`` loads them back, so long-lived conversations survive restarts and
+stay out of RAM while idle.
+
+The spill tier does SQLite I/O and (de)serializes whole histories under the
+store's lock. Code on an event loop uses the ``*_async`` methods, which run
+the call in a worker thread when a spill tier is configured.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import sqlite3
 import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TypeVar
 
 from pydantic_ai.messages import ModelMessage
 
+from initrunner._log import get_logger
+
+logger = get_logger("server.conversations")
+
+_T = TypeVar("_T")
+
 DEFAULT_TTL_SECONDS = 3600  # 1 hour
 
+# Rough per-object overheads for the size estimate: a message or part object
+# with its dataclass fields, timestamps and provider metadata.
+_MESSAGE_OVERHEAD = 400
+_PART_OVERHEAD = 200
+
+_CREATE_TABLE = """\
+CREATE TABLE IF NOT EXISTS conversations (
+    conversation_id TEXT PRIMARY KEY,
+    messages_json TEXT NOT NULL,
+    last_access REAL NOT NULL
+);
+"""
+
+
+def _content_bytes(content: object) -> int:
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    if isinstance(content, (list, tuple)):
+        return sum(_content_bytes(item) for item in content)
+    data = getattr(content, "data", None)  # BinaryContent
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    url = getattr(content, "url", None)  # ImageUrl, DocumentUrl, ...
+    if isinstance(url, str):
+        return len(url)
+    if isinstance(content, dict):
+        return len(str(content))
+    return 0
+
+
+def estimate_history_bytes(messages: Iterable[object]) -> int:
+    """Estimate the memory held by a message history.
+
+    Counts text, tool arguments and binary payloads plus a fixed overhead per
+    message and part. It is an estimate for enforcing a memory budget, not an
+    exact measure, and it never serializes the history.
+    """
+    total = 0
+    for message in messages:
+        total += _MESSAGE_OVERHEAD
+        parts = getattr(message, "parts", None)
+        if parts is None:
+            total += _content_bytes(message)
+            continue
+        for part in parts:
+            total += _PART_OVERHEAD
+            total += _content_bytes(getattr(part, "content", None))
+            total += _content_bytes(getattr(part, "args", None))
+    return total
+
 
 @dataclass
 class ConversationState:
     messages: list[ModelMessage] = field(default_factory=list)
     last_access: float = field(default_factory=time.monotonic)
+    size: int = 0
+
+
+@dataclass(frozen=True)
+class ConversationStoreStats:
+    """Point-in-time size of a :class:`ConversationStore`."""
+
+    conversations: int
+    bytes: int
+    spilled: int
 
 
 class ConversationStore:
-    """Thread-safe in-memory store for conversation histories."""
+    """Thread-safe LRU/TTL store for conversation histories."""
 
     def __init__(
-        self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_conversations: int = 0
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_conversations: int = 0,
+        *,
+        max_bytes: int = 0,
+        spill_path: Path | None = None,
     ) -> None:
         self._ttl = ttl_seconds
         self._max = max_conversations
-        self._conversations: dict[str, ConversationState] = {}
+        self._max_bytes = max_bytes
+        self._conversations: OrderedDict[str, ConversationState] = OrderedDict()
+        self._bytes = 0
         self._lock = threading.Lock()
+        self._spill: sqlite3.Connection | None = None
+        if spill_path is not None:
+            self._spill = _open_spill(spill_path)
 
     def get(self, conversation_id: str) -> list[ModelMessage] | None:
         """Return stored history for a conversation, or None if not found/expired."""
-        self._cleanup()
         with self._lock:
+            now = time.monotonic()
+            self._expire_locked(now)
             state = self._conversations.get(conversation_id)
             if state is None:
-                return None
-            state.last_access = time.monotonic()
+                # Loaded conversations are already the most recently used.
+                state = self._load_spilled_locked(conversation_id, now)
+                return list(state.messages) if state is not None else None
+            state.last_access = now
+            self._conversations.move_to_end(conversation_id)
             return list(state.messages)
 
     def save(self, conversation_id: str, messages: list) -> None:
         """Store updated history for a conversation."""
+        size = estimate_history_bytes(messages)
         with self._lock:
+            now = time.monotonic()
+            old = self._conversations.pop(conversation_id, None)
+            if old is not None:
+                self._bytes -= old.size
             self._conversations[conversation_id] = ConversationState(
-                messages=list(messages),
-                last_access=time.monotonic(),
+                messages=list(messages), last_access=now, size=size
             )
-            # Evict oldest conversations when cap is reached
-            if self._max > 0 and len(self._conversations) > self._max:
-                oldest_id = min(
-                    self._conversations,
-                    key=lambda cid: self._conversations[cid].last_access,
-                )
-                del self._conversations[oldest_id]
-
-    def _cleanup(self) -> None:
-        """Evict conversations older than TTL (lazy, on access)."""
-        now = time.monotonic()
+            self._bytes += size
+            self._expire_locked(now)
+            self._enforce_caps_locked()
+
+    def sweep(self) -> int:
+        """Drop expired conversations from memory and disk. Returns how many."""
         with self._lock:
-            expired = [
-                cid
-                for cid, state in self._conversations.items()
-                if (now - state.last_access) > self._ttl
-            ]
-            for cid in expired:
-                del self._conversations[cid]
+            removed = self._expire_locked(time.monotonic())
+            if self._spill is not None:
+                try:
+                    cur = self._spill.execute(
+                        "DELETE FROM conversations WHERE last_access < ?",
+                        (time.time() - self._ttl,),
+                    )
+                    removed += cur.rowcount
+                except sqlite3.Error as e:
+                    logger.warning("Conversation spill sweep failed: %s", e)
+            return removed
+
+    def stats(self) -> ConversationStoreStats:
+        with self._lock:
+            spilled = 0
+            if self._spill is not None:
+                spilled = self._spill.execute("SELECT COUNT(*) FROM conversations").fetchone()[0]
+            return ConversationStoreStats(
+                conversations=len(self._conversations), bytes=self._bytes, spilled=spilled
+            )
 
     def clear(self) -> None:
         """Remove all conversations."""
         with self._lock:
             self._conversations.clear()
+            self._bytes = 0
+            if self._spill is not None:
+                self._spill.execute("DELETE FROM conversations")
+
+    def close(self) -> None:
+        """Write in-memory conversations to the spill tier (if any) and release it.
+
+        Without a spill tier this just empties the store.
+        """
+        with self._lock:
+            if self._spill is not None:
+                while self._conversations:
+                    cid, state = self._conversations.popitem(last=False)
+                    self._spill_locked(cid, state)
+                self._spill.close()
+                self._spill = None
+            self._conversations.clear()
+            self._bytes = 0
+
+    # -- event-loop callers -----------------------------------------------------
+
+    async def get_async(self, conversation_id: str) -> list[ModelMessage] | None:
+        """:meth:`get`, off the event loop when there is a spill tier."""
+        return await self._off_loop(self.get, conversation_id)
+
+    async def save_async(self, conversation_id: str, messages: list) -> None:
+        """:meth:`save`, off the event loop when there is a spill tier."""
+        await self._off_loop(self.save, conversation_id, messages)
+
+    async def sweep_async(self) -> int:
+        """:meth:`sweep`, off the event loop when there is a spill tier."""
+        return await self._off_loop(self.sweep)
+
+    async def close_async(self) -> None:
+        """:meth:`close`, off the event loop when there is a spill tier."""
+        await self._off_loop(self.close)
+
+    async def _off_loop(self, fn: Callable[..., _T], *args: object) -> _T:
+        # Without a spill tier every call is in-memory work; skip the thread hop.
+        if self._spill is None:
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    # -- internals (call with self._lock held) --------------------------------
+
+    def _expire_locked(self, now: float) -> int:
+        removed = 0
+        while self._conversations:
+            cid, state = next(iter(self._conversations.items()))
+            if now - state.last_access <= self._ttl:
+                break
+            del self._conversations[cid]
+            self._bytes -= state.size
+            removed += 1
+        return removed
+
+    def _enforce_caps_locked(self) -> None:
+        while self._conversations and (
+            (self._max > 0 and len(self._conversations) > self._max)
+            or (self._max_bytes > 0 and self._bytes > self._max_bytes)
+        ):
+            cid, state = self._conversations.popitem(last=False)
+            self._bytes -= state.size
+            if self._spill is not None:
+                self._spill_locked(cid, state)
+
+    def _spill_locked(self, conversation_id: str, state: ConversationState) -> None:
+        assert self._spill is not None
+        from pydantic_ai.messages import ModelMessagesTypeAdapter
+
+        # Store wall-clock time so the TTL still holds after a restart.
+        last_access = time.time() - (time.monotonic() - state.last_access)
+        try:
+            raw = ModelMessagesTypeAdapter.dump_json(state.messages).decode("utf-8")
+            self._spill.execute(
+                "INSERT OR REPLACE INTO conversations (conversation_id, messages_json,"
+                " last_access) VALUES (?, ?, ?)",
+                (conversation_id, raw, last_access),
+            )
+        except Exception as e:
+            logger.warning("Could not spill conversation %s to disk: %s", conversation_id, e)
+
+    def _load_spilled_locked(self, conversation_id: str, now: float) -> ConversationState | None:
+        if self._spill is None:
+            return None
+        from pydantic_ai.messages import ModelMessagesTypeAdapter
+
+        try:
+            row = self._spill.execute(
+                "SELECT messages_json, last_access FROM conversations WHERE conversation_id = ?",
+                (conversation_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._spill.execute(
+                "DELETE FROM conversations WHERE conversation_id = ?", (conversation_id,)
+            )
+            if time.time() - row[1] > self._ttl:
+                return None
+            messages = list(ModelMessagesTypeAdapter.validate_json(row[0]))
+        except Exception as e:
+            logger.warning("Could not load spilled conversation %s: %s", conversation_id, e)
+            return None
+        state = ConversationState(
+            messages=messages, last_access=now, size=estimate_history_bytes(messages)
+        )
+        self._conversations[conversation_id] = state
+        self._bytes += state.size
+        self._enforce_caps_locked()
+        return state
+
+
+def _open_spill(path: Path) -> sqlite3.Connection:
+    from initrunner._paths import ensure_private_dir, secure_database
+
+    ensure_private_dir(path.parent)
+    conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+    secure_database(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(_CREATE_TABLE)
+    return conn
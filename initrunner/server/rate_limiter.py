@@ -1,4 +1,14 @@
-"""Token-bucket rate limiter for single-node deployment.
+"""Token-bucket rate limiters for single-host deployment.
+
+Every limiter exposes ``acquire(key) -> float``: ``0.0`` when the request may
+proceed, otherwise the seconds until the key's bucket holds a token again
+(``math.inf`` when it never refills). ``allow(key)`` is the boolean shorthand.
+
+- ``TokenBucketRateLimiter``: one bucket for everything; the key is ignored.
+- ``KeyedRateLimiter``: one bucket per key (API key, client IP, conversation,
+  served agent...) in lock-sharded, size-bounded LRU tables.
+- ``SQLiteRateLimiter``: keyed buckets in a SQLite file, so several server
+  processes on one host draw from the same quotas.
 
 InitRunner is designed for single-node deployment. Multi-node scaling requires
 an external state store (Redis/PostgreSQL) which is out of scope for the
@@ -7,8 +17,35 @@ lightweight runner.
 
 from __future__ import annotations
 
+import asyncio
+import math
+import sqlite3
 import threading
 import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from initrunner._log import get_logger
+
+if TYPE_CHECKING:
+    from initrunner.agent.schema.security import RateLimitConfig
+
+logger = get_logger("server.rate_limiter")
+
+_DEFAULT_SHARDS = 16
+_SQLITE_PRUNE_EVERY = 1000  # acquires between idle-bucket sweeps
+
+
+def _refill(tokens: float, elapsed: float, rate: float, burst: int) -> float:
+    return min(float(burst), tokens + max(0.0, elapsed) * rate)
+
+
+def _wait_for_token(tokens: float, rate: float) -> float:
+    if rate <= 0:
+        return math.inf
+    return (1.0 - tokens) / rate
 
 
 class TokenBucketRateLimiter:
@@ -26,15 +63,223 @@ class TokenBucketRateLimiter:
         self._last_refill = time.monotonic()
         self._lock = threading.Lock()
 
-    def allow(self) -> bool:
-        """Return True if the request is allowed, False if rate-limited."""
+    def acquire(self, key: str = "") -> float:
+        """Take a token. Returns 0.0, or the seconds until one is available."""
         with self._lock:
             now = time.monotonic()
-            elapsed = now - self._last_refill
-            self._tokens = min(self._burst, self._tokens + elapsed * self._rate)
+            self._tokens = _refill(self._tokens, now - self._last_refill, self._rate, self._burst)
             self._last_refill = now
 
             if self._tokens >= 1.0:
                 self._tokens -= 1.0
-                return True
-            return False
+                return 0.0
+            return _wait_for_token(self._tokens, self._rate)
+
+    def allow(self, key: str = "") -> bool:
+        """Return True if the request is allowed, False if rate-limited."""
+        return self.acquire(key) == 0.0
+
+
+class _Shard:
+    __slots__ = ("buckets", "lock")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> [tokens, last_refill]; ordered least recently used first
+        self.buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+
+class KeyedRateLimiter:
+    """Token buckets per key, spread over lock-sharded LRU tables.
+
+    Keys hash to one of ``shards`` tables, so requests for different keys
+    rarely contend on the same lock. Each table holds at most
+    ``max_keys / shards`` buckets; a new key evicts the least recently used
+    one. Evicting an idle bucket is harmless: it has usually refilled to
+    ``burst``, which is exactly what a fresh bucket starts with.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        max_keys: int = 10_000,
+        shards: int = _DEFAULT_SHARDS,
+    ) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._per_shard = max(1, max_keys // len(self._shards))
+
+    def acquire(self, key: str = "") -> float:
+        """Take a token from *key*'s bucket. Returns 0.0, or the seconds to wait."""
+        shard = self._shards[zlib.crc32(key.encode()) % len(self._shards)]
+        with shard.lock:
+            now = time.monotonic()
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                bucket = [float(self._burst), now]
+                shard.buckets[key] = bucket
+                if len(shard.buckets) > self._per_shard:
+                    shard.buckets.popitem(last=False)
+            else:
+                shard.buckets.move_to_end(key)
+                bucket[0] = _refill(bucket[0], now - bucket[1], self._rate, self._burst)
+                bucket[1] = now
+
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return 0.0
+            return _wait_for_token(bucket[0], self._rate)
+
+    def allow(self, key: str = "") -> bool:
+        return self.acquire(key) == 0.0
+
+    def __len__(self) -> int:
+        return sum(len(s.buckets) for s in self._shards)
+
+
+_CREATE_TABLE = """\
+CREATE TABLE IF NOT EXISTS buckets (
+    key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS idx_buckets_updated ON buckets(updated)"
+
+
+class SQLiteRateLimiter:
+    """Keyed token buckets shared between processes through a SQLite file.
+
+    Each ``acquire`` is one short ``BEGIN IMMEDIATE`` transaction, so two
+    server processes never spend the same token. Buckets use wall-clock time,
+    which every process on the host agrees on. Buckets idle long enough to
+    have refilled completely are deleted in periodic sweeps. Past ``max_keys``,
+    the least recently used buckets go next.
+
+    If the database is locked for longer than ``timeout`` seconds, the request
+    is let through and a warning logged. An unavailable limiter should not take
+    the server down with it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        rate: float,
+        burst: int,
+        *,
+        namespace: str = "",
+        max_keys: int = 10_000,
+        timeout: float = 1.0,
+    ) -> None:
+        from initrunner._paths import ensure_private_dir, secure_database
+
+        ensure_private_dir(path.parent)
+        self._rate = rate
+        self._burst = burst
+        self._prefix = f"{namespace}\x00" if namespace else ""
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+        self._since_prune = 0
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, timeout=timeout, isolation_level=None
+        )
+        secure_database(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_CREATE_TABLE)
+        self._conn.execute(_CREATE_INDEX)
+
+    def acquire(self, key: str = "") -> float:
+        """Take a token from *key*'s bucket. Returns 0.0, or the seconds to wait."""
+        full_key = self._prefix + key
+        with self._lock:
+            try:
+                return self._acquire_locked(full_key)
+            except sqlite3.Error as e:
+                logger.warning("Rate limiter database unavailable, allowing request: %s", e)
+                return 0.0
+
+    async def acquire_async(self, key: str = "") -> float:
+        """:meth:`acquire` in a worker thread, for callers on an event loop."""
+        return await asyncio.to_thread(self.acquire, key)
+
+    def allow(self, key: str = "") -> bool:
+        return self.acquire(key) == 0.0
+
+    def _acquire_locked(self, key: str) -> float:
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute(
+                "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                tokens = float(self._burst)
+            else:
+                tokens = _refill(row[0], now - row[1], self._rate, self._burst)
+            wait = 0.0
+            if tokens >= 1.0:
+                tokens -= 1.0
+            else:
+                wait = _wait_for_token(tokens, self._rate)
+            conn.execute(
+                "INSERT INTO buckets (key, tokens, updated) VALUES (?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET tokens = excluded.tokens,"
+                " updated = excluded.updated",
+                (key, tokens, now),
+            )
+            self._since_prune += 1
+            if self._since_prune >= _SQLITE_PRUNE_EVERY:
+                self._since_prune = 0
+                self._prune(now)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return wait
+
+    def _prune(self, now: float) -> None:
+        """Drop this namespace's refilled buckets, then trim it to ``max_keys``."""
+        ns = ("substr(key, 1, ?) = ?", (len(self._prefix), self._prefix))
+        if self._rate > 0:
+            self._conn.execute(
+                f"DELETE FROM buckets WHERE {ns[0]} AND updated < ?",
+                (*ns[1], now - self._burst / self._rate),
+            )
+        self._conn.execute(
+            "DELETE FROM buckets WHERE key IN (SELECT key FROM buckets"
+            f" WHERE {ns[0]} ORDER BY updated DESC LIMIT -1 OFFSET ?)",
+            (*ns[1], self._max_keys),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def build_rate_limiter(
+    config: RateLimitConfig, *, namespace: str = ""
+) -> TokenBucketRateLimiter | KeyedRateLimiter | SQLiteRateLimiter:
+    """Return the limiter a ``security.rate_limit`` section asks for.
+
+    *namespace* separates this server's buckets from other servers sharing the
+    SQLite file; every worker of one server must pass the same value.
+    """
+    rate = config.requests_per_minute / 60.0
+    if config.backend == "sqlite":
+        from initrunner.config import get_rate_limit_db_path
+
+        return SQLiteRateLimiter(
+            get_rate_limit_db_path(),
+            rate,
+            config.burst_size,
+            namespace=namespace,
+            max_keys=config.max_keys,
+        )
+    if config.key_by == "global" and not config.per_model:
+        return TokenBucketRateLimiter(rate=rate, burst=config.burst_size)
+    return KeyedRateLimiter(rate, config.burst_size, max_keys=config.max_keys)
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from initrunner.audit.logger import AuditLogger
 
 
 @dataclass
@@ -159,22 +163,20 @@ def cost_report_sync(
     since: str | None = None,
     until: str | None = None,
     audit_db: Path | None = None,
+    audit_logger: AuditLogger | None = None,
 ) -> CostReport:
     """Cost breakdown by agent for a time period."""
-    from initrunner.audit.logger import DEFAULT_DB_PATH
-    from initrunner.audit.logger import AuditLogger as _AuditLogger
-
-    db_path = audit_db or DEFAULT_DB_PATH
-    if not db_path.exists():
-        return CostReport(
-            entries=[],
-            total_cost_usd=None,
-            total_runs=0,
-            period_start=since,
-            period_end=until,
-        )
-
-    with _AuditLogger(db_path) as logger:
+    from initrunner.audit.logger import reuse_or_open
+
+    with reuse_or_open(audit_logger, audit_db) as logger:
+        if logger is None:
+            return CostReport(
+                entries=[],
+                total_cost_usd=None,
+                total_runs=0,
+                period_start=since,
+                period_end=until,
+            )
         rows = logger.cost_by_agent(agent_name=agent_name, since=since, until=until)
 
     entries = _agent_entries_from_rows(rows)
@@ -194,16 +196,14 @@ def cost_by_model_sync(
     since: str | None = None,
     until: str | None = None,
     audit_db: Path | None = None,
+    audit_logger: AuditLogger | None = None,
 ) -> list[ModelCostEntry]:
     """Cost breakdown by model/provider."""
-    from initrunner.audit.logger import DEFAULT_DB_PATH
-    from initrunner.audit.logger import AuditLogger as _AuditLogger
+    from initrunner.audit.logger import reuse_or_open
 
-    db_path = audit_db or DEFAULT_DB_PATH
-    if not db_path.exists():
-        return []
-
-    with _AuditLogger(db_path) as logger:
+    with reuse_or_open(audit_logger, audit_db) as logger:
+        if logger is None:
+            return []
         rows = logger.cost_by_model(since=since, until=until)
 
     return [
@@ -238,16 +238,14 @@ def cost_by_tool_sync(
     since: str | None = None,
     until: str | None = None,
     audit_db: Path | None = None,
+    audit_logger: AuditLogger | None = None,
 ) -> list[ToolCostEntry]:
     """Cost breakdown by tool name."""
-    from initrunner.audit.logger import DEFAULT_DB_PATH
-    from initrunner.audit.logger import AuditLogger as _AuditLogger
-
-    db_path = audit_db or DEFAULT_DB_PATH
-    if not db_path.exists():
-        return []
+    from initrunner.audit.logger import reuse_or_open
 
-    with _AuditLogger(db_path) as logger:
+    with reuse_or_open(audit_logger, audit_db) as logger:
+        if logger is None:
+            return []
         rows = logger.cost_by_tool(agent_name=agent_name, since=since, until=until)
 
     # Merge rows by tool_name (may have multiple model/provider combos)
@@ -289,25 +287,12 @@ def cost_by_tool_sync(
 def cost_summary_sync(
     *,
     audit_db: Path | None = None,
+    audit_logger: AuditLogger | None = None,
 ) -> CostSummary:
     """Overall cost summary: today, this week, this month, all-time, top agents, daily trend."""
-    from datetime import UTC, datetime
-
-    from initrunner.audit.logger import DEFAULT_DB_PATH
-    from initrunner.audit.logger import AuditLogger as _AuditLogger
-
-    db_path = audit_db or DEFAULT_DB_PATH
-    if not db_path.exists():
-        return CostSummary(
-            today=None,
-            this_week=None,
-            this_month=None,
-            all_time=None,
-            top_agents=[],
-            daily_trend=[],
-        )
+    from datetime import UTC, datetime, timedelta
 
-    from datetime import timedelta
+    from initrunner.audit.logger import reuse_or_open
 
     now = datetime.now(UTC)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
@@ -319,7 +304,16 @@ def cost_summary_sync(
     month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0).isoformat()
     trend_start = (now - timedelta(days=30)).isoformat()
 
-    with _AuditLogger(db_path) as logger:
+    with reuse_or_open(audit_logger, audit_db) as logger:
+        if logger is None:
+            return CostSummary(
+                today=None,
+                this_week=None,
+                this_month=None,
+                all_time=None,
+                top_agents=[],
+                daily_trend=[],
+            )
         today_rows = logger.cost_by_day(since=today_start)
         week_rows = logger.cost_by_day(since=week_start)
         month_rows = logger.cost_by_day(since=month_start)
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
+import random
+import statistics
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
 from initrunner.agent.schema.role import RoleDefinition
 from initrunner.ingestion.pipeline import FileStatus, IngestStats, _file_hash
+from initrunner.stores.base import DocumentStore, MemoryStoreBase, TableHealth
 
 # `_file_hash` is imported at module level (instead of inside
 # `compute_stale_ingest_plan`) so tests can monkeypatch it via
@@ -211,3 +215,85 @@ def run_auto_ingest(
         max_total_ingest_mb=resource_limits.max_total_ingest_mb,
         skip_existing_urls=True,
     )
+
+
+# ---------------------------------------------------------------------------
+# Store maintenance
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class StoreOptimizeReport:
+    """Layout and query latency of one store before and after ``optimize()``.
+
+    Latencies are the median of ``probes`` top-5 vector queries with random
+    vectors, in milliseconds; ``None`` when the store has no vectors yet.
+    """
+
+    store: str
+    path: Path
+    before: list[TableHealth]
+    after: list[TableHealth]
+    query_ms_before: float | None
+    query_ms_after: float | None
+    elapsed_s: float
+
+
+def _median_query_ms(query: Callable[[list[float]], object], dimensions: int, probes: int) -> float:
+    rng = random.Random(0)
+    samples = []
+    for _ in range(max(1, probes)):
+        vector = [rng.uniform(-1.0, 1.0) for _ in range(dimensions)]
+        started = time.perf_counter()
+        query(vector)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def _optimize_store(
+    name: str,
+    path: Path,
+    store: DocumentStore | MemoryStoreBase,
+    query: Callable[[list[float]], object],
+    probes: int,
+) -> StoreOptimizeReport:
+    dims = store.dimensions
+    before = store.table_health()
+    ms_before = _median_query_ms(query, dims, probes) if dims else None
+    started = time.perf_counter()
+    store.optimize()
+    elapsed = time.perf_counter() - started
+    return StoreOptimizeReport(
+        store=name,
+        path=path,
+        before=before,
+        after=store.table_health(),
+        query_ms_before=ms_before,
+        query_ms_after=_median_query_ms(query, dims, probes) if dims else None,
+        elapsed_s=elapsed,
+    )
+
+
+def optimize_role_stores(role: RoleDefinition, *, probes: int = 20) -> list[StoreOptimizeReport]:
+    """Compact and index the role's document and memory stores, if they exist."""
+    from initrunner.stores.base import resolve_memory_path, resolve_store_path
+    from initrunner.stores.factory import create_document_store, create_memory_store
+
+    reports: list[StoreOptimizeReport] = []
+    ingest = role.spec.ingest
+    if ingest is not None:
+        path = resolve_store_path(ingest.store_path, role.metadata.name)
+        if path.exists():
+            with create_document_store(ingest.store_backend, path) as docs:
+                reports.append(
+                    _optimize_store("documents", path, docs, lambda v: docs.query(v), probes)
+                )
+    memory = role.spec.memory
+    if memory is not None:
+        path = resolve_memory_path(memory.store_path, role.metadata.name)
+        if path.exists():
+            with create_memory_store(memory.store_backend, path) as mem:
+                reports.append(
+                    _optimize_store("memory", path, mem, lambda v: mem.search_memories(v), probes)
+                )
+    return reports
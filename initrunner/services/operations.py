@@ -42,15 +42,11 @@ def query_audit_sync(
         limit=limit,
         exclude_trigger_types=exclude_trigger_types,
     )
-    if audit_logger is not None:
-        return audit_logger.query(**_query_kwargs)  # type: ignore[arg-type]
-    from initrunner.audit.logger import DEFAULT_DB_PATH
-    from initrunner.audit.logger import AuditLogger as _AuditLogger
+    from initrunner.audit.logger import reuse_or_open
 
-    db_path = audit_db or DEFAULT_DB_PATH
-    if not db_path.exists():
-        return []
-    with _AuditLogger(db_path) as logger:
+    with reuse_or_open(audit_logger, audit_db) as logger:
+        if logger is None:
+            return []
         return logger.query(**_query_kwargs)  # type: ignore[arg-type]
 
 
@@ -74,8 +70,14 @@ def audit_prune_sync(
 def verify_audit_chain_sync(
     *,
     audit_db: Path | None = None,
+    incremental: bool = False,
+    workers: int = 1,
 ) -> ChainVerifyResult:
-    """Verify the signed audit chain end-to-end (sync)."""
+    """Verify the signed audit chain (sync).
+
+    End-to-end by default; with *incremental*, only rows after the last
+    verified checkpoint. *workers* > 1 verifies segments in parallel.
+    """
     from initrunner.audit.logger import DEFAULT_DB_PATH, ChainVerifyResult
     from initrunner.audit.logger import AuditLogger as _AuditLogger
 
@@ -93,7 +95,7 @@ def verify_audit_chain_sync(
             first_break_reason=None,
         )
     with _AuditLogger(db_path) as logger:
-        return logger.verify_chain()
+        return logger.verify_chain(incremental=incremental, workers=workers)
 
 
 @dataclass
@@ -135,21 +137,20 @@ def audit_stats_sync(
     since: str | None = None,
     until: str | None = None,
     audit_db: Path | None = None,
+    audit_logger: AuditLogger | None = None,
 ) -> AuditStats:
     """Compute aggregate audit stats (sync)."""
-    from initrunner.audit.logger import DEFAULT_DB_PATH
-    from initrunner.audit.logger import AuditLogger as _AuditLogger
-
-    db_path = audit_db or DEFAULT_DB_PATH
-    if not db_path.exists():
-        return AuditStats(
-            total_runs=0,
-            success_rate=0.0,
-            total_tokens=0,
-            avg_duration_ms=0,
-            top_agents=[],
-        )
-    with _AuditLogger(db_path) as logger:
+    from initrunner.audit.logger import reuse_or_open
+
+    with reuse_or_open(audit_logger, audit_db) as logger:
+        if logger is None:
+            return AuditStats(
+                total_runs=0,
+                success_rate=0.0,
+                total_tokens=0,
+                avg_duration_ms=0,
+                top_agents=[],
+            )
         return logger.stats(agent_name=agent_name, since=since, until=until)
 
 
@@ -157,15 +158,14 @@ def trigger_stats_sync(
     *,
     agent_name: str,
     audit_db: Path | None = None,
+    audit_logger: AuditLogger | None = None,
 ) -> list[TriggerStat]:
     """Per-trigger-type stats for an agent, derived from the audit trail (sync)."""
-    from initrunner.audit.logger import DEFAULT_DB_PATH
-    from initrunner.audit.logger import AuditLogger as _AuditLogger
+    from initrunner.audit.logger import reuse_or_open
 
-    db_path = audit_db or DEFAULT_DB_PATH
-    if not db_path.exists():
-        return []
-    with _AuditLogger(db_path) as logger:
+    with reuse_or_open(audit_logger, audit_db) as logger:
+        if logger is None:
+            return []
         return logger.trigger_stats(agent_name=agent_name)
 
 
@@ -311,6 +311,7 @@ def build_mcp_gateway_sync(
     audit_logger: AuditLogger | None = None,
     pass_through: bool = False,
     extra_skill_dirs: list[Path] | None = None,
+    max_concurrency: int = 4,
 ) -> object:
     """Build an MCP gateway server (sync). Returns a FastMCP instance."""
     require_mcp()
@@ -323,6 +324,7 @@ def build_mcp_gateway_sync(
         audit_logger=audit_logger,
         pass_through=pass_through,
         extra_skill_dirs=extra_skill_dirs,
+        max_concurrency=max_concurrency,
     )
 
 
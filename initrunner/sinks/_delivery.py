@@ -0,0 +1,387 @@
+"""Background sink delivery.
+
+``SinkDispatcher(background=True)`` gives every sink a
+:class:`SinkDeliveryWorker`: a bounded queue drained by one thread, so a slow
+or failing sink never holds up the run that produced the payload, or the
+other sinks.
+
+- Payloads reach a sink in dispatch order, up to ``sink.batch_size`` per
+  ``deliver_batch`` call.
+- A failed delivery is retried up to ``sink.max_attempts`` times with
+  exponential backoff. Waiting retries sit in a heap, so newer payloads keep
+  flowing while an endpoint is down.
+- ``close()`` keeps running retries as they fall due until none are left or
+  its timeout runs out. Only then are the remaining retries abandoned.
+- With an outbox (the audit DB), each payload is persisted before it is
+  queued and removed once delivered or abandoned. Entries are leased to the
+  worker that wrote them, and the worker renews its leases while it runs, so
+  another process running the same role never re-delivers them. A shutdown
+  with retries still waiting releases their leases; a crash leaves them to
+  expire. Any worker for the same sink then claims and delivers them.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from initrunner._log import get_logger
+from initrunner.sinks.base import SinkBase, SinkPayload, backoff_delay
+
+if TYPE_CHECKING:
+    from initrunner.audit.logger import AuditLogger
+
+logger = get_logger("sink.delivery")
+
+OverflowPolicy = Literal["block", "drop"]
+
+_DEFAULT_QUEUE_SIZE = 1000
+_BLOCK_WARN_SECONDS = 5.0
+_OUTBOX_LEASE_SECONDS = 60.0
+_OUTBOX_RENEW_SECONDS = _OUTBOX_LEASE_SECONDS / 3
+
+
+@dataclass(frozen=True)
+class SinkDeliveryStats:
+    """Snapshot of one sink's background delivery counters."""
+
+    sink: str
+    queue_depth: int
+    pending_retries: int
+    enqueued: int
+    delivered: int
+    retried: int
+    failed: int
+    dropped: int
+    batches: int
+
+
+@dataclass
+class _Delivery:
+    payload: SinkPayload
+    outbox_id: int | None = None
+    attempts: int = 0
+
+
+class _FlushMarker:
+    """Queue item that releases a flush() caller once everything before it was attempted."""
+
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class SinkDeliveryWorker:
+    """Deliver payloads to one sink from a background thread.
+
+    Backpressure when *queue_size* payloads are waiting: ``"block"`` waits for
+    room, ``"drop"`` discards the payload and counts it.
+    """
+
+    def __init__(
+        self,
+        sink: SinkBase,
+        *,
+        name: str,
+        queue_size: int = _DEFAULT_QUEUE_SIZE,
+        overflow: OverflowPolicy = "block",
+        outbox: AuditLogger | None = None,
+        outbox_key: str | None = None,
+    ) -> None:
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        if overflow not in ("block", "drop"):
+            raise ValueError(f"Unknown overflow policy: {overflow!r}")
+        self._sink = sink
+        self._name = name
+        self._overflow = overflow
+        self._outbox = outbox if outbox_key is not None else None
+        self._outbox_key = outbox_key
+        self._outbox_owner = uuid.uuid4().hex
+        # monotonic times of the next outbox claim and the next lease renewal
+        self._next_outbox_check = 0.0
+        self._next_lease_renewal = 0.0
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=queue_size)
+        # (due, seq, delivery); only touched by the worker thread
+        self._retries: list[tuple[float, int, _Delivery]] = []
+        self._seq = itertools.count()
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        # monotonic time after which close() abandons waiting retries
+        self._close_deadline: float | None = None
+        self._enqueued = 0
+        self._delivered = 0
+        self._retried = 0
+        self._failed = 0
+        self._dropped = 0
+        self._batches = 0
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f"sink-{name}")
+        self._thread.start()
+
+    # -- producer side -------------------------------------------------------
+
+    def submit(self, payload: SinkPayload) -> bool:
+        """Queue *payload* for delivery. Returns False if it was dropped."""
+        if self._closed:
+            logger.error("Sink %s is closed; dropping payload %s", self._name, payload.run_id)
+            self._count("_dropped")
+            return False
+        delivery = _Delivery(payload)
+        if self._outbox is not None:
+            delivery.outbox_id = self._outbox.add_sink_delivery(
+                self._outbox_key,  # type: ignore[arg-type]
+                json.dumps(payload.to_dict()),
+                owner=self._outbox_owner,
+                lease_seconds=_OUTBOX_LEASE_SECONDS,
+            )
+        if self._overflow == "drop":
+            try:
+                self._queue.put_nowait(delivery)
+            except queue.Full:
+                logger.warning(
+                    "Sink %s queue full; dropping payload %s", self._name, payload.run_id
+                )
+                self._forget(delivery)
+                self._count("_dropped")
+                return False
+        else:
+            try:
+                self._queue.put(delivery, timeout=_BLOCK_WARN_SECONDS)
+            except queue.Full:
+                logger.warning(
+                    "Sink %s queue full for %.0fs; caller blocked on backpressure",
+                    self._name,
+                    _BLOCK_WARN_SECONDS,
+                )
+                self._queue.put(delivery)
+        self._count("_enqueued")
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every payload queued before this call has been attempted.
+
+        Payloads waiting for a retry count as attempted. Returns False if
+        *timeout* elapsed first or the worker is closed.
+        """
+        if self._closed or not self._thread.is_alive():
+            return False
+        marker = _FlushMarker()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        return marker.done.wait(remaining)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver what is queued, stop the thread and close the sink.
+
+        Waiting retries are run as they fall due until none are left or
+        *timeout* expires. Retries that would fall due later are abandoned;
+        with an outbox they stay persisted and are retried on the next start.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if timeout is not None:
+            self._close_deadline = time.monotonic() + timeout
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Sink %s did not drain within %ss", self._name, timeout)
+            return
+        try:
+            self._sink.close()
+        except Exception as e:
+            logger.debug("Closing sink %s failed: %s", self._name, e)
+
+    def stats(self) -> SinkDeliveryStats:
+        with self._stats_lock:
+            return SinkDeliveryStats(
+                sink=self._name,
+                queue_depth=self._queue.qsize(),
+                pending_retries=len(self._retries),
+                enqueued=self._enqueued,
+                delivered=self._delivered,
+                retried=self._retried,
+                failed=self._failed,
+                dropped=self._dropped,
+                batches=self._batches,
+            )
+
+    def _count(self, counter: str, n: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + n)
+
+    # -- worker thread -------------------------------------------------------
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            timeout = self._tend_outbox()
+            if self._retries:
+                wait = max(0.0, self._retries[0][0] - time.monotonic())
+                timeout = wait if timeout is None else min(timeout, wait)
+            try:
+                item: object | None = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            batch: list[_Delivery] = []
+            markers: list[_FlushMarker] = []
+            while item is not None:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, _FlushMarker):
+                    markers.append(item)
+                else:
+                    batch.append(item)  # type: ignore[arg-type]
+                    if len(batch) >= max(1, self._sink.batch_size):
+                        break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    item = None
+            if batch:
+                self._deliver(batch)
+            self._retry_due()
+            for marker in markers:
+                marker.done.set()
+        self._drain_retries()
+        if self._retries:
+            where = "kept in the outbox" if self._outbox is not None else "dropped"
+            logger.warning(
+                "Sink %s stopped with %d delivery(ies) waiting to retry; %s",
+                self._name,
+                len(self._retries),
+                where,
+            )
+        if self._outbox is not None:
+            self._outbox.release_sink_deliveries(self._outbox_owner)
+
+    def _tend_outbox(self) -> float | None:
+        """Renew this worker's outbox leases and claim unleased entries, when due.
+
+        Claimed entries join the retry heap as due now. Returns the seconds
+        until the next check, or None without an outbox.
+        """
+        if self._outbox is None or self._outbox_key is None:
+            return None
+        now = time.monotonic()
+        if now < self._next_outbox_check:
+            return self._next_outbox_check - now
+        self._next_outbox_check = now + _OUTBOX_RENEW_SECONDS
+        self._renew_leases()
+        records = self._outbox.claim_sink_deliveries(
+            self._outbox_key,
+            self._outbox_owner,
+            lease_seconds=_OUTBOX_LEASE_SECONDS,
+            limit=self._queue.maxsize,
+        )
+        claimed = 0
+        for record in records:
+            try:
+                payload = SinkPayload(**json.loads(record.payload_json))
+            except (ValueError, TypeError) as e:
+                logger.error("Discarding unreadable sink outbox entry %d: %s", record.id, e)
+                self._outbox.remove_sink_delivery(record.id)
+                continue
+            delivery = _Delivery(payload, outbox_id=record.id)
+            heapq.heappush(self._retries, (now, next(self._seq), delivery))
+            claimed += 1
+        if claimed:
+            self._count("_enqueued", claimed)
+            logger.info("Sink %s: re-queued %d delivery(ies) from the outbox", self._name, claimed)
+        return _OUTBOX_RENEW_SECONDS
+
+    def _renew_leases(self) -> None:
+        """Extend this worker's outbox leases, at most once per renewal interval.
+
+        Called before every delivery attempt as well as from :meth:`_run`, so a
+        long run of retries against a slow endpoint never outlives the lease.
+        """
+        if self._outbox is None:
+            return
+        now = time.monotonic()
+        if now < self._next_lease_renewal:
+            return
+        self._next_lease_renewal = now + _OUTBOX_RENEW_SECONDS
+        self._outbox.renew_sink_leases(self._outbox_owner, lease_seconds=_OUTBOX_LEASE_SECONDS)
+
+    def _deliver(self, batch: list[_Delivery]) -> None:
+        self._renew_leases()
+        self._count("_batches")
+        if len(batch) == 1:
+            self._attempt(batch[0])
+            return
+        try:
+            self._sink.deliver_batch([d.payload for d in batch])
+        except Exception as e:
+            logger.debug(
+                "Sink %s batch of %d failed, retrying singly: %s", self._name, len(batch), e
+            )
+            for delivery in batch:
+                self._attempt(delivery)
+            return
+        for delivery in batch:
+            delivery.attempts += 1
+            self._succeeded(delivery)
+
+    def _attempt(self, delivery: _Delivery) -> None:
+        self._renew_leases()
+        delivery.attempts += 1
+        try:
+            self._sink.deliver(delivery.payload)
+        except Exception as e:
+            if delivery.attempts < self._sink.max_attempts:
+                due = time.monotonic() + backoff_delay(delivery.attempts)
+                heapq.heappush(self._retries, (due, next(self._seq), delivery))
+                self._count("_retried")
+                return
+            logger.error("Sink %s failed after %d attempt(s): %s", self._name, delivery.attempts, e)
+            self._count("_failed")
+            self._forget(delivery)
+            return
+        self._succeeded(delivery)
+
+    def _retry_due(self) -> None:
+        now = time.monotonic()
+        while self._retries and self._retries[0][0] <= now:
+            _, _, delivery = heapq.heappop(self._retries)
+            self._attempt(delivery)
+
+    def _drain_retries(self) -> None:
+        """After ``_STOP``: run retries as they fall due, up to the close deadline."""
+        deadline = self._close_deadline
+        while self._retries:
+            due = self._retries[0][0]
+            if deadline is not None and due > deadline:
+                return
+            wait = due - time.monotonic()
+            if wait > 0:
+                # Wake up to renew leases while waiting out a long backoff.
+                time.sleep(min(wait, _OUTBOX_RENEW_SECONDS))
+                self._renew_leases()
+                continue
+            self._retry_due()
+
+    def _succeeded(self, delivery: _Delivery) -> None:
+        self._count("_delivered")
+        self._forget(delivery)
+
+    def _forget(self, delivery: _Delivery) -> None:
+        """Drop *delivery*'s outbox entry: it was delivered or will never be."""
+        if self._outbox is not None and delivery.outbox_id is not None:
+            self._outbox.remove_sink_delivery(delivery.outbox_id)
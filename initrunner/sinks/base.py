@@ -10,6 +10,14 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from initrunner.triggers.base import ChannelAdapter
 
+_BACKOFF_BASE_SECONDS = 1.0
+_BACKOFF_MAX_SECONDS = 30.0
+
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait before retry number *attempt* (1-based): 1, 2, 4, ... capped at 30."""
+    return min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+
 
 @dataclass
 class SinkPayload:
@@ -69,11 +77,41 @@ class SinkPayload:
 
 
 class SinkBase(ABC):
-    """Abstract base for all sinks. Must never raise from send()."""
+    """Abstract base for all sinks. Must never raise from send().
+
+    Background delivery (see :mod:`initrunner.sinks._delivery`) calls
+    ``deliver`` / ``deliver_batch`` instead and retries failures itself, up to
+    ``max_attempts`` with exponential backoff, without blocking the run.
+    """
+
+    #: Attempts background delivery makes before giving up on a payload.
+    max_attempts: int = 1
+    #: Most payloads handed to one ``deliver_batch`` call.
+    batch_size: int = 1
 
     @abstractmethod
     def send(self, payload: SinkPayload) -> None: ...
 
+    def deliver(self, payload: SinkPayload) -> None:
+        """Make one delivery attempt, raising on failure.
+
+        Defaults to ``send()``, which handles its own errors. Sinks with
+        ``max_attempts > 1`` override this with a single raising attempt.
+        """
+        self.send(payload)
+
+    def deliver_batch(self, payloads: list[SinkPayload]) -> None:
+        """Deliver up to ``batch_size`` payloads at once, raising on failure.
+
+        A failed batch is retried one payload at a time, so a sink that
+        overrides this must deliver all of the batch or none of it.
+        """
+        for payload in payloads:
+            self.deliver(payload)
+
+    def close(self) -> None:  # noqa: B027 -- optional hook, no-op by default
+        """Release resources held between sends (connections, handles)."""
+
 
 class ChannelSinkBridge(SinkBase):
     """Wraps a :class:`~initrunner.triggers.base.ChannelAdapter` as a sink."""
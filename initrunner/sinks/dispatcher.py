@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import time
 from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from initrunner._log import get_logger
 from initrunner.agent.executor import RunResult
@@ -16,6 +20,10 @@ from initrunner.agent.schema.sinks import (
 )
 from initrunner.sinks.base import SinkBase, SinkPayload
 
+if TYPE_CHECKING:
+    from initrunner.audit.logger import AuditLogger
+    from initrunner.sinks._delivery import SinkDeliveryStats, SinkDeliveryWorker
+
 logger = get_logger("sink.dispatcher")
 
 
@@ -56,24 +64,68 @@ def build_sink(config: SinkConfig, role_dir: Path | None = None) -> SinkBase | N
     return builder(config, role_dir) if builder else None
 
 
+def sink_outbox_enabled() -> bool:
+    """True when ``INITRUNNER_SINK_OUTBOX`` asks for durable background delivery."""
+    return os.environ.get("INITRUNNER_SINK_OUTBOX", "").lower() in ("1", "true", "on", "yes")
+
+
+def _outbox_key(agent_name: str, index: int, config: SinkConfig) -> str:
+    """Stable identity of a configured sink for its outbox entries."""
+    digest = hashlib.sha256(config.model_dump_json().encode()).hexdigest()[:16]
+    return f"{agent_name}:{index}:{config.type}:{digest}"
+
+
 class SinkDispatcher:
+    """Build sinks from config and fan each run result out to them.
+
+    By default ``dispatch`` calls every sink inline on the run thread. With
+    ``background=True`` each sink gets its own delivery thread and queue
+    (see :mod:`initrunner.sinks._delivery`) and ``dispatch`` returns as soon
+    as the payload is queued; ``close()`` drains them. Passing an audit
+    logger as *outbox* persists background deliveries in its database so
+    they survive restarts.
+    """
+
     def __init__(
         self,
         sink_configs: list[SinkConfig],
         role: RoleDefinition,
         role_dir: Path | None = None,
+        *,
+        background: bool = False,
+        queue_size: int = 1000,
+        outbox: AuditLogger | None = None,
     ) -> None:
         self._sinks: list[SinkBase] = []
+        self._workers: list[SinkDeliveryWorker] = []
         self._role = role
+        self._background = background
+        self._queue_size = queue_size
+        self._outbox = outbox
 
-        for config in sink_configs:
+        for i, config in enumerate(sink_configs):
             sink = build_sink(config, role_dir)
             if sink:
-                self._sinks.append(sink)
+                self._add(sink, _outbox_key(role.metadata.name, i, config))
+
+    def _add(self, sink: SinkBase, outbox_key: str | None) -> None:
+        self._sinks.append(sink)
+        if self._background:
+            from initrunner.sinks._delivery import SinkDeliveryWorker
+
+            self._workers.append(
+                SinkDeliveryWorker(
+                    sink,
+                    name=f"{type(sink).__name__}-{len(self._sinks)}",
+                    queue_size=self._queue_size,
+                    outbox=self._outbox,
+                    outbox_key=outbox_key,
+                )
+            )
 
     def add_sink(self, sink: SinkBase) -> None:
         """Add an externally-constructed sink (e.g. DelegateSink)."""
-        self._sinks.append(sink)
+        self._add(sink, None)
 
     def dispatch(
         self,
@@ -93,6 +145,11 @@ class SinkDispatcher:
             trigger_metadata=trigger_metadata,
         )
 
+        if self._background:
+            for worker in self._workers:
+                worker.submit(payload)
+            return
+
         for sink in self._sinks:
             try:
                 sink.send(payload)
@@ -100,6 +157,30 @@ class SinkDispatcher:
                 name = type(sink).__name__
                 logger.error("Sink %s failed: %s", name, exc)
 
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until background sinks have attempted everything dispatched so far."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        ok = True
+        for worker in self._workers:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ok = worker.flush(remaining) and ok
+        return ok
+
+    def close(self, timeout: float | None = 30.0) -> None:
+        """Drain background deliveries and release sink resources. Idempotent."""
+        for worker in self._workers:
+            worker.close(timeout)
+        if not self._background:
+            for sink in self._sinks:
+                try:
+                    sink.close()
+                except Exception as exc:
+                    logger.debug("Closing sink %s failed: %s", type(sink).__name__, exc)
+
+    def delivery_stats(self) -> list[SinkDeliveryStats]:
+        """Per-sink counters for background delivery (empty when inline)."""
+        return [worker.stats() for worker in self._workers]
+
     @property
     def count(self) -> int:
         return len(self._sinks)
@@ -14,32 +14,41 @@ logger = get_logger("sink.file")
 
 
 class FileSink(SinkBase):
+    batch_size = 100
+
     def __init__(self, path: str, fmt: str = "json") -> None:
         self._path = Path(os.path.expandvars(path))
         self._format = fmt
 
+    def _format_line(self, payload: SinkPayload) -> str:
+        if self._format == "json":
+            return json.dumps(payload.to_dict()) + "\n"
+        ts = payload.timestamp or datetime.now(UTC).isoformat()
+        status = "OK" if payload.success else f"ERROR: {payload.error}"
+        return f"[{ts}] {payload.agent_name} | {status} | {payload.output}\n"
+
+    def deliver_batch(self, payloads: list[SinkPayload]) -> None:
+        """Append every payload with one open and one write."""
+        data = "".join(self._format_line(p) for p in payloads).encode()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Use os.open() with restrictive permissions so the file is
+        # never world-readable, even briefly.
+        fd = os.open(
+            str(self._path),
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+            0o600,
+        )
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def deliver(self, payload: SinkPayload) -> None:
+        self.deliver_batch([payload])
+
     def send(self, payload: SinkPayload) -> None:
         try:
-            self._path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Use os.open() with restrictive permissions so the file is
-            # never world-readable, even briefly.
-            fd = os.open(
-                str(self._path),
-                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
-                0o600,
-            )
-            try:
-                if self._format == "json":
-                    os.write(fd, (json.dumps(payload.to_dict()) + "\n").encode())
-                else:
-                    ts = payload.timestamp or datetime.now(UTC).isoformat()
-                    status = "OK" if payload.success else f"ERROR: {payload.error}"
-                    os.write(
-                        fd,
-                        f"[{ts}] {payload.agent_name} | {status} | {payload.output}\n".encode(),
-                    )
-            finally:
-                os.close(fd)
+            self.deliver(payload)
         except Exception as exc:
             logger.error("Failed to write to %s: %s", self._path, exc)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+import threading
 import time
 
 import httpx
@@ -14,6 +15,8 @@ logger = get_logger("sink.webhook")
 
 
 class WebhookSink(SinkBase):
+    """POST payloads over one keep-alive ``httpx.Client`` per sink."""
+
     def __init__(
         self,
         url: str,
@@ -27,21 +30,34 @@ class WebhookSink(SinkBase):
         self._headers = {k: os.path.expandvars(v) for k, v in (headers or {}).items()}
         self._timeout = timeout_seconds
         self._retry_count = retry_count
+        self.max_attempts = 1 + retry_count
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+
+    def _get_client(self) -> httpx.Client:
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(timeout=self._timeout)
+            return self._client
+
+    def deliver(self, payload: SinkPayload) -> None:
+        response = self._get_client().request(
+            self._method,
+            self._url,
+            json=payload.to_dict(),
+            headers=self._headers,
+        )
+        response.raise_for_status()
 
     def send(self, payload: SinkPayload) -> None:
-        attempts = 1 + self._retry_count
+        # Inline delivery blocks the caller, so it waits a fixed second between
+        # attempts. Exponential backoff is for the background worker only.
+        attempts = self.max_attempts
         last_err: Exception | None = None
 
         for attempt in range(attempts):
             try:
-                with httpx.Client(timeout=self._timeout) as client:
-                    response = client.request(
-                        self._method,
-                        self._url,
-                        json=payload.to_dict(),
-                        headers=self._headers,
-                    )
-                    response.raise_for_status()
+                self.deliver(payload)
                 return
             except Exception as exc:
                 last_err = exc
@@ -49,3 +65,9 @@ class WebhookSink(SinkBase):
                     time.sleep(1)
 
         logger.error("Failed after %d attempt(s): %s", attempts, last_err)
+
+    def close(self) -> None:
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
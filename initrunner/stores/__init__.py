@@ -6,12 +6,14 @@ from initrunner.stores.base import (
     DimensionMismatchError,
     DocumentStore,
     EmbeddingModelChangedError,
+    FileFingerprint,
     FileMetadataStore,
     Memory,
     MemoryStore,
     MemoryStoreBase,
     SearchResult,
     SessionStore,
+    SourceReplacement,
     StoreBackend,
     StoreConfig,
     resolve_memory_path,
@@ -31,12 +33,14 @@ __all__ = [
     "DimensionMismatchError",
     "DocumentStore",
     "EmbeddingModelChangedError",
+    "FileFingerprint",
     "FileMetadataStore",
     "Memory",
     "MemoryStore",
     "MemoryStoreBase",
     "SearchResult",
     "SessionStore",
+    "SourceReplacement",
     "StoreBackend",
     "StoreConfig",
     "create_document_store",
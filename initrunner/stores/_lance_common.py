@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import hashlib
+import os
+import threading
+import time
+from datetime import timedelta
 from pathlib import Path
 
 import lancedb  # type: ignore[import-not-found]
 import pyarrow as pa  # type: ignore[import-not-found]
 
 from initrunner._log import get_logger
-from initrunner.stores.base import DimensionMismatchError
+from initrunner.stores.base import DimensionMismatchError, TableHealth
 
 logger = get_logger("memory")
 
@@ -104,3 +108,181 @@ def _esc(val: str) -> str:
 def _safe_id(key: str) -> str:
     """Convert an arbitrary string (e.g. file path) to a valid ID."""
     return hashlib.sha256(key.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Vector indexes and table maintenance
+# ---------------------------------------------------------------------------
+# Every add appends a fragment and every delete leaves a deletion file, so a
+# store that is written a little at a time (one source or one memory per call)
+# ends up as thousands of tiny fragments, and vector search stays a
+# brute-force scan of all of them. Stores hand their tables to a
+# _TableMaintainer: past a row threshold it builds an ANN index, and after
+# every batch of writes it runs ``optimize()`` in the background. That
+# compacts fragments, folds new rows into the existing indexes and removes
+# old table versions.
+
+_DEFAULT_INDEX_MIN_ROWS = 50_000
+_DEFAULT_OPTIMIZE_EVERY = 100
+_DEFAULT_INDEX_TYPE = "ivf_hnsw_sq"
+# Versions younger than this survive cleanup, so readers that opened the table
+# a moment ago (e.g. another process) keep working.
+_VERSION_RETENTION = timedelta(minutes=10)
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.environ.get(name, "")
+    try:
+        return max(0, int(raw)) if raw else default
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+
+
+def _index_min_rows() -> int:
+    """``INITRUNNER_LANCE_INDEX_MIN_ROWS`` (default 50000); ``0`` never indexes."""
+    return _env_int("INITRUNNER_LANCE_INDEX_MIN_ROWS", _DEFAULT_INDEX_MIN_ROWS)
+
+
+def _optimize_every() -> int:
+    """``INITRUNNER_LANCE_OPTIMIZE_EVERY`` writes (default 100); ``0`` disables."""
+    return _env_int("INITRUNNER_LANCE_OPTIMIZE_EVERY", _DEFAULT_OPTIMIZE_EVERY)
+
+
+def _vector_index_config() -> object:
+    """Index config for ``INITRUNNER_LANCE_INDEX_TYPE``: ``ivf_hnsw_sq`` or ``ivf_pq``."""
+    from lancedb.index import HnswSq, IvfPq  # type: ignore[import-not-found]
+
+    raw = os.environ.get("INITRUNNER_LANCE_INDEX_TYPE", "").lower() or _DEFAULT_INDEX_TYPE
+    if raw == "ivf_pq":
+        return IvfPq(distance_type="cosine")
+    if raw != "ivf_hnsw_sq":
+        logger.warning("Ignoring invalid INITRUNNER_LANCE_INDEX_TYPE=%r", raw)
+    return HnswSq(distance_type="cosine")
+
+
+def _table_health(db: lancedb.DBConnection, name: str, index_name: str | None) -> TableHealth:
+    tbl = db.open_table(name)
+    stats = tbl.stats()
+    fragments = stats["fragment_stats"]
+    indexed = unindexed = 0
+    if index_name is not None and index_name in {ix.name for ix in tbl.list_indices()}:
+        index_stats = tbl.index_stats(index_name)
+        if index_stats is not None:
+            indexed = index_stats.num_indexed_rows
+            unindexed = index_stats.num_unindexed_rows
+    return TableHealth(
+        table=name,
+        rows=stats["num_rows"],
+        fragments=fragments["num_fragments"],
+        small_fragments=fragments["num_small_fragments"],
+        versions=len(tbl.list_versions()),
+        indexed_rows=indexed,
+        unindexed_rows=unindexed,
+    )
+
+
+def _ensure_vector_index(tbl: lancedb.table.Table, name: str, min_rows: int) -> bool:
+    """Build the cosine ANN index *name* on ``vector`` once *tbl* has *min_rows* rows.
+
+    Returns True if the index exists afterwards. Rows added later are still
+    searched (by a flat scan of the unindexed fragments) until ``optimize()``
+    folds them into the index.
+    """
+    if name in {ix.name for ix in tbl.list_indices()}:
+        return True
+    if min_rows <= 0 or tbl.count_rows() < min_rows:
+        return False
+    started = time.perf_counter()
+    try:
+        tbl.create_index("vector", config=_vector_index_config(), name=name)
+    except Exception as e:
+        logger.warning("Could not build vector index %s: %s", name, e)
+        return False
+    logger.info("Built vector index %s in %.1fs", name, time.perf_counter() - started)
+    return True
+
+
+class _TableMaintainer:
+    """Keep a store's LanceDB tables compacted and indexed.
+
+    *tables* maps each table name to the name of its vector index, or ``None``
+    for tables without a vector column. Stores call :meth:`note_write` after
+    each write; every ``optimize_every`` writes start one background
+    :meth:`optimize`. If one is still running, the next write past the
+    threshold tries again.
+    """
+
+    def __init__(
+        self,
+        db: lancedb.DBConnection,
+        tables: dict[str, str | None],
+        *,
+        optimize_every: int | None = None,
+        index_min_rows: int | None = None,
+    ) -> None:
+        self._db = db
+        self._tables = tables
+        self._every = _optimize_every() if optimize_every is None else optimize_every
+        self._min_rows = _index_min_rows() if index_min_rows is None else index_min_rows
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def note_write(self) -> None:
+        if self._every <= 0:
+            return
+        with self._lock:
+            self._writes += 1
+            if self._closed or self._writes < self._every:
+                return
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._writes = 0
+            self._thread = threading.Thread(
+                target=self._optimize_quietly, daemon=True, name="lance-optimize"
+            )
+            self._thread.start()
+
+    def optimize(self) -> None:
+        """Index large-enough tables, compact fragments and drop old versions."""
+        with self._run_lock:
+            existing = set(_table_names(self._db))
+            for name, index_name in self._tables.items():
+                if name not in existing:
+                    continue
+                tbl = self._db.open_table(name)
+                if index_name is not None:
+                    _ensure_vector_index(tbl, index_name, self._min_rows)
+                tbl.optimize(cleanup_older_than=_VERSION_RETENTION)
+
+    def health(self) -> list[TableHealth]:
+        existing = set(_table_names(self._db))
+        return [
+            _table_health(self._db, name, index_name)
+            for name, index_name in self._tables.items()
+            if name in existing
+        ]
+
+    def close(self) -> None:
+        """Wait for a running background optimize; start no new ones."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _optimize_quietly(self) -> None:
+        started = time.perf_counter()
+        try:
+            self.optimize()
+        except Exception as e:
+            # Usually a commit conflict with a concurrent writer; the next
+            # round picks up where this one stopped.
+            logger.warning("Background optimize failed: %s", e)
+            return
+        logger.debug(
+            "Optimized %s in %.2fs", ", ".join(self._tables), time.perf_counter() - started
+        )
@@ -55,6 +55,49 @@ class SearchResult:
     distance: float
 
 
+@dataclass(frozen=True)
+class SourceReplacement:
+    """New content for one source, for :meth:`DocumentStore.replace_sources`."""
+
+    source: str
+    texts: list[str]
+    embeddings: list[list[float]]
+    content_hash: str
+    last_modified: float
+    file_size: int = -1
+    etag: str | None = None
+    http_last_modified: str | None = None
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """What the store recorded about a source file when it was last ingested.
+
+    ``size`` is ``-1`` when unknown (URLs, and files ingested before sizes
+    were recorded). ``etag`` and ``http_last_modified`` are the validators a
+    URL source was served with, for conditional requests; ``None`` for files.
+    """
+
+    content_hash: str
+    last_modified: float
+    size: int
+    etag: str | None = None
+    http_last_modified: str | None = None
+
+
+@dataclass(frozen=True)
+class TableHealth:
+    """Storage layout of one store table, as reported by ``table_health()``."""
+
+    table: str
+    rows: int
+    fragments: int
+    small_fragments: int
+    versions: int
+    indexed_rows: int
+    unindexed_rows: int
+
+
 @dataclass
 class Memory:
     id: int
@@ -160,6 +203,7 @@ class FileMetadataStore(abc.ABC):
         last_modified: float,
         ingested_at: str,
         chunk_count: int,
+        file_size: int = -1,
     ) -> None: ...
 
     @abc.abstractmethod
@@ -183,6 +227,29 @@ class FileMetadataStore(abc.ABC):
         """
         ...
 
+    def list_file_fingerprints(self) -> dict[str, FileFingerprint]:
+        """Return ``{source: FileFingerprint}`` for all tracked sources."""
+        return {
+            source: FileFingerprint(content_hash, last_modified, -1)
+            for source, content_hash, last_modified, _, _ in self.list_all_file_metadata()
+        }
+
+    def refresh_file_stats(self, stats: dict[str, tuple[float, int]]) -> None:  # noqa: B027
+        """Record new ``(last_modified, file_size)`` for sources whose content is unchanged.
+
+        Lets the next ingest skip them on a stat alone. Optional: without it,
+        files whose mtime moved are hashed again on every ingest.
+        """
+
+    def refresh_url_validators(  # noqa: B027
+        self, validators: dict[str, tuple[str | None, str | None]]
+    ) -> None:
+        """Record new ``(etag, http_last_modified)`` for URLs whose content is unchanged.
+
+        Optional: without it, a URL whose validators changed but whose content
+        did not is downloaded in full on every ingest.
+        """
+
 
 class DocumentStore(FileMetadataStore):
     """Abstract interface for document vector stores.
@@ -251,12 +318,32 @@ class DocumentStore(FileMetadataStore):
         last_modified: float,
     ) -> int: ...
 
+    def replace_sources(self, replacements: list[SourceReplacement], ingested_at: str) -> int:
+        """Replace the chunks and file metadata of several sources at once.
+
+        Equivalent to calling :meth:`replace_source` for each entry (a source
+        listed twice keeps its last entry). Returns the number of chunks
+        written. Backends override this to write the whole batch in one go.
+        """
+        for r in replacements:
+            self.replace_source(
+                r.source, r.texts, r.embeddings, ingested_at, r.content_hash, r.last_modified
+            )
+        return sum(len(r.texts) for r in {r.source: r for r in replacements}.values())
+
     @abc.abstractmethod
     def read_store_meta(self, key: str) -> str | None: ...
 
     @abc.abstractmethod
     def write_store_meta(self, key: str, value: str) -> None: ...
 
+    def optimize(self) -> None:
+        """Compact storage and bring indexes up to date."""
+
+    def table_health(self) -> list[TableHealth]:
+        """Describe the storage layout of each table (empty if not applicable)."""
+        return []
+
     @abc.abstractmethod
     def close(self) -> None: ...
 
@@ -361,6 +448,13 @@ class MemoryStoreBase(SessionStore, MemoryStore):
     @abc.abstractmethod
     def dimensions(self) -> int | None: ...
 
+    def optimize(self) -> None:
+        """Compact storage and bring indexes up to date."""
+
+    def table_health(self) -> list[TableHealth]:
+        """Describe the storage layout of each table (empty if not applicable)."""
+        return []
+
     @abc.abstractmethod
     def close(self) -> None: ...
 
@@ -21,9 +21,16 @@ from initrunner.stores._lance_common import (
     _resolve_dimensions,
     _safe_id,
     _table_names,
+    _TableMaintainer,
     _write_meta,
 )
-from initrunner.stores.base import DocumentStore, SearchResult
+from initrunner.stores.base import (
+    DocumentStore,
+    FileFingerprint,
+    SearchResult,
+    SourceReplacement,
+    TableHealth,
+)
 
 # ---------------------------------------------------------------------------
 # Schemas
@@ -31,6 +38,8 @@ from initrunner.stores.base import DocumentStore, SearchResult
 
 # Name of the BM25 full-text index built on the ``text`` column for hybrid search.
 _FTS_INDEX_NAME = "text_fts"
+# Name of the ANN index on ``vector``, built once the table is large enough.
+_VECTOR_INDEX_NAME = "chunks_vector_idx"
 
 _FILE_META_SCHEMA = pa.schema(
     [
@@ -40,9 +49,22 @@ _FILE_META_SCHEMA = pa.schema(
         pa.field("last_modified", pa.float64()),
         pa.field("ingested_at", pa.string()),
         pa.field("chunk_count", pa.int32()),
+        # -1 when unknown; see _migrate_file_metadata_table
+        pa.field("file_size", pa.int64()),
+        # HTTP validators of URL sources; null for files
+        pa.field("etag", pa.string()),
+        pa.field("http_last_modified", pa.string()),
     ]
 )
 
+# Columns added to file_metadata after its first release, with the SQL
+# expression that fills them in on existing tables.
+_FILE_META_ADDED_COLUMNS = {
+    "file_size": "CAST(-1 AS BIGINT)",
+    "etag": "CAST(NULL AS STRING)",
+    "http_last_modified": "CAST(NULL AS STRING)",
+}
+
 
 def _make_chunks_schema(dimensions: int) -> pa.Schema:
     return pa.schema(
@@ -194,6 +216,8 @@ class LanceDocumentStore(DocumentStore):
         # File metadata table
         if "file_metadata" not in _table_names(self._db):
             self._db.create_table("file_metadata", schema=_FILE_META_SCHEMA)
+        else:
+            self._migrate_file_metadata_table()
 
         # Chunks table -- only created once dimensions are known
         self._chunks_ready = False
@@ -207,6 +231,26 @@ class LanceDocumentStore(DocumentStore):
         start = int(raw_next) if raw_next is not None else 1
         self._id_counter = _get_id_counter(str(db_path.resolve()), start)
 
+        self._maintainer = _TableMaintainer(
+            self._db, {"chunks": _VECTOR_INDEX_NAME, "file_metadata": None, "_meta": None}
+        )
+
+    def _migrate_file_metadata_table(self) -> None:
+        """Add columns to tables created before they existed.
+
+        Existing rows get a ``file_size`` of ``-1``, so their files are hashed
+        once more on the next ingest, which then records their size. Their
+        URLs have no validators, so the next fetch is unconditional.
+        """
+        tbl = self._db.open_table("file_metadata")
+        missing = {
+            name: expr
+            for name, expr in _FILE_META_ADDED_COLUMNS.items()
+            if name not in tbl.schema.names
+        }
+        if missing:
+            tbl.add_columns(missing)
+
     def _ensure_chunks_table(self, dimensions: int) -> None:
         if "chunks" not in _table_names(self._db):
             self._db.create_table("chunks", schema=_make_chunks_schema(dimensions))
@@ -275,6 +319,7 @@ class LanceDocumentStore(DocumentStore):
             tbl.add(data)
             self._flush_counter()
             self._ensure_fts_index()
+            self._maintainer.note_write()
 
     @staticmethod
     def _build_source_filter(source_filter: str | None) -> tuple[str | None, bool]:
@@ -398,6 +443,7 @@ class LanceDocumentStore(DocumentStore):
             if n == 0:
                 return 0
             tbl.delete(pred)
+            self._maintainer.note_write()
             return n
 
     # --- File metadata methods ---
@@ -425,6 +471,7 @@ class LanceDocumentStore(DocumentStore):
         last_modified: float,
         ingested_at: str,
         chunk_count: int,
+        file_size: int = -1,
     ) -> None:
         with self._lock:
             tbl = self._db.open_table("file_metadata")
@@ -437,6 +484,9 @@ class LanceDocumentStore(DocumentStore):
                         "last_modified": last_modified,
                         "ingested_at": ingested_at,
                         "chunk_count": chunk_count,
+                        "file_size": file_size,
+                        "etag": None,
+                        "http_last_modified": None,
                     }
                 ]
             )
@@ -483,6 +533,66 @@ class LanceDocumentStore(DocumentStore):
                 )
             )
 
+    def list_file_fingerprints(self) -> dict[str, FileFingerprint]:
+        with self._lock:
+            tbl = self._db.open_table("file_metadata")
+            if tbl.count_rows() == 0:
+                return {}
+            at = tbl.to_arrow().select(
+                [
+                    "source",
+                    "content_hash",
+                    "last_modified",
+                    "file_size",
+                    "etag",
+                    "http_last_modified",
+                ]
+            )
+            return {
+                row[0]: FileFingerprint(*row[1:])
+                for row in zip(
+                    at.column("source").to_pylist(),
+                    at.column("content_hash").to_pylist(),
+                    at.column("last_modified").to_pylist(),
+                    at.column("file_size").to_pylist(),
+                    at.column("etag").to_pylist(),
+                    at.column("http_last_modified").to_pylist(),
+                    strict=True,
+                )
+            }
+
+    def refresh_file_stats(self, stats: dict[str, tuple[float, int]]) -> None:
+        self._update_file_metadata(
+            {
+                source: {"last_modified": mtime, "file_size": size}
+                for source, (mtime, size) in stats.items()
+            }
+        )
+
+    def refresh_url_validators(self, validators: dict[str, tuple[str | None, str | None]]) -> None:
+        self._update_file_metadata(
+            {
+                url: {"etag": etag, "http_last_modified": last_modified}
+                for url, (etag, last_modified) in validators.items()
+            }
+        )
+
+    def _update_file_metadata(self, updates: dict[str, dict[str, object]]) -> None:
+        """Set columns on existing ``file_metadata`` rows in one ``merge_insert``."""
+        if not updates:
+            return
+        with self._lock:
+            tbl = self._db.open_table("file_metadata")
+            ids = ", ".join(f"'{_esc(_safe_id(source))}'" for source in updates)
+            rows = tbl.search().where(f"id IN ({ids})", prefilter=True).limit(None).to_list()
+            for row in rows:
+                row.pop("_distance", None)
+                row.update(updates[row["source"]])
+            if rows:
+                tbl.merge_insert("id").when_matched_update_all().execute(
+                    pa.Table.from_pylist(rows, schema=_FILE_META_SCHEMA)
+                )
+
     def replace_source(
         self,
         source: str,
@@ -492,43 +602,89 @@ class LanceDocumentStore(DocumentStore):
         content_hash: str,
         last_modified: float,
     ) -> int:
+        return self.replace_sources(
+            [SourceReplacement(source, texts, embeddings, content_hash, last_modified)],
+            ingested_at,
+        )
+
+    def replace_sources(self, replacements: list[SourceReplacement], ingested_at: str) -> int:
+        """Replace several sources in a handful of commits, however many there are.
+
+        One delete covers every affected source, all chunks go in as one Arrow
+        table and all file metadata in one ``merge_insert``; the ID counter and
+        the full-text index are updated once for the whole batch.
+        """
+        # A source listed twice keeps its last entry, as with repeated replace_source.
+        batch = list({r.source: r for r in replacements}.values())
+        if not batch:
+            return 0
+        for r in batch:
+            if len(r.embeddings) != len(r.texts):
+                raise ValueError(
+                    f"{r.source}: {len(r.texts)} texts but {len(r.embeddings)} embeddings"
+                )
         with self._lock:
+            if not self._chunks_ready:
+                first = next((r.embeddings[0] for r in batch if r.embeddings), None)
+                if first is not None:
+                    self._dimensions = len(first)
+                    _write_meta(self._db, "dimensions", str(self._dimensions))
+                    self._ensure_chunks_table(self._dimensions)
+
+            total = sum(len(r.texts) for r in batch)
             if self._chunks_ready:
                 tbl = self._db.open_table("chunks")
-                tbl.delete(f"source = '{_esc(source)}'")
-
-                ids = self._alloc_ids(len(texts))
-                data = [
-                    {
-                        "id": doc_id,
-                        "text": text,
-                        "source": source,
-                        "chunk_index": i,
-                        "ingested_at": ingested_at,
-                        "vector": emb,
-                    }
-                    for i, (doc_id, text, emb) in enumerate(
-                        zip(ids, texts, embeddings, strict=True)
-                    )
-                ]
-                tbl.add(data)
-                self._flush_counter()
-                self._ensure_fts_index()
+                sources = ", ".join(f"'{_esc(r.source)}'" for r in batch)
+                tbl.delete(f"source IN ({sources})")
+                if total:
+                    tbl.add(self._chunk_rows(batch, ingested_at, total))
+                    self._flush_counter()
+                    self._ensure_fts_index()
+                self._maintainer.note_write()
 
             fm = self._db.open_table("file_metadata")
             fm.merge_insert("id").when_matched_update_all().when_not_matched_insert_all().execute(
                 [
                     {
-                        "id": _safe_id(source),
-                        "source": source,
-                        "content_hash": content_hash,
-                        "last_modified": last_modified,
+                        "id": _safe_id(r.source),
+                        "source": r.source,
+                        "content_hash": r.content_hash,
+                        "last_modified": r.last_modified,
                         "ingested_at": ingested_at,
-                        "chunk_count": len(texts),
+                        "chunk_count": len(r.texts),
+                        "file_size": r.file_size,
+                        "etag": r.etag,
+                        "http_last_modified": r.http_last_modified,
                     }
+                    for r in batch
                 ]
             )
-            return len(texts)
+            return total
+
+    def _chunk_rows(self, batch: list[SourceReplacement], ingested_at: str, total: int) -> pa.Table:
+        """Build the ``chunks`` rows for *batch* as one Arrow table."""
+        assert self._dimensions is not None
+        ids = self._alloc_ids(total)
+        texts: list[str] = []
+        sources: list[str] = []
+        chunk_indexes: list[int] = []
+        vectors: list[list[float]] = []
+        for r in batch:
+            texts.extend(r.texts)
+            sources.extend([r.source] * len(r.texts))
+            chunk_indexes.extend(range(len(r.texts)))
+            vectors.extend(r.embeddings)
+        return pa.table(
+            {
+                "id": ids,
+                "text": texts,
+                "source": sources,
+                "chunk_index": chunk_indexes,
+                "ingested_at": [ingested_at] * total,
+                "vector": vectors,
+            },
+            schema=_make_chunks_schema(self._dimensions),
+        )
 
     def read_store_meta(self, key: str) -> str | None:
         with self._lock:
@@ -538,7 +694,15 @@ class LanceDocumentStore(DocumentStore):
         with self._lock:
             _write_meta(self._db, key, value)
 
+    def optimize(self) -> None:
+        """Build the vector index if the table is large enough, compact, prune versions."""
+        self._maintainer.optimize()
+
+    def table_health(self) -> list[TableHealth]:
+        return self._maintainer.health()
+
     def close(self) -> None:
+        self._maintainer.close()
         with self._lock:
             self._flush_counter()
             self._db = None  # type: ignore[assignment]
@@ -9,7 +9,6 @@ from pathlib import Path
 
 import lancedb  # type: ignore[import-not-found]
 import pyarrow as pa  # type: ignore[import-not-found]
-import pyarrow.compute as pc  # type: ignore[import-not-found]
 
 from initrunner._paths import ensure_private_dir
 from initrunner.stores._helpers import (
@@ -23,6 +22,7 @@ from initrunner.stores._lance_common import (
     _read_meta,
     _resolve_dimensions,
     _table_names,
+    _TableMaintainer,
     _write_meta,
     logger,
 )
@@ -31,6 +31,7 @@ from initrunner.stores.base import (
     MemoryStoreBase,
     MemoryType,
     SessionSummary,
+    TableHealth,
 )
 
 # ---------------------------------------------------------------------------
@@ -44,9 +45,23 @@ _SESSIONS_SCHEMA = pa.schema(
         pa.field("agent_name", pa.string()),
         pa.field("timestamp", pa.string()),
         pa.field("messages_json", pa.large_string()),
+        pa.field("preview", pa.string()),
+        pa.field("message_count", pa.int64()),
     ]
 )
 
+# Scalar indexes on the sessions table: (column, index type, index name).
+# agent_name has few distinct values, so a bitmap fits it better than a btree.
+_SESSION_INDEXES = (
+    ("agent_name", "BITMAP", "sessions_agent_name_idx"),
+    ("session_id", "BTREE", "sessions_session_id_idx"),
+)
+
+# Name of the ANN index on ``memories.vector``, built once the table is large enough.
+_VECTOR_INDEX_NAME = "memories_vector_idx"
+
+_SUMMARY_COLUMNS = ["id", "session_id", "timestamp", "preview", "message_count"]
+
 
 def _make_memories_schema(dimensions: int) -> pa.Schema:
     return pa.schema(
@@ -85,6 +100,36 @@ def _parse_memory_fields(row: dict) -> tuple[dict | None, MemoryType]:
     return meta, mem_type
 
 
+def _summarize_messages(messages_json: str) -> tuple[str, int]:
+    """Return (preview, message_count) for a serialized message list.
+
+    The preview is the first 80 chars of the first non-empty user prompt.
+    """
+    preview = "Untitled"
+    message_count = 0
+    try:
+        raw = json.loads(messages_json)
+    except (json.JSONDecodeError, TypeError):
+        return preview, message_count
+    if not isinstance(raw, list):
+        return preview, message_count
+    message_count = len(raw)
+    for msg in raw:
+        if not isinstance(msg, dict):
+            continue
+        for part in msg.get("parts", []):
+            if part.get("part_kind") == "user-prompt":
+                content = part.get("content", "")
+                if isinstance(content, str) and content.strip():
+                    return content.strip()[:80], message_count
+    return preview, message_count
+
+
+def _latest_key(agent_name: str) -> str:
+    """``_meta`` key holding the row id of *agent_name*'s newest session."""
+    return f"latest_session:{agent_name}"
+
+
 def _row_to_memory(row: dict) -> Memory:
     """Convert a dict row to a Memory instance."""
     meta, mem_type = _parse_memory_fields(row)
@@ -122,6 +167,10 @@ class LanceMemoryStore(MemoryStoreBase):
         # Sessions table
         if "sessions" not in _table_names(self._db):
             self._db.create_table("sessions", schema=_SESSIONS_SCHEMA)
+        else:
+            self._migrate_sessions_table()
+        self._session_indexes_ready = False
+        self._ensure_session_indexes()
 
         # Memories table -- only created once dimensions are known
         self._memories_ready = False
@@ -135,11 +184,56 @@ class LanceMemoryStore(MemoryStoreBase):
         raw_next_memory = _read_meta(self._db, "next_memory_id")
         self._next_memory_id = int(raw_next_memory) if raw_next_memory is not None else 1
 
+        self._maintainer = _TableMaintainer(
+            self._db, {"memories": _VECTOR_INDEX_NAME, "sessions": None, "_meta": None}
+        )
+
     def _ensure_memories_table(self, dimensions: int) -> None:
         if self._db is not None and "memories" not in _table_names(self._db):
             self._db.create_table("memories", schema=_make_memories_schema(dimensions))
         self._memories_ready = True
 
+    def _migrate_sessions_table(self) -> None:
+        """Backfill ``preview``/``message_count`` on tables created before they existed.
+
+        One-time rewrite: every stored ``messages_json`` is parsed once here so
+        listing never has to parse it again.
+        """
+        assert self._db is not None
+        tbl = self._db.open_table("sessions")
+        if "preview" in tbl.schema.names:
+            return
+        rows = tbl.to_arrow().to_pylist()
+        for row in rows:
+            row["preview"], row["message_count"] = _summarize_messages(row["messages_json"])
+        data = pa.Table.from_pylist(rows, schema=_SESSIONS_SCHEMA)
+        self._db.create_table("sessions", data=data, schema=_SESSIONS_SCHEMA, mode="overwrite")
+        logger.info("Backfilled session previews for %d rows", len(rows))
+
+    def _ensure_session_indexes(self) -> None:
+        """Create the scalar indexes on ``agent_name`` and ``session_id`` if absent.
+
+        Deferred until the table has rows, since LanceDB cannot train an index
+        on an empty table. Rows added afterwards are still found by filtered
+        queries; they are just scanned until the next ``optimize()``.
+        Callers must hold ``self._lock`` (or be in ``__init__``).
+        """
+        if self._session_indexes_ready or self._db is None:
+            return
+        tbl = self._db.open_table("sessions")
+        if tbl.count_rows() == 0:
+            return
+        existing = {ix.name for ix in tbl.list_indices()}
+        for column, index_type, name in _SESSION_INDEXES:
+            if name in existing:
+                continue
+            try:
+                tbl.create_scalar_index(column, index_type=index_type, name=name, replace=True)
+            except Exception as e:
+                logger.warning("Could not create session index %s: %s", name, e)
+                return
+        self._session_indexes_ready = True
+
     def _ensure_vec_table(self, dimensions: int) -> None:
         """Lazily create the memories table when dimensions become known."""
         if self._dimensions is not None:
@@ -177,6 +271,7 @@ class LanceMemoryStore(MemoryStoreBase):
 
         filtered = _filter_system_prompts(messages)
         data = ModelMessagesTypeAdapter.dump_json(filtered).decode("utf-8")
+        preview, message_count = _summarize_messages(data)
         with self._lock:
             if self._db is None:
                 raise RuntimeError("LanceMemoryStore is closed")
@@ -190,105 +285,100 @@ class LanceMemoryStore(MemoryStoreBase):
                         "agent_name": agent_name,
                         "timestamp": datetime.now(UTC).isoformat(),
                         "messages_json": data,
+                        "preview": preview,
+                        "message_count": message_count,
                     }
                 ]
             )
+            _write_meta(self._db, _latest_key(agent_name), str(doc_id))
             self._flush_counters()
+            self._ensure_session_indexes()
+            self._maintainer.note_write()
+
+    def _select_sessions(self, where: str, columns: list[str]) -> list[dict]:
+        """Return *columns* of every sessions row matching *where*.
+
+        The filter is pushed down to LanceDB (and its scalar indexes) and only
+        the projected columns are read. Callers must hold ``self._lock``.
+        """
+        assert self._db is not None
+        tbl = self._db.open_table("sessions")
+        return tbl.search().where(where, prefilter=True).select(columns).limit(None).to_list()
+
+    def _latest_row_id(self, where: str) -> int | None:
+        """Row id of the newest session row matching *where*. Caller holds the lock."""
+        rows = self._select_sessions(where, ["id", "timestamp"])
+        if not rows:
+            return None
+        return max(rows, key=lambda d: (d.get("timestamp", ""), d["id"]))["id"]
+
+    def _messages_json(self, row_id: int, agent_name: str) -> str | None:
+        """Read ``messages_json`` for one row. Caller holds the lock."""
+        rows = self._select_sessions(
+            f"id = {int(row_id)} AND agent_name = '{_esc(agent_name)}'", ["messages_json"]
+        )
+        return rows[0]["messages_json"] if rows else None
 
     def load_latest_session(self, agent_name: str, max_messages: int = 20) -> list | None:
         with self._lock:
             if self._db is None:
                 raise RuntimeError("LanceMemoryStore is closed")
-            tbl = self._db.open_table("sessions")
-            if tbl.count_rows() == 0:
-                return None
-            arrow_tbl = tbl.to_arrow()
-            # Filter by agent_name
-            mask = pc.equal(arrow_tbl.column("agent_name"), agent_name)  # type: ignore[unresolved-attribute]
-            filtered = arrow_tbl.filter(mask)
-            if filtered.num_rows == 0:
-                return None
-            rows = filtered.to_pylist()
-
-        # Sort by timestamp desc, take first
-        rows.sort(key=lambda d: d.get("timestamp", ""), reverse=True)
-        best = rows[0]
-        return _process_loaded_messages(best["messages_json"], max_messages)
+            messages_json: str | None = None
+            pointer = _read_meta(self._db, _latest_key(agent_name))
+            if pointer is not None:
+                messages_json = self._messages_json(int(pointer), agent_name)
+            if messages_json is None:
+                # No pointer yet (older store) or its row was deleted: find the
+                # newest row the slow way and repair the pointer.
+                row_id = self._latest_row_id(f"agent_name = '{_esc(agent_name)}'")
+                if row_id is None:
+                    return None
+                messages_json = self._messages_json(row_id, agent_name)
+                _write_meta(self._db, _latest_key(agent_name), str(row_id))
+
+        if messages_json is None:
+            return None
+        return _process_loaded_messages(messages_json, max_messages)
 
     def prune_sessions(self, agent_name: str, keep_count: int = 10) -> int:
         with self._lock:
             if self._db is None:
                 raise RuntimeError("LanceMemoryStore is closed")
-            tbl = self._db.open_table("sessions")
-            if tbl.count_rows() == 0:
-                return 0
-            arrow_tbl = tbl.to_arrow()
-            mask = pc.equal(arrow_tbl.column("agent_name"), agent_name)  # type: ignore[unresolved-attribute]
-            filtered = arrow_tbl.filter(mask)
-            rows = filtered.to_pylist()
-
+            rows = self._select_sessions(f"agent_name = '{_esc(agent_name)}'", ["id", "timestamp"])
             if len(rows) <= keep_count:
                 return 0
 
-            rows.sort(key=lambda d: d.get("timestamp", ""), reverse=True)
-            to_delete = rows[keep_count:]
-            for row in to_delete:
-                tbl.delete(f"id = {row['id']}")
+            rows.sort(key=lambda d: (d.get("timestamp", ""), d["id"]), reverse=True)
+            to_delete = [int(row["id"]) for row in rows[keep_count:]]
+            tbl = self._db.open_table("sessions")
+            tbl.delete(f"id IN ({', '.join(map(str, to_delete))})")
+            self._maintainer.note_write()
             return len(to_delete)
 
     def list_sessions(self, agent_name: str, limit: int = 20) -> list[SessionSummary]:
         with self._lock:
             if self._db is None:
                 raise RuntimeError("LanceMemoryStore is closed")
-            tbl = self._db.open_table("sessions")
-            if tbl.count_rows() == 0:
-                return []
-            arrow_tbl = tbl.to_arrow()
-            mask = pc.equal(arrow_tbl.column("agent_name"), agent_name)  # type: ignore[unresolved-attribute]
-            filtered = arrow_tbl.filter(mask)
-            rows = filtered.to_pylist()
+            rows = self._select_sessions(f"agent_name = '{_esc(agent_name)}'", _SUMMARY_COLUMNS)
 
         # Group by session_id, keep latest timestamp per session
-        session_map: dict[str, tuple[str, str]] = {}
+        latest: dict[str, dict] = {}
         for row in rows:
             sid = row["session_id"]
-            ts = row["timestamp"]
-            if sid not in session_map or ts > session_map[sid][0]:
-                session_map[sid] = (ts, row["messages_json"])
-
-        sorted_sessions = sorted(session_map.items(), key=lambda x: x[1][0], reverse=True)[:limit]
-
-        summaries: list[SessionSummary] = []
-        for session_id, (timestamp, messages_json) in sorted_sessions:
-            preview = "Untitled"
-            message_count = 0
-            try:
-                raw = json.loads(messages_json)
-                if isinstance(raw, list):
-                    message_count = len(raw)
-                    for msg in raw:
-                        if not isinstance(msg, dict):
-                            continue
-                        for part in msg.get("parts", []):
-                            if part.get("part_kind") == "user-prompt":
-                                content = part.get("content", "")
-                                if isinstance(content, str) and content.strip():
-                                    preview = content.strip()[:80]
-                                    break
-                        if preview != "Untitled":
-                            break
-            except (json.JSONDecodeError, TypeError):
-                pass
-            summaries.append(
-                SessionSummary(
-                    session_id=session_id,
-                    agent_name=agent_name,
-                    timestamp=timestamp,
-                    message_count=message_count,
-                    preview=preview,
-                )
+            if sid not in latest or row["timestamp"] > latest[sid]["timestamp"]:
+                latest[sid] = row
+
+        sorted_rows = sorted(latest.values(), key=lambda r: r["timestamp"], reverse=True)[:limit]
+        return [
+            SessionSummary(
+                session_id=row["session_id"],
+                agent_name=agent_name,
+                timestamp=row["timestamp"],
+                message_count=row["message_count"] or 0,
+                preview=row["preview"] or "Untitled",
             )
-        return summaries
+            for row in sorted_rows
+        ]
 
     def load_session_by_id(
         self, session_id: str, agent_name: str, max_messages: int = 20
@@ -296,22 +386,16 @@ class LanceMemoryStore(MemoryStoreBase):
         with self._lock:
             if self._db is None:
                 raise RuntimeError("LanceMemoryStore is closed")
-            tbl = self._db.open_table("sessions")
-            if tbl.count_rows() == 0:
-                return None
-            arrow_tbl = tbl.to_arrow()
-            mask = pc.and_(  # type: ignore[unresolved-attribute]
-                pc.equal(arrow_tbl.column("session_id"), session_id),  # type: ignore[unresolved-attribute]
-                pc.equal(arrow_tbl.column("agent_name"), agent_name),  # type: ignore[unresolved-attribute]
+            row_id = self._latest_row_id(
+                f"session_id = '{_esc(session_id)}' AND agent_name = '{_esc(agent_name)}'"
             )
-            filtered = arrow_tbl.filter(mask)
-            rows = filtered.to_pylist()
+            if row_id is None:
+                return None
+            messages_json = self._messages_json(row_id, agent_name)
 
-        if not rows:
+        if messages_json is None:
             return None
-        rows.sort(key=lambda d: d.get("timestamp", ""), reverse=True)
-        best = rows[0]
-        return _process_loaded_messages(best["messages_json"], max_messages)
+        return _process_loaded_messages(messages_json, max_messages)
 
     def delete_session(self, session_id: str, agent_name: str) -> bool:
         with self._lock:
@@ -323,6 +407,7 @@ class LanceMemoryStore(MemoryStoreBase):
             if n == 0:
                 return False
             tbl.delete(pred)
+            self._maintainer.note_write()
             return True
 
     # --- Long-term: semantic memories ---
@@ -363,6 +448,7 @@ class LanceMemoryStore(MemoryStoreBase):
                 ]
             )
             self._flush_counters()
+            self._maintainer.note_write()
             return doc_id
 
     def search_memories(
@@ -453,9 +539,9 @@ class LanceMemoryStore(MemoryStoreBase):
                 return 0
 
             rows.sort(key=lambda d: d.get("created_at", ""), reverse=True)
-            to_delete = rows[keep_count:]
-            for row in to_delete:
-                tbl.delete(f"id = {row['id']}")
+            to_delete = [int(row["id"]) for row in rows[keep_count:]]
+            tbl.delete(f"id IN ({', '.join(map(str, to_delete))})")
+            self._maintainer.note_write()
             return len(to_delete)
 
     def mark_consolidated(self, memory_ids: list[int], consolidated_at: str) -> None:
@@ -467,8 +553,11 @@ class LanceMemoryStore(MemoryStoreBase):
             if not self._memories_ready:
                 return
             tbl = self._db.open_table("memories")
-            for mid in memory_ids:
-                tbl.update(where=f"id = {mid}", values={"consolidated_at": consolidated_at})
+            tbl.update(
+                where=f"id IN ({', '.join(str(int(mid)) for mid in memory_ids)})",
+                values={"consolidated_at": consolidated_at},
+            )
+            self._maintainer.note_write()
 
     def get_unconsolidated_episodes(self, limit: int = 20) -> list[Memory]:
         with self._lock:
@@ -504,10 +593,25 @@ class LanceMemoryStore(MemoryStoreBase):
             self._ref_count += 1
         return self
 
+    def optimize(self) -> None:
+        """Build the vector index if the table is large enough, compact, prune versions."""
+        with self._lock:
+            if self._db is None:
+                raise RuntimeError("LanceMemoryStore is closed")
+        self._maintainer.optimize()
+
+    def table_health(self) -> list[TableHealth]:
+        with self._lock:
+            if self._db is None:
+                raise RuntimeError("LanceMemoryStore is closed")
+        return self._maintainer.health()
+
     def close(self) -> None:
         with self._lock:
             self._ref_count -= 1
             if self._ref_count > 0:
                 return
+            # Stop maintenance before the tables go away.
+            self._maintainer.close()
             self._flush_counters()
             self._db = None
@@ -0,0 +1,67 @@
+"""Built persona agent cache for team mode.
+
+Every team run used to rebuild each persona's agent, toolsets and model
+client from scratch, even when the daemon or dashboard ran the same team
+again. Built persona agents now live in one
+:class:`~initrunner.agent.agent_cache.BuiltAgentCache` shared by every
+``run_team*`` and ``run_team_graph_async`` call in the process.
+
+An entry is keyed by the fully resolved persona role -- persona config plus
+the shared memory/document stores patched onto it -- together with the
+directory it resolves paths against and the persona's environment. A persona
+adapted from a ``use:`` role file is also checked against that file, so an
+edited member role is rebuilt on the next run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Hashable, Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from initrunner.agent.agent_cache import BuiltAgentCache, cache_size_from_env
+
+if TYPE_CHECKING:
+    from initrunner.agent.schema.role import RoleDefinition
+
+_team_agent_cache: BuiltAgentCache[Any] = BuiltAgentCache(
+    cache_size_from_env("INITRUNNER_TEAM_AGENT_CACHE_SIZE", 64)
+)
+
+
+def get_team_agent_cache() -> BuiltAgentCache[Any]:
+    """Return the process-wide team agent cache."""
+    return _team_agent_cache
+
+
+def persona_cache_key(
+    role: RoleDefinition, role_dir: Path | None, env: Mapping[str, str] | None = None
+) -> Hashable:
+    """Cache key for a resolved persona: its final role, directory and environment."""
+    return (
+        hashlib.sha256(role.model_dump_json().encode()).hexdigest(),
+        str(role_dir) if role_dir is not None else None,
+        tuple(sorted((env or {}).items())),
+    )
+
+
+def build_persona_agent(
+    role: RoleDefinition,
+    role_dir: Path | None,
+    *,
+    role_file: Path | None = None,
+    env: Mapping[str, str] | None = None,
+) -> Any:
+    """Build (or reuse) the agent for a resolved persona role.
+
+    *role* must be final: shared stores already applied. *role_file* is the
+    member role file the persona was adapted from, if any.
+    """
+    from initrunner.agent.loader import build_agent
+
+    return _team_agent_cache.get_or_build(
+        persona_cache_key(role, role_dir, env),
+        lambda: build_agent(role, role_dir=role_dir),
+        source=role_file,
+    )
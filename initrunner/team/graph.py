@@ -26,6 +26,7 @@ from initrunner.agent.tool_events import (
     reset_tool_event_callback,
     set_tool_event_callback,
 )
+from initrunner.team.agents import build_persona_agent
 from initrunner.team.prompts import build_agent_prompt, build_parallel_prompt
 from initrunner.team.results import StepMetadata, TeamResult, accumulate_result
 from initrunner.team.roles import load_member_dotenvs, resolve_persona_role
@@ -143,15 +144,18 @@ def _make_sequential_persona_step(persona_name: str, index: int):
         }
 
         # Execute with persona environment
-        from initrunner.agent.loader import build_agent
-
         cb_token = None
         if deps.on_tool_event:
             _cb = deps.on_tool_event
             cb_token = set_tool_event_callback(lambda event, _name=persona_name: _cb(_name, event))
         try:
             with persona_env(persona.environment):
-                agent = build_agent(role, role_dir=member_dir or deps.team_dir)
+                agent = build_persona_agent(
+                    role,
+                    member_dir or deps.team_dir,
+                    role_file=team.member_role_file(persona_name),
+                    env=persona.environment,
+                )
                 result, _ = await execute_run_async(
                     agent,
                     role,
@@ -257,14 +261,14 @@ def _make_parallel_persona_step(persona_name: str, declared_index: int):
             "agent_name": persona_name,
         }
 
-        from initrunner.agent.loader import build_agent
-
         cb_token = None
         if deps.on_tool_event:
             _cb = deps.on_tool_event
             cb_token = set_tool_event_callback(lambda event, _name=persona_name: _cb(_name, event))
         try:
-            agent = build_agent(role, role_dir=member_dir or deps.team_dir)
+            agent = build_persona_agent(
+                role, member_dir or deps.team_dir, role_file=team.member_role_file(persona_name)
+            )
             result, _ = await execute_run_async(
                 agent,
                 role,
@@ -594,14 +598,14 @@ async def _run_debate_persona(
         "debate_round": str(round_num),
     }
 
-    from initrunner.agent.loader import build_agent
-
     cb_token = None
     if deps.on_tool_event:
         _cb = deps.on_tool_event
         cb_token = set_tool_event_callback(lambda event, _name=display_name: _cb(_name, event))
     try:
-        agent = build_agent(role, role_dir=member_dir or deps.team_dir)
+        agent = build_persona_agent(
+            role, member_dir or deps.team_dir, role_file=team.member_role_file(persona_name)
+        )
         run_result, _ = await execute_run_async(
             agent,
             role,
@@ -673,14 +677,12 @@ async def _run_synthesis(
         "agent_name": "synthesis",
     }
 
-    from initrunner.agent.loader import build_agent
-
     cb_token = None
     if deps.on_tool_event:
         _cb = deps.on_tool_event
         cb_token = set_tool_event_callback(lambda event: _cb("synthesis", event))
     try:
-        agent = build_agent(role, role_dir=deps.team_dir)
+        agent = build_persona_agent(role, deps.team_dir)
         run_result, _ = await execute_run_async(
             agent,
             role,
@@ -17,6 +17,7 @@ from typing import Any
 
 from initrunner._ids import generate_id
 from initrunner.agent.executor import RunResult
+from initrunner.team.agents import build_persona_agent
 from initrunner.team.graph import _log_team_aggregate
 
 # ---------------------------------------------------------------------------
@@ -116,7 +117,7 @@ def run_team(
             and run result after each persona finishes (success or failure).
     """
     from initrunner.agent.executor import execute_run
-    from initrunner.agent.loader import _load_dotenv, build_agent
+    from initrunner.agent.loader import _load_dotenv
 
     team_run_id = generate_id()
     result = TeamResult(team_run_id=team_run_id, team_name=team.metadata.name)
@@ -169,7 +170,12 @@ def run_team(
             apply_shared_stores(role, team, shared_mem_path, shared_doc_path)
 
             with persona_env(persona.environment):
-                agent = build_agent(role, role_dir=member_dir or team_dir)
+                agent = build_persona_agent(
+                    role,
+                    member_dir or team_dir,
+                    role_file=team.member_role_file(persona_name),
+                    env=persona.environment,
+                )
 
                 prompt = build_agent_prompt(
                     task, persona_name, prior_outputs, team.spec.handoff_max_chars
@@ -234,7 +240,7 @@ def run_team_parallel(
     does not cancel others. ``handoff_max_chars`` is irrelevant (no handoff).
     """
     from initrunner.agent.executor import execute_run
-    from initrunner.agent.loader import _load_dotenv, build_agent
+    from initrunner.agent.loader import _load_dotenv
 
     team_run_id = generate_id()
     result = TeamResult(team_run_id=team_run_id, team_name=team.metadata.name)
@@ -259,7 +265,9 @@ def run_team_parallel(
         role, member_dir = resolve_persona_role(persona_name, persona, team)
         apply_shared_stores(role, team, shared_mem_path, shared_doc_path)
 
-        agent = build_agent(role, role_dir=member_dir or team_dir)
+        agent = build_persona_agent(
+            role, member_dir or team_dir, role_file=team.member_role_file(persona_name)
+        )
         prompt = build_parallel_prompt(task, persona_name)
 
         trigger_metadata = {
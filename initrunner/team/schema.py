@@ -177,12 +177,25 @@ class TeamDefinition(BaseModel):
     # Empty for inline personas and for envelope teams.
     _member_roles: dict[str, RoleDefinition] = PrivateAttr(default_factory=dict)
     _member_role_dirs: dict[str, Path] = PrivateAttr(default_factory=dict)
-
-    def set_member_provenance(self, name: str, role: RoleDefinition, role_dir: Path) -> None:
+    _member_role_files: dict[str, Path] = PrivateAttr(default_factory=dict)
+
+    def set_member_provenance(
+        self,
+        name: str,
+        role: RoleDefinition,
+        role_dir: Path,
+        role_file: Path | None = None,
+    ) -> None:
         """Record the referenced role and source directory backing a persona."""
         self._member_roles[name] = role
         self._member_role_dirs[name] = role_dir
+        if role_file is not None:
+            self._member_role_files[name] = role_file
 
     def member_provenance(self, name: str) -> tuple[RoleDefinition | None, Path | None]:
         """Referenced role and source directory for a persona, if it has one."""
         return self._member_roles.get(name), self._member_role_dirs.get(name)
+
+    def member_role_file(self, name: str) -> Path | None:
+        """Role file a persona was adapted from, if it has one."""
+        return self._member_role_files.get(name)
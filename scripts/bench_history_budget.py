@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Time the history token-budget guard on long synthetic histories.
+
+``enforce_token_budget`` runs as a history processor before every model call,
+so on long autonomous runs it sees the same, slowly growing history over and
+over. For each history length this prints:
+
+- ``estimate``: ``estimate_tokens`` on a history it has already seen, which
+  is the common case between model calls.
+- ``under``: ``enforce_token_budget`` when the history fits (no-op path).
+- ``drop``: ``enforce_token_budget`` when half the history must be dropped.
+
+Histories are alternating tool-call responses and tool-return requests with
+~400 characters of text each.
+
+Usage:
+    python scripts/bench_history_budget.py
+    python scripts/bench_history_budget.py --sizes 1000,5000,10000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import time
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+
+from initrunner.agent.history_summarizer import enforce_token_budget, estimate_tokens
+
+
+def _history(n: int) -> list[ModelMessage]:
+    messages: list[ModelMessage] = [ModelRequest(parts=[UserPromptPart(content="start " * 50)])]
+    for i in range(n // 2):
+        call_id = f"call-{i}"
+        messages.append(
+            ModelResponse(
+                parts=[
+                    TextPart(content="thinking about the next step " * 10),
+                    ToolCallPart(tool_name="search", args={"q": f"q{i}"}, tool_call_id=call_id),
+                ]
+            )
+        )
+        messages.append(
+            ModelRequest(
+                parts=[
+                    ToolReturnPart(tool_name="search", content="result " * 60, tool_call_id=call_id)
+                ]
+            )
+        )
+    return messages
+
+
+def _time_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", default="1000,2000,5000,10000", help="history lengths")
+    parser.add_argument("--repeat", type=int, default=3, help="samples per cell (median)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # the guard warns on every drop
+
+    print(f"{'messages':>9} {'estimate ms':>12} {'under ms':>10} {'drop ms':>10}")
+    for n in (int(s) for s in args.sizes.split(",")):
+        messages = _history(n)
+        total = estimate_tokens(messages)
+        estimate = _time_ms(lambda m=messages: estimate_tokens(m), args.repeat)
+        under = _time_ms(lambda m=messages, b=total + 1: enforce_token_budget(m, b), args.repeat)
+        drop = _time_ms(lambda m=messages, b=total // 2: enforce_token_budget(m, b), args.repeat)
+        print(f"{n:>9} {estimate:>12.2f} {under:>10.2f} {drop:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Measure the per-request cost of the API server's guard middleware.
+
+Builds the ``--serve`` app with every guard switched on (HTTPS, body size,
+rate limit, auth) and a stub agent run that returns immediately, then drives
+``POST /v1/chat/completions`` in-process through ``httpx.ASGITransport``. Each
+mode is measured twice:
+
+- ``guard``: the app as shipped, one pure-ASGI ``GuardMiddleware`` layer.
+- ``base-http``: the same checks as four ``BaseHTTPMiddleware`` layers, the
+  stack the server used before.
+
+No network and no model calls, so the difference between the two rows is the
+middleware overhead. Absolute numbers depend on the machine; compare rows from
+one run.
+
+Usage:
+    python scripts/bench_server_middleware.py
+    python scripts/bench_server_middleware.py --requests 5000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from initrunner.agent.executor import RunResult
+from initrunner.agent.schema.base import ApiVersion, Kind, ModelConfig, RoleMetadata
+from initrunner.agent.schema.role import AgentSpec, RoleDefinition
+from initrunner.agent.schema.security import RateLimitConfig, SecurityPolicy, ServerConfig
+from initrunner.middleware import GuardMiddleware, _dispatch_from_check
+from initrunner.server.app import create_app
+
+API_KEY = "bench-key"
+HEADERS = {"Authorization": f"Bearer {API_KEY}", "X-Forwarded-Proto": "https"}
+
+
+def _role() -> RoleDefinition:
+    return RoleDefinition(
+        apiVersion=ApiVersion.V1,
+        kind=Kind.AGENT,
+        metadata=RoleMetadata(name="bench"),
+        spec=AgentSpec(
+            role="Benchmark stub.",
+            model=ModelConfig(provider="openai", name="gpt-5-mini"),
+            security=SecurityPolicy(
+                server=ServerConfig(require_https=True),
+                rate_limit=RateLimitConfig(requests_per_minute=10**9, burst_size=10**9),
+            ),
+        ),
+    )
+
+
+def _as_base_http(app: Starlette) -> Starlette:
+    """Swap the fused guard for one ``BaseHTTPMiddleware`` layer per check."""
+    for i, mw in enumerate(app.user_middleware):
+        if mw.cls is GuardMiddleware:
+            layers = [
+                Middleware(BaseHTTPMiddleware, dispatch=_dispatch_from_check(check))
+                for check in mw.kwargs["checks"]
+            ]
+            app.user_middleware[i : i + 1] = layers
+            app.middleware_stack = None
+            return app
+    raise RuntimeError("server app has no GuardMiddleware")
+
+
+async def _stub_run(*args, **kwargs):
+    return RunResult(run_id="bench", output="ok", success=True), []
+
+
+async def _stub_stream(*args, on_token=None, **kwargs):
+    if on_token is not None:
+        for token in ("o", "k"):
+            on_token(token)
+    return RunResult(run_id="bench", output="ok", success=True), []
+
+
+async def _measure(app: Starlette, requests: int, stream: bool) -> float:
+    """Return mean microseconds per request."""
+    body = {"messages": [{"role": "user", "content": "hi"}], "stream": stream}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(200, requests)):  # warm-up
+            await client.post("/v1/chat/completions", json=body, headers=HEADERS)
+        start = time.perf_counter()
+        for _ in range(requests):
+            resp = await client.post("/v1/chat/completions", json=body, headers=HEADERS)
+            if resp.status_code != 200:
+                raise RuntimeError(f"unexpected {resp.status_code}: {resp.text}")
+        return (time.perf_counter() - start) / requests * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--requests", type=int, default=2000, help="requests per sample")
+    parser.add_argument("--repeat", type=int, default=3, help="samples per row (median)")
+    args = parser.parse_args()
+
+    print(f"{'mode':<10} {'request':<10} {'us/request':>12}")
+    with (
+        patch("initrunner.server.app.execute_run_async", new=_stub_run),
+        patch("initrunner.server.app.execute_run_stream_async", new=_stub_stream),
+    ):
+        for stream in (False, True):
+            for mode in ("guard", "base-http"):
+                samples = []
+                for _ in range(args.repeat):
+                    app = create_app(MagicMock(), _role(), api_key=API_KEY)
+                    if mode == "base-http":
+                        app = _as_base_http(app)
+                    samples.append(asyncio.run(_measure(app, args.requests, stream)))
+                kind = "stream" if stream else "json"
+                print(f"{mode:<10} {kind:<10} {statistics.median(samples):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import importlib
 import importlib.util
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -49,6 +51,33 @@ def _reset_home_dir_cache():
     get_home_dir.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def _disable_oci_blob_cache(monkeypatch):
+    """Keep OCI pulls off the user's blob cache; cache tests re-enable it under a temp home."""
+    monkeypatch.setenv("INITRUNNER_OCI_CACHE", "0")
+
+
+@pytest.fixture(autouse=True)
+def _reset_embedding_state(monkeypatch):
+    """Keep tests off the user's embedding cache and from sharing embedders.
+
+    The on-disk cache is disabled; tests that exercise it point
+    ``INITRUNNER_HOME`` at a temp dir, re-enable it and call
+    ``reset_embedding_cache()`` themselves. Shared embedders from
+    ``get_embedder()`` capture API keys that tests monkeypatch, so the
+    registry is cleared around every test.
+    """
+    from initrunner.ingestion.embedding_cache import reset_embedding_cache
+    from initrunner.ingestion.embeddings import reset_embedders
+
+    monkeypatch.setenv("INITRUNNER_EMBEDDING_CACHE", "0")
+    reset_embedding_cache()
+    reset_embedders()
+    yield
+    reset_embedding_cache()
+    reset_embedders()
+
+
 def make_role(
     *,
     name: str = "test-agent",
@@ -80,6 +109,34 @@ def make_role(
     )
 
 
+@contextmanager
+def serve_urls(
+    content: str | Callable[[str], str] = "",
+    *,
+    headers: dict[str, str] | None = None,
+) -> Iterator[MagicMock]:
+    """Serve ingestion URL fetches from a mock transport instead of the network.
+
+    *content* is the plain-text body, or a function of the URL that returns
+    it (or raises, to fail the fetch). Yields the request handler mock, so
+    tests can count and inspect requests.
+    """
+    import httpx
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = content(str(request.url)) if callable(content) else content
+        return httpx.Response(
+            200, headers={"content-type": "text/plain", **(headers or {})}, text=body
+        )
+
+    handler = MagicMock(side_effect=respond)
+    with patch(
+        "initrunner.ingestion.crawler.AsyncSSRFSafeTransport",
+        lambda **kw: httpx.MockTransport(handler),
+    ):
+        yield handler
+
+
 def make_tool_build_context(
     *,
     role_dir: Path | None = None,
@@ -129,6 +186,16 @@ def _reset_credential_resolver():
     reset_resolver()
 
 
+@pytest.fixture(autouse=True)
+def _clear_agent_caches():
+    """Drop built delegate and team agents so no test reuses another test's mocks."""
+    from initrunner.agent.agent_cache import clear_agent_caches
+
+    clear_agent_caches()
+    yield
+    clear_agent_caches()
+
+
 @pytest.fixture
 def role():
     """Provide a default test RoleDefinition."""
@@ -206,9 +206,11 @@ def test_team_child_use_preserves_full_role(tmp_path: Path) -> None:
     assert role.metadata.name == "researcher"
     # ...and it resolves relative paths against its own directory.
     assert role_dir == (tmp_path / "roles").resolve()
+    assert team.member_role_file("researcher") == (tmp_path / "roles/researcher.yaml").resolve()
 
     # Inline personas keep synthesizing a role at runtime.
     assert team.member_provenance("writer") == (None, None)
+    assert team.member_role_file("writer") is None
 
 
 def test_team_child_use_tool_precedence(tmp_path: Path) -> None:
@@ -0,0 +1,93 @@
+"""Tests for the built-agent LRU shared by delegation and team mode."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from initrunner.agent.agent_cache import BuiltAgentCache, cache_size_from_env, clear_agent_caches
+
+
+def _build() -> MagicMock:
+    return MagicMock(side_effect=lambda: object())
+
+
+class TestBuiltAgentCache:
+    def test_reuses_build_per_key(self):
+        cache: BuiltAgentCache[object] = BuiltAgentCache(4)
+        build = _build()
+
+        first = cache.get_or_build("a", build)
+        assert cache.get_or_build("a", build) is first
+        assert cache.get_or_build("b", build) is not first
+        assert build.call_count == 2
+
+    def test_rebuilds_when_source_changes(self, tmp_path):
+        source = tmp_path / "role.yaml"
+        source.write_text("metadata:\n  name: one\n")
+        cache: BuiltAgentCache[object] = BuiltAgentCache(4)
+        build = _build()
+
+        first = cache.get_or_build("a", build, source=source)
+        assert cache.get_or_build("a", build, source=source) is first
+
+        source.write_text("metadata:\n  name: edited\n")
+        assert cache.get_or_build("a", build, source=source) is not first
+        assert build.call_count == 2
+        assert len(cache) == 1
+
+    def test_unreadable_source_is_never_cached(self, tmp_path):
+        cache: BuiltAgentCache[object] = BuiltAgentCache(4)
+        build = _build()
+
+        cache.get_or_build("a", build, source=tmp_path / "missing.yaml")
+        cache.get_or_build("a", build, source=tmp_path / "missing.yaml")
+        assert build.call_count == 2
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache: BuiltAgentCache[object] = BuiltAgentCache(2)
+        build = _build()
+
+        cache.get_or_build(0, build)
+        cache.get_or_build(1, build)
+        cache.get_or_build(0, build)  # refresh 0
+        cache.get_or_build(2, build)  # evicts 1
+        assert build.call_count == 3
+        cache.get_or_build(0, build)
+        assert build.call_count == 3
+        cache.get_or_build(1, build)
+        assert build.call_count == 4
+
+    def test_size_zero_disables(self):
+        cache: BuiltAgentCache[object] = BuiltAgentCache(0)
+        build = _build()
+
+        cache.get_or_build("a", build)
+        cache.get_or_build("a", build)
+        assert build.call_count == 2
+        assert len(cache) == 0
+
+    def test_clear_agent_caches_empties_every_cache(self):
+        caches: list[BuiltAgentCache[object]] = [BuiltAgentCache(4), BuiltAgentCache(4)]
+        for cache in caches:
+            cache.get_or_build("a", _build())
+
+        clear_agent_caches()
+
+        assert [len(c) for c in caches] == [0, 0]
+
+
+class TestCacheSizeFromEnv:
+    def test_default_when_unset(self, monkeypatch):
+        monkeypatch.delenv("INITRUNNER_TEST_CACHE_SIZE", raising=False)
+        assert cache_size_from_env("INITRUNNER_TEST_CACHE_SIZE", 32) == 32
+
+    def test_reads_and_clamps(self, monkeypatch):
+        monkeypatch.setenv("INITRUNNER_TEST_CACHE_SIZE", "8")
+        assert cache_size_from_env("INITRUNNER_TEST_CACHE_SIZE", 32) == 8
+        monkeypatch.setenv("INITRUNNER_TEST_CACHE_SIZE", "-1")
+        assert cache_size_from_env("INITRUNNER_TEST_CACHE_SIZE", 32) == 0
+
+    def test_invalid_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("INITRUNNER_TEST_CACHE_SIZE", "lots")
+        assert cache_size_from_env("INITRUNNER_TEST_CACHE_SIZE", 32) == 32
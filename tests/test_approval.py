@@ -276,7 +276,7 @@ class TestApprovalsApi:
         app = create_app(agent, role, audit_logger=audit, role_path=tmp_path / "role.yaml")
         return TestClient(app), audit, role
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_non_stream_paused(self, mock_execute, tmp_path):
         """A paused run returns 200 with pending_approvals and persists state."""
         mock_execute.return_value = (
@@ -1814,3 +1814,487 @@ class TestJudgeVerdicts:
             new = next(r for r in records if r.run_id == "new")
         assert old.judge_verdicts is None
         assert new.judge_verdicts == '[{"round":1}]'
+
+
+class TestBackgroundWriter:
+    """Opt-in batched writer: queued log(), flush barrier, backpressure, metrics."""
+
+    def test_flush_makes_records_visible(self, tmp_path):
+        with AuditLogger(tmp_path / "audit.db", background_writer=True) as logger:
+            for i in range(25):
+                logger.log(_make_record(run_id=f"r{i}"))
+            assert logger.flush(timeout=10)
+            assert len(logger.query()) == 25
+
+    def test_close_drains_queue(self, tmp_path):
+        db_path = tmp_path / "audit.db"
+        with AuditLogger(db_path, background_writer=True) as logger:
+            for i in range(50):
+                logger.log(_make_record(run_id=f"r{i}"))
+
+        conn = sqlite3.connect(str(db_path))
+        count = conn.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0]
+        conn.close()
+        assert count == 50
+
+    def test_batched_chain_verifies_in_order(self, tmp_path):
+        db_path = tmp_path / "audit.db"
+        n_threads = 8
+        m_records = 40
+        with AuditLogger(db_path, background_writer=True, writer_batch_size=16) as logger:
+            barrier = threading.Barrier(n_threads)
+
+            def _worker(thread_id: int) -> None:
+                barrier.wait()
+                for i in range(m_records):
+                    logger.log(_make_record(run_id=f"t{thread_id}-r{i}"))
+
+            threads = [threading.Thread(target=_worker, args=(t,)) for t in range(n_threads)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert logger.flush(timeout=10)
+
+            result = logger.verify_chain()
+            stats = logger.writer_stats()
+
+        assert result.ok
+        assert result.verified_rows == n_threads * m_records
+        assert stats is not None
+        assert stats.written == n_threads * m_records
+        assert stats.max_batch_size <= 16
+        assert stats.batches >= (n_threads * m_records) // 16
+
+    def test_batch_extends_sync_chain(self, tmp_path):
+        db_path = tmp_path / "audit.db"
+        with AuditLogger(db_path) as logger:
+            logger.log(_make_record(run_id="sync"))
+        with AuditLogger(db_path, background_writer=True) as logger:
+            for i in range(5):
+                logger.log(_make_record(run_id=f"bg{i}"))
+            logger.flush(timeout=10)
+            result = logger.verify_chain()
+        assert result.ok
+        assert result.verified_rows == 6
+
+    def test_batch_scrubs_secrets(self, tmp_path):
+        with AuditLogger(tmp_path / "audit.db", background_writer=True) as logger:
+            logger.log(_make_record(user_prompt="key sk-abc123def456ghi789jkl012mno345"))
+            logger.flush(timeout=10)
+            record = logger.query()[0]
+        assert "sk-abc123def456ghi789jkl012mno345" not in record.user_prompt
+
+    def test_drop_policy_counts_overflow(self, tmp_path, caplog):
+        gate = threading.Event()
+        with AuditLogger(
+            tmp_path / "audit.db",
+            background_writer=True,
+            writer_queue_size=2,
+            writer_overflow="drop",
+        ) as logger:
+            original = logger._log_signed_batch_locked
+
+            def _slow_batch(records):
+                gate.wait(10)
+                original(records)
+
+            assert logger._writer is not None
+            logger._writer._write_batch = _slow_batch
+            with caplog.at_level(logging.WARNING, logger="initrunner.audit.writer"):
+                for i in range(20):
+                    logger.log(_make_record(run_id=f"r{i}"))
+            stats = logger.writer_stats()
+            gate.set()
+            logger.flush(timeout=10)
+            final = logger.writer_stats()
+
+        assert stats is not None and stats.dropped > 0
+        assert final is not None
+        assert final.written + final.dropped == 20
+        assert "queue full; dropped 1 record(s)" in caplog.text
+
+    def test_failed_batch_never_raises(self, tmp_path, caplog):
+        with AuditLogger(tmp_path / "audit.db", background_writer=True) as logger:
+            assert logger._writer is not None
+
+            def _boom(records):
+                raise sqlite3.OperationalError("disk I/O error")
+
+            logger._writer._write_batch = _boom
+            with caplog.at_level(logging.ERROR, logger="initrunner.audit.writer"):
+                logger.log(_make_record())
+                logger.flush(timeout=10)
+            stats = logger.writer_stats()
+        assert stats is not None and stats.failed == 1
+        assert "Failed to write audit record" in caplog.text
+
+    def test_bad_record_does_not_lose_its_batch(self, tmp_path):
+        gate = threading.Event()
+        with AuditLogger(tmp_path / "audit.db", background_writer=True) as logger:
+            assert logger._writer is not None
+            original = logger._log_signed_batch_locked
+
+            def _reject_bad(records):
+                gate.wait(10)
+                if any(r.run_id == "bad" for r in records):
+                    raise sqlite3.IntegrityError("bad row")
+                original(records)
+
+            logger._writer._write_batch = _reject_bad
+            for run_id in ("a", "b", "bad", "c", "d"):
+                logger.log(_make_record(run_id=run_id))
+            gate.set()
+            assert logger.flush(timeout=10)
+            stats = logger.writer_stats()
+            written = sorted(r.run_id for r in logger.query())
+        assert written == ["a", "b", "c", "d"]
+        assert stats is not None and stats.failed == 1 and stats.written == 4
+
+    def test_sync_logger_has_no_writer_stats(self, tmp_path):
+        with AuditLogger(tmp_path / "audit.db") as logger:
+            assert logger.writer_stats() is None
+            assert logger.flush() is True
+
+    def test_batch_triggers_auto_prune_on_interval_crossing(self, tmp_path):
+        with AuditLogger(
+            tmp_path / "audit.db",
+            background_writer=True,
+            writer_batch_size=7,
+            auto_prune_interval=10,
+            retention_days=9999,
+            max_records=1_000_000,
+        ) as logger:
+            prune_calls: list[int] = []
+            original_prune = logger._prune_locked
+
+            def _tracking_prune(**kwargs):
+                prune_calls.append(1)
+                return original_prune(**kwargs)
+
+            logger._prune_locked = _tracking_prune  # type: ignore[invalid-assignment]
+            for i in range(25):
+                logger.log(_make_record(run_id=f"r{i}"))
+            logger.flush(timeout=10)
+            assert logger._insert_count == 25
+        assert len(prune_calls) == 2
+
+
+class TestReadPool:
+    def test_reads_see_committed_writes(self, tmp_path):
+        with AuditLogger(tmp_path / "audit.db", read_pool_size=2) as logger:
+            logger.log(_make_record(run_id="r1"))
+            logger.log(_make_record(run_id="r2"))
+            assert {r.run_id for r in logger.query()} == {"r1", "r2"}
+            assert logger.stats().total_runs == 2
+            assert logger.verify_chain().ok
+
+    def test_pool_connections_are_read_only(self, tmp_path):
+        with AuditLogger(tmp_path / "audit.db", read_pool_size=1) as logger:
+            with logger._reader() as conn:
+                try:
+                    conn.execute("DELETE FROM audit_log")
+                except sqlite3.OperationalError as e:
+                    assert "readonly" in str(e)
+                else:
+                    raise AssertionError("pooled reader accepted a write")
+
+    def test_pool_is_bounded_and_reused(self, tmp_path):
+        with AuditLogger(tmp_path / "audit.db", read_pool_size=2) as logger:
+            logger.log(_make_record())
+            errors: list[Exception] = []
+
+            def _read():
+                try:
+                    for _ in range(20):
+                        logger.query(limit=5)
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=_read) for _ in range(6)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            assert errors == []
+            assert len(logger._readers) <= 2
+
+    def test_reads_do_not_take_writer_lock(self, tmp_path):
+        with AuditLogger(tmp_path / "audit.db", read_pool_size=1) as logger:
+            logger.log(_make_record())
+            with logger._lock:
+                # Would deadlock if the read path shared the writer lock.
+                logger._readers.append(logger._open_reader())
+                logger._read_pool.put(logger._readers[-1])  # type: ignore[union-attr]
+                assert len(logger.query()) == 1
+
+    def test_close_closes_readers(self, tmp_path):
+        logger = AuditLogger(tmp_path / "audit.db", read_pool_size=1)
+        logger.query()
+        conn = logger._readers[0]
+        logger.close()
+        try:
+            conn.execute("SELECT 1")
+        except sqlite3.ProgrammingError:
+            pass
+        else:
+            raise AssertionError("reader left open after close()")
+
+
+class TestReuseOrOpen:
+    def test_yields_given_logger(self, tmp_path):
+        from initrunner.audit.logger import reuse_or_open
+
+        with AuditLogger(tmp_path / "audit.db") as logger:
+            with reuse_or_open(logger, tmp_path / "other.db") as got:
+                assert got is logger
+            # Not closed by the context manager.
+            assert logger.query() == []
+
+    def test_missing_db_yields_none(self, tmp_path):
+        from initrunner.audit.logger import reuse_or_open
+
+        with reuse_or_open(None, tmp_path / "missing.db") as got:
+            assert got is None
+        assert not (tmp_path / "missing.db").exists()
+
+    def test_opens_existing_db(self, tmp_path):
+        from initrunner.audit.logger import reuse_or_open
+
+        db = tmp_path / "audit.db"
+        with AuditLogger(db) as logger:
+            logger.log(_make_record())
+        with reuse_or_open(None, db) as got:
+            assert got is not None
+            assert len(got.query()) == 1
+
+
+class TestChainCheckpoints:
+    """Incremental verification from signed checkpoints, and parallel segments."""
+
+    def _env_with_key(self, monkeypatch, tmp_path):
+        import initrunner.audit._hmac as hmac_mod
+        import initrunner.config as cfg
+
+        key_path = tmp_path / "audit_hmac.key"
+        monkeypatch.setattr(cfg, "get_audit_hmac_key_path", lambda: key_path)
+        monkeypatch.setattr(hmac_mod, "get_audit_hmac_key_path", lambda: key_path)
+        monkeypatch.delenv("INITRUNNER_AUDIT_HMAC_KEY", raising=False)
+        return key_path
+
+    def _log(self, db_path, n, start=0):
+        with AuditLogger(db_path) as logger:
+            for i in range(start, start + n):
+                logger.log(_make_record(run_id=f"r{i}"))
+
+    def _tamper(self, db_path, sql, params=()):
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(sql, params)
+        conn.commit()
+        conn.close()
+
+    def test_incremental_only_walks_new_rows(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 5)
+        with AuditLogger(db_path) as logger:
+            assert logger.verify_chain().ok
+        self._log(db_path, 3, start=5)
+
+        with AuditLogger(db_path) as logger:
+            result = logger.verify_chain(incremental=True)
+
+        assert result.ok
+        assert result.resumed_from_id == 5
+        assert result.total_rows == 3
+        assert result.verified_rows == 3
+        assert result.last_verified_id == 8
+
+    def test_incremental_without_new_rows_keeps_tip(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 4)
+        with AuditLogger(db_path) as logger:
+            first = logger.verify_chain(incremental=True)
+            second = logger.verify_chain(incremental=True)
+
+        assert first.resumed_from_id is None
+        assert second.ok
+        assert second.total_rows == 0
+        assert second.last_verified_id == 4
+        assert second.last_verified_hash == first.last_verified_hash
+
+    def test_incremental_detects_tampering_after_checkpoint(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 3)
+        with AuditLogger(db_path) as logger:
+            logger.verify_chain()
+        self._log(db_path, 3, start=3)
+        self._tamper(db_path, "UPDATE audit_log SET output='tampered' WHERE id=5")
+
+        with AuditLogger(db_path) as logger:
+            result = logger.verify_chain(incremental=True)
+
+        assert result.ok is False
+        assert result.first_break_id == 5
+        assert result.first_break_reason == "hash_mismatch"
+
+    def test_full_walk_still_catches_rows_behind_checkpoint(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 4)
+        with AuditLogger(db_path) as logger:
+            logger.verify_chain()
+        self._tamper(db_path, "UPDATE audit_log SET output='tampered' WHERE id=2")
+
+        with AuditLogger(db_path) as logger:
+            assert logger.verify_chain(incremental=True).ok
+            full = logger.verify_chain()
+
+        assert full.ok is False
+        assert full.first_break_id == 2
+
+    def test_rewritten_checkpoint_row_is_a_break(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 3)
+        with AuditLogger(db_path) as logger:
+            logger.verify_chain()
+        self._tamper(db_path, "UPDATE audit_log SET record_hash='00' WHERE id=3")
+
+        with AuditLogger(db_path) as logger:
+            result = logger.verify_chain(incremental=True)
+
+        assert result.ok is False
+        assert result.first_break_reason == "checkpoint_mismatch"
+        assert result.first_break_id == 3
+
+    def test_forged_checkpoint_is_ignored(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 3)
+        self._tamper(db_path, "UPDATE audit_log SET output='tampered' WHERE id=2")
+        self._tamper(
+            db_path,
+            "INSERT INTO chain_checkpoints (created_at, last_id, last_hash, signature)"
+            " SELECT 'now', id, record_hash, 'forged' FROM audit_log WHERE id=3",
+        )
+
+        with AuditLogger(db_path) as logger:
+            result = logger.verify_chain(incremental=True)
+
+        assert result.resumed_from_id is None
+        assert result.ok is False
+        assert result.first_break_id == 2
+
+    def test_failed_verify_records_no_checkpoint(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 3)
+        self._tamper(db_path, "UPDATE audit_log SET output='tampered' WHERE id=2")
+
+        with AuditLogger(db_path) as logger:
+            assert not logger.verify_chain().ok
+            count = logger._conn.execute("SELECT COUNT(*) FROM chain_checkpoints").fetchone()[0]
+
+        assert count == 0
+
+    def test_reports_throughput(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 20)
+        with AuditLogger(db_path) as logger:
+            result = logger.verify_chain()
+
+        assert result.elapsed_s > 0
+        assert result.rows_per_sec > 0
+
+    def _legacy_row(self, db_path):
+        self._tamper(
+            db_path,
+            "INSERT INTO audit_log (run_id, agent_name, timestamp, user_prompt,"
+            " model, provider, output, tokens_in, tokens_out, total_tokens,"
+            " tool_calls, duration_ms, success, error, prev_hash, record_hash)"
+            " VALUES ('legacy', 'a', '2025-01-01T00:00:00Z', 'p', 'm', 'o', 'out',"
+            " 1, 1, 2, 0, 10, 1, NULL, NULL, NULL)",
+        )
+
+    def test_parallel_matches_sequential(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        with AuditLogger(db_path):
+            pass
+        self._legacy_row(db_path)
+        self._legacy_row(db_path)
+        self._log(db_path, 30, start=0)
+        self._tamper(db_path, "DELETE FROM audit_log WHERE id IN (10, 11)")
+
+        with AuditLogger(db_path) as logger:
+            seq = logger.verify_chain(checkpoint=False)
+            par = logger.verify_chain(workers=4, checkpoint=False)
+
+        assert seq.ok and par.ok
+        for attr in (
+            "total_rows",
+            "unsigned_legacy_rows",
+            "verified_rows",
+            "last_verified_id",
+            "last_verified_hash",
+            "pruned_gaps",
+        ):
+            assert getattr(par, attr) == getattr(seq, attr), attr
+
+    def test_parallel_reports_first_break(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 24)
+        # Break at a segment boundary (prev_hash) and a later hash mismatch.
+        self._tamper(db_path, "UPDATE audit_log SET prev_hash='00' WHERE id=7")
+        self._tamper(db_path, "UPDATE audit_log SET output='x' WHERE id=20")
+
+        with AuditLogger(db_path) as logger:
+            seq = logger.verify_chain()
+            par = logger.verify_chain(workers=4)
+
+        assert not seq.ok and not par.ok
+        assert (par.first_break_id, par.first_break_reason) == (7, "prev_hash_mismatch")
+        assert (par.first_break_id, par.first_break_reason) == (
+            seq.first_break_id,
+            seq.first_break_reason,
+        )
+        assert par.total_rows == seq.total_rows
+        assert par.verified_rows == seq.verified_rows
+
+    def test_parallel_incremental(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 5)
+        with AuditLogger(db_path) as logger:
+            logger.verify_chain()
+        self._log(db_path, 10, start=5)
+
+        with AuditLogger(db_path) as logger:
+            result = logger.verify_chain(incremental=True, workers=3)
+
+        assert result.ok
+        assert result.resumed_from_id == 5
+        assert result.verified_rows == 10
+        assert result.last_verified_id == 15
+
+    def test_cli_resumes_from_checkpoint(self, tmp_path, monkeypatch):
+        self._env_with_key(monkeypatch, tmp_path)
+        db_path = tmp_path / "audit.db"
+        self._log(db_path, 3)
+
+        first = cli_runner.invoke(cli_app, ["audit", "verify-chain", "--audit-db", str(db_path)])
+        second = cli_runner.invoke(cli_app, ["audit", "verify-chain", "--audit-db", str(db_path)])
+        full = cli_runner.invoke(
+            cli_app, ["audit", "verify-chain", "--full", "--audit-db", str(db_path)]
+        )
+
+        assert first.exit_code == 0 and second.exit_code == 0 and full.exit_code == 0
+        assert "Resumed after id" not in first.output
+        assert "Resumed after id" in second.output
+        assert "Rows/sec" in second.output
+        assert "Resumed after id" not in full.output
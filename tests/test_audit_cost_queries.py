@@ -207,3 +207,145 @@ class TestCostByModel:
             assert len(rows) == 1
             assert rows[0]["thinking_tokens"] == 40
             assert rows[0]["reasoning_tokens"] == 10
+
+
+def _insert_tools(logger: AuditLogger, tool_names: str | None, timestamp: str, **kwargs) -> None:
+    _insert_record(logger, timestamp=timestamp, **kwargs)
+    logger._conn.execute(
+        "UPDATE audit_log SET tool_names = ? WHERE id = (SELECT MAX(id) FROM audit_log)",
+        (tool_names,),
+    )
+    logger._conn.commit()
+
+
+def _raw(logger: AuditLogger, monkeypatch: pytest.MonkeyPatch, method: str, **kwargs):
+    """Answer a query by scanning audit_log, bypassing the rollups."""
+    with monkeypatch.context() as m:
+        m.setattr("initrunner.audit.logger.split_window", lambda since, until: None)
+        return getattr(logger, method)(**kwargs)
+
+
+def _sorted(rows: list[dict]) -> list[tuple]:
+    return sorted(tuple(sorted(r.items())) for r in rows)
+
+
+class TestRollups:
+    def _populate(self, logger: AuditLogger) -> None:
+        base = datetime(2026, 3, 1, tzinfo=UTC)
+        tools = ['["search", "search", "fetch"]', '["fetch"]', None, "not json"]
+        for i in range(120):
+            ts = (base + timedelta(hours=7 * i)).isoformat()
+            _insert_tools(
+                logger,
+                tools[i % len(tools)],
+                ts,
+                agent_name=f"agent-{i % 3}",
+                model=["gpt-4o", "gpt-4o-mini"][i % 2],
+                tokens_in=10 + i,
+                tokens_out=5 + i,
+            )
+
+    @pytest.mark.parametrize(
+        ("since", "until"),
+        [
+            (None, None),
+            ("2026-03-04T05:00:00+00:00", None),
+            (None, "2026-03-20T13:30:00+00:00"),
+            ("2026-03-04T05:00:00+00:00", "2026-03-20T13:30:00+00:00"),
+            ("2026-03-10T01:00:00+00:00", "2026-03-10T20:00:00+00:00"),
+            ("2026-03-10", "2026-03-12"),
+            ("garbage", None),
+        ],
+    )
+    def test_matches_raw_scan(self, audit_db, monkeypatch, since, until) -> None:
+        with AuditLogger(audit_db) as logger:
+            self._populate(logger)
+            for method, extra in [
+                ("cost_by_agent", {"agent_name": "agent-1"}),
+                ("cost_by_agent", {}),
+                ("cost_by_day", {}),
+                ("cost_by_model", {}),
+                ("cost_by_tool", {}),
+                ("cost_by_tool", {"agent_name": "agent-2"}),
+            ]:
+                kwargs = {"since": since, "until": until, **extra}
+                got = getattr(logger, method)(**kwargs)
+                assert _sorted(got) == _sorted(_raw(logger, monkeypatch, method, **kwargs))
+            got_stats = logger.stats(since=since, until=until)
+            raw_stats = _raw(logger, monkeypatch, "stats", since=since, until=until)
+            assert got_stats.total_runs == raw_stats.total_runs
+            assert got_stats.success_rate == raw_stats.success_rate
+            assert got_stats.total_tokens == raw_stats.total_tokens
+            assert got_stats.avg_duration_ms == raw_stats.avg_duration_ms
+
+    def test_delete_decrements_rollups(self, audit_db) -> None:
+        with AuditLogger(audit_db) as logger:
+            _insert_tools(logger, '["a"]', "2026-03-01T10:00:00+00:00", tokens_in=100)
+            _insert_tools(logger, '["a", "b"]', "2026-03-01T11:00:00+00:00", tokens_in=50)
+            logger._conn.execute("DELETE FROM audit_log WHERE tokens_in = 50")
+            logger._conn.commit()
+            usage = logger._conn.execute("SELECT * FROM usage_rollup").fetchall()
+            assert [(r["run_count"], r["tokens_in"]) for r in usage] == [(1, 100)]
+            tools = logger._conn.execute("SELECT tool_name, usage_count FROM tool_rollup")
+            assert [tuple(r) for r in tools] == [("a", 1)]
+
+    def test_prune_keeps_rollups_in_step(self, audit_db, monkeypatch) -> None:
+        with AuditLogger(audit_db) as logger:
+            old = (datetime.now(UTC) - timedelta(days=200)).isoformat()
+            _insert_record(logger, timestamp=old)
+            _insert_record(logger)
+            logger.prune(retention_days=90)
+            assert _sorted(logger.cost_by_day()) == _sorted(
+                _raw(logger, monkeypatch, "cost_by_day")
+            )
+            assert sum(r["run_count"] for r in logger.cost_by_day()) == 1
+
+    def test_backfills_existing_db(self, audit_db, monkeypatch) -> None:
+        with AuditLogger(audit_db) as logger:
+            self._populate(logger)
+            for name in ("insert", "delete", "update"):
+                logger._conn.execute(f"DROP TRIGGER trg_audit_rollup_{name}")
+            logger._conn.execute("DROP TABLE usage_rollup")
+            logger._conn.execute("DROP TABLE tool_rollup")
+        with AuditLogger(audit_db) as logger:
+            for method in ("cost_by_agent", "cost_by_tool"):
+                assert _sorted(getattr(logger, method)()) == _sorted(
+                    _raw(logger, monkeypatch, method)
+                )
+
+    def test_signed_log_updates_rollups(self, audit_db) -> None:
+        from initrunner.audit.logger import AuditRecord
+
+        with AuditLogger(audit_db) as logger:
+            logger.log(
+                AuditRecord(
+                    run_id="r1",
+                    agent_name="a",
+                    timestamp=datetime.now(UTC).isoformat(),
+                    user_prompt="p",
+                    model="gpt-4o",
+                    provider="openai",
+                    output="o",
+                    tokens_in=7,
+                    tokens_out=3,
+                    total_tokens=10,
+                    tool_calls=1,
+                    duration_ms=10,
+                    success=True,
+                    tool_names='["x"]',
+                )
+            )
+            row = logger._conn.execute("SELECT run_count, tokens_in FROM usage_rollup").fetchone()
+            assert tuple(row) == (1, 7)
+            assert logger.cost_by_tool()[0]["tool_name"] == "x"
+            assert logger.verify_chain().ok
+
+    def test_rebuild_rollups(self, audit_db, monkeypatch) -> None:
+        with AuditLogger(audit_db) as logger:
+            self._populate(logger)
+            logger._conn.execute("DELETE FROM usage_rollup")
+            logger._conn.commit()
+            assert logger.cost_by_model() == []
+            logger.rebuild_rollups()
+            raw = _raw(logger, monkeypatch, "cost_by_model")
+            assert _sorted(logger.cost_by_model()) == _sorted(raw)
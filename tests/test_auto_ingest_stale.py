@@ -21,6 +21,7 @@ from initrunner.agent.schema.ingestion import (
     IngestConfig,
 )
 from initrunner.agent.schema.role import AgentSpec, RoleDefinition
+from tests.conftest import serve_urls
 
 # ---------------------------------------------------------------------------
 # Fixtures and helpers
@@ -334,20 +335,14 @@ class TestUrlSkipBehavior:
         role = _make_role(tmp_path, sources=["*.txt", url])
         role_file = _role_file(tmp_path)
 
-        with patch(
-            "initrunner.ingestion.extractors.extract_url",
-            return_value="remote markdown",
-        ) as fetch:
+        with serve_urls("remote markdown") as fetch:
             run_auto_ingest(role, role_file)
             assert fetch.call_count == 1
 
         # Edit the local file -- the URL is unchanged.
         f.write_text("local content edited and longer")
 
-        with patch(
-            "initrunner.ingestion.extractors.extract_url",
-            return_value="remote markdown",
-        ) as fetch:
+        with serve_urls("remote markdown") as fetch:
             plan = compute_stale_ingest_plan(role, role_file)
             assert plan is not None
             run_auto_ingest(role, role_file)
@@ -364,15 +359,12 @@ class TestUrlSkipBehavior:
         role_file = _role_file(tmp_path)
 
         role1 = _make_role(tmp_path, sources=["*.txt"])
-        with patch("initrunner.ingestion.extractors.extract_url", return_value="x"):
+        with serve_urls("x"):
             run_auto_ingest(role1, role_file)
 
         # Add a URL to the YAML
         role2 = _make_role(tmp_path, sources=["*.txt", "https://example.test/new"])
-        with patch(
-            "initrunner.ingestion.extractors.extract_url",
-            return_value="new page text",
-        ) as fetch:
+        with serve_urls("new page text") as fetch:
             plan = compute_stale_ingest_plan(role2, role_file)
             assert plan is not None
             run_auto_ingest(role2, role_file)
@@ -389,7 +381,7 @@ class TestUrlSkipBehavior:
         assert role.spec.ingest is not None
         ingest_cfg = role.spec.ingest
 
-        with patch("initrunner.ingestion.extractors.extract_url", return_value="remote") as fetch:
+        with serve_urls("remote") as fetch:
             run_ingest(
                 ingest_cfg,
                 role.metadata.name,
@@ -399,7 +391,7 @@ class TestUrlSkipBehavior:
             assert fetch.call_count == 1
 
         # Manual run again -- still refetches (no skip_existing_urls flag)
-        with patch("initrunner.ingestion.extractors.extract_url", return_value="remote") as fetch:
+        with serve_urls("remote") as fetch:
             run_ingest(
                 ingest_cfg,
                 role.metadata.name,
@@ -333,8 +333,8 @@ class TestDaemonClarifyRouting:
         agent = MagicMock()
         return DaemonRunner(agent, role)
 
-    def test_answer_bypasses_semaphore(self):
-        """When a clarification is pending, the answer does not acquire the semaphore."""
+    def test_answer_bypasses_queue(self):
+        """When a clarification is pending, the answer does not go through the work queue."""
         from initrunner.runner.daemon import PendingClarification
         from initrunner.triggers.base import (
             TriggerEvent,
@@ -351,25 +351,21 @@ class TestDaemonClarifyRouting:
         with runner._pending_lock:
             runner._pending_clarifications[conv_key] = pc
 
-        # Exhaust all semaphore slots
-        for _ in range(runner._MAX_CONCURRENT):
-            runner._concurrency_semaphore.acquire()
+        # A stopped queue drops everything submitted to it
+        runner._work_queue.stop()
 
-        # Send answer -- should succeed despite no free slots
+        # Send answer -- should succeed despite the queue refusing work
         event = TriggerEvent(
             prompt="The answer is 42",
             trigger_type="telegram",
             metadata={"channel_target": "12345"},
         )
         assert event.conversation_key == conv_key
-        runner._on_trigger(event)
+        runner._submit_trigger(event)
 
         assert pc.event.is_set()
         assert pc.answer == "The answer is 42"
-
-        # Release semaphore slots for cleanup
-        for _ in range(runner._MAX_CONCURRENT):
-            runner._concurrency_semaphore.release()
+        assert runner.queue_stats().dropped == 0
 
     def test_answer_does_not_start_new_run(self):
         """A clarification answer should not trigger a new agent run."""
@@ -399,26 +395,22 @@ class TestDaemonClarifyRouting:
         assert pc.event.is_set()
 
     def test_non_pending_proceeds_normally(self):
-        """Without a pending clarification, trigger proceeds to semaphore."""
+        """Without a pending clarification, trigger is queued for a worker."""
         from initrunner.triggers.base import TriggerEvent
 
         runner = self._make_runner()
 
-        # Exhaust semaphore
-        for _ in range(runner._MAX_CONCURRENT):
-            runner._concurrency_semaphore.acquire()
-
         event = TriggerEvent(
             prompt="normal message",
             trigger_type="telegram",
             metadata={"chat_id": "99999"},
         )
-        # Should be skipped (no free semaphore slot) -- just verify no crash
-        runner._on_trigger(event)
+        # Workers are not started, so the event stays queued
+        runner._submit_trigger(event)
 
-        # Release
-        for _ in range(runner._MAX_CONCURRENT):
-            runner._concurrency_semaphore.release()
+        stats = runner.queue_stats()
+        assert stats.depth == 1
+        assert stats.in_flight == 0
 
     def test_non_conversational_no_clarify_callback(self):
         """Non-conversational triggers (no conv_key) get no clarify callback."""
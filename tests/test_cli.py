@@ -887,6 +887,41 @@ class TestIngest:
             assert "Skipped: 3" in result.output
             assert "10 chunks stored" in result.output
 
+    def test_ingest_optimize_reports_stores(self, tmp_path, monkeypatch):
+        from initrunner.stores.lance_store import LanceDocumentStore
+
+        monkeypatch.setenv("INITRUNNER_LANCE_OPTIMIZE_EVERY", "0")
+        store_path = tmp_path / "docs.lance"
+        with LanceDocumentStore(store_path, dimensions=4) as store:
+            for i in range(3):
+                store.add_documents([f"t{i}"], [[1.0, 0.0, 0.0, float(i)]], [f"s{i}"])
+        role_file = tmp_path / "role.yaml"
+        role_file.write_text(
+            textwrap.dedent(f"""\
+            apiVersion: initrunner/v1
+            kind: Agent
+            metadata:
+              name: test-agent
+            spec:
+              role: Test
+              model:
+                provider: openai
+                name: gpt-5-mini
+              ingest:
+                sources:
+                  - "*.txt"
+                store_path: {store_path}
+        """)
+        )
+
+        with patch("initrunner.ingestion.pipeline.run_ingest") as mock_ingest:
+            result = runner.invoke(app, ["ingest", str(role_file), "--optimize"])
+        assert result.exit_code == 0, result.output
+        mock_ingest.assert_not_called()
+        assert "chunks" in result.output
+        assert "3 -> " in result.output
+        assert "query latency" in result.output
+
 
 class TestAuditExport:
     def _seed_db(self, db_path):
@@ -0,0 +1,131 @@
+"""Tests for initrunner.ingestion.crawler -- concurrent URL fetching."""
+
+import asyncio
+import itertools
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from initrunner.ingestion.crawler import DomainThrottle, UrlFetch, fetch_urls
+
+
+def _patch_transport(handler):
+    return patch(
+        "initrunner.ingestion.crawler.AsyncSSRFSafeTransport",
+        lambda **kw: httpx.MockTransport(handler),
+    )
+
+
+def _fetch(urls, validators=None, **kwargs):
+    return asyncio.run(fetch_urls(urls, validators, **kwargs))
+
+
+class TestFetchUrls:
+    def test_html_converted_and_validators_returned(self):
+        def handle(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={
+                    "content-type": "text/html",
+                    "etag": '"v1"',
+                    "last-modified": "Wed, 01 Jan 2026 00:00:00 GMT",
+                },
+                text="<html><body><h1>Title</h1><script>x()</script></body></html>",
+            )
+
+        with _patch_transport(handle):
+            [result] = _fetch(["https://example.com/a"])
+
+        assert result.text is not None and "Title" in result.text
+        assert "x()" not in result.text
+        assert result.etag == '"v1"'
+        assert result.last_modified == "Wed, 01 Jan 2026 00:00:00 GMT"
+        assert not result.not_modified and result.error is None
+
+    def test_conditional_request_not_modified(self):
+        seen: list[httpx.Headers] = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers)
+            return httpx.Response(304)
+
+        with _patch_transport(handle):
+            [result] = _fetch(
+                ["https://example.com/a"],
+                {"https://example.com/a": ('"v1"', "Wed, 01 Jan 2026 00:00:00 GMT")},
+            )
+
+        assert seen[0]["if-none-match"] == '"v1"'
+        assert seen[0]["if-modified-since"] == "Wed, 01 Jan 2026 00:00:00 GMT"
+        assert result == UrlFetch(
+            "https://example.com/a",
+            not_modified=True,
+            etag='"v1"',
+            last_modified="Wed, 01 Jan 2026 00:00:00 GMT",
+        )
+
+    def test_no_validators_means_unconditional(self):
+        seen: list[httpx.Headers] = []
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers)
+            return httpx.Response(200, headers={"content-type": "text/plain"}, text="body")
+
+        with _patch_transport(handle):
+            [result] = _fetch(["https://example.com/a"])
+
+        assert "if-none-match" not in seen[0]
+        assert "if-modified-since" not in seen[0]
+        assert result.text == "body"
+
+    def test_errors_returned_in_input_order(self):
+        def handle(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/down":
+                raise httpx.ConnectError("connection refused")
+            if request.url.path == "/missing":
+                return httpx.Response(404)
+            return httpx.Response(200, headers={"content-type": "text/plain"}, text="ok")
+
+        urls = ["https://a.test/down", "https://b.test/ok", "https://c.test/missing"]
+        with _patch_transport(handle):
+            results = _fetch(urls)
+
+        assert [r.url for r in results] == urls
+        assert results[0].error == "connection refused"
+        assert results[1].text == "ok"
+        assert results[2].error is not None and "404" in results[2].error
+
+    def test_same_host_is_spaced_other_hosts_are_not(self):
+        sent: dict[str, list[float]] = {}
+
+        def handle(request: httpx.Request) -> httpx.Response:
+            sent.setdefault(request.url.host, []).append(time.monotonic())
+            return httpx.Response(200, headers={"content-type": "text/plain"}, text="ok")
+
+        urls = [f"https://same.test/{i}" for i in range(3)]
+        urls += [f"https://host{i}.test/" for i in range(3)]
+        with _patch_transport(handle):
+            _fetch(urls, domain_rate=10.0)
+
+        same = sent["same.test"]
+        assert all(b - a >= 0.08 for a, b in itertools.pairwise(same))
+        others = [sent[f"host{i}.test"][0] for i in range(3)]
+        assert max(others) - min(others) < 0.08
+
+
+class TestDomainThrottle:
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError, match="rate"):
+            DomainThrottle(0)
+
+    def test_burst_allows_back_to_back_requests(self):
+        async def run() -> float:
+            throttle = DomainThrottle(rate=1.0, burst=3)
+            start = time.monotonic()
+            for _ in range(3):
+                await throttle.acquire("example.com")
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 0.1
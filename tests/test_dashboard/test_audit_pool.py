@@ -0,0 +1,117 @@
+"""Tests for the shared dashboard AuditPool."""
+
+import threading
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from initrunner.dashboard.app import create_app
+from initrunner.dashboard.config import DashboardSettings
+from initrunner.dashboard.deps import AuditPool
+
+
+def test_get_returns_same_instance(tmp_path):
+    with patch("initrunner.config.get_audit_db_path", return_value=tmp_path / "audit.db"):
+        pool = AuditPool()
+        try:
+            assert pool.get() is pool.get()
+        finally:
+            pool.close()
+
+
+def test_get_without_create_skips_missing_db(tmp_path):
+    db = tmp_path / "audit.db"
+    with patch("initrunner.config.get_audit_db_path", return_value=db):
+        pool = AuditPool()
+        assert pool.get(create=False) is None
+        assert not db.exists()
+        logger = pool.get()
+        assert logger is not None
+        assert pool.get(create=False) is logger
+        pool.close()
+
+
+def test_concurrent_first_use_opens_once(tmp_path):
+    opened: list[object] = []
+    with patch("initrunner.config.get_audit_db_path", return_value=tmp_path / "audit.db"):
+        pool = AuditPool()
+        barrier = threading.Barrier(8)
+
+        def _get():
+            barrier.wait()
+            opened.append(pool.get())
+
+        threads = [threading.Thread(target=_get) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len({id(x) for x in opened}) == 1
+        pool.close()
+
+
+def test_close_reopens_on_next_get(tmp_path):
+    with patch("initrunner.config.get_audit_db_path", return_value=tmp_path / "audit.db"):
+        pool = AuditPool()
+        first = pool.get()
+        pool.close()
+        second = pool.get()
+        assert second is not first
+        pool.close()
+
+
+def test_requests_share_one_logger(tmp_path):
+    from initrunner.audit.logger import AuditLogger
+
+    db = tmp_path / "audit.db"
+    AuditLogger(db).close()
+    with (
+        patch("initrunner.config.get_audit_db_path", return_value=db),
+        patch("initrunner.dashboard.deps.AuditPool.get", autospec=True) as mock_get,
+    ):
+        real = AuditLogger(db, read_pool_size=2)
+        mock_get.return_value = real
+        app = create_app(DashboardSettings())
+        client = TestClient(app)
+        for _ in range(3):
+            assert client.get("/api/cost/by-agent").status_code == 200
+            assert client.get("/api/audit/stats").status_code == 200
+        real.close()
+    assert mock_get.call_count == 6
+    pools = {call.args[0] for call in mock_get.call_args_list}
+    assert len(pools) == 1
+
+
+def test_get_async_opens_off_the_event_loop(tmp_path):
+    import asyncio
+
+    opened_on: list[int] = []
+    real_get = AuditPool.get
+
+    def _get(self, *, create=True):
+        opened_on.append(threading.get_ident())
+        return real_get(self, create=create)
+
+    with (
+        patch("initrunner.config.get_audit_db_path", return_value=tmp_path / "audit.db"),
+        patch.object(AuditPool, "get", _get),
+    ):
+        pool = AuditPool()
+
+        async def _main():
+            first = await pool.get_async()
+            return first, await pool.get_async()
+
+        first, second = asyncio.run(_main())
+        assert first is not None and first is second
+        # The second call reuses the open logger without another thread hop.
+        assert len(opened_on) == 1 and opened_on[0] != threading.get_ident()
+        pool.close()
+
+
+def test_unavailable_logger_returns_503():
+    with patch("initrunner.dashboard.deps.AuditPool.get", return_value=None):
+        client = TestClient(create_app(DashboardSettings()))
+        resp = client.get("/api/approvals/pending")
+    assert resp.status_code == 503
+    assert resp.json()["detail"] == "Audit log is unavailable"
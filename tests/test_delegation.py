@@ -13,6 +13,7 @@ from initrunner.agent.delegation import (
     exit_delegation,
     get_current_chain,
     get_current_depth,
+    get_delegate_cache,
     reset_context,
 )
 
@@ -165,6 +166,50 @@ class TestInlineInvoker:
         assert "API limit exceeded" in result
 
 
+class TestDelegateAgentCache:
+    def _role_file(self, tmp_path, name="sub-agent"):
+        role_file = tmp_path / f"{name}.yaml"
+        role_file.write_text(f"metadata:\n  name: {name}\n")
+        return role_file
+
+    def test_shared_memory_settings_cached_separately(self, tmp_path):
+        role_file = self._role_file(tmp_path)
+        mock_result = MagicMock(success=True, output="ok")
+
+        with (
+            patch("initrunner.agent.delegation.InlineInvoker._build") as mock_build,
+            patch("initrunner.agent.executor.execute_run") as mock_exec,
+        ):
+            mock_build.side_effect = lambda: (MagicMock(), MagicMock())
+            mock_exec.return_value = (mock_result, [])
+
+            for path in (None, "/tmp/shared.db", None, "/tmp/shared.db"):
+                InlineInvoker(role_file, max_depth=3, timeout=60, shared_memory_path=path).invoke(
+                    "x"
+                )
+
+        assert mock_build.call_count == 2
+        assert len(get_delegate_cache()) == 2
+
+    def test_invoker_builds_once_per_role(self, tmp_path):
+        role_file = self._role_file(tmp_path)
+        mock_result = MagicMock(success=True, output="ok")
+
+        with (
+            patch("initrunner.agent.loader.load_and_build") as mock_load,
+            patch("initrunner.agent.executor.execute_run") as mock_exec,
+        ):
+            mock_load.return_value = (MagicMock(), MagicMock())
+            mock_exec.return_value = (mock_result, [])
+
+            invoker = InlineInvoker(role_file, max_depth=3, timeout=60)
+            assert invoker.invoke("one") == "ok"
+            assert InlineInvoker(role_file, max_depth=3, timeout=60).invoke("two") == "ok"
+
+        mock_load.assert_called_once_with(role_file)
+        assert mock_exec.call_count == 2
+
+
 class TestMcpInvoker:
     def test_successful_invocation(self):
         invoker = McpInvoker(
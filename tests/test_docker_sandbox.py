@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import subprocess
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -465,6 +466,297 @@ class TestDockerBackend:
             assert any(f"{code_file}:/work/_run.py:ro" in m for m in mount_args)
 
 
+# ===========================================================================
+# Warm container pool tests
+# ===========================================================================
+
+
+class _FakeDocker:
+    """Stand-in for the docker CLI as seen by the container pool."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+        self.exec_result = subprocess.CompletedProcess([], 0, b"out\n", b"")
+        self.exec_error: BaseException | None = None
+        self.procs = b"UID PID CMD\nroot 1 docker-init\nroot 7 sleep\n"
+        self.diff = b""
+        self.running: set[str] = set()
+
+    def __call__(self, cmd, **kwargs):
+        self.calls.append(cmd)
+        sub = cmd[1]
+        out = b""
+        if sub == "run" and "-d" not in cmd:
+            return subprocess.CompletedProcess(cmd, 0, b"once\n", b"")
+        if sub == "run":
+            self.running.add(cmd[cmd.index("--name") + 1])
+        elif sub == "inspect":
+            out = b"true\n"
+        elif sub == "top":
+            out = self.procs
+        elif sub == "diff":
+            out = self.diff
+        elif sub == "ps":
+            out = "\n".join(sorted(self.running)).encode()
+        elif sub == "exec" and not cmd[-1].startswith("rm -rf"):
+            if self.exec_error is not None:
+                raise self.exec_error
+            return self.exec_result
+        return subprocess.CompletedProcess(cmd, 0, out, b"")
+
+    def subcommands(self, name: str) -> list[list[str]]:
+        return [c for c in self.calls if c[1] == name]
+
+
+@pytest.fixture()
+def docker_pool():
+    from initrunner.agent.runtime_sandbox.docker_pool import DockerContainerPool
+
+    fake = _FakeDocker()
+    with (
+        patch("initrunner.agent.runtime_sandbox.docker_pool.subprocess.run", new=fake),
+        patch("initrunner.agent.runtime_sandbox.docker_pool._kill_container") as kill,
+    ):
+        pool = DockerContainerPool()
+        yield pool, fake, kill
+        pool.close()
+
+
+def _pool_run(pool, *, settings=None, writable_rootfs=False, timeout=30):
+    from initrunner.agent.schema.security import DockerPoolConfig
+
+    proc = pool.run(
+        ["docker", "run", "--rm", "--init", "--network", "none", "python:3.12-slim"],
+        ["python3", "-c", "print(1)"],
+        stdin=None,
+        env={"A": "1"},
+        timeout=timeout,
+        settings=settings or DockerPoolConfig(enabled=True),
+        writable_rootfs=writable_rootfs,
+    )
+    pool._queue.join()  # wait for the post-call recycle check
+    return proc
+
+
+class TestDockerContainerPool:
+    def test_first_call_runs_one_shot(self, docker_pool):
+        pool, fake, _ = docker_pool
+        assert _pool_run(pool) is None
+        assert fake.calls == []
+        assert pool.stats().misses == 1
+
+    def test_repeat_calls_reuse_one_container(self, docker_pool):
+        pool, fake, _ = docker_pool
+        _pool_run(pool)
+        assert _pool_run(pool).stdout == b"out\n"
+        assert _pool_run(pool).stdout == b"out\n"
+
+        assert len(fake.subcommands("run")) == 1
+        run = fake.subcommands("run")[0]
+        assert run[:3] == ["docker", "run", "-d"]
+        assert run[-4:] == ["--entrypoint", "sleep", "python:3.12-slim", "infinity"]
+        assert "initrunner.pool=true" in run
+        execs = [c for c in fake.subcommands("exec") if not c[-1].startswith("rm -rf")]
+        assert {c[c.index("-e") + 2] for c in execs} == {run[run.index("--name") + 1]}
+        assert execs[0][2:4] == ["-e", "A=1"]
+        stats = pool.stats()
+        assert (stats.containers, stats.idle, stats.busy) == (1, 1, 0)
+        assert (stats.hits, stats.misses, stats.created) == (1, 2, 1)
+        assert stats.max_exec_ms >= stats.avg_exec_ms >= 0
+
+    def test_container_recycled_after_max_uses(self, docker_pool):
+        from initrunner.agent.schema.security import DockerPoolConfig
+
+        pool, _, kill = docker_pool
+        settings = DockerPoolConfig(enabled=True, max_uses=1)
+        _pool_run(pool, settings=settings)
+        _pool_run(pool, settings=settings)
+        stats = pool.stats()
+        assert (stats.containers, stats.recycled) == (0, 1)
+        kill.assert_called_once()
+
+    def test_stray_process_recycles_container(self, docker_pool):
+        pool, fake, _ = docker_pool
+        _pool_run(pool)
+        _pool_run(pool)
+        assert pool.stats().idle == 1
+        fake.procs += b"root 9 nohup\n"  # left behind by the next call
+        _pool_run(pool)
+        assert pool.stats().recycled == 1
+
+    def test_rootfs_write_recycles_container(self, docker_pool):
+        pool, fake, _ = docker_pool
+        fake.diff = b"A /root/.cache\n"
+        _pool_run(pool, writable_rootfs=True)
+        _pool_run(pool, writable_rootfs=True)
+        assert pool.stats().recycled == 1
+
+    def test_read_only_rootfs_skips_diff(self, docker_pool):
+        pool, fake, _ = docker_pool
+        fake.diff = b"A /root/.cache\n"
+        _pool_run(pool)
+        _pool_run(pool)
+        assert fake.subcommands("diff") == []
+        assert pool.stats().idle == 1
+
+    def test_oom_kill_recycles_container(self, docker_pool):
+        pool, fake, _ = docker_pool
+        fake.exec_result = subprocess.CompletedProcess([], 137, b"", b"")
+        _pool_run(pool)
+        assert _pool_run(pool).returncode == 137
+        assert pool.stats().recycled == 1
+
+    def test_timeout_removes_container(self, docker_pool):
+        pool, fake, kill = docker_pool
+        _pool_run(pool)
+        fake.exec_error = subprocess.TimeoutExpired(cmd="docker", timeout=5)
+        with pytest.raises(SubprocessTimeout):
+            _pool_run(pool, timeout=5)
+        kill.assert_called_once()
+        assert pool.stats().containers == 0
+
+    def test_daemon_error_falls_back_to_one_shot(self, docker_pool):
+        pool, fake, kill = docker_pool
+        _pool_run(pool)
+        fake.exec_result = subprocess.CompletedProcess(
+            [], 1, b"", b"Error response from daemon: container is not running"
+        )
+        assert _pool_run(pool) is None
+        kill.assert_called_once()
+        assert pool.stats().containers == 0
+
+    def test_busy_pool_falls_back_to_one_shot(self, docker_pool):
+        from initrunner.agent.schema.security import DockerPoolConfig
+
+        pool, _, _ = docker_pool
+        settings = DockerPoolConfig(enabled=True, max_containers=1)
+        key = ("docker", "run", "img")
+        assert pool._acquire(key, settings, False) is None  # first sighting
+        assert pool._acquire(key, settings, False) is not None
+        assert pool._acquire(key, settings, False) is None
+
+    def test_reap_removes_idle_and_vanished_containers(self, docker_pool):
+        from initrunner.agent.schema.security import DockerPoolConfig
+
+        pool, fake, _ = docker_pool
+        _pool_run(pool)
+        _pool_run(pool)
+        assert pool.reap() == 0
+        fake.running.clear()
+        assert pool.reap() == 1
+        assert pool.stats().containers == 0
+
+        settings = DockerPoolConfig(enabled=True, idle_timeout_seconds=0.001)
+        _pool_run(pool, settings=settings)
+        time.sleep(0.01)
+        assert pool.reap() == 1
+
+    def test_close_removes_all_containers(self, docker_pool):
+        pool, fake, _ = docker_pool
+        _pool_run(pool)
+        _pool_run(pool)
+        pool.close()
+        assert fake.subcommands("rm")[-1][:3] == ["docker", "rm", "-f"]
+        assert _pool_run(pool) is None
+
+
+class TestDockerBackendPooled:
+    def test_pooled_property(self):
+        from initrunner.agent.runtime_sandbox.docker import DockerBackend
+
+        assert DockerBackend(SandboxConfig(backend="docker")).pooled is False
+        config = SandboxConfig(backend="docker", docker=DockerBackendConfig(pool={"enabled": True}))
+        assert DockerBackend(config).pooled is True
+
+    def test_run_dispatches_through_pool(self, tmp_path, docker_pool):
+        from initrunner.agent.runtime_sandbox.docker import DockerBackend
+
+        pool, fake, _ = docker_pool
+        config = SandboxConfig(backend="docker", docker=DockerBackendConfig(pool={"enabled": True}))
+        audit = MagicMock()
+        backend = DockerBackend(config, audit=audit)
+        with patch(
+            "initrunner.agent.runtime_sandbox.docker_pool.get_container_pool", return_value=pool
+        ):
+            first = backend.run(["echo"], env={}, cwd=tmp_path, timeout=30)
+            second = backend.run(["echo"], env={}, cwd=tmp_path, timeout=30)
+        pool._queue.join()
+
+        assert first.stdout == "once\n"
+        assert second.stdout == "out\n"
+        one_shot, run = fake.subcommands("run")
+        assert "-d" not in one_shot
+        assert f"{tmp_path}:/work" in run
+        details = audit.log_security_event.call_args[1]["details"]
+        assert details.endswith("pooled=1")
+
+
+class TestPythonScratchDirs:
+    def test_released_dir_is_emptied_and_reused(self):
+        from initrunner.agent.tools.python_exec import _ScratchDirs
+
+        dirs = _ScratchDirs()
+        path = dirs.acquire()
+        (Path(path) / "_run.py").write_text("print(1)")
+        (Path(path) / "sub").mkdir()
+        (Path(path) / "sub" / "f").write_text("x")
+        dirs.release(path)
+        assert list(Path(path).iterdir()) == []
+        assert dirs.acquire() == path
+        dirs.release(path)
+        dirs.close()
+        assert not Path(path).exists()
+
+    def test_pooled_backend_skips_code_file_mount(self):
+        from initrunner.agent.schema.tools import PythonToolConfig
+        from initrunner.agent.tools.python_exec import build_python_toolset
+
+        ctx = _make_ctx()
+        backend = MagicMock(pooled=True)
+        backend.name = "docker"
+        backend.run.return_value = MagicMock(stdout="ok\n", stderr="", returncode=0)
+        ctx.sandbox_backend = backend
+        toolset = build_python_toolset(PythonToolConfig(), ctx)
+        run_python = toolset.tools["run_python"].function
+
+        run_python("print('ok')")
+        run_python("print('ok')")
+
+        first, second = backend.run.call_args_list
+        assert first[1]["extra_mounts"] == []
+        assert first[1]["cwd"] == second[1]["cwd"]
+
+
+class TestBwrapPreflightCache:
+    def test_successful_probe_runs_once(self, monkeypatch):
+        from initrunner.agent.runtime_sandbox import bwrap
+
+        monkeypatch.setattr(bwrap, "_probed_bwrap", set())
+        monkeypatch.setattr(bwrap.sys, "platform", "linux")
+        monkeypatch.setattr(bwrap.shutil, "which", lambda name: "/usr/bin/bwrap")
+        ok = MagicMock(returncode=0, stderr=b"")
+        with patch.object(bwrap.subprocess, "run", return_value=ok) as mock_run:
+            backend = bwrap.BwrapBackend(SandboxConfig(backend="bwrap"))
+            backend.preflight()
+            backend.preflight()
+        mock_run.assert_called_once()
+
+    def test_failed_probe_not_cached(self, monkeypatch):
+        from initrunner.agent.runtime_sandbox import bwrap
+        from initrunner.agent.runtime_sandbox.base import SandboxUnavailableError
+
+        monkeypatch.setattr(bwrap, "_probed_bwrap", set())
+        monkeypatch.setattr(bwrap.sys, "platform", "linux")
+        monkeypatch.setattr(bwrap.shutil, "which", lambda name: "/usr/bin/bwrap")
+        failed = MagicMock(returncode=1, stderr=b"setting up uid map: Permission denied")
+        backend = bwrap.BwrapBackend(SandboxConfig(backend="bwrap"))
+        with patch.object(bwrap.subprocess, "run", return_value=failed) as mock_run:
+            for _ in range(2):
+                with pytest.raises(SandboxUnavailableError):
+                    backend.preflight()
+        assert mock_run.call_count == 2
+
+
 # ===========================================================================
 # Tool builder integration tests
 # ===========================================================================
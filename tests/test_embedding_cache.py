@@ -0,0 +1,170 @@
+"""Tests for the on-disk embedding cache and its use in embed_texts."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from initrunner.ingestion import embeddings
+from initrunner.ingestion.embedding_cache import (
+    EmbeddingCache,
+    get_embedding_cache,
+    reset_embedding_cache,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = EmbeddingCache(tmp_path / "cache" / "embeddings.db")
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def enabled_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("INITRUNNER_HOME", str(tmp_path))
+    monkeypatch.setenv("INITRUNNER_EMBEDDING_CACHE", "1")
+    reset_embedding_cache()
+    c = get_embedding_cache()
+    assert c is not None
+    return c
+
+
+def _fake_embedder(identity: str = "openai:text-embedding-3-small") -> MagicMock:
+    """An embedder tagged like create_embedder does, returning [len(text), 1.0]."""
+
+    async def _embed(texts, input_type="document"):
+        return MagicMock(embeddings=[[float(len(t)), 1.0] for t in texts])
+
+    embedder = MagicMock()
+    embedder.embed = AsyncMock(side_effect=_embed)
+    embeddings._cache_tags[embedder] = embeddings._CacheTag(identity)
+    return embedder
+
+
+class TestEmbeddingCache:
+    def test_round_trip(self, cache):
+        cache.put_many("m", "document", ["a", "b"], [[0.5, 1.0], [2.0, 3.0]])
+        assert cache.get_many("m", "document", ["b", "c", "a"]) == [
+            [2.0, 3.0],
+            None,
+            [0.5, 1.0],
+        ]
+
+    def test_keyed_by_model_and_input_type(self, cache):
+        cache.put_many("m", "document", ["a"], [[1.0]])
+        assert cache.get_many("other", "document", ["a"]) == [None]
+        assert cache.get_many("m", "query", ["a"]) == [None]
+
+    def test_stats_counts_hits_and_misses(self, cache):
+        cache.put_many("m", "document", ["a"], [[1.0, 2.0]])
+        cache.get_many("m", "document", ["a", "a", "b"])
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (2, 1, 1)
+        assert stats.size_bytes == 8  # two float32 values
+        assert stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        # Each 4-float vector is 16 bytes; a 40-byte cap holds two of them.
+        c = EmbeddingCache(tmp_path / "e.db", max_bytes=40)
+        try:
+            c.put_many("m", "document", ["a", "b"], [[1.0] * 4, [2.0] * 4])
+            c.get_many("m", "document", ["a"])  # "b" is now least recently used
+            c.put_many("m", "document", ["c"], [[3.0] * 4])
+            assert c.get_many("m", "document", ["a", "b", "c"]) == [
+                [1.0] * 4,
+                None,
+                [3.0] * 4,
+            ]
+            assert c.stats().size_bytes <= 40
+        finally:
+            c.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "e.db"
+        first = EmbeddingCache(path)
+        first.put_many("m", "document", ["a"], [[1.0]])
+        first.close()
+        second = EmbeddingCache(path)
+        try:
+            assert second.get_many("m", "document", ["a"]) == [[1.0]]
+        finally:
+            second.close()
+
+    def test_clear(self, cache):
+        cache.put_many("m", "document", ["a"], [[1.0]])
+        cache.clear()
+        assert cache.get_many("m", "document", ["a"]) == [None]
+        assert cache.stats().size_bytes == 0
+
+
+class TestGetEmbeddingCache:
+    def test_disabled_by_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("INITRUNNER_HOME", str(tmp_path))
+        assert get_embedding_cache() is None
+        assert not (tmp_path / "cache").exists()
+
+    def test_enabled_under_home(self, enabled_cache, tmp_path):
+        assert (tmp_path / "cache" / "embeddings.db").exists()
+        assert get_embedding_cache() is enabled_cache
+
+
+class TestEmbedTextsCache:
+    def test_second_call_served_from_cache(self, enabled_cache):
+        embedder = _fake_embedder()
+        first = asyncio.run(embeddings.embed_texts(embedder, ["ab", "abc"]))
+        second = asyncio.run(embeddings.embed_texts(embedder, ["abc", "ab"]))
+        assert first == [[2.0, 1.0], [3.0, 1.0]]
+        assert second == [[3.0, 1.0], [2.0, 1.0]]
+        assert embedder.embed.await_count == 1
+        assert embeddings.embedding_cache_counts(embedder) == (2, 2)
+
+    def test_only_unique_misses_are_embedded(self, enabled_cache):
+        embedder = _fake_embedder()
+        asyncio.run(embeddings.embed_texts(embedder, ["ab"]))
+        result = asyncio.run(embeddings.embed_texts(embedder, ["ab", "xyz", "xyz"]))
+        assert result == [[2.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+        assert embedder.embed.await_args_list[-1].args == (["xyz"],)
+
+    def test_model_identity_separates_entries(self, enabled_cache):
+        asyncio.run(embeddings.embed_texts(_fake_embedder("openai:a"), ["ab"]))
+        other = _fake_embedder("openai:b")
+        asyncio.run(embeddings.embed_texts(other, ["ab"]))
+        assert other.embed.await_count == 1
+
+    def test_untagged_embedder_bypasses_cache(self, enabled_cache):
+        embedder = MagicMock()
+        embedder.embed = AsyncMock(return_value=MagicMock(embeddings=[[1.0]]))
+        asyncio.run(embeddings.embed_texts(embedder, ["ab"]))
+        asyncio.run(embeddings.embed_texts(embedder, ["ab"]))
+        assert embedder.embed.await_count == 2
+        assert enabled_cache.stats().entries == 0
+
+    def test_cache_io_runs_off_the_event_loop(self, enabled_cache, monkeypatch):
+        import threading
+
+        calls: list[tuple[str, int]] = []
+        for name in ("get_many", "put_many"):
+            real = getattr(enabled_cache, name)
+
+            def _spy(*args, _name=name, _real=real):
+                calls.append((_name, threading.get_ident()))
+                return _real(*args)
+
+            monkeypatch.setattr(enabled_cache, name, _spy)
+
+        async def _run():
+            await embeddings.embed_texts(_fake_embedder(), ["ab"])
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(_run())
+        assert [name for name, _ in calls] == ["get_many", "put_many"]
+        assert all(ident != loop_thread for _, ident in calls)
+
+    def test_create_embedder_tags_identity(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        embedder = embeddings.create_embedder("openai", "text-embedding-3-small")
+        tag = embeddings._cache_tags[embedder]
+        assert tag.identity == embeddings.compute_model_identity("openai", "text-embedding-3-small")
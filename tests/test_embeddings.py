@@ -280,6 +280,48 @@ class TestStandardProviderApiKeyEnv:
             create_embedder(provider="openai")
 
 
+class TestEmbedderRegistry:
+    def test_same_settings_share_one_embedder(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        from initrunner.ingestion.embeddings import get_embedder
+
+        first = get_embedder("openai", "text-embedding-3-small")
+        assert get_embedder("openai", "text-embedding-3-small") is first
+        assert get_embedder("openai", "text-embedding-3-large") is not first
+        assert (
+            get_embedder("openai", "text-embedding-3-small", api_key_env="OPENAI_API_KEY")
+            is not first
+        )
+
+    def test_reset_embedders_rebuilds(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        from initrunner.ingestion.embeddings import get_embedder, reset_embedders
+
+        first = get_embedder("openai")
+        reset_embedders()
+        assert get_embedder("openai") is not first
+
+    def test_embed_single_reuses_embedder_and_loop(self):
+        import asyncio
+
+        from initrunner.ingestion import embeddings
+
+        loops = set()
+
+        async def _embed(texts, input_type="document"):
+            loops.add(asyncio.get_running_loop())
+            return MagicMock(embeddings=[[1.0, 2.0] for _ in texts])
+
+        fake = MagicMock()
+        fake.embed = _embed
+        with patch.object(embeddings, "create_embedder", return_value=fake) as create:
+            assert embeddings.embed_single("openai", "m", "a") == [1.0, 2.0]
+            assert embeddings.embed_single("openai", "m", "b") == [1.0, 2.0]
+            assert asyncio.run(embeddings.embed_single_async("openai", "m", "c")) == [1.0, 2.0]
+        create.assert_called_once()
+        assert len(loops) == 1
+
+
 class TestGetReranker:
     def test_rrf_reranker(self):
         from lancedb.rerankers import RRFReranker
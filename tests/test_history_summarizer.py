@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from pydantic_ai.messages import (
     ModelMessage,
@@ -68,6 +68,20 @@ def _alternating(n: int) -> list:
     return msgs
 
 
+def _quadratic_drop(messages: list, budget: int, preserve_first: bool) -> list:
+    """The original re-estimating drop loop, kept as a reference."""
+    first = [messages[0]] if preserve_first and messages else []
+    middle = messages[1 if preserve_first and len(messages) > 1 else 0 :]
+    dropped = []
+    while len(middle) > 1 and estimate_tokens(first + middle) > budget:
+        msg = middle.pop(0)
+        dropped.append(msg)
+        if isinstance(msg, (ModelRequest, ModelResponse)) and middle:
+            if isinstance(middle[0], ModelResponse):
+                dropped.append(middle.pop(0))
+    return dropped
+
+
 # ---------------------------------------------------------------------------
 # resolve_context_window
 # ---------------------------------------------------------------------------
@@ -180,6 +194,21 @@ class TestEstimateTokens:
         expected = _MSG_OVERHEAD + len("text") // 4 + _PART_OVERHEAD
         assert est == expected
 
+    def test_per_message_estimate_cached(self):
+        msgs = _alternating(10)
+        target = "initrunner.agent.history_summarizer._estimate_part_tokens"
+        with patch(target, return_value=1) as part_tokens:
+            first = estimate_tokens(msgs)
+            second = estimate_tokens(msgs)
+        assert first == second == 10 * (_MSG_OVERHEAD + 1)
+        assert part_tokens.call_count == 10
+
+    def test_cache_refreshed_when_parts_added(self):
+        msg = _req("a" * 40)
+        before = estimate_tokens([msg])
+        msg.parts.append(UserPromptPart(content="b" * 40))
+        assert estimate_tokens([msg]) == before + 40 // 4 + _PART_OVERHEAD
+
 
 # ---------------------------------------------------------------------------
 # enforce_token_budget -- truncation (stage 1)
@@ -369,6 +398,30 @@ class TestEnforceTokenBudgetDropping:
             if i == 0:
                 assert isinstance(msg, ModelRequest)
 
+    def test_drops_same_messages_as_reestimating_loop(self):
+        """The running-total drop picks exactly what re-estimating would."""
+        msgs = [
+            _req("q" * 160),
+            _tool_resp("shell"),
+            _tool_resp("read"),  # dangling response
+            _tool_req("read", "r" * 200),
+            _resp("a" * 120),
+            _req("q" * 80),
+            _resp("a" * 200),
+            _resp("b" * 40),
+            _req("q" * 200),
+            _resp("a" * 60),
+            _req("last"),
+        ]
+        for preserve_first in (False, True):
+            for budget in range(60, estimate_tokens(msgs), 15):
+                dropped = _quadratic_drop(msgs, budget, preserve_first)
+                result = enforce_token_budget(msgs, budget=budget, preserve_first=preserve_first)
+                offset = 1 if preserve_first else 0
+                summary = result[offset].parts[0].content
+                assert f"[{len(dropped)} earlier messages dropped" in summary
+                assert result[offset + 1 :] == msgs[offset + len(dropped) :]
+
 
 # ---------------------------------------------------------------------------
 # build_history_processor
@@ -1,10 +1,13 @@
 """End-to-end tests for incremental ingestion."""
 
+import os
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from initrunner.agent.schema.ingestion import ChunkingConfig, EmbeddingConfig, IngestConfig
+from initrunner.ingestion import pipeline
 from initrunner.ingestion.pipeline import FileStatus, run_ingest
 from initrunner.stores.lance_store import LanceDocumentStore
 
@@ -166,3 +169,147 @@ class TestIncrementalIngest:
         assert stats.new == 0
         assert stats.total_chunks == 0
         assert stats.file_results == []
+
+
+class TestChangeDetection:
+    def test_unchanged_files_not_hashed(self, ingest_env):
+        tmp_path, _ = ingest_env
+        (tmp_path / "a.txt").write_text("hello world")
+        run_ingest(_make_config(), "test", base_dir=tmp_path)
+
+        with patch("initrunner.ingestion.pipeline._file_hash") as file_hash:
+            stats = run_ingest(_make_config(), "test", base_dir=tmp_path)
+
+        assert stats.skipped == 1
+        file_hash.assert_not_called()
+
+    def test_verify_hashes_hashes_every_file(self, ingest_env):
+        tmp_path, _ = ingest_env
+        (tmp_path / "a.txt").write_text("hello world")
+        run_ingest(_make_config(), "test", base_dir=tmp_path)
+
+        with patch(
+            "initrunner.ingestion.pipeline._file_hash",
+            wraps=pipeline._file_hash,
+        ) as file_hash:
+            stats = run_ingest(_make_config(), "test", base_dir=tmp_path, verify_hashes=True)
+
+        assert stats.skipped == 1
+        assert file_hash.call_count == 1
+
+    def test_same_size_rewrite_detected(self, ingest_env):
+        tmp_path, _ = ingest_env
+        f = tmp_path / "a.txt"
+        f.write_text("aaaa")
+        run_ingest(_make_config(), "test", base_dir=tmp_path)
+
+        f.write_text("bbbb")
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        stats = run_ingest(_make_config(), "test", base_dir=tmp_path)
+        assert stats.updated == 1
+
+    def test_touched_file_refreshes_stats(self, ingest_env):
+        tmp_path, store_path = ingest_env
+        f = tmp_path / "a.txt"
+        f.write_text("hello world")
+        run_ingest(_make_config(), "test", base_dir=tmp_path)
+
+        st = f.stat()
+        os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        stats = run_ingest(_make_config(), "test", base_dir=tmp_path)
+        assert stats.skipped == 1
+
+        with LanceDocumentStore(store_path, dimensions=4) as store:
+            fp = store.list_file_fingerprints()[str(f)]
+        assert fp.last_modified == f.stat().st_mtime
+        assert fp.size == f.stat().st_size
+
+        with patch("initrunner.ingestion.pipeline._file_hash") as file_hash:
+            stats = run_ingest(_make_config(), "test", base_dir=tmp_path)
+        assert stats.skipped == 1
+        file_hash.assert_not_called()
+
+    def test_new_file_hashed_once(self, ingest_env):
+        tmp_path, store_path = ingest_env
+        f = tmp_path / "a.txt"
+        f.write_text("hello world")
+
+        with patch(
+            "initrunner.ingestion.pipeline._file_hash",
+            wraps=pipeline._file_hash,
+        ) as file_hash:
+            stats = run_ingest(_make_config(), "test", base_dir=tmp_path)
+
+        assert stats.new == 1
+        assert file_hash.call_count == 1
+        with LanceDocumentStore(store_path, dimensions=4) as store:
+            fp = store.list_file_fingerprints()[str(f)]
+        assert fp.content_hash == pipeline._file_hash(f)
+        assert fp.size == len("hello world")
+
+
+class TestUrlConditionalFetch:
+    URL = "https://docs.example.test/page"
+
+    def _serve(self, etag, seen):
+        def handle(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == etag:
+                return httpx.Response(304, headers={"etag": etag})
+            return httpx.Response(
+                200, headers={"content-type": "text/plain", "etag": etag}, text=f"page {etag}"
+            )
+
+        return patch(
+            "initrunner.ingestion.crawler.AsyncSSRFSafeTransport",
+            lambda **kw: httpx.MockTransport(handle),
+        )
+
+    def test_not_modified_url_skipped(self, ingest_env):
+        tmp_path, store_path = ingest_env
+        seen: list[str | None] = []
+
+        with self._serve('"v1"', seen):
+            stats1 = run_ingest(_make_config([self.URL]), "test", base_dir=tmp_path)
+            stats2 = run_ingest(_make_config([self.URL]), "test", base_dir=tmp_path)
+
+        assert stats1.new == 1
+        assert stats2.skipped == 1
+        assert seen == [None, '"v1"']
+        with LanceDocumentStore(store_path, dimensions=4) as store:
+            assert store.list_file_fingerprints()[self.URL].etag == '"v1"'
+
+    def test_changed_validators_recorded_for_unchanged_content(self, ingest_env):
+        tmp_path, store_path = ingest_env
+        seen: list[str | None] = []
+        with self._serve('"v1"', seen):
+            run_ingest(_make_config([self.URL]), "test", base_dir=tmp_path)
+
+        # Same body, new ETag: content hash matches, so only the ETag is stored.
+        def handle(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, headers={"content-type": "text/plain", "etag": '"v2"'}, text='page "v1"'
+            )
+
+        with patch(
+            "initrunner.ingestion.crawler.AsyncSSRFSafeTransport",
+            lambda **kw: httpx.MockTransport(handle),
+        ):
+            stats = run_ingest(_make_config([self.URL]), "test", base_dir=tmp_path)
+
+        assert stats.skipped == 1
+        with LanceDocumentStore(store_path, dimensions=4) as store:
+            assert store.list_file_fingerprints()[self.URL].etag == '"v2"'
+
+    def test_force_sends_no_validators(self, ingest_env):
+        tmp_path, _ = ingest_env
+        seen: list[str | None] = []
+
+        with self._serve('"v1"', seen):
+            run_ingest(_make_config([self.URL]), "test", base_dir=tmp_path)
+            stats = run_ingest(_make_config([self.URL]), "test", base_dir=tmp_path, force=True)
+
+        assert stats.new == 1
+        assert seen == [None, None]
@@ -11,14 +11,18 @@ from pydantic_ai.tools import ToolDefinition
 from initrunner.agent.schema.tools import McpToolConfig
 from initrunner.mcp._cache import (
     CACHE_VERSION,
+    SEARCH_INDEX_VERSION,
     CachedTool,
     cache_age_seconds,
     cache_key,
     diff_schemas,
     invalidate_cache,
     read_cache,
+    read_search_index,
+    search_index_key,
     to_tool_definitions,
     write_cache,
+    write_search_index,
 )
 
 # ---------------------------------------------------------------------------
@@ -171,6 +175,55 @@ class TestCacheAge:
         assert cache_age_seconds("nope") is None
 
 
+# ---------------------------------------------------------------------------
+# tool_search index cache
+# ---------------------------------------------------------------------------
+
+
+class TestSearchIndexCache:
+    def test_key_covers_catalog_contents_and_order(self):
+        a = ("read_file", "Read a file", ["path"])
+        b = ("write_file", "Write a file", ["path", "content"])
+        key = search_index_key([a, b])
+        assert key == search_index_key([a, b])
+        assert key != search_index_key([b, a])
+        assert key != search_index_key([a, (b[0], "Write a file to disk", b[2])])
+
+    def test_round_trip(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        monkeypatch.setattr("initrunner.mcp._cache.get_mcp_cache_dir", lambda: tmp_path)
+        index = {"names": ["read_file"], "lengths": [3], "postings": {"read": [[0, 1, 0, 1]]}}
+        write_search_index("k", index)
+        assert read_search_index("k") == index
+        assert read_search_index("other") is None
+
+    def test_wrong_version_or_corrupt_returns_none(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ):
+        monkeypatch.setattr("initrunner.mcp._cache.get_mcp_cache_dir", lambda: tmp_path)
+        (tmp_path / "search-index-old.json").write_text(json.dumps({"version": 999, "index": {}}))
+        (tmp_path / "search-index-bad.json").write_text("[1, 2")
+        assert read_search_index("old") is None
+        assert read_search_index("bad") is None
+
+    def test_write_keeps_only_recently_used_indexes(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ):
+        import os
+
+        monkeypatch.setattr("initrunner.mcp._cache.get_mcp_cache_dir", lambda: tmp_path)
+        monkeypatch.setattr("initrunner.mcp._cache.SEARCH_INDEX_KEEP", 2)
+        for age, key in enumerate(["new", "mid", "old"]):
+            path = tmp_path / f"search-index-{key}.json"
+            path.write_text(json.dumps({"version": SEARCH_INDEX_VERSION, "index": {}}))
+            stamp = 1_000_000 - age * 100
+            os.utime(path, (stamp, stamp))
+        assert read_search_index("old") == {}  # reading marks it as used
+
+        write_search_index("latest", {})
+        remaining = sorted(p.name for p in tmp_path.glob("search-index-*.json"))
+        assert remaining == ["search-index-latest.json", "search-index-old.json"]
+
+
 # ---------------------------------------------------------------------------
 # diff_schemas
 # ---------------------------------------------------------------------------
@@ -3,16 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import textwrap
 from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
 from initrunner.mcp.gateway import (
     _VALID_TRANSPORTS,
+    METRICS_URI,
+    GatewayMetrics,
+    PassThroughBackend,
     _AgentEntry,
     _make_tool_name,
     _register_agent_tool,
@@ -171,13 +175,13 @@ class TestAgentToolExecution:
         mcp = FastMCP("test")
         entry = _make_entry("bot", "A bot")
 
-        with patch("initrunner.agent.executor.execute_run") as mock_exec:
+        with patch("initrunner.agent.executor.execute_run_async") as mock_exec:
             mock_exec.return_value = (_FakeRunResult(success=True, output="hi there"), [])
             _register_agent_tool(mcp, entry, "bot", None)
-            # Call while patch is active (handler calls execute_run at invocation time)
+            # Call while patch is active (handler calls execute_run_async at invocation time)
             tool = asyncio.run(mcp.get_tool("bot"))
             assert tool is not None
-            result = tool.fn(prompt="hello")  # type: ignore[unresolved-attribute]
+            result = asyncio.run(tool.fn(prompt="hello"))  # type: ignore[unresolved-attribute]
             assert result == "hi there"
 
     def test_failure_returns_error_string(self):
@@ -186,14 +190,14 @@ class TestAgentToolExecution:
         mcp = FastMCP("test")
         entry = _make_entry("bot", "A bot")
 
-        with patch("initrunner.agent.executor.execute_run") as mock_exec:
+        with patch("initrunner.agent.executor.execute_run_async") as mock_exec:
             mock_exec.return_value = (
                 _FakeRunResult(success=False, error="model overloaded"),
                 [],
             )
             _register_agent_tool(mcp, entry, "bot", None)
             tool = asyncio.run(mcp.get_tool("bot"))
-            result = tool.fn(prompt="hello")  # type: ignore[unresolved-attribute]
+            result = asyncio.run(tool.fn(prompt="hello"))  # type: ignore[unresolved-attribute]
             assert result == "Error: model overloaded"
 
     def test_exception_caught(self):
@@ -202,11 +206,11 @@ class TestAgentToolExecution:
         mcp = FastMCP("test")
         entry = _make_entry("bot", "A bot")
 
-        with patch("initrunner.agent.executor.execute_run") as mock_exec:
+        with patch("initrunner.agent.executor.execute_run_async") as mock_exec:
             mock_exec.side_effect = RuntimeError("boom")
             _register_agent_tool(mcp, entry, "bot", None)
             tool = asyncio.run(mcp.get_tool("bot"))
-            result = tool.fn(prompt="hello")  # type: ignore[unresolved-attribute]
+            result = asyncio.run(tool.fn(prompt="hello"))  # type: ignore[unresolved-attribute]
             assert "Internal error" in result
             assert "boom" in result
 
@@ -222,7 +226,7 @@ class TestAgentToolExecution:
             _make_entry("gamma", "Gamma"),
         ]
 
-        with patch("initrunner.agent.executor.execute_run") as mock_exec:
+        with patch("initrunner.agent.executor.execute_run_async") as mock_exec:
 
             def side_effect(agent, role, prompt, **kwargs):
                 # Return which agent name was used
@@ -237,7 +241,86 @@ class TestAgentToolExecution:
 
             for name in ("alpha", "beta", "gamma"):
                 tool = asyncio.run(mcp.get_tool(name))
-                assert tool.fn(prompt="x") == f"from:{name}"  # type: ignore[union-attr]
+                assert asyncio.run(tool.fn(prompt="x")) == f"from:{name}"  # type: ignore[union-attr]
+
+    def test_handler_is_async(self):
+        from fastmcp import FastMCP
+
+        mcp = FastMCP("test")
+        _register_agent_tool(mcp, _make_entry("bot"), "bot", None)
+        tool = asyncio.run(mcp.get_tool("bot"))
+        assert asyncio.iscoroutinefunction(tool.fn)  # type: ignore[union-attr]
+
+    def test_concurrent_calls_capped_per_agent(self):
+        from fastmcp import FastMCP
+
+        mcp = FastMCP("test")
+        active = 0
+        peak = 0
+
+        async def slow_run(agent, role, prompt, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return _FakeRunResult(success=True, output=prompt), []
+
+        with patch("initrunner.agent.executor.execute_run_async", side_effect=slow_run):
+            _register_agent_tool(mcp, _make_entry("bot"), "bot", None, max_concurrency=2)
+            tool = asyncio.run(mcp.get_tool("bot"))
+
+            async def run_many():
+                return await asyncio.gather(
+                    *(tool.fn(prompt=str(i)) for i in range(6))  # type: ignore[union-attr]
+                )
+
+            results = asyncio.run(run_many())
+
+        assert results == [str(i) for i in range(6)]
+        assert peak == 2
+
+    def test_slow_audit_write_does_not_stall_other_calls(self, tmp_path):
+        import time
+
+        from fastmcp import FastMCP
+        from pydantic_ai import Agent
+        from pydantic_ai.models.test import TestModel
+
+        from initrunner.agent.loader import load_role
+
+        mcp = FastMCP("test")
+        write_started: list[float] = []
+
+        def slow_log(record):
+            if record.agent_name == "slow":
+                write_started.append(time.monotonic())
+                time.sleep(1.0)  # a write waiting on a locked audit DB
+
+        audit_logger = MagicMock()
+        audit_logger.log.side_effect = slow_log
+        for name in ("slow", "fast"):
+            entry = _AgentEntry(
+                name=name,
+                description=name,
+                role=load_role(_write_role(tmp_path, name)),
+                agent=Agent(TestModel(custom_output_text=name)),
+                role_path=tmp_path / f"{name}.yaml",
+            )
+            _register_agent_tool(mcp, entry, name, audit_logger)
+        slow_tool = asyncio.run(mcp.get_tool("slow"))
+        fast_tool = asyncio.run(mcp.get_tool("fast"))
+
+        async def main():
+            slow = asyncio.create_task(slow_tool.fn(prompt="x"))  # type: ignore[union-attr]
+            while not write_started:
+                await asyncio.sleep(0.01)
+            fast = await fast_tool.fn(prompt="x")  # type: ignore[union-attr]
+            return fast, time.monotonic() - write_started[0], await slow
+
+        fast, served_after, slow = asyncio.run(main())
+        assert (fast, slow) == ("fast", "slow")
+        assert served_after < 0.5
 
 
 # ---------------------------------------------------------------------------
@@ -461,6 +544,150 @@ class TestPassThroughTools:
         assert len(tools) == 0
 
 
+# ---------------------------------------------------------------------------
+# TestPassThroughBackend
+# ---------------------------------------------------------------------------
+
+
+def _greeter():
+    from fastmcp import FastMCP
+
+    source = FastMCP("source")
+
+    @source.tool
+    def greet(name: str) -> str:
+        return f"hi {name}"
+
+    return source
+
+
+class TestPassThroughBackend:
+    def test_session_is_reused(self):
+        backend = PassThroughBackend("bot", _greeter())
+
+        async def run():
+            first = await backend.client()
+            second = await backend.client()
+            assert first is second
+            assert backend.health().connected
+            await backend.close()
+
+        asyncio.run(run())
+        health = backend.health()
+        assert health.connects == 1
+        assert not health.connected
+
+    def test_health_check_reconnects_dead_session(self):
+        backend = PassThroughBackend("bot", _greeter())
+
+        async def run():
+            client = await backend.client()
+            await client.close()  # the server went away
+            assert await backend.check()
+            assert (await backend.client()).is_connected()
+            await backend.close()
+
+        asyncio.run(run())
+        assert backend.health().connects == 2
+
+    def test_failed_connect_backs_off(self):
+        backend = PassThroughBackend("bot", _greeter())
+        connect = AsyncMock(side_effect=ConnectionError("refused"))
+        backend._client.__aenter__ = connect  # type: ignore[method-assign]
+
+        async def run():
+            with pytest.raises(ConnectionError):
+                await backend.client()
+            with pytest.raises(RuntimeError, match="unavailable"):
+                await backend.client()
+            assert not await backend.check()
+
+        asyncio.run(run())
+        assert connect.await_count == 1
+        health = backend.health()
+        assert health.consecutive_failures == 1
+        assert health.last_error == "refused"
+
+    @patch("initrunner.mcp.gateway._build_pass_through_transport")
+    def test_proxied_calls_share_one_session(self, mock_transport):
+        from fastmcp import Client, FastMCP
+
+        mock_transport.return_value = _greeter()
+        parent = FastMCP("parent")
+        [backend] = _register_pass_through_tools(
+            parent, [TestPassThroughTools()._make_entry_with_mcp("bot")]
+        )
+
+        async def run():
+            async with Client(parent) as client:
+                for name in ("a", "b", "c"):
+                    result = await client.call_tool("bot_greet", {"name": name})
+                    assert result.data == f"hi {name}"
+            await backend.close()
+
+        asyncio.run(run())
+        assert backend.health().connects == 1
+
+
+# ---------------------------------------------------------------------------
+# TestGatewayMetrics
+# ---------------------------------------------------------------------------
+
+
+class TestGatewayMetrics:
+    def test_snapshot(self):
+        metrics = GatewayMetrics()
+        metrics.call_started("bot")
+        metrics.call_started("bot")
+        metrics.call_finished("bot", 0.010)
+        metrics.call_finished("bot", 0.030, error=True)
+        metrics.call_started("bot")
+
+        [stats] = metrics.snapshot()
+        assert (stats.tool, stats.calls, stats.errors, stats.in_flight) == ("bot", 2, 1, 1)
+        assert stats.p50_ms == 30.0
+        assert stats.max_ms == 30.0
+
+    def test_metrics_resource_counts_agent_calls(self, tmp_path):
+        from fastmcp import Client
+
+        outcomes = iter(
+            [
+                (_FakeRunResult(success=True, output="ok"), []),
+                (_FakeRunResult(success=False, error="overloaded"), []),
+            ]
+        )
+
+        with (
+            patch("initrunner.mcp.gateway._load_agents", return_value=[_make_entry("bot")]),
+            patch(
+                "initrunner.agent.executor.execute_run_async",
+                side_effect=lambda *a, **kw: next(outcomes),
+            ),
+        ):
+            mcp = build_mcp_gateway([tmp_path / "bot.yaml"])
+
+            async def run():
+                async with Client(mcp) as client:
+                    await client.call_tool("bot", {"prompt": "1"})
+                    await client.call_tool("bot", {"prompt": "2"})
+                    [content] = await client.read_resource(METRICS_URI)
+                    return json.loads(content.text)  # type: ignore[union-attr]
+
+            report = asyncio.run(run())
+
+        [stats] = report["tools"]
+        assert stats["tool"] == "bot"
+        assert stats["calls"] == 2
+        assert stats["errors"] == 1
+        assert stats["in_flight"] == 0
+        assert report["backends"] == []
+
+    def test_rejects_zero_concurrency(self, tmp_path):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            build_mcp_gateway([tmp_path / "bot.yaml"], max_concurrency=0)
+
+
 class TestGroupExpansion:
     """A group file exposes one MCP tool per member."""
 
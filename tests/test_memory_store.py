@@ -115,6 +115,98 @@ class TestSessionPersistence:
         assert deleted == 3
 
 
+class TestSessionIndexing:
+    def test_list_sessions_uses_stored_summary(self, tmp_path):
+        store_path = tmp_path / "test.lance"
+        with MemoryStore(store_path, dimensions=4) as store:
+            store.save_session("s1", "agent-a", [_make_request("first"), _make_response("ok")])
+            store.save_session("s2", "agent-a", [_make_request("  second question  ")])
+            store.save_session("s1", "agent-a", [_make_request("first again")])
+            store.save_session("s9", "agent-b", [_make_request("other agent")])
+            sessions = store.list_sessions("agent-a")
+
+        assert [s.session_id for s in sessions] == ["s1", "s2"]
+        assert sessions[0].preview == "first again"
+        assert sessions[0].message_count == 1
+        assert sessions[1].preview == "second question"
+
+    def test_latest_session_is_per_agent(self, tmp_path):
+        store_path = tmp_path / "test.lance"
+        with MemoryStore(store_path, dimensions=4) as store:
+            store.save_session("s1", "agent-a", [_make_request("from a")])
+            store.save_session("s2", "agent-b", [_make_request("from b")])
+            loaded = store.load_latest_session("agent-a")
+
+        assert loaded is not None
+        assert loaded[0].parts[0].content == "from a"
+
+    def test_latest_session_falls_back_after_delete(self, tmp_path):
+        store_path = tmp_path / "test.lance"
+        with MemoryStore(store_path, dimensions=4) as store:
+            store.save_session("s1", "agent-a", [_make_request("older")])
+            store.save_session("s2", "agent-a", [_make_request("newer")])
+            assert store.delete_session("s2", "agent-a")
+            loaded = store.load_latest_session("agent-a")
+
+        assert loaded is not None
+        assert loaded[0].parts[0].content == "older"
+
+    def test_load_session_by_id_picks_newest_save(self, tmp_path):
+        store_path = tmp_path / "test.lance"
+        with MemoryStore(store_path, dimensions=4) as store:
+            store.save_session("s1", "agent-a", [_make_request("v1")])
+            store.save_session("s1", "agent-a", [_make_request("v2")])
+            loaded = store.load_session_by_id("s1", "agent-a")
+            missing = store.load_session_by_id("s1", "agent-b")
+
+        assert loaded is not None
+        assert loaded[0].parts[0].content == "v2"
+        assert missing is None
+
+    def test_old_sessions_table_is_backfilled(self, tmp_path):
+        import lancedb
+        import pyarrow as pa
+        from pydantic_ai.messages import ModelMessagesTypeAdapter
+
+        store_path = tmp_path / "test.lance"
+        with MemoryStore(store_path, dimensions=4):
+            pass
+        old_schema = pa.schema(
+            [
+                pa.field("id", pa.int64()),
+                pa.field("session_id", pa.string()),
+                pa.field("agent_name", pa.string()),
+                pa.field("timestamp", pa.string()),
+                pa.field("messages_json", pa.large_string()),
+            ]
+        )
+        data = ModelMessagesTypeAdapter.dump_json([_make_request("legacy prompt")]).decode()
+        db = lancedb.connect(str(store_path))
+        db.create_table(
+            "sessions",
+            data=[
+                {
+                    "id": 1,
+                    "session_id": "old",
+                    "agent_name": "agent-a",
+                    "timestamp": datetime.now(UTC).isoformat(),
+                    "messages_json": data,
+                }
+            ],
+            schema=old_schema,
+            mode="overwrite",
+        )
+
+        with MemoryStore(store_path, dimensions=4) as store:
+            sessions = store.list_sessions("agent-a")
+            loaded = store.load_latest_session("agent-a")
+
+        assert [(s.session_id, s.preview, s.message_count) for s in sessions] == [
+            ("old", "legacy prompt", 1)
+        ]
+        assert loaded is not None
+
+
 class TestLongTermMemory:
     def test_add_and_count_memories(self, tmp_path):
         store_path = tmp_path / "test.lance"
@@ -478,3 +570,31 @@ class TestConsolidation:
         with MemoryStore(store_path, dimensions=4) as store:
             # Should not error
             store.mark_consolidated([], "2026-01-01T00:00:00+00:00")
+
+
+class TestMaintenance:
+    def test_optimize_indexes_and_compacts_memories(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("INITRUNNER_LANCE_OPTIMIZE_EVERY", "0")
+        monkeypatch.setenv("INITRUNNER_LANCE_INDEX_MIN_ROWS", "20")
+        with MemoryStore(tmp_path / "test.lance", dimensions=4) as store:
+            for i in range(24):
+                store.add_memory(f"m{i}", "general", [1.0, i / 10, 0.5, 0.1])
+            before = next(h for h in store.table_health() if h.table == "memories")
+            assert before.fragments == 24
+
+            store.optimize()
+
+            after = next(h for h in store.table_health() if h.table == "memories")
+            assert after.fragments < before.fragments
+            assert (after.indexed_rows, after.unindexed_rows) == (24, 0)
+            assert store.search_memories([1.0, 0.0, 0.5, 0.1], top_k=1)[0][0].content == "m0"
+
+    def test_prune_memories_deletes_in_one_commit(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("INITRUNNER_LANCE_OPTIMIZE_EVERY", "0")
+        with MemoryStore(tmp_path / "test.lance", dimensions=4) as store:
+            for i in range(6):
+                store.add_memory(f"m{i}", "general", [1.0, 0.0, 0.0, 0.0])
+            version = store._db.open_table("memories").version
+            assert store.prune_memories(keep_count=2) == 4
+            assert store._db.open_table("memories").version == version + 1
+            assert store.count_memories() == 2
@@ -15,11 +15,15 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from initrunner.middleware import (
+    GuardMiddleware,
     all_paths_predicate,
     detail_error_response,
+    make_auth_check,
     make_auth_dispatch,
     make_body_size_dispatch,
+    make_https_check,
     make_https_dispatch,
+    make_rate_limit_check,
     make_rate_limit_dispatch,
     make_security_headers_dispatch,
     openai_error_response,
@@ -363,7 +367,7 @@ class TestMakeRateLimitDispatch:
     @pytest.mark.asyncio
     async def test_allows_when_under_limit(self):
         limiter = MagicMock()
-        limiter.allow.return_value = True
+        limiter.acquire.return_value = 0.0
         dispatch = make_rate_limit_dispatch(
             rate_limiter=limiter,
             applies_to=all_paths_predicate(),
@@ -373,12 +377,12 @@ class TestMakeRateLimitDispatch:
         call_next, resp = _make_call_next()
         result = await dispatch(req, call_next)
         assert result is resp
-        limiter.allow.assert_called_once()
+        limiter.acquire.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_denies_when_over_limit(self):
         limiter = MagicMock()
-        limiter.allow.return_value = False
+        limiter.acquire.return_value = 2.5
         dispatch = make_rate_limit_dispatch(
             rate_limiter=limiter,
             applies_to=all_paths_predicate(),
@@ -390,12 +394,41 @@ class TestMakeRateLimitDispatch:
         assert result.status_code == 429
         body = json.loads(result.body)
         assert body["error"]["type"] == "rate_limit_exceeded"
+        assert result.headers["Retry-After"] == "3"
         call_next.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_key_func_selects_bucket(self):
+        limiter = MagicMock()
+        limiter.acquire.return_value = 0.0
+        dispatch = make_rate_limit_dispatch(
+            rate_limiter=limiter,
+            applies_to=all_paths_predicate(),
+            error_response=detail_error_response,
+            key_func=lambda request: request.headers["x-client"],
+        )
+        call_next, _ = _make_call_next()
+        await dispatch(_make_request(headers={"x-client": "abc"}), call_next)
+        limiter.acquire.assert_called_once_with("abc")
+
+    @pytest.mark.asyncio
+    async def test_no_retry_after_when_bucket_never_refills(self):
+        limiter = MagicMock()
+        limiter.acquire.return_value = float("inf")
+        dispatch = make_rate_limit_dispatch(
+            rate_limiter=limiter,
+            applies_to=all_paths_predicate(),
+            error_response=detail_error_response,
+        )
+        call_next, _ = _make_call_next()
+        result = await dispatch(_make_request(), call_next)
+        assert result.status_code == 429
+        assert "Retry-After" not in result.headers
+
     @pytest.mark.asyncio
     async def test_passthrough_for_non_applicable_path(self):
         limiter = MagicMock()
-        limiter.allow.return_value = False  # would deny if checked
+        limiter.acquire.return_value = 2.5  # would deny if checked
         dispatch = make_rate_limit_dispatch(
             rate_limiter=limiter,
             applies_to=prefix_predicate("/api"),
@@ -405,7 +438,7 @@ class TestMakeRateLimitDispatch:
         call_next, resp = _make_call_next()
         result = await dispatch(req, call_next)
         assert result is resp
-        limiter.allow.assert_not_called()
+        limiter.acquire.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -591,3 +624,94 @@ class TestMakeHttpsDispatch:
         call_next, resp = _make_call_next()
         result = await dispatch(req, call_next)
         assert result is resp
+
+
+# ---------------------------------------------------------------------------
+# TestGuardMiddleware
+# ---------------------------------------------------------------------------
+
+
+def _guarded_client(checks):
+    from starlette.applications import Starlette
+    from starlette.responses import PlainTextResponse, StreamingResponse
+    from starlette.routing import Route
+    from starlette.testclient import TestClient
+
+    async def echo(request):
+        return PlainTextResponse(await request.body())
+
+    async def stream(request):
+        async def gen():
+            for part in ("a", "b", "c"):
+                yield part
+
+        return StreamingResponse(gen(), media_type="text/plain")
+
+    app = Starlette(
+        routes=[
+            Route("/echo", echo, methods=["POST"]),
+            Route("/stream", stream),
+        ]
+    )
+    app.add_middleware(GuardMiddleware, checks=checks)
+    return TestClient(app)
+
+
+class TestGuardMiddleware:
+    def test_no_checks_pass_through_body_and_stream(self):
+        client = _guarded_client([])
+        assert client.post("/echo", content=b"payload").text == "payload"
+        assert client.get("/stream").text == "abc"
+
+    def test_first_failing_check_answers(self):
+        limiter = MagicMock()
+        limiter.acquire.return_value = 2.5
+        client = _guarded_client(
+            [
+                make_https_check(
+                    applies_to=all_paths_predicate(), error_response=detail_error_response
+                ),
+                make_rate_limit_check(
+                    rate_limiter=limiter,
+                    applies_to=all_paths_predicate(),
+                    error_response=detail_error_response,
+                ),
+            ]
+        )
+        resp = client.get("/stream")
+        assert resp.status_code == 403
+        # A rejected request never reaches later checks.
+        limiter.acquire.assert_not_called()
+
+    def test_all_checks_pass(self):
+        limiter = MagicMock()
+        limiter.acquire.return_value = 0.0
+        client = _guarded_client(
+            [
+                make_rate_limit_check(
+                    rate_limiter=limiter,
+                    applies_to=all_paths_predicate(),
+                    error_response=detail_error_response,
+                ),
+                make_auth_check(
+                    api_key="k",
+                    applies_to=all_paths_predicate(),
+                    error_response=detail_error_response,
+                ),
+            ]
+        )
+        assert client.get("/stream").status_code == 401
+        resp = client.get("/stream", headers={"Authorization": "Bearer k"})
+        assert resp.status_code == 200
+        assert resp.text == "abc"
+        assert limiter.acquire.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_is_not_checked(self):
+        check = MagicMock()
+        inner = AsyncMock()
+        guard = GuardMiddleware(inner, checks=[check])
+        scope = {"type": "lifespan"}
+        await guard(scope, AsyncMock(), AsyncMock())
+        check.assert_not_called()
+        inner.assert_awaited_once()
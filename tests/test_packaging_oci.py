@@ -1,7 +1,9 @@
 """Tests for OCI reference parsing and client."""
 
+import hashlib
+import io
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -87,125 +89,348 @@ class TestParseOCIRef:
         assert ref.base_url == "https://ghcr.io"
 
 
+class _Response:
+    """Minimal stand-in for an ``http.client.HTTPResponse``."""
+
+    def __init__(self, status=200, body=b"", headers=None, fail_after=None):
+        from email.message import Message
+
+        self.status = status
+        self.headers = Message()
+        for key, value in (headers or {}).items():
+            self.headers[key] = value
+        self._body = io.BytesIO(body)
+        self._fail_after = fail_after
+
+    def read(self, n=-1):
+        if self._fail_after is not None and self._body.tell() >= self._fail_after:
+            raise ConnectionResetError("connection reset by peer")
+        if self._fail_after is not None and n > 0:
+            n = min(n, self._fail_after - self._body.tell())
+        return self._body.read(n)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeRegistry:
+    """In-memory OCI registry that answers ``urllib.request.urlopen`` calls."""
+
+    def __init__(self):
+        self.blobs: dict[str, bytes] = {}
+        self.manifests: dict[str, bytes] = {}
+        self.uploads: dict[str, bytearray] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.fail_patches: set[int] = set()  # 1-based PATCH numbers to drop
+        self.cut_blob_reads_at: int | None = None  # first blob GET dies here
+        self._patches = 0
+
+    @staticmethod
+    def _error(url, code):
+        import urllib.error
+        from email.message import Message
+
+        return urllib.error.HTTPError(url, code, "error", Message(), io.BytesIO(b""))
+
+    @staticmethod
+    def _range(received: bytearray) -> dict[str, str]:
+        # Per the distribution spec: no Range header until a byte has landed.
+        return {"Range": f"0-{len(received) - 1}"} if received else {}
+
+    def urlopen(self, req, timeout=None):
+        import urllib.error
+        from urllib.parse import parse_qs, urlparse
+
+        method = req.get_method()
+        parsed = urlparse(req.full_url)
+        path = parsed.path
+        self.requests.append((method, path))
+
+        if "/blobs/uploads/" in path:
+            session = path.rsplit("/", 1)[1]
+            if method == "POST":
+                session = str(len(self.uploads) + 1)
+                self.uploads[session] = bytearray()
+                return _Response(202, headers={"Location": f"{path}{session}"})
+            received = self.uploads[session]
+            if method == "PATCH":
+                self._patches += 1
+                if self._patches in self.fail_patches:
+                    raise urllib.error.URLError("connection reset")
+                start, _, _end = req.get_header("Content-range").partition("-")
+                if int(start) != len(received):
+                    raise self._error(req.full_url, 416)
+                received.extend(req.data)
+                return _Response(202, headers={"Location": path, **self._range(received)})
+            if method == "GET":
+                return _Response(204, headers=self._range(received))
+            if method == "PUT":
+                received.extend(req.data or b"")
+                digest = parse_qs(parsed.query)["digest"][0]
+                assert digest == f"sha256:{hashlib.sha256(received).hexdigest()}"
+                self.blobs[digest] = bytes(received)
+                return _Response(201)
+
+        if "/blobs/" in path:
+            digest = path.rsplit("/", 1)[1]
+            if digest not in self.blobs:
+                raise self._error(req.full_url, 404)
+            if method == "HEAD":
+                return _Response(200)
+            data = self.blobs[digest]
+            range_header = req.get_header("Range")
+            if range_header:
+                start = int(range_header.removeprefix("bytes=").rstrip("-"))
+                return _Response(206, data[start:])
+            cut, self.cut_blob_reads_at = self.cut_blob_reads_at, None
+            return _Response(200, data, fail_after=cut)
+
+        if "/manifests/" in path:
+            ref = path.rsplit("/", 1)[1]
+            if method == "PUT":
+                digest = f"sha256:{hashlib.sha256(req.data).hexdigest()}"
+                self.manifests[ref] = self.manifests[digest] = req.data
+                return _Response(201, headers={"Docker-Content-Digest": digest})
+            if ref not in self.manifests:
+                raise self._error(req.full_url, 404)
+            return _Response(200, self.manifests[ref])
+
+        raise AssertionError(f"unexpected request {method} {req.full_url}")
+
+    def count(self, method, fragment):
+        return sum(1 for m, p in self.requests if m == method and fragment in p)
+
+
+def _bundle_bytes() -> bytes:
+    """A valid role bundle tarball."""
+    import tarfile
+
+    from initrunner.packaging.bundle import BundleFile, BundleManifest
+
+    role_content = (
+        b"apiVersion: initrunner/v1\nkind: Agent\n"
+        b"metadata:\n  name: test-agent\n"
+        b"spec:\n  role: test\n  model:\n"
+        b"    provider: openai\n    name: gpt-5-mini\n"
+    )
+    manifest = BundleManifest(
+        name="test-agent",
+        version="1.0.0",
+        files=[
+            BundleFile(
+                path="role.yaml",
+                sha256=hashlib.sha256(role_content).hexdigest(),
+                size=len(role_content),
+                kind="role",
+            )
+        ],
+    )
+
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        manifest_bytes = manifest.model_dump_json(indent=2).encode()
+        info = tarfile.TarInfo(name="manifest.json")
+        info.size = len(manifest_bytes)
+        tar.addfile(info, io.BytesIO(manifest_bytes))
+
+        info = tarfile.TarInfo(name="role.yaml")
+        info.size = len(role_content)
+        tar.addfile(info, io.BytesIO(role_content))
+    return buf.getvalue()
+
+
+def _client(tag="1.0", digest="", chunk_size=16):
+    from initrunner.packaging.oci import OCIClient
+
+    ref = OCIRef(registry="ghcr.io", repository="org/test", tag=tag, digest=digest)
+    with patch("initrunner.packaging.oci.resolve_auth", return_value=None):
+        return OCIClient(ref, chunk_size=chunk_size)
+
+
+def _push(registry, tmp_path, data=b"fake bundle content", **kwargs):
+    bundle_path = tmp_path / "test.tar.gz"
+    bundle_path.write_bytes(data)
+    with patch("urllib.request.urlopen", side_effect=registry.urlopen):
+        return _client(**kwargs).push(bundle_path, {"name": "test", "version": "1.0"})
+
+
+@pytest.fixture
+def blob_cache_home(tmp_path, monkeypatch):
+    home = tmp_path / "home"
+    monkeypatch.setenv("INITRUNNER_HOME", str(home))
+    monkeypatch.setenv("INITRUNNER_OCI_CACHE", "1")
+    return home
+
+
 class TestOCIClient:
     def test_push_flow(self, tmp_path):
-        """Test push with mocked HTTP responses."""
-        from initrunner.packaging.oci import OCIClient
+        registry = FakeRegistry()
+        data = b"fake bundle content " * 10
+
+        digest = _push(registry, tmp_path, data)
+
+        layer_digest = f"sha256:{hashlib.sha256(data).hexdigest()}"
+        assert registry.blobs[layer_digest] == data
+        manifest = json.loads(registry.manifests["1.0"])
+        assert manifest["layers"][0] == {
+            "mediaType": "application/vnd.initrunner.role.v1.tar+gzip",
+            "digest": layer_digest,
+            "size": len(data),
+        }
+        assert digest == f"sha256:{hashlib.sha256(registry.manifests['1.0']).hexdigest()}"
+        # 200 bytes in 16-byte PATCH chunks
+        assert registry.count("PATCH", "/blobs/uploads/") == 13
 
-        ref = OCIRef(registry="ghcr.io", repository="org/test", tag="1.0")
+    def test_push_skips_blobs_registry_has(self, tmp_path):
+        registry = FakeRegistry()
+        _push(registry, tmp_path)
+        registry.requests.clear()
 
-        with patch("initrunner.packaging.oci.resolve_auth", return_value=None):
-            client = OCIClient(ref)
+        _push(registry, tmp_path)
 
-        # Mock the HTTP calls
-        bundle_path = tmp_path / "test.tar.gz"
-        bundle_path.write_bytes(b"fake bundle content")
+        assert registry.count("HEAD", "/blobs/") == 2
+        assert registry.count("POST", "/blobs/uploads/") == 0
+        assert registry.count("PUT", "/manifests/") == 1
 
-        config_data = {"name": "test", "version": "1.0"}
+    def test_push_resumes_failed_chunk(self, tmp_path):
+        registry = FakeRegistry()
+        registry.fail_patches = {3}
+        data = bytes(range(100))
 
-        mock_upload_resp = MagicMock()
-        mock_upload_resp.headers = {"Location": "/v2/org/test/blobs/uploads/123"}
-        mock_upload_resp.__enter__ = MagicMock(return_value=mock_upload_resp)
-        mock_upload_resp.__exit__ = MagicMock(return_value=False)
+        _push(registry, tmp_path, data)
 
-        mock_put_resp = MagicMock()
-        mock_put_resp.__enter__ = MagicMock(return_value=mock_put_resp)
-        mock_put_resp.__exit__ = MagicMock(return_value=False)
+        assert registry.blobs[f"sha256:{hashlib.sha256(data).hexdigest()}"] == data
+        assert registry.count("GET", "/blobs/uploads/") == 1
 
-        mock_manifest_resp = MagicMock()
-        mock_manifest_resp.headers = {"Docker-Content-Digest": "sha256:test123"}
-        mock_manifest_resp.__enter__ = MagicMock(return_value=mock_manifest_resp)
-        mock_manifest_resp.__exit__ = MagicMock(return_value=False)
+    @pytest.mark.parametrize(("received", "offset"), [(b"", 0), (b"x", 1), (b"abcd", 4)])
+    def test_upload_status_offset_follows_range_end(self, received, offset):
+        registry = FakeRegistry()
+        registry.uploads["1"] = bytearray(received)
+        url = "https://ghcr.io/v2/org/test/blobs/uploads/1"
 
-        responses = [
-            # blob upload initiate (config)
-            mock_upload_resp,
-            # blob upload complete (config)
-            mock_put_resp,
-            # blob upload initiate (layer)
-            mock_upload_resp,
-            # blob upload complete (layer)
-            mock_put_resp,
-            # manifest PUT
-            mock_manifest_resp,
-        ]
+        with patch("urllib.request.urlopen", side_effect=registry.urlopen):
+            location, next_offset = _client()._upload_status(url)
 
-        with patch("urllib.request.urlopen", side_effect=responses):
-            digest = client.push(bundle_path, config_data)
+        assert location == url
+        assert next_offset == offset
 
-        assert digest == "sha256:test123"
+    def test_push_gives_up_after_repeated_failures(self, tmp_path):
+        registry = FakeRegistry()
+        registry.fail_patches = set(range(1, 100))
+
+        with pytest.raises(OCIError, match="Failed to upload blob"):
+            _push(registry, tmp_path)
 
     def test_pull_flow(self, tmp_path):
-        """Test pull with mocked HTTP responses."""
-        import hashlib
-        import io
-        import tarfile
+        registry = FakeRegistry()
+        _push(registry, tmp_path, _bundle_bytes(), tag="latest")
 
-        from initrunner.packaging.bundle import BundleFile, BundleManifest
-        from initrunner.packaging.oci import OCIClient
+        with patch("urllib.request.urlopen", side_effect=registry.urlopen):
+            result = _client(tag="latest").pull(tmp_path / "extracted")
 
-        ref = OCIRef(registry="ghcr.io", repository="org/test", tag="latest")
+        assert (result / "role.yaml").exists()
+        assert (result / "manifest.json").exists()
+        assert not (result / "bundle.tar.gz").exists()
 
-        with patch("initrunner.packaging.oci.resolve_auth", return_value=None):
-            client = OCIClient(ref)
+    def test_pull_resumes_interrupted_download(self, tmp_path):
+        registry = FakeRegistry()
+        _push(registry, tmp_path, _bundle_bytes())
+        registry.cut_blob_reads_at = 100
+        registry.requests.clear()
 
-        # Create a valid bundle in memory
-        role_content = (
-            b"apiVersion: initrunner/v1\nkind: Agent\n"
-            b"metadata:\n  name: test-agent\n"
-            b"spec:\n  role: test\n  model:\n"
-            b"    provider: openai\n    name: gpt-5-mini\n"
-        )
-        role_sha = hashlib.sha256(role_content).hexdigest()
-
-        manifest = BundleManifest(
-            name="test-agent",
-            version="1.0.0",
-            files=[
-                BundleFile(
-                    path="role.yaml",
-                    sha256=role_sha,
-                    size=len(role_content),
-                    kind="role",
-                )
-            ],
-        )
-
-        buf = io.BytesIO()
-        with tarfile.open(fileobj=buf, mode="w:gz") as tar:
-            manifest_bytes = manifest.model_dump_json(indent=2).encode()
-            info = tarfile.TarInfo(name="manifest.json")
-            info.size = len(manifest_bytes)
-            tar.addfile(info, io.BytesIO(manifest_bytes))
-
-            info = tarfile.TarInfo(name="role.yaml")
-            info.size = len(role_content)
-            tar.addfile(info, io.BytesIO(role_content))
-
-        bundle_bytes = buf.getvalue()
-        layer_digest = f"sha256:{hashlib.sha256(bundle_bytes).hexdigest()}"
-
-        oci_manifest = {
-            "schemaVersion": 2,
-            "layers": [{"digest": layer_digest, "size": len(bundle_bytes)}],
-        }
+        with (
+            patch("initrunner.packaging.oci._READ_BUFFER_BYTES", 64),
+            patch("urllib.request.urlopen", side_effect=registry.urlopen),
+        ):
+            result = _client().pull(tmp_path / "extracted")
 
-        mock_manifest_resp = MagicMock()
-        mock_manifest_resp.read.return_value = json.dumps(oci_manifest).encode()
-        mock_manifest_resp.__enter__ = MagicMock(return_value=mock_manifest_resp)
-        mock_manifest_resp.__exit__ = MagicMock(return_value=False)
+        assert (result / "role.yaml").exists()
+        assert registry.count("GET", "/blobs/sha256:") == 2
+
+    def test_pull_rejects_digest_mismatch(self, tmp_path):
+        registry = FakeRegistry()
+        _push(registry, tmp_path, _bundle_bytes())
+        layer_digest = json.loads(registry.manifests["1.0"])["layers"][0]["digest"]
+        registry.blobs[layer_digest] = b"tampered"
+
+        with patch("urllib.request.urlopen", side_effect=registry.urlopen):
+            with pytest.raises(OCIError, match="digest mismatch"):
+                _client().pull(tmp_path / "extracted")
 
-        mock_blob_resp = MagicMock()
-        mock_blob_resp.read.return_value = bundle_bytes
-        mock_blob_resp.__enter__ = MagicMock(return_value=mock_blob_resp)
-        mock_blob_resp.__exit__ = MagicMock(return_value=False)
+        assert not list((tmp_path / "extracted").glob("bundle.tar.gz*"))
 
-        with patch("urllib.request.urlopen", side_effect=[mock_manifest_resp, mock_blob_resp]):
-            target = tmp_path / "extracted"
-            result = client.pull(target)
+    def test_pull_by_digest_from_cache_is_offline(self, tmp_path, blob_cache_home):
+        registry = FakeRegistry()
+        manifest_digest = _push(registry, tmp_path, _bundle_bytes())
+
+        with patch("urllib.request.urlopen", side_effect=registry.urlopen):
+            _client(digest=manifest_digest).pull(tmp_path / "first")
+        registry.requests.clear()
+
+        with patch("urllib.request.urlopen", side_effect=AssertionError("network used")):
+            result = _client(digest=manifest_digest).pull(tmp_path / "second")
 
         assert (result / "role.yaml").exists()
-        assert (result / "manifest.json").exists()
+
+    def test_pull_by_tag_fetches_only_manifest(self, tmp_path, blob_cache_home):
+        registry = FakeRegistry()
+        _push(registry, tmp_path, _bundle_bytes())
+        registry.requests.clear()
+
+        # The pushed layer went into the cache, so even the first pull skips it.
+        with patch("urllib.request.urlopen", side_effect=registry.urlopen):
+            result = _client().pull(tmp_path / "extracted")
+
+        assert (result / "role.yaml").exists()
+        assert registry.requests == [("GET", "/v2/org/test/manifests/1.0")]
+
+    def test_corrupt_cache_entry_is_downloaded_again(self, tmp_path, blob_cache_home):
+        from initrunner.packaging.blob_cache import get_blob_cache
+
+        registry = FakeRegistry()
+        _push(registry, tmp_path, _bundle_bytes())
+        layer_digest = json.loads(registry.manifests["1.0"])["layers"][0]["digest"]
+        cache = get_blob_cache()
+        assert cache is not None
+        cache.path(layer_digest).write_bytes(b"bit rot")
+
+        with patch("urllib.request.urlopen", side_effect=registry.urlopen):
+            result = _client().pull(tmp_path / "extracted")
+
+        assert (result / "role.yaml").exists()
+        assert registry.count("GET", "/blobs/sha256:") == 1
+        assert cache.get(layer_digest) is not None
+
+    def test_blob_cache_evicts_least_recently_used(self, tmp_path):
+        import os
+
+        from initrunner.packaging.blob_cache import BlobCache
+
+        def _digest(data: bytes) -> str:
+            return f"sha256:{hashlib.sha256(data).hexdigest()}"
+
+        cache = BlobCache(tmp_path / "blobs", max_bytes=250)
+        old, used, new = b"a" * 100, b"b" * 100, b"c" * 100
+        for stamp, data in ((1_000, old), (2_000, used)):
+            path = cache.add_bytes(_digest(data), data)
+            os.utime(path, (stamp, stamp))
+        assert cache.get(_digest(old)) is not None  # a hit makes it recently used
+
+        cache.add_bytes(_digest(new), new)
+
+        assert cache.get(_digest(used)) is None
+        assert cache.get(_digest(old)) is not None
+        assert cache.get(_digest(new)) is not None
+
+    def test_blob_cache_size_from_env(self, blob_cache_home, monkeypatch):
+        from initrunner.packaging.blob_cache import get_blob_cache
+
+        monkeypatch.setenv("INITRUNNER_OCI_CACHE_MAX_MB", "5")
+        cache = get_blob_cache()
+        assert cache is not None and cache.max_bytes == 5 * 1024 * 1024
 
     def test_head_not_found(self):
         """HEAD request returns 404."""
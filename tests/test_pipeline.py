@@ -7,9 +7,11 @@ from initrunner.ingestion.pipeline import (
     IngestStats,
     _content_hash,
     _file_hash,
+    _hash_files,
     _is_url,
     resolve_sources,
 )
+from tests.conftest import serve_urls
 
 
 class TestIsUrl:
@@ -87,6 +89,29 @@ class TestFileHash:
         h2 = _file_hash(f)
         assert h1 != h2
 
+    def test_multi_buffer_file(self, tmp_path):
+        import hashlib
+
+        data = bytes(range(256)) * 9000  # > 2 read buffers
+        f = tmp_path / "big.bin"
+        f.write_bytes(data)
+        assert _file_hash(f) == hashlib.sha256(data).hexdigest()
+
+    def test_hash_files_keeps_order_and_errors(self, tmp_path):
+        paths = []
+        for i in range(5):
+            f = tmp_path / f"{i}.txt"
+            f.write_text(f"file {i}")
+            paths.append(f)
+        paths.insert(2, tmp_path / "missing.txt")
+
+        results = _hash_files(paths)
+
+        assert isinstance(results[2], OSError)
+        assert [r for i, r in enumerate(results) if i != 2] == [
+            _file_hash(p) for i, p in enumerate(paths) if i != 2
+        ]
+
 
 class TestContentHash:
     def test_deterministic(self):
@@ -224,15 +249,13 @@ class TestProgressCallback:
 class TestUrlClassification:
     def test_classify_urls_new(self, tmp_path):
         """URLs not in metadata are classified as NEW."""
-        from unittest.mock import patch
-
         from initrunner.ingestion.pipeline import _classify_urls
 
-        def fake_extract(url, **kw):
+        def fake_extract(url):
             return f"Content from {url}"
 
         stats = IngestStats()
-        with patch("initrunner.ingestion.extractors.extract_url", side_effect=fake_extract):
+        with serve_urls(fake_extract):
             to_process, resolved = _classify_urls(
                 ["https://example.com/page"],
                 {},
@@ -242,7 +265,7 @@ class TestUrlClassification:
             )
 
         assert len(to_process) == 1
-        url, status, text = to_process[0]
+        url, status, text, _validators = to_process[0]
         assert url == "https://example.com/page"
         assert status == FileStatus.NEW
         assert "Content from" in text
@@ -250,20 +273,18 @@ class TestUrlClassification:
 
     def test_classify_urls_skipped(self, tmp_path):
         """URLs with unchanged content hash are SKIPPED."""
-        from unittest.mock import patch
-
         from initrunner.ingestion.pipeline import _classify_urls, _content_hash
 
         content = "Same content"
 
-        def fake_extract(url, **kw):
+        def fake_extract(url):
             return content
 
         existing_hash = _content_hash(content)
         file_metadata = {"https://example.com/page": existing_hash}
 
         stats = IngestStats()
-        with patch("initrunner.ingestion.extractors.extract_url", side_effect=fake_extract):
+        with serve_urls(fake_extract):
             to_process, _resolved = _classify_urls(
                 ["https://example.com/page"],
                 file_metadata,
@@ -277,15 +298,13 @@ class TestUrlClassification:
 
     def test_classify_urls_error_handled(self):
         """URLs that fail to fetch are recorded as errors."""
-        from unittest.mock import patch
-
         from initrunner.ingestion.pipeline import _classify_urls
 
-        def fake_extract(url, **kw):
+        def fake_extract(url):
             raise ConnectionError("connection refused")
 
         stats = IngestStats()
-        with patch("initrunner.ingestion.extractors.extract_url", side_effect=fake_extract):
+        with serve_urls(fake_extract):
             to_process, _resolved = _classify_urls(
                 ["https://down.example.com"],
                 {},
@@ -299,20 +318,18 @@ class TestUrlClassification:
 
     def test_classify_urls_force(self):
         """Force mode classifies all as NEW regardless of hash."""
-        from unittest.mock import patch
-
         from initrunner.ingestion.pipeline import _classify_urls, _content_hash
 
         content = "Same content"
 
-        def fake_extract(url, **kw):
+        def fake_extract(url):
             return content
 
         existing_hash = _content_hash(content)
         file_metadata = {"https://example.com/page": existing_hash}
 
         stats = IngestStats()
-        with patch("initrunner.ingestion.extractors.extract_url", side_effect=fake_extract):
+        with serve_urls(fake_extract):
             to_process, _resolved = _classify_urls(
                 ["https://example.com/page"],
                 file_metadata,
@@ -323,3 +340,124 @@ class TestUrlClassification:
 
         assert len(to_process) == 1
         assert to_process[0][1] == FileStatus.NEW
+
+
+class TestConcurrentPipeline:
+    def _run(self, tmp_path, fake_embed, **concurrency):
+        from unittest.mock import MagicMock, patch
+
+        from initrunner.agent.schema.ingestion import (
+            ChunkingConfig,
+            ConcurrencyConfig,
+            EmbeddingConfig,
+            IngestConfig,
+        )
+        from initrunner.ingestion.pipeline import run_ingest
+
+        config = IngestConfig(
+            sources=["*.txt"],
+            chunking=ChunkingConfig(strategy="fixed", chunk_size=512, chunk_overlap=0),
+            embeddings=EmbeddingConfig(),
+            concurrency=ConcurrencyConfig(**concurrency),
+        )
+        with (
+            patch("initrunner.ingestion.pipeline.create_embedder", return_value=MagicMock()),
+            patch("initrunner.ingestion.pipeline.embed_texts", new=fake_embed),
+            patch(
+                "initrunner.ingestion.pipeline._get_store_path",
+                return_value=tmp_path / "store.db",
+            ),
+        ):
+            return run_ingest(config, "test-agent", base_dir=tmp_path)
+
+    def test_batches_chunks_across_files(self, tmp_path):
+        for i in range(5):
+            (tmp_path / f"f{i}.txt").write_text(f"content of file {i}")
+        batch_sizes: list[int] = []
+
+        async def fake_embed(emb, texts, **kw):
+            batch_sizes.append(len(texts))
+            return [[1.0, 0.0, 0.0, 0.0]] * len(texts)
+
+        stats = self._run(tmp_path, fake_embed, embed_batch_size=2)
+
+        assert stats.new == 5
+        assert batch_sizes == [2, 2, 1]
+        assert (stats.extract.items, stats.embed.items, stats.store.items) == (5, 5, 5)
+        assert stats.embed.per_sec > 0
+
+    def test_bounds_requests_in_flight(self, tmp_path):
+        import asyncio
+
+        # More single-chunk files than the stage queues hold.
+        for i in range(40):
+            (tmp_path / f"f{i:02d}.txt").write_text(f"file number {i}")
+        in_flight = 0
+        peak = 0
+
+        async def fake_embed(emb, texts, **kw):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[1.0, 0.0, 0.0, 0.0]] * len(texts)
+
+        stats = self._run(tmp_path, fake_embed, embed_batch_size=3, embed_concurrency=2)
+
+        assert stats.new == 40
+        assert stats.total_chunks == 40
+        assert peak == 2
+
+    def test_empty_embedding_marks_sources_error(self, tmp_path):
+        (tmp_path / "a.txt").write_text("hello")
+        (tmp_path / "b.txt").write_text("world")
+
+        async def fake_embed(emb, texts, **kw):
+            return []
+
+        stats = self._run(tmp_path, fake_embed)
+
+        assert stats.errored == 2
+        assert stats.new == 0
+        assert all(r.error == "Embedding returned empty" for r in stats.file_results)
+
+    def test_embedding_failure_propagates(self, tmp_path):
+        import pytest
+
+        (tmp_path / "a.txt").write_text("hello")
+
+        async def fake_embed(emb, texts, **kw):
+            raise RuntimeError("rate limited")
+
+        with pytest.raises(RuntimeError, match="rate limited"):
+            self._run(tmp_path, fake_embed)
+
+    def test_ready_sources_share_store_writes(self, tmp_path):
+        from unittest.mock import patch
+
+        from initrunner.stores.lance_document_store import LanceDocumentStore
+
+        for i in range(40):
+            (tmp_path / f"f{i:02d}.txt").write_text(f"file number {i}")
+
+        async def fake_embed(emb, texts, **kw):
+            return [[1.0, 0.0, 0.0, float(i)] for i, _ in enumerate(texts)]
+
+        original = LanceDocumentStore.replace_sources
+        batches: list[int] = []
+
+        def recording(self, replacements, ingested_at):
+            batches.append(len(replacements))
+            return original(self, replacements, ingested_at)
+
+        with patch.object(LanceDocumentStore, "replace_sources", recording):
+            stats = self._run(tmp_path, fake_embed, embed_batch_size=4)
+
+        assert stats.new == 40
+        assert sum(batches) == 40
+        assert len(batches) < 40
+        assert stats.store.items == 40
+        with LanceDocumentStore(tmp_path / "store.db") as store:
+            assert store.count() == 40
+            assert len(store.list_sources()) == 40
@@ -1,10 +1,19 @@
-"""Tests for the token-bucket rate limiter."""
+"""Tests for the token-bucket rate limiters."""
 
 from __future__ import annotations
 
+import math
 import time
 
-from initrunner.server.rate_limiter import TokenBucketRateLimiter
+import pytest
+
+from initrunner.agent.schema.security import RateLimitConfig
+from initrunner.server.rate_limiter import (
+    KeyedRateLimiter,
+    SQLiteRateLimiter,
+    TokenBucketRateLimiter,
+    build_rate_limiter,
+)
 
 
 class TestTokenBucketRateLimiter:
@@ -44,3 +53,105 @@ class TestTokenBucketRateLimiter:
         assert limiter.allow() is False
         time.sleep(0.01)
         assert limiter.allow() is False
+
+    def test_acquire_reports_wait(self):
+        limiter = TokenBucketRateLimiter(rate=2.0, burst=1)
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() == pytest.approx(0.5, abs=0.05)
+
+    def test_zero_rate_wait_is_infinite(self):
+        limiter = TokenBucketRateLimiter(rate=0.0, burst=1)
+        limiter.acquire()
+        assert limiter.acquire() == math.inf
+
+
+class TestKeyedRateLimiter:
+    def test_keys_have_separate_buckets(self):
+        limiter = KeyedRateLimiter(rate=0.0, burst=1)
+        assert limiter.allow("a") is True
+        assert limiter.allow("a") is False
+        assert limiter.allow("b") is True
+
+    def test_refills_per_key(self):
+        limiter = KeyedRateLimiter(rate=100.0, burst=1)
+        assert limiter.allow("a") is True
+        assert limiter.allow("a") is False
+        time.sleep(0.02)
+        assert limiter.allow("a") is True
+
+    def test_lru_bound_evicts_idle_keys(self):
+        limiter = KeyedRateLimiter(rate=0.0, burst=1, max_keys=4, shards=1)
+        for key in "abcde":
+            limiter.acquire(key)
+        assert len(limiter) == 4
+        # "a" was evicted, so it starts again with a full bucket.
+        assert limiter.allow("a") is True
+        assert limiter.allow("e") is False
+
+    def test_recent_use_protects_from_eviction(self):
+        limiter = KeyedRateLimiter(rate=0.0, burst=1, max_keys=2, shards=1)
+        limiter.acquire("a")
+        limiter.acquire("b")
+        limiter.acquire("a")  # "b" is now least recently used
+        limiter.acquire("c")
+        assert limiter.allow("a") is False
+
+
+class TestSQLiteRateLimiter:
+    def test_processes_share_buckets(self, tmp_path):
+        path = tmp_path / "ratelimit.db"
+        first = SQLiteRateLimiter(path, rate=0.0, burst=2)
+        second = SQLiteRateLimiter(path, rate=0.0, burst=2)
+        try:
+            assert first.allow("k") is True
+            assert second.allow("k") is True
+            assert first.allow("k") is False
+            assert second.acquire("k") == math.inf
+            assert second.allow("other") is True
+        finally:
+            first.close()
+            second.close()
+
+    def test_namespaces_are_separate(self, tmp_path):
+        path = tmp_path / "ratelimit.db"
+        a = SQLiteRateLimiter(path, rate=0.0, burst=1, namespace="a")
+        b = SQLiteRateLimiter(path, rate=0.0, burst=1, namespace="b")
+        try:
+            assert a.allow("k") is True
+            assert b.allow("k") is True
+            assert a.allow("k") is False
+        finally:
+            a.close()
+            b.close()
+
+    def test_prune_trims_to_max_keys(self, tmp_path, monkeypatch):
+        from initrunner.server import rate_limiter as rl
+
+        monkeypatch.setattr(rl, "_SQLITE_PRUNE_EVERY", 5)
+        limiter = SQLiteRateLimiter(tmp_path / "r.db", rate=0.0, burst=1, max_keys=3)
+        try:
+            for key in "abcde":
+                limiter.acquire(key)
+            count = limiter._conn.execute("SELECT COUNT(*) FROM buckets").fetchone()[0]
+            assert count == 3
+        finally:
+            limiter.close()
+
+
+class TestBuildRateLimiter:
+    def test_global_default(self):
+        assert isinstance(build_rate_limiter(RateLimitConfig()), TokenBucketRateLimiter)
+
+    def test_keyed(self):
+        limiter = build_rate_limiter(RateLimitConfig(key_by="ip"))
+        assert isinstance(limiter, KeyedRateLimiter)
+        assert isinstance(build_rate_limiter(RateLimitConfig(per_model=True)), KeyedRateLimiter)
+
+    def test_sqlite_under_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("INITRUNNER_HOME", str(tmp_path))
+        limiter = build_rate_limiter(RateLimitConfig(backend="sqlite"), namespace="srv")
+        try:
+            assert isinstance(limiter, SQLiteRateLimiter)
+            assert (tmp_path / "ratelimit.db").exists()
+        finally:
+            limiter.close()
@@ -7,7 +7,12 @@ from unittest.mock import AsyncMock, patch
 import anyio
 import pytest
 
-from initrunner._async import run_sync
+from initrunner._async import (
+    get_shared_loop,
+    run_on_shared_loop,
+    run_on_shared_loop_async,
+    run_sync,
+)
 
 
 async def _double(n: int) -> int:
@@ -42,3 +47,32 @@ async def test_sync_wrapper_from_async_context():
             lambda: run_flow_graph_sync(None, {}, "test")  # type: ignore[arg-type]
         )
         assert result == sentinel
+
+
+async def _current_loop():
+    import asyncio
+
+    return asyncio.get_running_loop()
+
+
+def test_run_on_shared_loop_reuses_one_loop():
+    """run_on_shared_loop() runs every call on the same background loop."""
+    first = run_on_shared_loop(_current_loop())
+    assert run_on_shared_loop(_current_loop()) is first
+    assert first is get_shared_loop()
+    assert run_on_shared_loop(_double(5)) == 10
+
+
+@pytest.mark.asyncio
+async def test_run_on_shared_loop_async_hops_loops():
+    """run_on_shared_loop_async() awaits the shared loop from another running loop."""
+    assert await run_on_shared_loop_async(_current_loop()) is get_shared_loop()
+
+
+def test_run_on_shared_loop_from_shared_thread_does_not_deadlock():
+    """Nested use from inside the shared loop falls back instead of blocking on itself."""
+
+    async def _nested() -> int:
+        return run_on_shared_loop(_double(3))
+
+    assert run_on_shared_loop(_nested()) == 6
@@ -15,7 +15,7 @@ from initrunner.agent.schema.guardrails import Guardrails
 from initrunner.agent.schema.role import AgentSpec, RoleDefinition
 from initrunner.agent.schema.security import RateLimitConfig, SecurityPolicy, ServerConfig
 from initrunner.cli.main import app as cli_app
-from initrunner.server.conversations import ConversationStore
+from initrunner.server.conversations import ConversationStore, ConversationStoreStats
 from initrunner.server.convert import openai_messages_to_pydantic
 from initrunner.server.models import ChatMessage
 
@@ -195,7 +195,7 @@ class TestModelsEndpoint:
 
 
 class TestChatCompletionsEndpoint:
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_non_streaming(self, mock_execute):
         mock_execute.return_value = (
             RunResult(
@@ -225,7 +225,7 @@ class TestChatCompletionsEndpoint:
         assert data["usage"]["completion_tokens"] == 5
         assert "X-Conversation-Id" in resp.headers
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_non_streaming_error(self, mock_execute):
         mock_execute.return_value = (
             RunResult(run_id="test-123", output="", success=False, error="model error"),
@@ -274,7 +274,7 @@ class TestChatCompletionsEndpoint:
         assert resp.status_code == 400
         assert "no user message" in resp.json()["error"]["message"]
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_conversation_id_returned(self, mock_execute):
         mock_execute.return_value = (
             RunResult(run_id="test", output="Hi", success=True),
@@ -290,7 +290,7 @@ class TestChatCompletionsEndpoint:
         assert conv_id is not None
         assert len(conv_id) > 0
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_non_streaming_excludes_null_fields(self, mock_execute):
         mock_execute.return_value = (
             RunResult(
@@ -312,7 +312,7 @@ class TestChatCompletionsEndpoint:
         raw = resp.text
         assert "null" not in raw
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_conversation_tracking_with_header(self, mock_execute):
         mock_execute.return_value = (
             RunResult(run_id="test", output="First reply", success=True),
@@ -496,10 +496,99 @@ class TestRateLimiting:
         client.get("/v1/models")
         resp = client.get("/v1/models")
         assert resp.status_code == 429
+        assert resp.headers["Retry-After"] == "1"
+
+    def test_key_by_ip_gives_each_client_its_own_bucket(self):
+        from initrunner.server.app import create_app
+
+        role = _make_security_role(
+            rate_limit=RateLimitConfig(requests_per_minute=1, burst_size=1, key_by="ip")
+        )
+        app = create_app(MagicMock(), role)
+        first = TestClient(app, client=("10.0.0.1", 1234))
+        second = TestClient(app, client=("10.0.0.2", 1234))
+        assert first.get("/v1/models").status_code == 200
+        assert first.get("/v1/models").status_code == 429
+        assert second.get("/v1/models").status_code == 200
+
+    @staticmethod
+    def _req(auth: str | None = None, host: str = "1.2.3.4", conv: str | None = None):
+        req = MagicMock()
+        req.headers = {}
+        if auth:
+            req.headers["authorization"] = auth
+        if conv:
+            req.headers["x-conversation-id"] = conv
+        req.client.host = host
+        return req
+
+    def test_key_by_api_key_only_trusts_the_configured_key(self):
+        from initrunner.server.app import _rate_limit_key
+
+        valid = _rate_limit_key(self._req("Bearer one"), "api_key", "one")
+        assert valid.startswith("key:") and "one" not in valid
+        # Unknown tokens share the caller's IP bucket, so rotating them
+        # while guessing the key buys no fresh buckets.
+        for token in ("two", "three"):
+            assert _rate_limit_key(self._req(f"Bearer {token}"), "api_key", "one") == "ip:1.2.3.4"
+        assert _rate_limit_key(self._req("Bearer one"), "api_key", None) == "ip:1.2.3.4"
+        assert _rate_limit_key(self._req(None), "api_key", "one") == "ip:1.2.3.4"
+        assert _rate_limit_key(self._req("Bearer one"), "global", "one") == ""
+
+    def test_key_by_conversation_is_scoped_to_the_client(self):
+        from initrunner.server.app import _rate_limit_key
+
+        a = _rate_limit_key(self._req(conv="c1"), "conversation")
+        assert a != _rate_limit_key(self._req(conv="c2"), "conversation")
+        assert a != _rate_limit_key(self._req(conv="c1", host="5.6.7.8"), "conversation")
+        assert _rate_limit_key(self._req(), "conversation") == "ip:1.2.3.4"
+
+    def test_rotating_bearer_tokens_stays_limited(self):
+        from initrunner.server.app import create_app
+
+        role = _make_security_role(
+            rate_limit=RateLimitConfig(requests_per_minute=1, burst_size=1, key_by="api_key")
+        )
+        client = TestClient(create_app(MagicMock(), role, api_key="secret"))
+        assert (
+            client.get("/v1/models", headers={"Authorization": "Bearer guess-1"}).status_code == 401
+        )
+        assert (
+            client.get("/v1/models", headers={"Authorization": "Bearer guess-2"}).status_code == 429
+        )
+        ok = client.get("/v1/models", headers={"Authorization": "Bearer secret"})
+        assert ok.status_code == 200
+
+    def test_sqlite_backend_acquires_off_the_event_loop(self, tmp_path, monkeypatch):
+        import asyncio
+
+        from initrunner.server.app import create_app
+        from initrunner.server.rate_limiter import SQLiteRateLimiter
+
+        monkeypatch.setenv("INITRUNNER_HOME", str(tmp_path))
+        on_loop: list[bool] = []
+        real_acquire = SQLiteRateLimiter.acquire
+
+        def _acquire(self, key=""):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(True)
+            except RuntimeError:
+                on_loop.append(False)
+            return real_acquire(self, key)
+
+        monkeypatch.setattr(SQLiteRateLimiter, "acquire", _acquire)
+        role = _make_security_role(
+            rate_limit=RateLimitConfig(requests_per_minute=1, burst_size=1, backend="sqlite")
+        )
+        client = TestClient(create_app(MagicMock(), role))
+        assert client.get("/v1/models").status_code == 200
+        assert client.get("/v1/models").status_code == 429
+        assert on_loop == [False, False]
 
 
 class TestErrorSanitization:
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_exception_details_not_leaked(self, mock_execute):
         mock_execute.side_effect = RuntimeError("secret database password: hunter2")
         client = _create_test_client()
@@ -512,6 +601,55 @@ class TestErrorSanitization:
         assert resp.json()["error"]["message"] == "Internal server error"
 
 
+class TestAuditWriteOffLoop:
+    def test_slow_audit_write_does_not_stall_other_requests(self):
+        import asyncio
+        import threading
+
+        import httpx
+        from pydantic_ai import Agent
+        from pydantic_ai.models.test import TestModel
+
+        from initrunner.server.app import create_app
+
+        write_started: list[float] = []
+        in_write = threading.Event()
+
+        def slow_log(record):
+            write_started.append(time.monotonic())
+            in_write.set()
+            time.sleep(1.0)  # a write waiting on a locked audit DB
+
+        audit_logger = MagicMock()
+        audit_logger.log.side_effect = slow_log
+        app = create_app(
+            Agent(TestModel(custom_output_text="hi")), _make_role(), audit_logger=audit_logger
+        )
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                run = asyncio.create_task(
+                    client.post(
+                        "/v1/chat/completions",
+                        json={
+                            "model": "test-agent",
+                            "messages": [{"role": "user", "content": "Hi"}],
+                        },
+                    )
+                )
+                await asyncio.to_thread(in_write.wait, 5)
+                health = await client.get("/health")
+                served_after = time.monotonic() - write_started[0]
+                return health, served_after, await run
+
+        health, served_after, completion = asyncio.run(main())
+        assert health.status_code == 200
+        assert served_after < 0.5
+        assert completion.status_code == 200
+        audit_logger.log.assert_called_once()
+
+
 class TestConversationCap:
     def test_max_conversations_evicts_oldest(self):
         store = ConversationStore(max_conversations=2)
@@ -523,6 +661,161 @@ class TestConversationCap:
         assert store.get("conv-2") is not None
         assert store.get("conv-3") is not None
 
+    def test_get_refreshes_lru_order(self):
+        store = ConversationStore(max_conversations=2)
+        store.save("conv-1", [{"fake": "msg1"}])
+        store.save("conv-2", [{"fake": "msg2"}])
+        store.get("conv-1")
+        store.save("conv-3", [{"fake": "msg3"}])
+        assert store.get("conv-2") is None
+        assert store.get("conv-1") is not None
+
+    def test_byte_cap_evicts_least_recently_used(self):
+        from initrunner.server.conversations import estimate_history_bytes
+
+        history = [_text_request("x" * 1000)]
+        size = estimate_history_bytes(history)
+        store = ConversationStore(max_bytes=size * 2)
+        for cid in ("a", "b", "c"):
+            store.save(cid, history)
+        assert store.get("a") is None
+        assert store.stats().conversations == 2
+        assert store.stats().bytes == size * 2
+
+    def test_resave_replaces_size(self):
+        store = ConversationStore()
+        store.save("a", [_text_request("x" * 5000)])
+        big = store.stats().bytes
+        store.save("a", [_text_request("x")])
+        assert store.stats().bytes < big
+
+    def test_sweep_drops_expired(self):
+        store = ConversationStore(ttl_seconds=0.01)
+        store.save("a", [{"fake": "msg"}])
+        store.save("b", [{"fake": "msg"}])
+        time.sleep(0.03)
+        assert store.sweep() == 2
+        assert store.stats() == ConversationStoreStats(conversations=0, bytes=0, spilled=0)
+
+
+def _text_request(text: str):
+    from pydantic_ai.messages import ModelRequest, UserPromptPart
+
+    return ModelRequest(parts=[UserPromptPart(content=text)])
+
+
+class TestConversationEstimate:
+    def test_grows_with_content(self):
+        from initrunner.server.conversations import estimate_history_bytes
+
+        small = estimate_history_bytes([_text_request("hi")])
+        large = estimate_history_bytes([_text_request("hi" * 1000)])
+        assert large - small == 2 * 1000 - 2
+
+    def test_counts_binary_and_tool_args(self):
+        from pydantic_ai.messages import BinaryContent, ModelResponse, ToolCallPart
+
+        from initrunner.server.conversations import estimate_history_bytes
+
+        image = _text_request("")
+        image.parts[0].content = [BinaryContent(data=b"\0" * 4096, media_type="image/png")]
+        call = ModelResponse(parts=[ToolCallPart(tool_name="t", args='{"q": "' + "a" * 500 + '"}')])
+        assert estimate_history_bytes([image]) >= 4096
+        assert estimate_history_bytes([call]) >= 500
+
+
+class TestConversationSpill:
+    def test_evicted_conversation_loads_back_from_disk(self, tmp_path):
+        store = ConversationStore(max_conversations=1, spill_path=tmp_path / "conv.db")
+        store.save("a", [_text_request("first")])
+        store.save("b", [_text_request("second")])
+        assert store.stats().spilled == 1
+        history = store.get("a")
+        assert history is not None
+        assert history[0].parts[0].content == "first"
+        # Loading "a" pushed "b" out to disk in turn.
+        assert store.stats().conversations == 1
+        assert store.get("b")[0].parts[0].content == "second"
+
+    def test_close_persists_across_restart(self, tmp_path):
+        path = tmp_path / "conv.db"
+        store = ConversationStore(spill_path=path)
+        store.save("a", [_text_request("keep me")])
+        store.close()
+
+        reopened = ConversationStore(spill_path=path)
+        history = reopened.get("a")
+        assert history is not None
+        assert history[0].parts[0].content == "keep me"
+        reopened.close()
+
+    def test_expired_spilled_conversation_is_gone(self, tmp_path):
+        path = tmp_path / "conv.db"
+        store = ConversationStore(ttl_seconds=0.01, spill_path=path)
+        store.save("a", [_text_request("old")])
+        store.close()
+        time.sleep(0.03)
+        reopened = ConversationStore(ttl_seconds=0.01, spill_path=path)
+        assert reopened.get("a") is None
+        reopened.close()
+
+    def test_slow_spill_lookup_does_not_stall_other_requests(self, tmp_path, monkeypatch):
+        import asyncio
+        import threading
+
+        import httpx
+        from pydantic_ai import Agent
+        from pydantic_ai.models.test import TestModel
+
+        from initrunner.server.app import create_app
+
+        monkeypatch.setenv("INITRUNNER_HOME", str(tmp_path))
+        load_started: list[float] = []
+        in_load = threading.Event()
+        real_load = ConversationStore._load_spilled_locked
+
+        def slow_load(self, conversation_id, now):
+            load_started.append(time.monotonic())
+            in_load.set()
+            time.sleep(1.0)  # a spill DB locked by another server process
+            return real_load(self, conversation_id, now)
+
+        monkeypatch.setattr(ConversationStore, "_load_spilled_locked", slow_load)
+        role = _make_security_role(server=ServerConfig(persist_conversations=True))
+        app = create_app(Agent(TestModel(custom_output_text="hi")), role)
+
+        async def main():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                run = asyncio.create_task(
+                    client.post(
+                        "/v1/chat/completions",
+                        json={
+                            "model": "test-agent",
+                            "messages": [{"role": "user", "content": "Hi"}],
+                        },
+                        headers={"X-Conversation-Id": "new-conv"},
+                    )
+                )
+                await asyncio.to_thread(in_load.wait, 5)
+                health = await client.get("/health")
+                served_after = time.monotonic() - load_started[0]
+                return health, served_after, await run
+
+        health, served_after, completion = asyncio.run(main())
+        assert health.status_code == 200
+        assert served_after < 0.5
+        assert completion.status_code == 200
+
+    def test_lifespan_closes_store(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("INITRUNNER_HOME", str(tmp_path))
+        from initrunner.server.app import create_app
+
+        role = _make_security_role(server=ServerConfig(persist_conversations=True))
+        with TestClient(create_app(MagicMock(), role)) as client:
+            assert client.get("/health").status_code == 200
+        assert (tmp_path / "server_conversations.db").exists()
+
 
 # ---- CLI tests ----
 
@@ -537,8 +830,8 @@ def _stream_body(content: str = "Hi") -> dict:
 
 
 class TestStreamingEndpoint:
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_uses_executor(self, mock_validate, mock_stream):
         from initrunner.agent.policies import ValidationResult
 
@@ -565,7 +858,7 @@ class TestStreamingEndpoint:
         call_kwargs = mock_stream.call_args
         assert call_kwargs.kwargs.get("on_token") is not None
 
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_blocked_input(self, mock_validate):
         from initrunner.agent.policies import ValidationResult
 
@@ -583,8 +876,8 @@ class TestStreamingEndpoint:
         assert resp.status_code == 400
         assert "Blocked by policy" in resp.json()["error"]["message"]
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_passes_audit_logger(
         self,
         mock_validate,
@@ -613,8 +906,8 @@ class TestStreamingEndpoint:
         call_kwargs = mock_stream.call_args
         assert call_kwargs.kwargs["audit_logger"] is audit
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_returns_conversation_id(
         self,
         mock_validate,
@@ -636,8 +929,8 @@ class TestStreamingEndpoint:
         assert resp.status_code == 200
         assert "X-Conversation-Id" in resp.headers
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_openai_sse_format(
         self,
         mock_validate,
@@ -693,8 +986,8 @@ class TestStreamingEndpoint:
         assert finish_chunk["usage"]["total_tokens"] == 15
         assert chunks[-1] == "[DONE]"
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_exception_handling(
         self,
         mock_validate,
@@ -715,8 +1008,8 @@ class TestStreamingEndpoint:
         assert "secret crash details" not in resp.text
         assert "[DONE]" in resp.text
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_chunks_exclude_null_fields(self, mock_validate, mock_stream):
         from initrunner.agent.policies import ValidationResult
 
@@ -749,8 +1042,8 @@ class TestStreamingEndpoint:
             if line.startswith("data: ") and line != "data: [DONE]":
                 assert "null" not in line
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_multi_turn_with_conversation_id(self, mock_validate, mock_stream):
         from initrunner.agent.policies import ValidationResult
 
@@ -883,8 +1176,8 @@ class TestServeCLICorsFlag:
 class TestNonStreamingValidation:
     """Tests for pre-flight input validation and error classification (fixes #2, #3)."""
 
-    @patch("initrunner.server.app.execute_run_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_non_streaming_blocked_input_returns_400(self, mock_validate, mock_execute):
         from initrunner.agent.policies import ValidationResult
 
@@ -902,7 +1195,7 @@ class TestNonStreamingValidation:
         assert "Blocked by content policy" in resp.json()["error"]["message"]
         mock_execute.assert_not_called()
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_non_streaming_timeout_returns_504(self, mock_execute):
         mock_execute.return_value = (
             RunResult(
@@ -923,7 +1216,7 @@ class TestNonStreamingValidation:
         assert resp.json()["error"]["type"] == "timeout"
         assert resp.json()["error"]["message"] == "Request timed out"
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_non_streaming_output_blocked_returns_400(self, mock_execute):
         mock_execute.return_value = (
             RunResult(
@@ -943,7 +1236,7 @@ class TestNonStreamingValidation:
         assert resp.status_code == 400
         assert resp.json()["error"]["type"] == "content_filter"
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_non_streaming_usage_limit_from_result_returns_400(self, mock_execute):
         mock_execute.return_value = (
             RunResult(
@@ -963,7 +1256,7 @@ class TestNonStreamingValidation:
         assert resp.status_code == 400
         assert resp.json()["error"]["type"] == "context_length_exceeded"
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_non_streaming_model_error_sanitized(self, mock_execute):
         mock_execute.return_value = (
             RunResult(
@@ -1013,8 +1306,8 @@ class TestConversationTrimming:
 class TestStreamingHeaders:
     """Tests for streaming response headers (fix #6)."""
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_has_x_accel_buffering_header(self, mock_validate, mock_stream):
         from initrunner.agent.policies import ValidationResult
 
@@ -1033,25 +1326,67 @@ class TestStreamingHeaders:
         assert resp.headers.get("X-Accel-Buffering") == "no"
 
 
-class TestTokenQueueSize:
-    """Test that token queue is large enough (fix #5)."""
+class TestAsyncExecution:
+    """Runs execute on the server's event loop, bounded by max_concurrent_runs."""
+
+    @patch("initrunner.server.app.execute_run_stream_async")
+    def test_streaming_delivers_every_token(self, mock_stream):
+        # The token channel is unbounded: a long response is never truncated.
+        def fake_stream(agent, role, prompt, *, on_token=None, **kw):
+            for i in range(20_000):
+                on_token(f"t{i} ")
+            return RunResult(run_id="long", output="", success=True), []
+
+        mock_stream.side_effect = fake_stream
+
+        resp = _create_test_client().post("/v1/chat/completions", json=_stream_body())
+        assert resp.status_code == 200
+        assert resp.text.count('"content":"t') == 20_000
+        assert '"content":"t19999 "' in resp.text
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_are_limited(self):
+        import asyncio
+
+        import httpx
+
+        from initrunner.server.app import create_app
+
+        active = 0
+        peak = 0
+
+        async def fake_run(*args, **kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            active -= 1
+            return RunResult(run_id="r", output="ok", success=True), []
 
-    def test_token_queue_max_sufficient(self):
-        # Read the source to verify the constant — the queue is defined inside
-        # create_app so we inspect source.
-        import inspect
+        role = _make_security_role(server=ServerConfig(max_concurrent_runs=2))
+        app = create_app(MagicMock(), role)
+        transport = httpx.ASGITransport(app=app)
+        body = {"messages": [{"role": "user", "content": "Hi"}]}
+        with patch("initrunner.server.app.execute_run_async", new=fake_run):
+            async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+                responses = await asyncio.gather(
+                    *(client.post("/v1/chat/completions", json=body) for _ in range(6))
+                )
+        assert [r.status_code for r in responses] == [200] * 6
+        assert peak == 2
 
-        from initrunner.server import app as app_module
+    def test_max_concurrent_runs_must_be_positive(self):
+        from pydantic import ValidationError
 
-        source = inspect.getsource(app_module)
-        assert "_TOKEN_QUEUE_MAX = 65_536" in source
+        with pytest.raises(ValidationError):
+            ServerConfig(max_concurrent_runs=0)
 
 
 class TestStreamingResultChecks:
     """Tests for streaming handler checking result.success after stream completes."""
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_failed_result_does_not_save_conversation(self, mock_validate, mock_stream):
         from initrunner.agent.policies import ValidationResult
 
@@ -1090,8 +1425,8 @@ class TestStreamingResultChecks:
         ]
         assert len(stop_chunks) == 0
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_output_blocked_sends_content_filter(self, mock_validate, mock_stream):
         from initrunner.agent.policies import ValidationResult
 
@@ -1129,8 +1464,8 @@ class TestStreamingResultChecks:
         assert len(finish_chunks) == 1
         assert finish_chunks[0]["choices"][0]["finish_reason"] == "content_filter"
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_timeout_sends_error_sse(self, mock_validate, mock_stream):
         from initrunner.agent.policies import ValidationResult
 
@@ -1158,8 +1493,8 @@ class TestStreamingResultChecks:
         assert "timeout" in resp.text
         assert "[DONE]" in resp.text
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_success_still_works(self, mock_validate, mock_stream):
         """Regression guard: successful streaming should still save conversation and send stop."""
         from initrunner.agent.policies import ValidationResult
@@ -1205,8 +1540,8 @@ class TestStreamingResultChecks:
 class TestSkipDoubleValidation:
     """Tests that the server passes skip_input_validation=True to avoid double validation."""
 
-    @patch("initrunner.server.app.execute_run_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_non_streaming_passes_skip_input_validation(self, mock_validate, mock_execute):
         from initrunner.agent.policies import ValidationResult
 
@@ -1224,8 +1559,8 @@ class TestSkipDoubleValidation:
         call_kwargs = mock_execute.call_args
         assert call_kwargs.kwargs["skip_input_validation"] is True
 
-    @patch("initrunner.server.app.execute_run_stream_sync")
-    @patch("initrunner.server.app.validate_input")
+    @patch("initrunner.server.app.execute_run_stream_async")
+    @patch("initrunner.server.app.validate_input_async")
     def test_streaming_passes_skip_input_validation(self, mock_validate, mock_stream):
         from initrunner.agent.policies import ValidationResult
 
@@ -46,7 +46,7 @@ class TestModelListing:
 
 
 class TestRouting:
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_model_selects_the_agent(self, mock_exec):
         mock_exec.return_value = _ok("triaged")
         client = _client()
@@ -79,7 +79,7 @@ class TestRouting:
         assert resp.status_code == 400
         assert "unknown model 'nope'" in resp.json()["error"]["message"]
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_single_agent_server_still_ignores_model(self, mock_exec):
         """The long-standing single-agent behaviour is unchanged."""
         mock_exec.return_value = _ok()
@@ -94,7 +94,7 @@ class TestRouting:
 
 
 class TestConversationIsolation:
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_history_does_not_cross_agents(self, mock_exec):
         """One conversation id reused across agents must not share history."""
         mock_exec.return_value = _ok()
@@ -115,7 +115,7 @@ class TestConversationIsolation:
         # The writer starts fresh: no server-side history was handed to it.
         assert mock_exec.call_args.kwargs["message_history"] is None
 
-    @patch("initrunner.server.app.execute_run_sync")
+    @patch("initrunner.server.app.execute_run_async")
     def test_history_is_kept_per_agent(self, mock_exec):
         mock_exec.return_value = _ok()
         client = _client()
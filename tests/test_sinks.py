@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import httpx
+import pytest
 
 from initrunner.agent.executor import RunResult
 from initrunner.agent.schema.role import RoleDefinition
 from initrunner.agent.schema.sinks import CustomSinkConfig, FileSinkConfig, WebhookSinkConfig
-from initrunner.sinks.base import SinkPayload
+from initrunner.sinks.base import SinkBase, SinkPayload
 from initrunner.sinks.dispatcher import SinkDispatcher
 
 
@@ -86,8 +90,7 @@ class TestWebhookSink:
 
         with patch("initrunner.sinks.webhook.httpx.Client") as mock_client_cls:
             mock_client = MagicMock()
-            mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
-            mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+            mock_client_cls.return_value = mock_client
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
             mock_client.request.return_value = mock_response
@@ -112,8 +115,7 @@ class TestWebhookSink:
 
         with patch("initrunner.sinks.webhook.httpx.Client") as mock_client_cls:
             mock_client = MagicMock()
-            mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
-            mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+            mock_client_cls.return_value = mock_client
             mock_response = MagicMock()
             mock_response.raise_for_status = MagicMock()
             mock_client.request.return_value = mock_response
@@ -135,8 +137,7 @@ class TestWebhookSink:
             patch("initrunner.sinks.webhook.time.sleep") as mock_sleep,
         ):
             mock_client = MagicMock()
-            mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
-            mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
+            mock_client_cls.return_value = mock_client
             mock_client.request.side_effect = httpx.HTTPError("fail")
 
             # Should not raise
@@ -156,6 +157,32 @@ class TestWebhookSink:
             # Should not raise
             sink.send(payload)
 
+    def test_client_reused_across_sends_and_closed(self):
+        from initrunner.sinks.webhook import WebhookSink
+
+        sink = WebhookSink(url="https://example.com/hook")
+        with patch("initrunner.sinks.webhook.httpx.Client") as mock_client_cls:
+            sink.send(_make_payload())
+            sink.send(_make_payload())
+            sink.close()
+
+            mock_client_cls.assert_called_once()
+            assert mock_client_cls.return_value.request.call_count == 2
+            mock_client_cls.return_value.close.assert_called_once()
+
+    def test_inline_retry_waits_one_second(self):
+        from initrunner.sinks.webhook import WebhookSink
+
+        sink = WebhookSink(url="https://example.com/hook", retry_count=3)
+        with (
+            patch("initrunner.sinks.webhook.httpx.Client") as mock_client_cls,
+            patch("initrunner.sinks.webhook.time.sleep") as mock_sleep,
+        ):
+            mock_client_cls.return_value.request.side_effect = httpx.HTTPError("fail")
+            sink.send(_make_payload())
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1, 1, 1]
+
 
 class TestFileSink:
     def test_write_json(self, tmp_path):
@@ -231,6 +258,23 @@ class TestFileSink:
         content = out.read_text()
         assert "ERROR: something broke" in content
 
+    def test_deliver_batch_appends_all(self, tmp_path):
+        from initrunner.sinks.file import FileSink
+
+        out = tmp_path / "results.jsonl"
+        sink = FileSink(path=str(out), fmt="json")
+        sink.deliver_batch([_make_payload(output=str(i)) for i in range(5)])
+
+        lines = out.read_text().strip().split("\n")
+        assert [json.loads(line)["output"] for line in lines] == ["0", "1", "2", "3", "4"]
+
+    def test_deliver_raises(self):
+        from initrunner.sinks.file import FileSink
+
+        sink = FileSink(path="/dev/null/impossible/file.jsonl", fmt="json")
+        with pytest.raises(OSError):
+            sink.deliver(_make_payload())
+
 
 class TestCustomSink:
     def test_calls_function(self):
@@ -356,6 +400,327 @@ class TestSinkDispatcher:
         dispatcher = SinkDispatcher(configs, role, role_dir=tmp_path)  # type: ignore[invalid-argument-type]
         assert dispatcher.count == 1
 
+    def test_background_dispatch_is_queued_and_drained(self, tmp_path):
+        role = RoleDefinition.model_validate(_make_role_data())
+        out = tmp_path / "results.jsonl"
+        dispatcher = SinkDispatcher(
+            [FileSinkConfig(path=str(out))],  # type: ignore[list-item]
+            role,
+            background=True,
+        )
+        for i in range(3):
+            dispatcher.dispatch(RunResult(run_id=f"r{i}", output="ok", success=True), "p")
+        dispatcher.close()
+
+        lines = out.read_text().strip().split("\n")
+        assert [json.loads(line)["run_id"] for line in lines] == ["r0", "r1", "r2"]
+        (stats,) = dispatcher.delivery_stats()
+        assert (stats.enqueued, stats.delivered, stats.failed) == (3, 3, 0)
+
+
+class _RecordingSink(SinkBase):
+    def __init__(self, *, fail_times: int = 0, max_attempts: int = 1, batch_size: int = 1):
+        self.fail_times = fail_times
+        self.max_attempts = max_attempts
+        self.batch_size = batch_size
+        self.delivered: list[str] = []
+        self.batches: list[int] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.closed = False
+
+    def send(self, payload: SinkPayload) -> None:
+        raise AssertionError("background delivery must not call send()")
+
+    def deliver(self, payload: SinkPayload) -> None:
+        self.gate.wait(5)
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise RuntimeError("endpoint down")
+        self.delivered.append(payload.run_id)
+
+    def deliver_batch(self, payloads: list[SinkPayload]) -> None:
+        self.batches.append(len(payloads))
+        for p in payloads:
+            self.deliver(p)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.005)
+
+
+def _outbox_rows(db_path, sink_key: str) -> list[tuple]:
+    """Every outbox row for *sink_key*, leased or not."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT id, owner FROM sink_outbox WHERE sink_key = ?", (sink_key,)
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.fixture()
+def fast_backoff():
+    with patch("initrunner.sinks._delivery.backoff_delay", return_value=0.01) as backoff:
+        yield backoff
+
+
+class TestSinkDeliveryWorker:
+    def test_submit_does_not_wait_for_slow_sink(self):
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        sink = _RecordingSink()
+        sink.gate.clear()
+        worker = SinkDeliveryWorker(sink, name="slow")
+        start = time.monotonic()
+        assert worker.submit(_make_payload(run_id="a"))
+        assert time.monotonic() - start < 1.0
+        assert sink.delivered == []
+        sink.gate.set()
+        assert worker.flush(5)
+        assert sink.delivered == ["a"]
+        worker.close(5)
+        assert sink.closed
+
+    def test_failed_delivery_retried_with_backoff(self, fast_backoff):
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        sink = _RecordingSink(fail_times=2, max_attempts=3)
+        worker = SinkDeliveryWorker(sink, name="flaky")
+        worker.submit(_make_payload(run_id="a"))
+        worker.submit(_make_payload(run_id="b"))
+        _wait_for(lambda: worker.stats().delivered == 2)
+        worker.close(5)
+
+        assert sorted(sink.delivered) == ["a", "b"]
+        assert worker.stats().retried == 2
+        assert [c.args[0] for c in fast_backoff.call_args_list] == [1, 1]
+
+    def test_retries_do_not_block_newer_payloads(self):
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        sink = _RecordingSink(fail_times=1, max_attempts=2)
+        worker = SinkDeliveryWorker(sink, name="flaky")  # real 1s backoff
+        worker.submit(_make_payload(run_id="a"))
+        worker.submit(_make_payload(run_id="b"))
+        assert worker.flush(5)
+        assert sink.delivered == ["b"]
+        assert worker.stats().pending_retries == 1
+        _wait_for(lambda: sink.delivered == ["b", "a"])
+        worker.close(5)
+
+    def test_gives_up_after_max_attempts(self, fast_backoff):
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        sink = _RecordingSink(fail_times=10, max_attempts=2)
+        worker = SinkDeliveryWorker(sink, name="down")
+        worker.submit(_make_payload())
+        _wait_for(lambda: worker.stats().failed == 1)
+        worker.close(5)
+        assert sink.delivered == []
+
+    def test_close_runs_waiting_retries(self):
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        sink = _RecordingSink(fail_times=1, max_attempts=3)
+        worker = SinkDeliveryWorker(sink, name="flaky")  # real 1s backoff
+        worker.submit(_make_payload(run_id="a"))
+        _wait_for(lambda: worker.stats().pending_retries == 1)
+        worker.close(30)
+
+        assert sink.delivered == ["a"]
+        assert worker.stats().delivered == 1
+        assert worker.stats().pending_retries == 0
+        assert sink.closed
+
+    def test_close_abandons_retries_due_after_timeout(self):
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        sink = _RecordingSink(fail_times=1, max_attempts=3)
+        worker = SinkDeliveryWorker(sink, name="flaky")  # real 1s backoff
+        worker.submit(_make_payload(run_id="a"))
+        _wait_for(lambda: worker.stats().pending_retries == 1)
+        started = time.monotonic()
+        worker.close(0.2)
+
+        assert time.monotonic() - started < 0.5
+        assert sink.delivered == []
+        assert worker.stats().pending_retries == 1
+
+    def test_queued_payloads_delivered_in_batches(self):
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        sink = _RecordingSink(batch_size=10)
+        sink.gate.clear()
+        worker = SinkDeliveryWorker(sink, name="batch")
+        worker.submit(_make_payload(run_id="0"))
+        _wait_for(lambda: worker.stats().queue_depth == 0)  # "0" holds the worker
+        for i in range(1, 6):
+            worker.submit(_make_payload(run_id=str(i)))
+        sink.gate.set()
+        worker.close(5)
+
+        assert sink.batches == [5]  # single payloads go through deliver()
+        assert sink.delivered == ["0", "1", "2", "3", "4", "5"]
+
+    def test_drop_overflow_policy(self):
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        sink = _RecordingSink()
+        sink.gate.clear()
+        worker = SinkDeliveryWorker(sink, name="full", queue_size=1, overflow="drop")
+        worker.submit(_make_payload(run_id="a"))
+        _wait_for(lambda: worker.stats().queue_depth == 0)  # "a" is being delivered
+        assert worker.submit(_make_payload(run_id="b"))
+        assert not worker.submit(_make_payload(run_id="c"))
+        sink.gate.set()
+        worker.close(5)
+        assert sink.delivered == ["a", "b"]
+        assert worker.stats().dropped == 1
+
+
+class TestSinkOutbox:
+    def test_undelivered_payload_survives_restart(self, tmp_path):
+        from initrunner.audit.logger import AuditLogger
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        audit = AuditLogger(tmp_path / "audit.db")
+        try:
+            down = _RecordingSink(fail_times=1, max_attempts=2)
+            worker = SinkDeliveryWorker(down, name="hook", outbox=audit, outbox_key="agent:0")
+            worker.submit(_make_payload(run_id="kept", trigger_metadata={"k": "v"}))
+            _wait_for(lambda: worker.stats().pending_retries == 1)
+            worker.close(0.2)  # shuts down before the 1s retry falls due
+            assert len(_outbox_rows(tmp_path / "audit.db", "agent:0")) == 1
+
+            up = _RecordingSink()
+            worker = SinkDeliveryWorker(up, name="hook", outbox=audit, outbox_key="agent:0")
+            assert worker.flush(5)
+            worker.close(5)
+            assert up.delivered == ["kept"]
+            assert _outbox_rows(tmp_path / "audit.db", "agent:0") == []
+        finally:
+            audit.close()
+
+    def test_delivered_and_abandoned_entries_removed(self, tmp_path, fast_backoff):
+        from initrunner.audit.logger import AuditLogger
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        audit = AuditLogger(tmp_path / "audit.db")
+        try:
+            sink = _RecordingSink(fail_times=1)
+            worker = SinkDeliveryWorker(sink, name="hook", outbox=audit, outbox_key="agent:0")
+            worker.submit(_make_payload(run_id="fails"))
+            worker.submit(_make_payload(run_id="ok"))
+            worker.close(5)
+            assert sink.delivered == ["ok"]
+            assert _outbox_rows(tmp_path / "audit.db", "agent:0") == []
+        finally:
+            audit.close()
+
+    def test_entries_of_a_live_worker_are_not_claimed(self, tmp_path):
+        from initrunner.audit.logger import AuditLogger
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        audit = AuditLogger(tmp_path / "audit.db")
+        try:
+            down = _RecordingSink(fail_times=1, max_attempts=2)
+            first = SinkDeliveryWorker(down, name="hook", outbox=audit, outbox_key="agent:0")
+            first.submit(_make_payload(run_id="in-flight"))
+            _wait_for(lambda: first.stats().pending_retries == 1)
+
+            other = _RecordingSink()
+            second = SinkDeliveryWorker(other, name="hook", outbox=audit, outbox_key="agent:0")
+            assert second.flush(5)
+            second.close(5)
+            assert other.delivered == []
+
+            first.close(30)
+            assert down.delivered == ["in-flight"]
+            assert _outbox_rows(tmp_path / "audit.db", "agent:0") == []
+        finally:
+            audit.close()
+
+    def test_leases_renewed_during_a_long_retry_burst(self, tmp_path, monkeypatch, fast_backoff):
+        from initrunner.audit.logger import AuditLogger
+        from initrunner.sinks import _delivery
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        monkeypatch.setattr(_delivery, "_OUTBOX_LEASE_SECONDS", 1.0)
+        monkeypatch.setattr(_delivery, "_OUTBOX_RENEW_SECONDS", 0.2)
+
+        class _SlowRetrySink(_RecordingSink):
+            def __init__(self):
+                super().__init__(max_attempts=2)
+                self.failed_once: set[str] = set()
+
+            def deliver(self, payload):
+                if payload.run_id not in self.failed_once:
+                    self.failed_once.add(payload.run_id)
+                    raise RuntimeError("endpoint down")
+                time.sleep(0.3)  # a slow endpoint
+                self.delivered.append(payload.run_id)
+
+        audit = AuditLogger(tmp_path / "audit.db")
+        try:
+            sink = _SlowRetrySink()
+            worker = SinkDeliveryWorker(sink, name="hook", outbox=audit, outbox_key="agent:0")
+            for i in range(6):
+                worker.submit(_make_payload(run_id=str(i)))
+            # The retries take ~1.8s in all, well past the 1s lease.
+            stolen = []
+            deadline = time.monotonic() + 10
+            while len(sink.delivered) < 6 and time.monotonic() < deadline:
+                stolen += audit.claim_sink_deliveries("agent:0", "other", lease_seconds=60)
+                time.sleep(0.05)
+            worker.close(5)
+            assert stolen == []
+            assert sorted(sink.delivered) == [str(i) for i in range(6)]
+        finally:
+            audit.close()
+
+    def test_expired_lease_is_claimed(self, tmp_path):
+        from initrunner.audit.logger import AuditLogger
+        from initrunner.sinks._delivery import SinkDeliveryWorker
+
+        audit = AuditLogger(tmp_path / "audit.db")
+        try:
+            payload = json.dumps(_make_payload(run_id="orphan").to_dict())
+            audit.add_sink_delivery("agent:0", payload, owner="crashed", lease_seconds=-1)
+
+            sink = _RecordingSink()
+            worker = SinkDeliveryWorker(sink, name="hook", outbox=audit, outbox_key="agent:0")
+            assert worker.flush(5)
+            worker.close(5)
+            assert sink.delivered == ["orphan"]
+            assert _outbox_rows(tmp_path / "audit.db", "agent:0") == []
+        finally:
+            audit.close()
+
+    def test_outbox_key_stable_per_config(self):
+        from initrunner.sinks.dispatcher import _outbox_key
+
+        a = WebhookSinkConfig(url="https://example.com/a")
+        b = WebhookSinkConfig(url="https://example.com/b")
+        assert _outbox_key("agent", 0, a) == _outbox_key("agent", 0, a)
+        assert _outbox_key("agent", 0, a) != _outbox_key("agent", 0, b)
+        assert _outbox_key("agent", 0, a) != _outbox_key("agent", 1, a)
+
+    def test_env_toggle(self, monkeypatch):
+        from initrunner.sinks.dispatcher import sink_outbox_enabled
+
+        monkeypatch.delenv("INITRUNNER_SINK_OUTBOX", raising=False)
+        assert not sink_outbox_enabled()
+        monkeypatch.setenv("INITRUNNER_SINK_OUTBOX", "1")
+        assert sink_outbox_enabled()
+
 
 class TestChannelSinkBridge:
     def test_send_with_channel_target(self):
@@ -45,6 +45,16 @@ def _wait_for_port(port: int, timeout: float = 5.0) -> None:
     raise TimeoutError(f"Port {port} not ready within {timeout}s")
 
 
+def _wait_until(predicate, timeout: float = 5.0) -> bool:
+    """Poll *predicate* until true; daemon runs finish on a worker thread."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
 def _sign_body(body: bytes, secret: str) -> dict[str, str]:
     """Compute X-Hub-Signature-256 header dict for the given body and secret."""
     sig = "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
@@ -431,8 +441,8 @@ class TestDaemonRunner:
                     headers=_sign_body(body, secret),
                 )
                 assert execute_called.wait(timeout=5)
-                # The callback runs synchronously in the request handler,
-                # so dispatch has been called by the time we get the response.
+                # The webhook only queues the event; a worker dispatches after the run.
+                assert _wait_until(lambda: sink_dispatcher.dispatch.called)
                 sink_dispatcher.dispatch.assert_called_once()
             finally:
                 if captured_handlers:
@@ -483,7 +493,8 @@ class TestDaemonRunner:
                     headers=_sign_body(body, secret),
                 )
                 assert execute_called.wait(timeout=5)
-                # Callback is synchronous — prune_sessions runs before response.
+                # The webhook only queues the event; a worker prunes after the run.
+                assert _wait_until(lambda: memory_store.prune_sessions.called)
                 assert role.spec.memory is not None
                 memory_store.prune_sessions.assert_called_once_with(
                     "test-agent", role.spec.memory.max_sessions
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from initrunner.team.runner import (
@@ -1271,3 +1272,75 @@ class TestReferencedPersonaRuntime:
         assert result.success is True
         role_dirs = {call.kwargs["role_dir"] for call in mock_build.call_args_list}
         assert role_dirs == {roles_dir.resolve(), tmp_path}
+
+
+class TestPersonaAgentCache:
+    """Built persona agents are reused across team runs."""
+
+    @patch("initrunner.agent.loader.build_agent")
+    @patch("initrunner.agent.executor.execute_run")
+    @patch("initrunner.agent.loader._load_dotenv")
+    def test_repeated_runs_reuse_agents(self, mock_dotenv, mock_exec, mock_build, tmp_path):
+        team = _make_team()
+        mock_build.side_effect = lambda role, role_dir=None: MagicMock(name=role.metadata.name)
+        mock_exec.side_effect = _parallel_side_effect(
+            {"alpha": _ok_result("r1", "a"), "bravo": _ok_result("r2", "b")}
+        )
+
+        run_team(team, "first task", team_dir=tmp_path)
+        run_team(team, "second task", team_dir=tmp_path)
+        run_team_parallel(team, "third task", team_dir=tmp_path)
+
+        assert mock_build.call_count == 2
+        agents = {
+            (c.kwargs["trigger_metadata"]["agent_name"], id(c.args[0]))
+            for c in mock_exec.call_args_list
+        }
+        assert len(agents) == 2
+
+    @patch("initrunner.agent.loader.build_agent")
+    @patch("initrunner.agent.executor.execute_run")
+    @patch("initrunner.agent.loader._load_dotenv")
+    def test_shared_store_path_is_part_of_key(self, mock_dotenv, mock_exec, mock_build, tmp_path):
+        mock_build.return_value = MagicMock()
+        mock_exec.side_effect = _parallel_side_effect(
+            {"alpha": _ok_result("r1", "a"), "bravo": _ok_result("r2", "b")}
+        )
+
+        for store in ("one.db", "two.db", "one.db"):
+            team = _make_team(shared_memory={"enabled": True, "store_path": str(tmp_path / store)})
+            run_team(team, "task", team_dir=tmp_path)
+
+        assert mock_build.call_count == 4
+
+    @patch("initrunner.agent.loader.build_agent")
+    @patch("initrunner.agent.executor.execute_run")
+    @patch("initrunner.agent.loader._load_dotenv")
+    def test_member_role_file_change_rebuilds(self, mock_dotenv, mock_exec, mock_build, tmp_path):
+        team, roles_dir = TestReferencedPersonaRuntime._team_with_reference(tmp_path)
+        assert team.member_role_file("researcher") == (roles_dir / "researcher.yaml").resolve()
+        mock_build.return_value = MagicMock()
+        mock_exec.side_effect = _parallel_side_effect(
+            {"researcher": _ok_result("r1", "a"), "writer": _ok_result("r2", "b")}
+        )
+
+        run_team(team, "task", team_dir=tmp_path)
+        run_team(team, "task", team_dir=tmp_path)
+        assert mock_build.call_count == 2
+
+        role_file = roles_dir / "researcher.yaml"
+        role_file.write_text(role_file.read_text() + "description: edited\n")
+        run_team(team, "task", team_dir=tmp_path)
+
+        assert mock_build.call_count == 3
+        assert mock_build.call_args.args[0].metadata.name == "researcher"
+
+    def test_environment_is_part_of_key(self):
+        from initrunner.team.agents import persona_cache_key
+
+        role = _persona_to_role("alpha", _make_team().spec.personas["alpha"], _make_team())
+
+        key = persona_cache_key(role, None, {"REGION": "eu"})
+        assert persona_cache_key(role, None, {"REGION": "eu"}) == key
+        assert persona_cache_key(role, None, {"REGION": "us"}) != key
+        assert persona_cache_key(role, Path("/other"), {"REGION": "eu"}) != key
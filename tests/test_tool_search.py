@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import threading
 from unittest.mock import MagicMock, patch
 
@@ -156,6 +157,45 @@ class TestBM25Index:
         assert len(results) >= 1
         assert results[0][0] == "send_notification"
 
+    def test_query_extending_a_token_matches(self):
+        idx = _BM25Index()
+        idx.add("send_email", "Send an email", ["recipient"])
+        idx.add("read_file", "Read a file", ["path"])
+        idx.build()
+
+        # "emails" extends the indexed token "email"
+        results = idx.search("emails")
+        assert [name for name, _ in results] == ["send_email"]
+
+    def test_exact_match_outranks_prefix_match(self):
+        idx = _BM25Index()
+        idx.add("list_files", "List files in a directory", ["path"])
+        idx.add("list_filesystems", "List mounted filesystems", [])
+        idx.build()
+
+        results = idx.search("files")
+        assert results[0][0] == "list_files"
+        assert results[1][0] == "list_filesystems"
+        assert results[0][1] > results[1][1]
+
+    def test_round_trip_through_dict(self):
+        idx = _BM25Index()
+        idx.add("send_slack_message", "Send a message to a Slack channel", ["channel", "text"])
+        idx.add("read_file", "Read contents of a file from disk", ["path"])
+        idx.add("send_notification", "Send a push notification", ["device_id"])
+        idx.build()
+
+        loaded = _BM25Index.from_dict(json.loads(json.dumps(idx.to_dict())))
+        assert len(loaded) == 3
+        for query in ("slack", "send", "notif", "file path", "nothing here"):
+            assert loaded.search(query) == idx.search(query)
+
+    def test_from_dict_rejects_malformed_data(self):
+        with pytest.raises((KeyError, TypeError, ValueError, IndexError)):
+            _BM25Index.from_dict(
+                {"names": ["a"], "lengths": [1], "postings": {"a": [[5, 1, 0, 0]]}}
+            )
+
     def test_no_match(self):
         idx = _BM25Index()
         idx.add("read_file", "Read a file from disk", ["path"])
@@ -304,6 +344,43 @@ class TestToolSearchManager:
 
         assert errors == [], f"Concurrent search errors: {errors}"
 
+    def test_persist_index_reused_across_managers(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("initrunner.mcp._cache.get_mcp_cache_dir", lambda: tmp_path)
+        tool_defs = self._sample_tool_defs()
+        ctx = MagicMock()
+
+        first = ToolSearchManager(always_available=[], persist_index=True)
+        asyncio.run(first.prepare_tools_callback(ctx, tool_defs))
+        assert len(list(tmp_path.glob("search-index-*.json"))) == 1
+
+        second = ToolSearchManager(always_available=[], persist_index=True)
+        with patch.object(_BM25Index, "add", side_effect=AssertionError("rebuilt")):
+            asyncio.run(second.prepare_tools_callback(ctx, tool_defs))
+        assert second.search("slack") == first.search("slack")
+
+    def test_persist_index_rebuilds_corrupt_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("initrunner.mcp._cache.get_mcp_cache_dir", lambda: tmp_path)
+        tool_defs = self._sample_tool_defs()
+        ctx = MagicMock()
+
+        asyncio.run(
+            ToolSearchManager(always_available=[], persist_index=True).prepare_tools_callback(
+                ctx, tool_defs
+            )
+        )
+        (path,) = tmp_path.glob("search-index-*.json")
+        path.write_text(json.dumps({"version": 1, "index": {"names": ["x"], "lengths": []}}))
+
+        manager = ToolSearchManager(always_available=[], persist_index=True)
+        asyncio.run(manager.prepare_tools_callback(ctx, tool_defs))
+        assert "send_slack_message" in manager.search("slack")
+
+    def test_no_persistence_by_default(self, monkeypatch, tmp_path):
+        monkeypatch.setattr("initrunner.mcp._cache.get_mcp_cache_dir", lambda: tmp_path)
+        manager = ToolSearchManager(always_available=[])
+        asyncio.run(manager.prepare_tools_callback(MagicMock(), self._sample_tool_defs()))
+        assert list(tmp_path.iterdir()) == []
+
 
 # ---------------------------------------------------------------------------
 # build_tool_search_toolset
@@ -411,3 +411,214 @@ class TestHybridSearch:
             )
             assert len(results) == 2
             assert any("python" in r.text for r in results)
+
+
+class TestReplaceSources:
+    def test_replaces_many_sources_in_one_batch(self, tmp_path):
+        from initrunner.stores.base import SourceReplacement
+
+        vec = [1.0, 0.0, 0.0, 0.0]
+        with LanceDocumentStore(tmp_path / "test.lance", dimensions=4) as store:
+            store.replace_source("a.txt", ["old a1", "old a2"], [vec, vec], "t0", "h0", 1.0)
+            store.replace_source("keep.txt", ["keep"], [vec], "t0", "hk", 1.0)
+
+            written = store.replace_sources(
+                [
+                    SourceReplacement("a.txt", ["new a"], [vec], "h1", 2.0),
+                    SourceReplacement("b.txt", ["b1", "b2"], [vec, vec], "hb", 2.0),
+                    SourceReplacement("c.txt", ["stale"], [vec], "stale", 2.0),
+                    SourceReplacement("c.txt", ["c1"], [vec], "hc", 3.0),
+                ],
+                "t1",
+            )
+
+            assert written == 4
+            texts = {r.text for r in store.query(vec, top_k=10)}
+            assert texts == {"keep", "new a", "b1", "b2", "c1"}
+            ids = [r.chunk_id for r in store.query(vec, top_k=10)]
+            assert len(set(ids)) == 5
+            assert store.list_file_hashes() == {
+                "a.txt": "h1",
+                "b.txt": "hb",
+                "c.txt": "hc",
+                "keep.txt": "hk",
+            }
+            assert store.get_file_metadata("c.txt") == ("hc", 3.0, "t1")
+
+    def test_batch_commits_once_per_table(self, tmp_path, monkeypatch):
+        from initrunner.stores.base import SourceReplacement
+
+        monkeypatch.setenv("INITRUNNER_LANCE_OPTIMIZE_EVERY", "0")
+        vec = [1.0, 0.0, 0.0, 0.0]
+        with LanceDocumentStore(tmp_path / "test.lance", dimensions=4) as store:
+            store.add_documents(["seed"], [vec], ["seed.txt"])
+            versions = {t: store._db.open_table(t).version for t in ("chunks", "file_metadata")}
+            store.replace_sources(
+                [SourceReplacement(f"s{i}.txt", [f"t{i}"], [vec], f"h{i}", 0.0) for i in range(50)],
+                "now",
+            )
+            # chunks: one delete + one add; file_metadata: one merge_insert
+            assert store._db.open_table("chunks").version == versions["chunks"] + 2
+            assert store._db.open_table("file_metadata").version == versions["file_metadata"] + 1
+            assert store.count() == 51
+
+    def test_mismatched_embeddings_rejected_before_delete(self, tmp_path):
+        from initrunner.stores.base import SourceReplacement
+
+        vec = [1.0, 0.0, 0.0, 0.0]
+        with LanceDocumentStore(tmp_path / "test.lance", dimensions=4) as store:
+            store.replace_source("a.txt", ["a"], [vec], "t0", "h0", 1.0)
+            with pytest.raises(ValueError, match="2 texts but 1 embeddings"):
+                store.replace_sources(
+                    [SourceReplacement("a.txt", ["x", "y"], [vec], "h1", 2.0)], "t1"
+                )
+            assert store.count() == 1
+
+
+class TestFileFingerprints:
+    def test_fingerprints_include_size(self, tmp_path):
+        from initrunner.stores.base import FileFingerprint, SourceReplacement
+
+        vec = [1.0, 0.0, 0.0, 0.0]
+        with LanceDocumentStore(tmp_path / "test.lance", dimensions=4) as store:
+            store.upsert_file_metadata("a.txt", "ha", 1.0, "t0", 1, file_size=10)
+            store.replace_sources([SourceReplacement("b.txt", ["b"], [vec], "hb", 2.0, 20)], "t0")
+            store.upsert_file_metadata("c.txt", "hc", 3.0, "t0", 1)
+
+            assert store.list_file_fingerprints() == {
+                "a.txt": FileFingerprint("ha", 1.0, 10),
+                "b.txt": FileFingerprint("hb", 2.0, 20),
+                "c.txt": FileFingerprint("hc", 3.0, -1),
+            }
+
+    def test_refresh_file_stats_keeps_hash(self, tmp_path):
+        from initrunner.stores.base import FileFingerprint
+
+        with LanceDocumentStore(tmp_path / "test.lance", dimensions=4) as store:
+            store.upsert_file_metadata("a.txt", "ha", 1.0, "t0", 2, file_size=10)
+            store.upsert_file_metadata("b.txt", "hb", 1.0, "t0", 1, file_size=10)
+            store.refresh_file_stats({"a.txt": (5.0, 12), "missing.txt": (5.0, 1)})
+
+            fps = store.list_file_fingerprints()
+            assert fps == {
+                "a.txt": FileFingerprint("ha", 5.0, 12),
+                "b.txt": FileFingerprint("hb", 1.0, 10),
+            }
+            assert store.get_file_metadata("a.txt") == ("ha", 5.0, "t0")
+
+    def test_file_size_column_added_to_old_store(self, tmp_path):
+        import lancedb
+        import pyarrow as pa
+
+        from initrunner.stores.base import FileFingerprint
+
+        path = tmp_path / "test.lance"
+        path.mkdir()
+        old_schema = pa.schema(
+            [
+                pa.field("id", pa.string()),
+                pa.field("source", pa.string()),
+                pa.field("content_hash", pa.string()),
+                pa.field("last_modified", pa.float64()),
+                pa.field("ingested_at", pa.string()),
+                pa.field("chunk_count", pa.int32()),
+            ]
+        )
+        db = lancedb.connect(str(path))
+        db.create_table(
+            "file_metadata",
+            data=pa.table(
+                {
+                    "id": ["a.txt"],
+                    "source": ["a.txt"],
+                    "content_hash": ["ha"],
+                    "last_modified": [1.0],
+                    "ingested_at": ["t0"],
+                    "chunk_count": [1],
+                },
+                schema=old_schema,
+            ),
+        )
+
+        with LanceDocumentStore(path, dimensions=4) as store:
+            assert store.list_file_fingerprints() == {"a.txt": FileFingerprint("ha", 1.0, -1)}
+            store.upsert_file_metadata("b.txt", "hb", 2.0, "t1", 1, file_size=7)
+            assert store.list_file_fingerprints()["b.txt"] == FileFingerprint("hb", 2.0, 7)
+
+
+def _unit(i: int, dims: int = 8) -> list[float]:
+    vec = [0.1] * dims
+    vec[i % dims] = 1.0 + i / 100
+    return vec
+
+
+class TestTableMaintenance:
+    def _chunks(self, store: LanceDocumentStore):
+        return next(h for h in store.table_health() if h.table == "chunks")
+
+    def test_optimize_compacts_replaced_sources(self, tmp_path, monkeypatch):
+        from datetime import timedelta
+
+        from initrunner.stores import _lance_common
+
+        monkeypatch.setenv("INITRUNNER_LANCE_OPTIMIZE_EVERY", "0")
+        monkeypatch.setattr(_lance_common, "_VERSION_RETENTION", timedelta(milliseconds=1))
+        with LanceDocumentStore(tmp_path / "test.lance", dimensions=8) as store:
+            for round_ in range(2):
+                for i in range(6):
+                    store.replace_source(
+                        f"s{i}.txt", [f"text {i} {round_}"], [_unit(i)], "", f"h{round_}", 0.0
+                    )
+            before = self._chunks(store)
+            assert before.fragments > 1
+
+            store.optimize()
+
+            after = self._chunks(store)
+            assert after.rows == 6
+            assert after.fragments == 1
+            assert after.versions < before.versions
+            assert store.query(_unit(3), top_k=1)[0].text == "text 3 1"
+
+    def test_vector_index_built_past_threshold(self, tmp_path, monkeypatch):
+        from initrunner.stores.lance_document_store import _VECTOR_INDEX_NAME
+
+        monkeypatch.setenv("INITRUNNER_LANCE_OPTIMIZE_EVERY", "0")
+        monkeypatch.setenv("INITRUNNER_LANCE_INDEX_MIN_ROWS", "40")
+        with LanceDocumentStore(tmp_path / "test.lance", dimensions=8) as store:
+            store.add_documents(
+                [f"t{i}" for i in range(30)], [_unit(i) for i in range(30)], ["a"] * 30
+            )
+            store.optimize()
+            assert self._chunks(store).indexed_rows == 0
+
+            store.add_documents(
+                [f"t{i}" for i in range(30, 60)], [_unit(i) for i in range(30, 60)], ["b"] * 30
+            )
+            store.optimize()
+            tbl = store._db.open_table("chunks")
+            assert _VECTOR_INDEX_NAME in {ix.name for ix in tbl.list_indices()}
+            health = self._chunks(store)
+            assert (health.indexed_rows, health.unindexed_rows) == (60, 0)
+
+            # Rows added after the index are found before the next optimize.
+            store.add_documents(["fresh"], [[0.0] * 7 + [5.0]], ["c"])
+            assert self._chunks(store).unindexed_rows == 1
+            assert store.query([0.0] * 7 + [5.0], top_k=1)[0].text == "fresh"
+
+    def test_background_optimize_after_writes(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("INITRUNNER_LANCE_OPTIMIZE_EVERY", "3")
+        store = LanceDocumentStore(tmp_path / "test.lance", dimensions=8)
+        for i in range(3):
+            store.add_documents([f"t{i}"], [_unit(i)], [f"s{i}"])
+        store._maintainer.close()  # waits for the background run
+        assert self._chunks(store).fragments < 3
+        store.close()
+
+    def test_optimize_every_zero_disables_background(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("INITRUNNER_LANCE_OPTIMIZE_EVERY", "0")
+        with LanceDocumentStore(tmp_path / "test.lance", dimensions=8) as store:
+            for i in range(4):
+                store.add_documents([f"t{i}"], [_unit(i)], [f"s{i}"])
+            assert store._maintainer._thread is None
+            assert self._chunks(store).fragments == 4
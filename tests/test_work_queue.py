@@ -0,0 +1,171 @@
+"""Tests for the daemon trigger work queue."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from initrunner.runner.work_queue import TriggerWorkQueue
+from initrunner.triggers.base import TriggerEvent, register_conversational_trigger_type
+
+
+def _event(trigger_type: str = "cron", prompt: str = "p", **metadata: str) -> TriggerEvent:
+    return TriggerEvent(trigger_type=trigger_type, prompt=prompt, metadata=metadata)
+
+
+class _Recorder:
+    """Handler that records prompts in run order and can be held open."""
+
+    def __init__(self) -> None:
+        self.order: list[str] = []
+        self.release = threading.Event()
+        self.release.set()
+        self._lock = threading.Lock()
+
+    def __call__(self, event: TriggerEvent) -> None:
+        with self._lock:
+            self.order.append(event.prompt)
+        self.release.wait(timeout=5)
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+class TestScheduling:
+    def test_runs_higher_priority_first(self):
+        rec = _Recorder()
+        q = TriggerWorkQueue(rec, workers=1)
+        q.submit(_event("file_watch", "file", path="/a"))
+        q.submit(_event("cron", "cron"))
+        q.submit(_event("webhook", "hook"))
+        q.start()
+        _wait_until(lambda: q.stats().completed == 3)
+        q.stop()
+        assert rec.order == ["hook", "cron", "file"]
+
+    def test_priority_overrides(self):
+        rec = _Recorder()
+        q = TriggerWorkQueue(rec, workers=1, priorities={"file_watch": 0})
+        q.submit(_event("webhook", "hook"))
+        q.submit(_event("file_watch", "file", path="/a"))
+        q.start()
+        _wait_until(lambda: q.stats().completed == 2)
+        q.stop()
+        assert rec.order == ["file", "hook"]
+
+    def test_same_conversation_runs_in_order_one_at_a_time(self):
+        register_conversational_trigger_type("telegram")
+        running: set[str] = set()
+        overlap: list[str] = []
+        order: list[str] = []
+        lock = threading.Lock()
+
+        def handler(event: TriggerEvent) -> None:
+            key = event.conversation_key or ""
+            with lock:
+                if key in running:
+                    overlap.append(key)
+                running.add(key)
+                order.append(event.prompt)
+            time.sleep(0.02)
+            with lock:
+                running.discard(key)
+
+        q = TriggerWorkQueue(handler, workers=4)
+        q.start()
+        for i in range(6):
+            q.submit(_event("telegram", f"a{i}", channel_target="A"))
+            q.submit(_event("telegram", f"b{i}", channel_target="B"))
+        _wait_until(lambda: q.stats().completed == 12)
+        q.stop()
+
+        assert overlap == []
+        assert [p for p in order if p.startswith("a")] == [f"a{i}" for i in range(6)]
+        assert [p for p in order if p.startswith("b")] == [f"b{i}" for i in range(6)]
+
+
+class TestBackpressure:
+    def test_full_queue_drops_equal_priority_event(self):
+        drops: list[str] = []
+        q = TriggerWorkQueue(
+            _Recorder(), workers=1, max_queued=2, on_drop=lambda e, r: drops.append(e.prompt)
+        )
+        assert q.submit(_event(prompt="1"))
+        assert q.submit(_event(prompt="2"))
+        assert not q.submit(_event(prompt="3"))
+        assert drops == ["3"]
+        assert (q.stats().depth, q.stats().dropped) == (2, 1)
+
+    def test_full_queue_evicts_lower_priority_event(self):
+        rec = _Recorder()
+        drops: list[str] = []
+        q = TriggerWorkQueue(
+            rec, workers=1, max_queued=2, on_drop=lambda e, r: drops.append(e.prompt)
+        )
+        q.submit(_event("file_watch", "file", path="/a"))
+        q.submit(_event("cron", "cron"))
+        assert q.submit(_event("webhook", "hook"))
+        assert drops == ["file"]
+        q.start()
+        _wait_until(lambda: q.stats().completed == 2)
+        q.stop()
+        assert rec.order == ["hook", "cron"]
+
+    def test_burst_is_absorbed_not_dropped(self):
+        rec = _Recorder()
+        rec.release.clear()
+        q = TriggerWorkQueue(rec, workers=2, max_queued=50)
+        q.start()
+        for i in range(20):
+            assert q.submit(_event("webhook", str(i)))
+        rec.release.set()
+        _wait_until(lambda: q.stats().completed == 20)
+        stats = q.stats()
+        q.stop()
+        assert stats.dropped == 0
+        assert stats.max_wait_s >= stats.avg_wait_s > 0
+
+    def test_stop_discards_queued_and_refuses_new(self):
+        q = TriggerWorkQueue(_Recorder(), workers=1)
+        q.submit(_event())
+        q.submit(_event())
+        assert q.stop() == 2
+        assert not q.submit(_event())
+        assert q.stats().depth == 0
+
+
+class TestCoalescing:
+    def test_duplicate_file_events_coalesce_while_queued(self):
+        rec = _Recorder()
+        q = TriggerWorkQueue(rec, workers=1)
+        for _ in range(5):
+            q.submit(_event("file_watch", "a", path="/a"))
+        q.submit(_event("file_watch", "b", path="/b"))
+        assert q.stats().coalesced == 4
+        q.start()
+        _wait_until(lambda: q.stats().completed == 2)
+        q.stop()
+        assert rec.order == ["a", "b"]
+
+    def test_event_after_start_is_not_coalesced(self):
+        rec = _Recorder()
+        rec.release.clear()
+        q = TriggerWorkQueue(rec, workers=1)
+        q.start()
+        q.submit(_event("file_watch", "a", path="/a"))
+        _wait_until(lambda: q.stats().in_flight == 1)
+        q.submit(_event("file_watch", "a", path="/a"))
+        rec.release.set()
+        _wait_until(lambda: q.stats().completed == 2)
+        q.stop()
+        assert q.stats().coalesced == 0
+
+    def test_other_types_are_not_coalesced(self):
+        q = TriggerWorkQueue(_Recorder(), workers=1)
+        q.submit(_event("webhook", "same", path="/hook"))
+        q.submit(_event("webhook", "same", path="/hook"))
+        assert q.stats().depth == 2